@@ -0,0 +1,731 @@
+#*******************************************************************************************
+ #
+ #  File Name:  bank_change_statistics.py
+ #
+ #  File Description:
+ #      This module calculates statistics of the change in profit/loss series for
+ #      bank_main.py one block of rows at a time, so the series is never held in 
+ #      memory: the top-k increases and decreases in profits, ties included, and the
+ #      rolling N-month average change for each window size.  Bounded heaps keep the
+ #      top-k changes in O(log k) time per row, and each rolling window keeps its last
+ #      N changes and their running sum, so it updates in O(1) time per row.  The
+ #      statistics of two consecutive parts of a file merge: each window also keeps its
+ #      first N - 1 changes, so the merge can evaluate the windows that span the seam.
+ #
+ #      The running state lives in two small classes with __slots__, one for the
+ #      statistics and one for each window, and a block of changes updates it with
+ #      running sums, maxima, and minima computed over the whole block in C, so no
+ #      dictionary lookup, tuple, or function call happens for each row.  Only a 
+ #      change that can enter the top-k, a rare event once the heaps are full, becomes
+ #      a tuple.  finalize_change_statistics turns the state into the results 
+ #      dictionary once, at the end.
+ #
+ #      Here is a List of classes, subroutines, and functions:
+ #
+ #      rolling_window_accumulator
+ #      change_statistics_accumulator
+ #      create_change_statistics
+ #      push_top_change
+ #      add_top_change
+ #      add_top_changes
+ #      update_rolling_window
+ #      update_change_statistics
+ #      merge_change_statistics
+ #      sort_top_changes
+ #      finalize_change_statistics
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Mergeable state for sharded runs        Nicholas J. George
+ #  10/18/2026      Slotted accumulators for the scan       Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import collections
+import heapq
+import itertools
+import operator
+
+
+# These constants are the default number of top increases and decreases and the default
+# rolling window sizes, in months, for the report.
+CONSTANT_DEFAULT_TOP_COUNT = 3
+
+CONSTANT_DEFAULT_WINDOW_SIZES = (3, 6, 12)
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  rolling_window_accumulator
+ #
+ #  Class Description:
+ #      This class holds the running state of one rolling window: its last N changes,
+ #      their sum, its first N - 1 (date, change) tuples, its number of changes, and 
+ #      the latest, highest, and lowest averages, with the dates of the highest and 
+ #      lowest kept beside their values.  The averages are None until the window holds
+ #      N changes.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  int     size_integer        the window size in months
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class rolling_window_accumulator:
+
+    __slots__ \
+        = ('size_integer', 
+           'changes_deque', 
+           'head_list', 
+           'change_count_integer', 
+           'sum_integer',
+           'latest_average_float', 
+           'highest_date_string', 
+           'highest_average_float', 
+           'lowest_date_string', 
+           'lowest_average_float')
+
+
+    def __init__(self, size_integer):
+
+        self.size_integer = size_integer
+
+        self.changes_deque = collections.deque(maxlen = size_integer)
+
+        self.head_list = []
+
+        self.change_count_integer = 0
+
+        self.sum_integer = 0
+
+        self.latest_average_float = None
+
+        self.highest_date_string = None
+
+        self.highest_average_float = None
+
+        self.lowest_date_string = None
+
+        self.lowest_average_float = None
+
+
+    def offer_average(self, date_string, average_change_float):
+
+        # The first of several equal averages stays the highest or lowest.
+        self.latest_average_float = average_change_float
+
+        if self.highest_average_float is None or average_change_float > self.highest_average_float:
+
+            self.highest_date_string, self.highest_average_float = date_string, average_change_float
+
+        if self.lowest_average_float is None or average_change_float < self.lowest_average_float:
+
+            self.lowest_date_string, self.lowest_average_float = date_string, average_change_float
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  change_statistics_accumulator
+ #
+ #  Class Description:
+ #      This class holds the running state of the change statistics: the number of top
+ #      changes, the bounded heaps and ties lists of the top increases and decreases, 
+ #      and a rolling_window_accumulator for each window size.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  int     top_count_integer       the number of top increases and decreases
+ #  tuple   window_sizes_tuple      the rolling window sizes in months
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class change_statistics_accumulator:
+
+    __slots__ \
+        = ('top_count_integer', 
+           'increase_heap_list', 
+           'increase_ties_list', 
+           'decrease_heap_list', 
+           'decrease_ties_list', 
+           'windows_list')
+
+
+    def __init__(self, top_count_integer, window_sizes_tuple):
+
+        self.top_count_integer = top_count_integer
+
+        self.increase_heap_list = []
+
+        self.increase_ties_list = []
+
+        self.decrease_heap_list = []
+
+        self.decrease_ties_list = []
+
+        self.windows_list \
+            = [rolling_window_accumulator(window_size_integer) for window_size_integer in window_sizes_tuple]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_change_statistics
+ #
+ #  Subroutine Description:
+ #      This function returns a new change_statistics_accumulator with the running 
+ #      state of the change statistics.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  int     top_count_integer       the number of top increases and decreases
+ #  tuple   window_sizes_tuple      the rolling window sizes in months
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Mergeable state for sharded runs            Nicholas J. George
+ #  10/18/2026          Slotted accumulators for the scan           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_change_statistics(top_count_integer, window_sizes_tuple):
+
+    return change_statistics_accumulator(top_count_integer, window_sizes_tuple)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  push_top_change
+ #
+ #  Subroutine Description:
+ #      This subroutine offers one change to a bounded min-heap of the k changes with the
+ #      largest keys.  The heap's smallest key is the threshold; changes whose key equals
+ #      the threshold once the heap is full go to the ties list, and the ties list is
+ #      cleared whenever the threshold rises, so every change tied with the k-th largest
+ #      key is kept.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  list    heap_list           the min-heap of (key, row index, date, change) tuples
+ #  list    ties_list           the changes tied with the heap's smallest key
+ #  int     top_count_integer   the number of top changes
+ #  tuple   change_tuple        the (key, row index, date, change) tuple to offer
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def push_top_change(heap_list, ties_list, top_count_integer, change_tuple):
+
+    if len(heap_list) < top_count_integer:
+
+        heapq.heappush(heap_list, change_tuple)
+
+    elif change_tuple[0] > heap_list[0][0]:
+
+        removed_change_tuple = heapq.heapreplace(heap_list, change_tuple)
+
+        if removed_change_tuple[0] == heap_list[0][0]:
+
+            ties_list.append(removed_change_tuple)
+
+        else:
+
+            ties_list.clear()
+
+    elif change_tuple[0] == heap_list[0][0]:
+
+        ties_list.append(change_tuple)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  add_top_change
+ #
+ #  Subroutine Description:
+ #      This subroutine offers one change to the top increases if it is greater than
+ #      zero or to the top decreases if it is less than zero.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  object  change_statistics_object    the running state of the change statistics
+ #  int     row_index                   the index of the row with the change
+ #  String  date_string                 the date of the row with the change
+ #  int     change_integer              the change in profit/loss
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Slotted accumulators for the scan           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def add_top_change(change_statistics_object, row_index, date_string, change_integer):
+
+    top_count_integer = change_statistics_object.top_count_integer
+
+    if top_count_integer > 0:
+
+        if change_integer > 0:
+
+            push_top_change \
+                (change_statistics_object.increase_heap_list,
+                 change_statistics_object.increase_ties_list,
+                 top_count_integer,
+                 (change_integer, row_index, date_string, change_integer))
+
+        elif change_integer < 0:
+
+            push_top_change \
+                (change_statistics_object.decrease_heap_list,
+                 change_statistics_object.decrease_ties_list,
+                 top_count_integer,
+                 (-change_integer, row_index, date_string, change_integer))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  add_top_changes
+ #
+ #  Subroutine Description:
+ #      This subroutine offers a block of changes to one bounded heap, in row order, 
+ #      with the same result as offering each to push_top_change.  A change enters the 
+ #      heap or its ties only if its key is greater than zero and at least the heap's 
+ #      threshold, which only rises, so a pass in C over the block's keys skips every 
+ #      change below the threshold at the start of the block, and the rest are checked
+ #      against the threshold as it rises.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  list    heap_list           the min-heap of (key, row index, date, change) tuples
+ #  list    ties_list           the changes tied with the heap's smallest key
+ #  int     top_count_integer   the number of top changes
+ #  int     first_row_index     the index of the row with the block's first change
+ #  list    dates_list          the dates of the rows with the changes
+ #  list    changes_list        the changes in profit/loss
+ #  list    keys_list           the heap keys of the changes
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def add_top_changes \
+        (heap_list, ties_list, top_count_integer, first_row_index, dates_list, changes_list, keys_list):
+
+    # This variable is the smallest key that can enter the heap or its ties; until the 
+    # heap is full, any key greater than zero can.
+    threshold_integer = heap_list[0][0] if len(heap_list) == top_count_integer else 0
+
+    if threshold_integer > 0:
+
+        candidate_flags = map(operator.ge, keys_list, itertools.repeat(threshold_integer))
+
+    else:
+
+        candidate_flags = map(operator.gt, keys_list, itertools.repeat(0))
+
+
+    for row_offset in itertools.compress(itertools.count(), candidate_flags):
+
+        key_integer = keys_list[row_offset]
+
+        if key_integer > 0 and key_integer >= threshold_integer:
+
+            push_top_change \
+                (heap_list,
+                 ties_list,
+                 top_count_integer,
+                 (key_integer, first_row_index + row_offset, dates_list[row_offset], changes_list[row_offset]))
+
+            threshold_integer = heap_list[0][0] if len(heap_list) == top_count_integer else 0
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  update_rolling_window
+ #
+ #  Subroutine Description:
+ #      This subroutine moves one rolling window forward over a block of changes.  The
+ #      running sums come from one accumulation in C of each change minus the change 
+ #      that leaves the window, and the block's highest and lowest averages, the first
+ #      of several equal ones, replace the window's only if they beat them.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  window_object   the running state of the rolling window
+ #  list    dates_list      the dates of the rows with the changes
+ #  list    changes_list    the changes in profit/loss
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def update_rolling_window(window_object, dates_list, changes_list):
+
+    window_size_integer = window_object.size_integer
+
+    previous_changes_list = list(window_object.changes_deque)
+
+    head_needed_integer = window_size_integer - 1 - len(window_object.head_list)
+
+    if head_needed_integer > 0:
+
+        window_object.head_list.extend(zip(dates_list[:head_needed_integer], changes_list[:head_needed_integer]))
+
+
+    # These lines of code calculate the window's sum after each change: until the window
+    # is full, no change leaves it.
+    leaving_changes = itertools.chain \
+                        (itertools.repeat(0, window_size_integer - len(previous_changes_list)),
+                         previous_changes_list,
+                         changes_list)
+
+    window_sums_list \
+        = list(itertools.accumulate(map(operator.sub, changes_list, leaving_changes), 
+                                    initial = window_object.sum_integer))
+
+    window_object.sum_integer = window_sums_list[-1]
+
+    window_object.change_count_integer += len(changes_list)
+
+    window_object.changes_deque.extend(changes_list[-window_size_integer:])
+
+
+    # This variable is the offset of the first change that fills the window.
+    first_full_offset = max(0, window_size_integer - len(previous_changes_list) - 1)
+
+    full_window_sums_list = window_sums_list[first_full_offset + 1:]
+
+    if len(full_window_sums_list) == 0:
+
+        return
+
+
+    # Dividing by the window size keeps the order of the sums, so only the latest, 
+    # highest, and lowest sums become averages.
+    window_object.latest_average_float = full_window_sums_list[-1] / window_size_integer
+
+    highest_sum_integer = max(full_window_sums_list)
+
+    highest_average_float = highest_sum_integer / window_size_integer
+
+    if window_object.highest_average_float is None or highest_average_float > window_object.highest_average_float:
+
+        window_object.highest_date_string \
+            = dates_list[first_full_offset + full_window_sums_list.index(highest_sum_integer)]
+
+        window_object.highest_average_float = highest_average_float
+
+    lowest_sum_integer = min(full_window_sums_list)
+
+    lowest_average_float = lowest_sum_integer / window_size_integer
+
+    if window_object.lowest_average_float is None or lowest_average_float < window_object.lowest_average_float:
+
+        window_object.lowest_date_string \
+            = dates_list[first_full_offset + full_window_sums_list.index(lowest_sum_integer)]
+
+        window_object.lowest_average_float = lowest_average_float
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  update_change_statistics
+ #
+ #  Subroutine Description:
+ #      This subroutine adds a block of changes in profit/loss to the change 
+ #      statistics.  Like the greatest increase and decrease in the summary, an 
+ #      increase must be greater than zero and a decrease less than zero to count, and
+ #      the first of several equal rolling averages is the highest or lowest.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  object  change_statistics_object    the running state of the change statistics
+ #  int     first_row_index             the index of the row with the block's first 
+ #                                      change
+ #  list    dates_list                  the dates of the rows with the changes
+ #  list    changes_list                the changes in profit/loss
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Mergeable state for sharded runs            Nicholas J. George
+ #  10/18/2026          Slotted accumulators for the scan           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def update_change_statistics(change_statistics_object, first_row_index, dates_list, changes_list):
+
+    if len(changes_list) == 0:
+
+        return
+
+    top_count_integer = change_statistics_object.top_count_integer
+
+    if top_count_integer > 0:
+
+        add_top_changes \
+            (change_statistics_object.increase_heap_list,
+             change_statistics_object.increase_ties_list,
+             top_count_integer,
+             first_row_index,
+             dates_list,
+             changes_list,
+             changes_list)
+
+        add_top_changes \
+            (change_statistics_object.decrease_heap_list,
+             change_statistics_object.decrease_ties_list,
+             top_count_integer,
+             first_row_index,
+             dates_list,
+             changes_list,
+             list(map(operator.neg, changes_list)))
+
+
+    for window_object in change_statistics_object.windows_list:
+
+        update_rolling_window(window_object, dates_list, changes_list)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  merge_change_statistics
+ #
+ #  Subroutine Description:
+ #      This function merges the change statistics of the rows that follow a part of a 
+ #      file into the statistics of that part and returns them.  The change between the 
+ #      last row of the first part and the first row of the following part, the seam 
+ #      change, joins the top changes, and the following part's top changes join with 
+ #      their row indices moved past the first part.  For each window, the windows that 
+ #      contain the seam change are built from the last N - 1 changes of the first part, 
+ #      the seam change, and the first N - 1 changes of the following part, and are 
+ #      compared in file order between the two parts' own windows, so the first of 
+ #      several equal averages still wins.  Both parts must hold at least one row.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  object  change_statistics_object    the statistics of the first part
+ #  object  following_statistics_object the statistics of the following part
+ #  int     row_offset_integer          the number of rows in the first part
+ #  String  seam_date_string            the date of the following part's first row
+ #  int     seam_change_integer         the seam change in profit/loss
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Slotted accumulators for the scan           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def merge_change_statistics \
+        (change_statistics_object, 
+         following_statistics_object, 
+         row_offset_integer, 
+         seam_date_string, 
+         seam_change_integer):
+
+    add_top_change \
+        (change_statistics_object, row_offset_integer, seam_date_string, seam_change_integer)
+
+    for heap_list, ties_list, following_heap_list, following_ties_list \
+        in ((change_statistics_object.increase_heap_list, 
+             change_statistics_object.increase_ties_list,
+             following_statistics_object.increase_heap_list, 
+             following_statistics_object.increase_ties_list),
+            (change_statistics_object.decrease_heap_list, 
+             change_statistics_object.decrease_ties_list,
+             following_statistics_object.decrease_heap_list, 
+             following_statistics_object.decrease_ties_list)):
+
+        for key_integer, row_index, date_string, change_integer in following_heap_list + following_ties_list:
+
+            push_top_change \
+                (heap_list,
+                 ties_list,
+                 change_statistics_object.top_count_integer,
+                 (key_integer, row_index + row_offset_integer, date_string, change_integer))
+
+
+    for window_object, following_window_object \
+        in zip(change_statistics_object.windows_list, following_statistics_object.windows_list):
+
+        window_size_integer = window_object.size_integer
+
+        changes_list = list(window_object.changes_deque)
+
+        # This list holds the last N - 1 changes of the first part, the seam change, and 
+        # the first N - 1 changes of the following part; only the seam change and the 
+        # following part's changes need dates.
+        seam_changes_list \
+            = [(None, change_integer) \
+               for change_integer in changes_list[max(0, len(changes_list) - window_size_integer + 1):]] \
+              + [(seam_date_string, seam_change_integer)] \
+              + following_window_object.head_list
+
+        seam_index = len(seam_changes_list) - 1 - len(following_window_object.head_list)
+
+
+        # This repetition loop evaluates, in file order, each window that ends at or after
+        # the seam change and starts at or before it.
+        for end_index \
+            in range(max(seam_index, window_size_integer - 1),
+                     min(len(seam_changes_list), seam_index + window_size_integer)):
+
+            window_object.offer_average \
+                (seam_changes_list[end_index][0],
+                 sum(change_integer \
+                     for _, change_integer \
+                     in seam_changes_list[end_index - window_size_integer + 1:end_index + 1]) \
+                 / window_size_integer)
+
+
+        if following_window_object.latest_average_float is not None:
+
+            window_object.latest_average_float = following_window_object.latest_average_float
+
+            if window_object.highest_average_float is None \
+                or following_window_object.highest_average_float > window_object.highest_average_float:
+
+                window_object.highest_date_string = following_window_object.highest_date_string
+
+                window_object.highest_average_float = following_window_object.highest_average_float
+
+            if window_object.lowest_average_float is None \
+                or following_window_object.lowest_average_float < window_object.lowest_average_float:
+
+                window_object.lowest_date_string = following_window_object.lowest_date_string
+
+                window_object.lowest_average_float = following_window_object.lowest_average_float
+
+
+        window_object.head_list \
+            = (window_object.head_list \
+               + [(seam_date_string, seam_change_integer)] \
+               + following_window_object.head_list)[:window_size_integer - 1]
+
+        window_object.changes_deque.append(seam_change_integer)
+
+        window_object.changes_deque.extend(following_window_object.changes_deque)
+
+        window_object.sum_integer = sum(window_object.changes_deque)
+
+        window_object.change_count_integer += 1 + following_window_object.change_count_integer
+
+
+    return change_statistics_object
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  sort_top_changes
+ #
+ #  Subroutine Description:
+ #      This function returns the (date, change) tuples of a heap and its ties list from
+ #      the largest key to the smallest, with equal keys in row order.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  list    heap_list       the min-heap of (key, row index, date, change) tuples
+ #  list    ties_list       the changes tied with the heap's smallest key
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def sort_top_changes(heap_list, ties_list):
+
+    return [(change_tuple[2], change_tuple[3]) \
+            for change_tuple \
+            in sorted(heap_list + ties_list, key = lambda change_tuple: (-change_tuple[0], change_tuple[1]))]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  finalize_change_statistics
+ #
+ #  Subroutine Description:
+ #      This function returns the results of the change statistics: the top increases
+ #      and the top decreases as lists of (date, change) tuples and, for each rolling
+ #      window, a tuple of the window size, the latest average, and the (date, average)
+ #      tuples of the highest and lowest averages.  A window with more months than the
+ #      data has changes has None for its averages.  It builds the results dictionary
+ #      once, from the running state, at the end of the scan.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  object  change_statistics_object    the running state of the change statistics
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Slotted accumulators for the scan           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def finalize_change_statistics(change_statistics_object):
+
+    return {'Top Count': change_statistics_object.top_count_integer,
+            'Top Increases': sort_top_changes \
+                                (change_statistics_object.increase_heap_list,
+                                 change_statistics_object.increase_ties_list),
+            'Top Decreases': sort_top_changes \
+                                (change_statistics_object.decrease_heap_list,
+                                 change_statistics_object.decrease_ties_list),
+            'Rolling Averages': [(window_object.size_integer,
+                                  window_object.latest_average_float,
+                                  None if window_object.highest_average_float is None \
+                                  else (window_object.highest_date_string, window_object.highest_average_float),
+                                  None if window_object.lowest_average_float is None \
+                                  else (window_object.lowest_date_string, window_object.lowest_average_float)) \
+                                 for window_object in change_statistics_object.windows_list]}
@@ -9,269 +9,990 @@
  #      calculates each of the following values for the year (2023): the total 
  #      number of records in the data set, the net total amount of 'Profit/Losses', 
  #      the changes in 'Profit/Losses', the greatest increase in profits (date and 
- #      amount), and the greatest decrease in profits (date and amount).  In 
- #      addition, the program both prints the results to the terminal and exports it 
- #      to a text file in the analysis folder, budget_data.txt. 
+ #      amount), the greatest decrease in profits (date and amount), the top-k 
+ #      increases and decreases in profits, and the rolling N-month average 
+ #      changes.  In addition, the program both prints the results to the terminal and exports it 
+ #      to a text file in the analysis folder, budget_data.txt.  In batch mode, the
+ #      program analyzes a directory or glob of budget csv files in a process pool,
+ #      writes a report for each file, and writes one consolidated summary across all
+ #      of them.  For a date range, the program answers from an index it persists next
+ #      to the csv file instead of reading the csv file again.  The summary and the
+ #      change statistics are aggregators on the shared streaming aggregation core, so
+ #      they run together over one pass through the csv file or over shards of it in a
+ #      process pool.  The analysis functions take a path or a text stream and return a 
+ #      new summary dictionary without printing or writing a file, so a long-running 
+ #      process can import the module and analyze one input after another; the 
+ #      script's entry point calls the same functions and then writes the results.
+ #      With --profile, the program reports the time, rows, bytes, throughput, and peak
+ #      traced memory of each stage of the run to the standard error stream as JSON or
+ #      Prometheus text, and --profile-dump also saves a cProfile dump.  The script 
+ #      keeps each summary in a result cache keyed by the content of the csv file and
+ #      the options, so an unchanged ledger comes back without being parsed.  A ledger
+ #      stored gzip, bz2, or xz compressed is read as it decompresses, without a copy
+ #      on disk.  The aggregators read the ledger through the schema parser, which
+ #      splits blocks of the file into the Date and Profit/Losses columns and converts
+ #      the profits and losses a whole column at a time.  Records from any other
+ #      source are gathered into the same blocks of columns, and the summary and the
+ #      change statistics update their running totals and extremes a block at a 
+ #      time, with no container built for each row.
  #   
  #      Here is a list of the functions and subroutines:
  #
+ #      create_summary_dictionary
+ #      assign_summary_values
+ #      read_budget_column_blocks
+ #      calculate_profit_loss_changes
+ #      budget_summary_aggregator
+ #      change_statistics_aggregator
+ #      create_budget_aggregators
  #      read_file_and_calculate_values
+ #      read_cached_file_and_calculate_values
+ #      read_date_range_and_calculate_values
+ #      format_change_statistics_lines
  #      write_data_to_terminal
  #      write_data_to_file
+ #      analyze_ledger_file
+ #      find_ledger_files
+ #      format_batch_summary_lines
+ #      run_batch_analysis
  #
  #
  #  Date            Description                             Programmer
  #  ----------      ------------------------------------    ------------------
  #  07/30/2023      Initial Development                     Nicholas J. George
+ #  10/18/2026      NumPy vectorized backend                Nicholas J. George
+ #  10/18/2026      Batch mode for many ledgers             Nicholas J. George
+ #  10/18/2026      Top-k changes and rolling averages      Nicholas J. George
+ #  10/18/2026      Date-range queries from an index        Nicholas J. George
+ #  10/18/2026      Shared streaming aggregation core       Nicholas J. George
+ #  10/18/2026      Importable analysis API                 Nicholas J. George
+ #  10/18/2026      Stage profiling instrumentation         Nicholas J. George
+ #  10/18/2026      Content-addressed result cache          Nicholas J. George
+ #  10/18/2026      Compressed input files                  Nicholas J. George
+ #  10/18/2026      Schema-specialized csv parser           Nicholas J. George
+ #  10/18/2026      Allocation-free budget scan             Nicholas J. George
  #
  #******************************************************************************************/
 
-import csv
+import argparse
+import functools
+import glob
+import itertools
+import multiprocessing
+import operator
+import os
+import sys
 from enum import Enum
 
+import bank_change_statistics
+import bank_numpy_backend
+import bank_range_index
+
+# This line of code adds the shared folder to the module search path, so the program can
+# import the streaming aggregation core.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+
+import compressed_input
+import result_cache
+import schema_parser
+import stage_profiling
+import streaming_aggregation
+
 
 # This enumeration contains constant values for the input csv file's column indices.
 class data_column_indices_enumeration(Enum):
 
-    DATE_COLUMN_INDEX = 0
+    DATE_COLUMN_INDEX = 0
+
+    PROFIT_LOSS_COLUMN_INDEX = 1
+
+
+# This enumeration contains indices for the nested summary dictionary's keys.
+class dictionary_indices_enumeration(Enum):
+
+    TOTAL_RECORDS = 0
+
+    TOTAL = 1
+
+    AVERAGE_CHANGE = 2
+
+    GREATEST_INCREASE_IN_PROFIT_LOSS = 3
+
+    GREATEST_DECREASE_IN_PROFIT_LOSS = 4
+
+    CHANGE_STATISTICS = 5
+
+
+    NESTED_DATA = 1
+
+    DATE = 0
+
+    VALUE = 1
+
+
+# This constant is the program's folder; the default file paths are relative to it 
+# rather than to the current working directory.
+CONSTANT_PROGRAM_DIRECTORY_NAME = os.path.dirname(os.path.abspath(__file__))
+
+
+# These constants are the names of the input and output file paths.
+CONSTANT_INPUT_FILE_NAME = os.path.join(CONSTANT_PROGRAM_DIRECTORY_NAME, 'resources', 'budget_data.csv')
+
+CONSTANT_OUTPUT_FILE_NAME = os.path.join(CONSTANT_PROGRAM_DIRECTORY_NAME, 'analysis', 'budget_data.txt')
+
+
+# These constants are the default output folder for batch mode and the name of the 
+# consolidated summary file in it.
+CONSTANT_BATCH_OUTPUT_DIRECTORY_NAME = os.path.join(CONSTANT_PROGRAM_DIRECTORY_NAME, 'analysis', 'batch')
+
+CONSTANT_BATCH_SUMMARY_FILE_NAME = 'batch_summary.txt'
+
+
+# This constant is the default folder of the result cache.
+CONSTANT_RESULT_CACHE_DIRECTORY_NAME = os.path.join(CONSTANT_PROGRAM_DIRECTORY_NAME, 'analysis', 'result_cache')
+
+
+# This constant is the title and tile line for the output data.
+CONSTANT_OUTPUT_DATA_TITLE = 'Financial Analysis'
+
+CONSTANT_OUTPUT_DATA_TITLE_LINE = '----------------------------'
+
+CONSTANT_BATCH_OUTPUT_DATA_TITLE = 'Financial Analysis (All Ledgers)'
+
+
+# This constant is the csv schema of the budget data for the schema parser: two columns,
+# both parsed, with the profits and losses converted to integers.
+CONSTANT_BUDGET_CSV_SCHEMA \
+    = schema_parser.csv_schema \
+        (len(data_column_indices_enumeration),
+         (data_column_indices_enumeration.DATE_COLUMN_INDEX.value,
+          data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value),
+         (data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value,))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_summary_dictionary
+ #
+ #  Subroutine Description:
+ #      This function returns a new summary dictionary with initial values.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_summary_dictionary():
+
+    return {'Total Records': 0,
+            'Total Profits': 0,
+            'Average Change': 0.0,
+            'Greatest Increase in Profits': {'Date': '', 'Value': 0 },
+            'Greatest Decrease in Profits': {'Date': '', 'Value': 0 },
+            'Change Statistics': {'Top Count': 0, 'Top Increases': [], 'Top Decreases': [], 'Rolling Averages': []}}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  assign_summary_values
+ #
+ #  Subroutine Description:
+ #      This subroutine assigns the summary values from the aggregators or the NumPy 
+ #      backend to a summary dictionary.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  dictionary  summary_dictionary      the summary dictionary to fill in
+ #  tuple       summary_values_tuple    the total records, the total profit/loss, the
+ #                                      average change, the (date, value) tuples of 
+ #                                      the greatest increase and decrease, and the 
+ #                                      change statistics
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Top-k changes and rolling averages          Nicholas J. George
+ #  10/18/2026          Shared streaming aggregation core           Nicholas J. George
+ #  10/18/2026          Importable analysis API                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def assign_summary_values(summary_dictionary, summary_values_tuple):
+
+    total_records_integer, \
+    total_profit_loss_integer, \
+    average_change_float, \
+    greatest_increase_tuple, \
+    greatest_decrease_tuple, \
+    change_statistics_dictionary \
+        = summary_values_tuple
+
+    summary_dictionary \
+        [list(summary_dictionary.keys())[dictionary_indices_enumeration.TOTAL_RECORDS.value]] \
+            = total_records_integer
+
+    summary_dictionary \
+        [list(summary_dictionary.keys())[dictionary_indices_enumeration.TOTAL.value]] \
+            = total_profit_loss_integer
+
+    summary_dictionary \
+        [list(summary_dictionary.keys())[dictionary_indices_enumeration.AVERAGE_CHANGE.value]] \
+            = average_change_float
+
+    summary_dictionary \
+        [list(summary_dictionary.keys())[dictionary_indices_enumeration.CHANGE_STATISTICS.value]] \
+            = change_statistics_dictionary
+
+
+    # This repetition loop assigns the date and value of the greatest increase and the 
+    # greatest decrease in profit/loss to the appropriate nested summary dictionaries.
+    for dictionary_index, extreme_change_tuple \
+        in ((dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value, greatest_increase_tuple),
+            (dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value, greatest_decrease_tuple)):
+
+        nested_summary_dictionary = summary_dictionary[list(summary_dictionary.keys())[dictionary_index]]
+
+        nested_summary_dictionary \
+            [list(nested_summary_dictionary.keys())[dictionary_indices_enumeration.DATE.value]] \
+                = extreme_change_tuple[0]
+
+        nested_summary_dictionary \
+            [list(nested_summary_dictionary.keys())[dictionary_indices_enumeration.VALUE.value]] \
+                = extreme_change_tuple[1]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_budget_column_blocks
+ #
+ #  Subroutine Description:
+ #      This generator gathers budget records into blocks and yields each block as the
+ #      schema parser would: a list of columns with the dates, the profits and losses 
+ #      converted to integers, and None for any other column.  The aggregators then 
+ #      update from records and from the schema parser the same way.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  iterable    csv_records                 the csv records after the header row
+ #  int         date_column_index           the index of the Date column
+ #  int         profit_loss_column_index    the index of the Profit/Losses column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_budget_column_blocks(csv_records, date_column_index, profit_loss_column_index):
+
+    csv_records = iter(csv_records)
+
+    column_count_integer = max(date_column_index, profit_loss_column_index) + 1
+
+    for csv_records_list \
+        in iter(lambda: list(itertools.islice(csv_records, streaming_aggregation.CONSTANT_RECORD_BATCH_SIZE)), []):
+
+        columns_list = [None] * column_count_integer
+
+        columns_list[date_column_index] = list(map(operator.itemgetter(date_column_index), csv_records_list))
+
+        columns_list[profit_loss_column_index] \
+            = list(map(int, map(operator.itemgetter(profit_loss_column_index), csv_records_list)))
+
+        yield columns_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_profit_loss_changes
+ #
+ #  Subroutine Description:
+ #      This function returns the changes in profit/loss of a block of records and the
+ #      dates of the records with the changes.  If the aggregator has no records yet,
+ #      it stores the block's first date and profit/loss, and the first record has no
+ #      change; otherwise the first change is from the aggregator's last profit/loss.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  object  aggregator                  the summary or change statistics aggregator
+ #  list    date_strings_list           the dates of the block's records
+ #  list    profit_loss_integers_list   the profits and losses of the block's records
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_profit_loss_changes(aggregator, date_strings_list, profit_loss_integers_list):
+
+    if aggregator.total_records_integer == 0:
+
+        aggregator.first_date_string = date_strings_list[0]
+
+        aggregator.first_profit_loss_integer = profit_loss_integers_list[0]
+
+        return date_strings_list[1:], \
+               list(map(operator.sub, profit_loss_integers_list[1:], profit_loss_integers_list))
+
+    return date_strings_list, \
+           list(map(operator.sub, 
+                    profit_loss_integers_list, 
+                    itertools.chain((aggregator.last_profit_loss_integer,), profit_loss_integers_list)))
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  budget_summary_aggregator
+ #
+ #  Class Description:
+ #      This class is the streaming aggregator for the summary values: the total number
+ #      of records, the net total profit/loss, the average change, and the greatest 
+ #      increase and decrease in profits.  The net change in profit/loss is the last 
+ #      value minus the first, so the aggregator keeps the first and last values instead
+ #      of summing the changes.  Merging the aggregator of the records that follow 
+ #      compares, in file order, the change between the two parts, the seam change, and
+ #      then the following part's greatest changes, so the first of several equal 
+ #      changes still wins.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  int     date_column_index           the index of the Date column
+ #  int     profit_loss_column_index    the index of the Profit/Losses column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #  10/18/2026          Allocation-free budget scan                 Nicholas J. George
+ #  10/18/2026          Zero average change for a single record     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class budget_summary_aggregator(streaming_aggregation.streaming_aggregator):
+
+    def __init__(self, date_column_index, profit_loss_column_index):
+
+        self.date_column_index = date_column_index
+
+        self.profit_loss_column_index = profit_loss_column_index
+
+        super().__init__()
+
+
+    def initialize(self):
+
+        # These variables are the number of records and the net total profit/loss.
+        self.total_records_integer = 0
+
+        self.total_profit_loss_integer = 0
+
+
+        # These variables are the date and value of the first record and the value of 
+        # the last record, which the merge method needs for the seam change.
+        self.first_date_string = ''
+
+        self.first_profit_loss_integer = 0
+
+        self.last_profit_loss_integer = 0
+
+
+        # These lists are the date and value of the greatest increase and the greatest
+        # decrease in profit/loss.
+        self.greatest_increase_list = ['', 0]
+
+        self.greatest_decrease_list = ['', 0]
+
+
+    def update(self, csv_records):
+
+        for columns_list \
+            in read_budget_column_blocks(csv_records, self.date_column_index, self.profit_loss_column_index):
+
+            self.update_columns(columns_list)
+
+
+    def update_columns(self, columns_list):
+
+        date_strings_list = columns_list[self.date_column_index]
+
+        profit_loss_integers_list = columns_list[self.profit_loss_column_index]
+
+        if len(profit_loss_integers_list) == 0:
+
+            return
+
+
+        change_dates_list, changes_profit_loss_list \
+            = calculate_profit_loss_changes(self, date_strings_list, profit_loss_integers_list)
+
+
+        # If the block's greatest change beats the greatest so far, its first occurrence
+        # becomes the greatest, as in the record-at-a-time loop.
+        greatest_increase_integer = max(changes_profit_loss_list, default = 0)
+
+        if greatest_increase_integer > self.greatest_increase_list[1]:
+
+            self.greatest_increase_list \
+                = [change_dates_list[changes_profit_loss_list.index(greatest_increase_integer)], 
+                   greatest_increase_integer]
+
+        greatest_decrease_integer = min(changes_profit_loss_list, default = 0)
+
+        if greatest_decrease_integer < self.greatest_decrease_list[1]:
+
+            self.greatest_decrease_list \
+                = [change_dates_list[changes_profit_loss_list.index(greatest_decrease_integer)], 
+                   greatest_decrease_integer]
+
+
+        self.last_profit_loss_integer = profit_loss_integers_list[-1]
+
+        self.total_records_integer += len(profit_loss_integers_list)
+
+        self.total_profit_loss_integer += sum(profit_loss_integers_list)
+
+
+    def merge(self, following_aggregator):
+
+        if following_aggregator.total_records_integer == 0:
+
+            return self
+
+        if self.total_records_integer == 0:
+
+            vars(self).update(vars(following_aggregator))
+
+            return self
+
+
+        # This list is the date and value of the seam change, the change between the 
+        # last record of this part and the first record of the following part.
+        seam_change_list \
+            = [following_aggregator.first_date_string, 
+               following_aggregator.first_profit_loss_integer - self.last_profit_loss_integer]
+
+        for following_change_list in (seam_change_list, following_aggregator.greatest_increase_list):
+
+            if following_change_list[1] > self.greatest_increase_list[1]:
+
+                self.greatest_increase_list = list(following_change_list)
+
+        for following_change_list in (seam_change_list, following_aggregator.greatest_decrease_list):
+
+            if following_change_list[1] < self.greatest_decrease_list[1]:
+
+                self.greatest_decrease_list = list(following_change_list)
+
+
+        self.total_records_integer += following_aggregator.total_records_integer
+
+        self.total_profit_loss_integer += following_aggregator.total_profit_loss_integer
+
+        self.last_profit_loss_integer = following_aggregator.last_profit_loss_integer
+
+        return self
+
+
+    def finalize(self):
+
+        # This line of code calculates the average change in profit/loss by taking the 
+        # net change in profit/loss and dividing it by the number of months minus one, 
+        # because changes in profit/loss do not start until the second month.  A single
+        # month has no change, so its average change is zero.
+        average_change_float \
+            = round \
+                (float(self.last_profit_loss_integer - self.first_profit_loss_integer) \
+                 / float(self.total_records_integer - 1), 2) \
+              if self.total_records_integer > 1 else 0.0
+
+        return self.total_records_integer, \
+               self.total_profit_loss_integer, \
+               average_change_float, \
+               tuple(self.greatest_increase_list), \
+               tuple(self.greatest_decrease_list)
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  change_statistics_aggregator
+ #
+ #  Class Description:
+ #      This class is the streaming aggregator for the top-k increases and decreases in
+ #      profits and the rolling N-month average changes.  It keeps the running state 
+ #      from bank_change_statistics.py and the first and last profit/loss values, so it
+ #      can merge the aggregator of the records that follow.  It updates the running 
+ #      state a block of changes at a time.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  int     date_column_index           the index of the Date column
+ #  int     profit_loss_column_index    the index of the Profit/Losses column
+ #  int     top_count_integer           the number of top increases and decreases
+ #  tuple   window_sizes_tuple          the rolling window sizes in months
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Allocation-free budget scan                 Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class change_statistics_aggregator(streaming_aggregation.streaming_aggregator):
+
+    def __init__(self, date_column_index, profit_loss_column_index, top_count_integer, window_sizes_tuple):
+
+        self.date_column_index = date_column_index
+
+        self.profit_loss_column_index = profit_loss_column_index
+
+        self.top_count_integer = top_count_integer
+
+        self.window_sizes_tuple = window_sizes_tuple
+
+        super().__init__()
+
+
+    def initialize(self):
+
+        # This object contains the running state of the top-k changes and the rolling
+        # averages.
+        self.change_statistics_object \
+            = bank_change_statistics.create_change_statistics(self.top_count_integer, self.window_sizes_tuple)
+
+        self.total_records_integer = 0
+
+        self.first_date_string = ''
+
+        self.first_profit_loss_integer = 0
+
+        self.last_profit_loss_integer = 0
+
+
+    def update(self, csv_records):
+
+        for columns_list \
+            in read_budget_column_blocks(csv_records, self.date_column_index, self.profit_loss_column_index):
+
+            self.update_columns(columns_list)
+
+
+    def update_columns(self, columns_list):
+
+        date_strings_list = columns_list[self.date_column_index]
+
+        profit_loss_integers_list = columns_list[self.profit_loss_column_index]
+
+        if len(profit_loss_integers_list) == 0:
+
+            return
+
+        # This variable is the index of the row with the block's first change.
+        first_row_index = max(1, self.total_records_integer)
+
+        change_dates_list, changes_profit_loss_list \
+            = calculate_profit_loss_changes(self, date_strings_list, profit_loss_integers_list)
+
+        bank_change_statistics.update_change_statistics \
+            (self.change_statistics_object, first_row_index, change_dates_list, changes_profit_loss_list)
+
+        self.last_profit_loss_integer = profit_loss_integers_list[-1]
+
+        self.total_records_integer += len(profit_loss_integers_list)
+
+
+    def merge(self, following_aggregator):
+
+        if following_aggregator.total_records_integer == 0:
+
+            return self
+
+        if self.total_records_integer == 0:
+
+            vars(self).update(vars(following_aggregator))
+
+            return self
+
+
+        bank_change_statistics.merge_change_statistics \
+            (self.change_statistics_object,
+             following_aggregator.change_statistics_object,
+             self.total_records_integer,
+             following_aggregator.first_date_string,
+             following_aggregator.first_profit_loss_integer - self.last_profit_loss_integer)
+
+        self.total_records_integer += following_aggregator.total_records_integer
+
+        self.last_profit_loss_integer = following_aggregator.last_profit_loss_integer
+
+        return self
+
+
+    def finalize(self):
+
+        return bank_change_statistics.finalize_change_statistics(self.change_statistics_object)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_budget_aggregators
+ #
+ #  Subroutine Description:
+ #      This function returns a new list of the program's aggregators: the summary 
+ #      aggregator and the change statistics aggregator.  It is a module-level function,
+ #      so the worker processes can create the aggregators for their shards.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  int     top_count_integer       the number of top increases and decreases
+ #  tuple   window_sizes_tuple      the rolling window sizes in months
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_budget_aggregators(top_count_integer, window_sizes_tuple):
+
+    return [budget_summary_aggregator \
+                (data_column_indices_enumeration.DATE_COLUMN_INDEX.value,
+                 data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value),
+            change_statistics_aggregator \
+                (data_column_indices_enumeration.DATE_COLUMN_INDEX.value,
+                 data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value,
+                 top_count_integer,
+                 window_sizes_tuple)]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_file_and_calculate_values
+ #
+ #  Subroutine Description:
+ #      This function reads an input csv file, calculates the summary values for the
+ #      program output, and returns them in a new summary dictionary.  For large input
+ #      files, the NumPy backend calculates the values when NumPy is installed; 
+ #      otherwise, the program's aggregators calculate them in one pass through the 
+ #      file or, with more than one worker, over shards of the file in a process pool.
+ #      The input may also be a file-like object open in text mode, which the 
+ #      aggregators read in one pass from its current position.  A compressed input 
+ #      file, detected by its magic bytes, skips the NumPy backend and decompresses as
+ #      the aggregators read it; the members of a gzip file decompress in parallel 
+ #      with more than one worker.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the input csv file or a text stream
+ #                                  (default: CONSTANT_INPUT_FILE_NAME)
+ #  int     top_count_integer       the number of top increases and decreases
+ #                                  (default: CONSTANT_DEFAULT_TOP_COUNT)
+ #  tuple   window_sizes_tuple      the rolling window sizes in months
+ #                                  (default: CONSTANT_DEFAULT_WINDOW_SIZES)
+ #  int     worker_count_integer    the number of worker processes (default: 1)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  7/30/2023           Initial Development                         Nicholas J. George
+ #  10/18/2026          NumPy vectorized backend                    Nicholas J. George
+ #  10/18/2026          Input file parameter for batch mode         Nicholas J. George
+ #  10/18/2026          Top-k changes and rolling averages          Nicholas J. George
+ #  10/18/2026          Shared streaming aggregation core           Nicholas J. George
+ #  10/18/2026          Importable analysis API                     Nicholas J. George
+ #  10/18/2026          Stage profiling instrumentation             Nicholas J. George
+ #  10/18/2026          Compressed input files                      Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_file_and_calculate_values \
+        (input_file_name_string = CONSTANT_INPUT_FILE_NAME,
+         top_count_integer = bank_change_statistics.CONSTANT_DEFAULT_TOP_COUNT,
+         window_sizes_tuple = bank_change_statistics.CONSTANT_DEFAULT_WINDOW_SIZES,
+         worker_count_integer = 1):
+
+    summary_dictionary = create_summary_dictionary()
+
+    aggregators_list = create_budget_aggregators(top_count_integer, window_sizes_tuple)
+
+
+    # If the input is a stream rather than a path, the aggregators read it in one pass.
+    if hasattr(input_file_name_string, 'read'):
+
+        streaming_aggregation.aggregate_stream(input_file_name_string, aggregators_list, CONSTANT_BUDGET_CSV_SCHEMA)
+
+        assign_summary_values \
+            (summary_dictionary, aggregators_list[0].finalize() + (aggregators_list[1].finalize(),))
+
+        return summary_dictionary
+
+
+    # If the NumPy backend is selected for a large, uncompressed input file, it 
+    # calculates the summary values in vectorized form, and the program skips the 
+    # aggregators.
+    if compressed_input.detect_compression_format(input_file_name_string) is None \
+        and bank_numpy_backend.is_numpy_backend_selected(input_file_name_string):
+
+        numpy_summary_tuple \
+            = bank_numpy_backend.calculate_budget_summary_numpy \
+                (input_file_name_string, 
+                 data_column_indices_enumeration.DATE_COLUMN_INDEX.value, 
+                 data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value,
+                 top_count_integer,
+                 window_sizes_tuple)
+
+        if numpy_summary_tuple is not None:
+
+            assign_summary_values(summary_dictionary, numpy_summary_tuple)
+
+            return summary_dictionary
+
+
+    # These lines of code run the summary and change statistics aggregators together 
+    # over the csv file, either in one pass or over shards whose results merge in 
+    # file order.
+    if worker_count_integer > 1:
+
+        aggregators_list \
+            = streaming_aggregation.aggregate_file_shards \
+                (input_file_name_string, 
+                 functools.partial(create_budget_aggregators, top_count_integer, window_sizes_tuple),
+                 worker_count_integer,
+                 CONSTANT_BUDGET_CSV_SCHEMA)
+
+    else:
 
-    PROFIT_LOSS_COLUMN_INDEX = 1
+        streaming_aggregation.aggregate_file(input_file_name_string, aggregators_list, CONSTANT_BUDGET_CSV_SCHEMA)
 
 
-# This enumeration contains indices for the nested summary dictionary's keys.
-class dictionary_indices_enumeration(Enum):
+    summary_aggregator, statistics_aggregator = aggregators_list
 
-    TOTAL_RECORDS = 0
+    with stage_profiling.measure_stage('finalize'):
 
-    TOTAL = 1
+        assign_summary_values \
+            (summary_dictionary, summary_aggregator.finalize() + (statistics_aggregator.finalize(),))
 
-    AVERAGE_CHANGE = 2
+    return summary_dictionary
 
-    GREATEST_INCREASE_IN_PROFIT_LOSS = 3
 
-    GREATEST_DECREASE_IN_PROFIT_LOSS = 4
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_cached_file_and_calculate_values
+ #
+ #  Subroutine Description:
+ #      This function returns the summary dictionary of an input csv file from the
+ #      result cache if the cache holds one for the file's current contents, the same
+ #      options, and the same program; otherwise, it calls 
+ #      read_file_and_calculate_values and stores the result.  The number of workers
+ #      does not change the result, so it is not part of the cache key.  Without a
+ #      cache folder, the function does not use the cache.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the input csv file
+ #                                      (default: CONSTANT_INPUT_FILE_NAME)
+ #  int     top_count_integer           the number of top increases and decreases
+ #                                      (default: CONSTANT_DEFAULT_TOP_COUNT)
+ #  tuple   window_sizes_tuple          the rolling window sizes in months
+ #                                      (default: CONSTANT_DEFAULT_WINDOW_SIZES)
+ #  int     worker_count_integer        the number of worker processes (default: 1)
+ #  String  cache_directory_string      the folder of the result cache, or None
+ #                                      (default: CONSTANT_RESULT_CACHE_DIRECTORY_NAME)
+ #  int     cache_size_limit_integer    the size limit of the cache folder in bytes
+ #                                      (default: CONSTANT_RESULT_CACHE_SIZE_LIMIT)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Compressed input files                      Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #
+ #******************************************************************************************/
 
+def read_cached_file_and_calculate_values \
+        (input_file_name_string = CONSTANT_INPUT_FILE_NAME,
+         top_count_integer = bank_change_statistics.CONSTANT_DEFAULT_TOP_COUNT,
+         window_sizes_tuple = bank_change_statistics.CONSTANT_DEFAULT_WINDOW_SIZES,
+         worker_count_integer = 1,
+         cache_directory_string = CONSTANT_RESULT_CACHE_DIRECTORY_NAME,
+         cache_size_limit_integer = result_cache.CONSTANT_RESULT_CACHE_SIZE_LIMIT):
+
+    analysis_function \
+        = functools.partial \
+            (read_file_and_calculate_values, 
+             input_file_name_string, 
+             top_count_integer, 
+             window_sizes_tuple, 
+             worker_count_integer)
+
+    if cache_directory_string is None:
+
+        return analysis_function()
+
+
+    summary_dictionary, _ \
+        = result_cache.read_or_calculate_result \
+            (cache_directory_string, 
+             input_file_name_string, 
+             os.path.basename(__file__), 
+             [__file__, 
+              bank_change_statistics.__file__, 
+              bank_numpy_backend.__file__, 
+              compressed_input.__file__, 
+              schema_parser.__file__,
+              streaming_aggregation.__file__],
+             {'Top Count': top_count_integer, 'Window Sizes': list(window_sizes_tuple)},
+             analysis_function,
+             cache_size_limit_integer)
+
+    return summary_dictionary
 
-    NESTED_DATA = 1
 
-    DATE = 0
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_date_range_and_calculate_values
+ #
+ #  Subroutine Description:
+ #      This function calculates the summary values for the rows between two dates
+ #      from the date-range index of an input csv file, which it builds first if it is 
+ #      missing or the csv file has changed, and returns them in a new summary 
+ #      dictionary.  The change statistics stay empty.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  start_date_string       the first date of the range
+ #  String  end_date_string         the last date of the range
+ #  String  input_file_name_string  the path of the input csv file
+ #                                  (default: CONSTANT_INPUT_FILE_NAME)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Importable analysis API                     Nicholas J. George
+ #
+ #******************************************************************************************/
 
-    VALUE = 1
+def read_date_range_and_calculate_values \
+        (start_date_string, end_date_string, input_file_name_string = CONSTANT_INPUT_FILE_NAME):
 
+    range_index_dictionary \
+        = bank_range_index.open_range_index \
+            (input_file_name_string, 
+             data_column_indices_enumeration.DATE_COLUMN_INDEX.value, 
+             data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value)
 
-# These constants are the names of the input and output file paths.
-CONSTANT_INPUT_FILE_NAME = './resources/budget_data.csv'
+    summary_dictionary = create_summary_dictionary()
 
-CONSTANT_OUTPUT_FILE_NAME = './analysis/budget_data.txt'
+    try:
 
+        summary_dictionary.update \
+            (bank_range_index.query_date_range \
+                (range_index_dictionary, start_date_string, end_date_string))
 
-# This constant is the title and tile line for the output data.
-CONSTANT_OUTPUT_DATA_TITLE = 'Financial Analysis'
+    finally:
 
-CONSTANT_OUTPUT_DATA_TITLE_LINE = '----------------------------'
+        bank_range_index.close_range_index(range_index_dictionary)
+
+    return summary_dictionary
 
 
 #*******************************************************************************************
  #
- #  Subroutine Name:  read_file_and_calculate_values
+ #  Subroutine Name:  format_change_statistics_lines
  #
  #  Subroutine Description:
- #      This subroutine reads an input csv file and calculates the summary values
- #      for the program output.
+ #      This function returns the report sections for the change statistics in the 
+ #      summary dictionary: one section per list of top changes, with one line per 
+ #      change, and one section per rolling window, with its latest, highest, and 
+ #      lowest average.
  #
  #  Subroutine Parameters:
  #
- #  Type    Name            Description
- #  -----   -------------   ----------------------------------------------
- #  n/a     n/a             n/a
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  dictionary  summary_dictionary      the summary dictionary
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
- #  7/30/2023           Initial Development                         Nicholas J. George
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Importable analysis API                     Nicholas J. George
  #
  #******************************************************************************************/
 
-def read_file_and_calculate_values():
-
-    # These variables contain the current and last profit/loss values 
-    # as the program moves down the rows of input data.
-    last_profit_loss_integer = 0
-
-
-    # These variables contain the change in profit/loss pertaining to the current 
-    # and last values versus the net change in profit/loss.
-    current_changes_profit_loss_integer = 0
-
-    net_changes_profit_loss_integer = 0
-
-
-    #This line of code opens the csv file and returns a file object.
-    with open(CONSTANT_INPUT_FILE_NAME) as csv_file:
-
-        # This line of code reads the data from the file object and assigns 
-        # it to a reader object.
-        csv_reader = csv.reader(csv_file)
-
-        # This repetition loop moves down the rows of data and calculates the values 
-        # for the summary.
-        for csv_index, csv_record in enumerate(csv_reader):
-
-            # If the row index is equal to zero, the program takes no action because the first 
-            # row of data is the header information.
-            
-            # If the row index is greater than one, these lines of code calculate the changes 
-            # in profit/loss and update summary dictionary variables for the net total 
-            # profit/loss, net total change in profit/loss, and dates and names for the
-            # greatest increase and greatest decrease in profit/loss.
-            if csv_index > 1: 
-
-                # This line of code takes the current profit/loss value from the row of data 
-                # and assigns it to a variable.
-                current_profit_loss_integer \
-                    = int \
-                        (csv_record \
-                            [data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value])
-
-                # This line of code adds the current profit/loss to the summary dictionary
-                # value for the net total profit/loss .
-                summary_dictionary \
-                    [list(summary_dictionary.keys())[dictionary_indices_enumeration.TOTAL.value]] \
-                        += current_profit_loss_integer
-
-
-                # This line of code calculates the change in profit/loss and assigns it
-                # to a variable.
-                current_changes_profit_loss_integer \
-                    = current_profit_loss_integer - last_profit_loss_integer
-
-                # This line of code adds the current change in profit/loss to the net total 
-                # change in profit/loss.
-                net_changes_profit_loss_integer += current_changes_profit_loss_integer
-
-
-                # This line of code assigns the current profit/loss value to the variable 
-                # for the last profit/loss value for processing the next row.
-                last_profit_loss_integer = current_profit_loss_integer
-
-
-                # These lines of code check to see if the current increase in profit/loss 
-                # is the greatest increase.  If it is, the program assigns the date and
-                # value in the row of data to the appropriate summary dictionary variables.
-                if current_changes_profit_loss_integer \
-                   > summary_dictionary \
-                        [list \
-                            (summary_dictionary.keys()) \
-                                    [dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value]] \
-                        [list \
-                            (list \
-                                (summary_dictionary.items()) \
-                                        [dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value] \
-                                        [dictionary_indices_enumeration.NESTED_DATA.value].keys()) \
-                                [dictionary_indices_enumeration.VALUE.value]]:
-
-                    summary_dictionary \
-                        [list \
-                            (summary_dictionary.keys()) \
-                                [dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value]] \
-                                    [list \
-                                        (list \
-                                            (summary_dictionary.items()) \
-                                                [dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value] \
-                                                [dictionary_indices_enumeration.NESTED_DATA.value].keys()) \
-                                        [dictionary_indices_enumeration.DATE.value]] \
-                            = csv_record[data_column_indices_enumeration.DATE_COLUMN_INDEX.value]
-
-                    summary_dictionary \
-                        [list \
-                            (summary_dictionary.keys()) \
-                                [dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value]] \
-                                    [list \
-                                        (list \
-                                            (summary_dictionary.items()) \
-                                                [dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value] \
-                                                [dictionary_indices_enumeration.NESTED_DATA.value].keys()) \
-                                        [dictionary_indices_enumeration.VALUE.value]] \
-                            = current_changes_profit_loss_integer
-
-
-                # These lines of code check to see if the current decrease in profit/loss 
-                # is the greatest decrease.  If it is, the program assigns the date and
-                # value to the appropriate summary dictionary variables.
-                if current_changes_profit_loss_integer \
-                    < summary_dictionary \
-                        [list \
-                            (summary_dictionary.keys()) \
-                                [dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value]] \
-                                    [list \
-                                        (list \
-                                            (summary_dictionary.items()) \
-                                                [dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value] \
-                                                [dictionary_indices_enumeration.NESTED_DATA.value].keys()) \
-                                            [dictionary_indices_enumeration.VALUE.value]]:
-                    
-                    summary_dictionary \
-                        [list \
-                            (summary_dictionary.keys()) \
-                                [dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value]] \
-                                    [list \
-                                        (list \
-                                            (summary_dictionary.items()) \
-                                                [dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value] \
-                                                [dictionary_indices_enumeration.NESTED_DATA.value].keys()) \
-                                            [dictionary_indices_enumeration.DATE.value]] \
-                            = csv_record[data_column_indices_enumeration.DATE_COLUMN_INDEX.value]
-                    
-                    summary_dictionary \
-                        [list \
-                            (summary_dictionary.keys()) \
-                                [dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value]] \
-                                    [list \
-                                        (list \
-                                            (summary_dictionary.items()) \
-                                                [dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value] \
-                                                [dictionary_indices_enumeration.NESTED_DATA.value].keys()) \
-                                            [dictionary_indices_enumeration.VALUE.value]] \
-                            = current_changes_profit_loss_integer
-
-
-            # If the row index is equal to one, the program is looking at the first row 
-            # of data, and there is change in profit/loss to calculate.
-            elif csv_index == 1:
-
-                # This line of code assigns the current profit/loss value in the data 
-                # to the variable for the last profit/loss value, so the program can 
-                # use it in the next iteration.
-                last_profit_loss_integer \
-                    = int(csv_record[data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value])
-                
-
-                # This line of code initializes the summary dictionary variable for net 
-                # total profit/loss with the current protfit/loss value in the data.
-                summary_dictionary \
-                    [list(summary_dictionary.keys())[dictionary_indices_enumeration.TOTAL.value]] \
-                        = last_profit_loss_integer
-    
-    
-    # This line of code assigns the row index in the iteration loop to the summary dictionary variable for the total 
-    # number of months.
-    summary_dictionary \
-        [list(summary_dictionary.keys())[dictionary_indices_enumeration.TOTAL_RECORDS.value]] \
-            = csv_index
+def format_change_statistics_lines(summary_dictionary):
 
+    change_statistics_dictionary \
+        = summary_dictionary \
+            [list(summary_dictionary.keys())[dictionary_indices_enumeration.CHANGE_STATISTICS.value]]
 
-    # This line of code calculates the average change in profit/loss by taking the net changes in profit/loss 
-    # and dividing it by the number of months minus one, because changes in profit/loss do not start until the 
-    # second month when there is both a current and last value available.
-    summary_dictionary \
-        [list(summary_dictionary.keys())[dictionary_indices_enumeration.AVERAGE_CHANGE.value]] \
-            = round \
-                (float \
-                    (net_changes_profit_loss_integer) \
-                 / float \
-                        (summary_dictionary \
-                            [list(summary_dictionary.keys()) \
-                                    [dictionary_indices_enumeration.TOTAL_RECORDS.value]] - 1), 2)
+    section_lines_list = []
+
+    if change_statistics_dictionary['Top Count'] > 0:
+
+        for top_changes_key_string, section_title_string \
+            in (('Top Increases', 'Increases'), ('Top Decreases', 'Decreases')):
+
+            section_lines_list.append \
+                ('\n'.join \
+                    ([f'Top {change_statistics_dictionary["Top Count"]} {section_title_string} in Profits:'] \
+                     + [f'    {change_rank}. {date_string} ({change_value_integer:,.2f} USD)' \
+                        for change_rank, (date_string, change_value_integer) \
+                        in enumerate(change_statistics_dictionary[top_changes_key_string], 1)]))
+
+
+    for window_size_integer, latest_average_float, highest_tuple, lowest_tuple \
+        in change_statistics_dictionary['Rolling Averages']:
+
+        if latest_average_float is None:
+
+            section_lines_list.append \
+                (f'Rolling {window_size_integer}-Month Average Change: ' \
+                 + f'n/a (fewer than {window_size_integer} changes)')
+
+        else:
+
+            section_lines_list.append \
+                (f'Rolling {window_size_integer}-Month Average Change: {latest_average_float:,.2f} USD\n' \
+                 + f'    Highest: {highest_tuple[0]} ({highest_tuple[1]:,.2f} USD)\n' \
+                 + f'    Lowest: {lowest_tuple[0]} ({lowest_tuple[1]:,.2f} USD)')
+
+    return section_lines_list
 
 
 #*******************************************************************************************
@@ -283,18 +1004,20 @@ def read_file_and_calculate_values():
  #
  #  Subroutine Parameters:
  #
- #  Type    Name            Description
- #  -----   -------------   ----------------------------------------------
- #  n/a     n/a             n/a
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  dictionary  summary_dictionary      the summary dictionary
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  7/30/2023           Initial Development                         Nicholas J. George
+ #  10/18/2026          Top-k changes and rolling averages          Nicholas J. George
+ #  10/18/2026          Importable analysis API                     Nicholas J. George
  #
  #******************************************************************************************/
 
-def write_data_to_terminal():
+def write_data_to_terminal(summary_dictionary):
 
     print()
 
@@ -333,6 +1056,12 @@ def write_data_to_terminal():
 
     print()
 
+    for section_lines_string in format_change_statistics_lines(summary_dictionary):
+
+        print(section_lines_string)
+
+        print()
+
 
 #*******************************************************************************************
  #
@@ -343,20 +1072,25 @@ def write_data_to_terminal():
  #
  #  Subroutine Parameters:
  #
- #  Type    Name            Description
- #  -----   -------------   ----------------------------------------------
- #  n/a     n/a             n/a
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  dictionary  summary_dictionary      the summary dictionary
+ #  String      output_file_name_string the path of the output text file
+ #                                      (default: CONSTANT_OUTPUT_FILE_NAME)
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  7/30/2023           Initial Development                         Nicholas J. George
+ #  10/18/2026          Output file parameter for batch mode        Nicholas J. George
+ #  10/18/2026          Top-k changes and rolling averages          Nicholas J. George
+ #  10/18/2026          Importable analysis API                     Nicholas J. George
  #
  #******************************************************************************************/
 
-def write_data_to_file():
+def write_data_to_file(summary_dictionary, output_file_name_string = CONSTANT_OUTPUT_FILE_NAME):
 
-    with open(CONSTANT_OUTPUT_FILE_NAME, 'w') as txt_file:
+    with open(output_file_name_string, 'w') as txt_file:
     
         txt_file.write('\n')
 
@@ -393,9 +1127,326 @@ def write_data_to_file():
                       + f'{summary_dictionary[list(summary_dictionary.keys())[dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value]][list(list(summary_dictionary.items())[dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value][dictionary_indices_enumeration.NESTED_DATA.value].keys())[dictionary_indices_enumeration.DATE.value]]} ' \
                       + f'({summary_dictionary[list(summary_dictionary.keys())[dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value]][list(list(summary_dictionary.items())[dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value][dictionary_indices_enumeration.NESTED_DATA.value].keys())[dictionary_indices_enumeration.VALUE.value]]:,.2f} USD)')
 
+        for section_lines_string in format_change_statistics_lines(summary_dictionary):
+
+            txt_file.write('\n\n')
+
+            txt_file.write(section_lines_string)
+
         txt_file.write('\n')
 
 
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  analyze_ledger_file
+ #
+ #  Subroutine Description:
+ #      This function runs in a worker process during batch mode.  It analyzes one 
+ #      budget csv file and writes the file's report.  It
+ #      returns the ledger name, the summary dictionary, and an empty error message, or, 
+ #      if the file cannot be read or analyzed, the ledger name, None, and the error 
+ #      message, so one bad ledger does not stop the batch.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  tuple   ledger_tuple    the ledger name, the input file path, the output file path,
+ #                          the number of top changes, and the rolling window sizes
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Top-k changes and rolling averages          Nicholas J. George
+ #  10/18/2026          Importable analysis API                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def analyze_ledger_file(ledger_tuple):
+
+    ledger_name_string, \
+    input_file_name_string, \
+    output_file_name_string, \
+    top_count_integer, \
+    window_sizes_tuple \
+        = ledger_tuple
+
+    try:
+
+        summary_dictionary \
+            = read_file_and_calculate_values(input_file_name_string, top_count_integer, window_sizes_tuple)
+
+        write_data_to_file(summary_dictionary, output_file_name_string)
+
+    except Exception as error:
+
+        return ledger_name_string, None, f'{type(error).__name__}: {error}'
+
+    return ledger_name_string, summary_dictionary, ''
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_ledger_files
+ #
+ #  Subroutine Description:
+ #      This function returns a list of tuples, one per budget csv file in a directory or
+ #      matching a glob pattern, sorted by path.  Each tuple holds the ledger name, the 
+ #      input file path, and the path of the ledger's report in the output directory.  The
+ #      ledger name is the file's path relative to the folder the files share, without 
+ #      the extension and with path separators replaced by underscores, so ledgers with 
+ #      the same file name in different folders receive different reports.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  batch_path_string           a directory of csv files or a glob pattern
+ #  String  output_directory_string     the folder for the reports
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_ledger_files(batch_path_string, output_directory_string):
+
+    if os.path.isdir(batch_path_string):
+
+        batch_path_string = os.path.join(batch_path_string, '*.csv')
+
+    input_file_names_list \
+        = sorted \
+            (os.path.abspath(file_name_string) \
+             for file_name_string in glob.glob(batch_path_string, recursive = True) \
+             if os.path.isfile(file_name_string))
+
+    if len(input_file_names_list) == 0:
+
+        return []
+
+
+    common_directory_string \
+        = os.path.commonpath \
+            ([os.path.dirname(file_name_string) for file_name_string in input_file_names_list])
+
+    ledger_tuples_list = []
+
+    for input_file_name_string in input_file_names_list:
+
+        ledger_name_string \
+            = os.path.splitext \
+                (os.path.relpath(input_file_name_string, common_directory_string))[0] \
+                    .replace(os.sep, '_')
+
+        ledger_tuples_list.append \
+            ((ledger_name_string, 
+              input_file_name_string, 
+              os.path.join(output_directory_string, ledger_name_string + '.txt')))
+
+    return ledger_tuples_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  format_batch_summary_lines
+ #
+ #  Subroutine Description:
+ #      This function returns the lines of the consolidated summary across all ledgers:
+ #      the number of ledgers, the total records and total profits of all ledgers, the 
+ #      ledger, date, and value of the greatest increase and the greatest decrease in 
+ #      profits, one line per ledger, and the ledgers that could not be analyzed.  Ties 
+ #      go to the first ledger in path order, like the first row within a ledger.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  list    ledger_results_list     the results of analyze_ledger_file in path order
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def format_batch_summary_lines(ledger_results_list):
+
+    summary_keys_list = list(create_summary_dictionary().keys())
+
+    nested_keys_list \
+        = list(create_summary_dictionary() \
+                   [summary_keys_list[dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value]].keys())
+
+    total_records_integer = 0
+
+    total_profit_loss_integer = 0
+
+    # These lists contain the ledger name, date, and value of the greatest increase and 
+    # the greatest decrease in profits across all ledgers.
+    greatest_increase_list = ['', '', 0]
+
+    greatest_decrease_list = ['', '', 0]
+
+    ledger_lines_list = []
+
+    failed_lines_list = []
+
+
+    # This repetition loop adds each ledger's values to the totals, compares its greatest
+    # increase and decrease to the greatest so far, and formats its line of the summary.
+    for ledger_name_string, ledger_summary_dictionary, error_string in ledger_results_list:
+
+        if ledger_summary_dictionary is None:
+
+            failed_lines_list.append(f'{ledger_name_string}: {error_string}')
+
+            continue
+
+        total_records_integer \
+            += ledger_summary_dictionary[summary_keys_list[dictionary_indices_enumeration.TOTAL_RECORDS.value]]
+
+        total_profit_loss_integer \
+            += ledger_summary_dictionary[summary_keys_list[dictionary_indices_enumeration.TOTAL.value]]
+
+        greatest_increase_dictionary \
+            = ledger_summary_dictionary \
+                [summary_keys_list[dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value]]
+
+        greatest_decrease_dictionary \
+            = ledger_summary_dictionary \
+                [summary_keys_list[dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value]]
+
+        if greatest_increase_dictionary[nested_keys_list[dictionary_indices_enumeration.VALUE.value]] \
+            > greatest_increase_list[2]:
+
+            greatest_increase_list \
+                = [ledger_name_string, 
+                   greatest_increase_dictionary[nested_keys_list[dictionary_indices_enumeration.DATE.value]],
+                   greatest_increase_dictionary[nested_keys_list[dictionary_indices_enumeration.VALUE.value]]]
+
+        if greatest_decrease_dictionary[nested_keys_list[dictionary_indices_enumeration.VALUE.value]] \
+            < greatest_decrease_list[2]:
+
+            greatest_decrease_list \
+                = [ledger_name_string, 
+                   greatest_decrease_dictionary[nested_keys_list[dictionary_indices_enumeration.DATE.value]],
+                   greatest_decrease_dictionary[nested_keys_list[dictionary_indices_enumeration.VALUE.value]]]
+
+        ledger_lines_list.append \
+            (f'{ledger_name_string}: ' \
+             + f'{ledger_summary_dictionary[summary_keys_list[dictionary_indices_enumeration.TOTAL_RECORDS.value]]:,} Records, ' \
+             + f'{ledger_summary_dictionary[summary_keys_list[dictionary_indices_enumeration.TOTAL.value]]:,.2f} USD Total, ' \
+             + f'{ledger_summary_dictionary[summary_keys_list[dictionary_indices_enumeration.AVERAGE_CHANGE.value]]:,.2f} USD Average Change')
+
+
+    summary_lines_list \
+        = [CONSTANT_BATCH_OUTPUT_DATA_TITLE,
+           CONSTANT_OUTPUT_DATA_TITLE_LINE,
+           f'Ledgers: {len(ledger_results_list):,}',
+           f'{summary_keys_list[dictionary_indices_enumeration.TOTAL_RECORDS.value]}: {total_records_integer:,}',
+           f'{summary_keys_list[dictionary_indices_enumeration.TOTAL.value]}: {total_profit_loss_integer:,.2f} USD',
+           f'{summary_keys_list[dictionary_indices_enumeration.GREATEST_INCREASE_IN_PROFIT_LOSS.value]}: ' \
+           + f'{greatest_increase_list[0]} {greatest_increase_list[1]} ({greatest_increase_list[2]:,.2f} USD)',
+           f'{summary_keys_list[dictionary_indices_enumeration.GREATEST_DECREASE_IN_PROFIT_LOSS.value]}: ' \
+           + f'{greatest_decrease_list[0]} {greatest_decrease_list[1]} ({greatest_decrease_list[2]:,.2f} USD)',
+           CONSTANT_OUTPUT_DATA_TITLE_LINE] \
+          + ledger_lines_list
+
+    if len(failed_lines_list) > 0:
+
+        summary_lines_list \
+            += [CONSTANT_OUTPUT_DATA_TITLE_LINE, f'Failed Ledgers: {len(failed_lines_list):,}'] \
+               + failed_lines_list
+
+    return summary_lines_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  run_batch_analysis
+ #
+ #  Subroutine Description:
+ #      This subroutine analyzes every budget csv file in a directory or matching a glob
+ #      pattern in one invocation.  A process pool analyzes the files and writes a 
+ #      Financial Analysis report for each of them to the output directory; the 
+ #      subroutine then prints the consolidated summary across all ledgers to the 
+ #      terminal and writes it to batch_summary.txt in the output directory.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  batch_path_string           a directory of csv files or a glob pattern
+ #  String  output_directory_string     the folder for the reports
+ #  int     worker_count_integer        the number of worker processes
+ #  int     top_count_integer           the number of top increases and decreases
+ #  tuple   window_sizes_tuple          the rolling window sizes in months
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Top-k changes and rolling averages          Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def run_batch_analysis \
+        (batch_path_string, 
+         output_directory_string, 
+         worker_count_integer, 
+         top_count_integer = bank_change_statistics.CONSTANT_DEFAULT_TOP_COUNT,
+         window_sizes_tuple = bank_change_statistics.CONSTANT_DEFAULT_WINDOW_SIZES):
+
+    ledger_tuples_list \
+        = [ledger_tuple + (top_count_integer, window_sizes_tuple) \
+           for ledger_tuple in find_ledger_files(batch_path_string, output_directory_string)]
+
+    if len(ledger_tuples_list) == 0:
+
+        raise FileNotFoundError(f'No budget csv files match {batch_path_string}')
+
+    os.makedirs(output_directory_string, exist_ok = True)
+
+
+    # A single worker analyzes the ledgers in this process; otherwise, the pool hands 
+    # each worker a chunk of ledgers at a time, since most ledgers are small.
+    worker_count_integer = max(1, min(worker_count_integer, len(ledger_tuples_list)))
+
+    if worker_count_integer == 1:
+
+        ledger_results_list = [analyze_ledger_file(ledger_tuple) for ledger_tuple in ledger_tuples_list]
+
+    else:
+
+        with multiprocessing.Pool(worker_count_integer) as process_pool:
+
+            ledger_results_list \
+                = process_pool.map \
+                    (analyze_ledger_file, 
+                     ledger_tuples_list, 
+                     max(1, len(ledger_tuples_list) // (worker_count_integer * 4)))
+
+
+    summary_lines_list = format_batch_summary_lines(ledger_results_list)
+
+    print()
+
+    with open(os.path.join(output_directory_string, CONSTANT_BATCH_SUMMARY_FILE_NAME), 'w') as txt_file:
+
+        for summary_line_string in summary_lines_list:
+
+            print(summary_line_string)
+
+            print()
+
+            txt_file.write(summary_line_string + '\n\n')
+
+
 #*******************************************************************************************
  #
  #  Subroutine Name: n/a
@@ -413,18 +1464,153 @@ def write_data_to_file():
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  7/30/2023           Initial Development                         Nicholas J. George
+ #  10/18/2026          Batch mode for many ledgers                 Nicholas J. George
+ #  10/18/2026          Top-k changes and rolling averages          Nicholas J. George
+ #  10/18/2026          Date-range queries from an index            Nicholas J. George
+ #  10/18/2026          Shared streaming aggregation core           Nicholas J. George
+ #  10/18/2026          Importable analysis API                     Nicholas J. George
  #
  #******************************************************************************************/
 
-summary_dictionary \
-     = {'Total Records': 0,
-        'Total Profits': 0,
-        'Average Change': 0.0,
-        'Greatest Increase in Profits': {'Date': '', 'Value': 0 },
-        'Greatest Decrease in Profits': {'Date': '', 'Value': 0 }}
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(description = 'Summarize the budget data.')
+
+    argument_parser.add_argument \
+        ('--batch', metavar = 'PATH', 
+         help = 'a directory or glob pattern of budget csv files to analyze in one run')
+
+    argument_parser.add_argument \
+        ('--output-dir', default = CONSTANT_BATCH_OUTPUT_DIRECTORY_NAME, 
+         help = 'the folder for the batch reports and the consolidated summary')
+
+    argument_parser.add_argument \
+        ('--workers', type = int, 
+         help = 'the number of worker processes (0: one per CPU; default: one per CPU '
+                'in batch mode and one otherwise)')
+
+    argument_parser.add_argument \
+        ('--top', type = int, default = bank_change_statistics.CONSTANT_DEFAULT_TOP_COUNT, 
+         help = 'the number of top increases and decreases in profits to report (0: none)')
+
+    argument_parser.add_argument \
+        ('--windows', type = int, nargs = '*', default = bank_change_statistics.CONSTANT_DEFAULT_WINDOW_SIZES, 
+         help = 'the rolling window sizes in months')
+
+    argument_parser.add_argument \
+        ('--range', nargs = 2, metavar = ('START', 'END'), 
+         help = 'summarize the rows between two dates, inclusive, from the date-range index')
+
+    argument_parser.add_argument \
+        ('--profile', choices = stage_profiling.CONSTANT_REPORT_FORMATS, 
+         help = 'report the timing and memory of each stage to the standard error stream')
+
+    argument_parser.add_argument \
+        ('--profile-dump', metavar = 'FILE', 
+         help = 'with --profile, also save a cProfile dump of the run to FILE')
+
+    argument_parser.add_argument \
+        ('--no-cache', action = 'store_true', 
+         help = 'analyze the csv file even if the result cache holds its summary')
+
+    argument_parser.add_argument \
+        ('--cache-dir', default = CONSTANT_RESULT_CACHE_DIRECTORY_NAME, 
+         help = 'the folder of the result cache')
+
+    argument_parser.add_argument \
+        ('--cache-size', type = int, 
+         default = result_cache.CONSTANT_RESULT_CACHE_SIZE_LIMIT // (1024 * 1024), 
+         help = 'the size limit of the result cache in MiB')
+
+    arguments_namespace = argument_parser.parse_args()
+
+    window_sizes_tuple = tuple(arguments_namespace.windows)
+
+    if arguments_namespace.top < 0 or min(window_sizes_tuple, default = 1) < 1:
+
+        argument_parser.error('--top must be zero or more and each window size one or more')
+
+    if (arguments_namespace.workers or 0) < 0:
+
+        argument_parser.error('--workers must be zero or more')
+
+    if arguments_namespace.cache_size < 0:
+
+        argument_parser.error('--cache-size must be zero or more')
+
+    if arguments_namespace.profile_dump is not None and arguments_namespace.profile is None:
+
+        argument_parser.error('--profile-dump requires --profile')
+
+    if arguments_namespace.profile is not None:
+
+        stage_profiling.start_profiling \
+            (os.path.basename(__file__), cprofile_boolean = arguments_namespace.profile_dump is not None)
+
+    if arguments_namespace.batch is not None:
+
+        try:
+
+            with stage_profiling.measure_stage('batch'):
+
+                run_batch_analysis \
+                    (arguments_namespace.batch, 
+                     arguments_namespace.output_dir, 
+                     arguments_namespace.workers or os.cpu_count(),
+                     arguments_namespace.top,
+                     window_sizes_tuple)
+
+        except FileNotFoundError as error:
+
+            argument_parser.error(str(error))
+
+    elif arguments_namespace.range is not None:
+
+        try:
+
+            with stage_profiling.measure_stage('range_query'):
+
+                summary_dictionary = read_date_range_and_calculate_values(*arguments_namespace.range)
+
+        except ValueError as error:
+
+            argument_parser.error(str(error))
+
+        with stage_profiling.measure_stage('render_terminal'):
+
+            write_data_to_terminal(summary_dictionary)
+
+    else:
+
+        with stage_profiling.measure_stage('analyze') as analyze_stage:
+
+            summary_dictionary \
+                = read_cached_file_and_calculate_values \
+                    (CONSTANT_INPUT_FILE_NAME, 
+                     arguments_namespace.top, 
+                     window_sizes_tuple,
+                     1 if arguments_namespace.workers is None else arguments_namespace.workers or os.cpu_count(),
+                     None if arguments_namespace.no_cache else arguments_namespace.cache_dir,
+                     arguments_namespace.cache_size * 1024 * 1024)
+
+            analyze_stage.record \
+                (summary_dictionary[list(summary_dictionary.keys())[dictionary_indices_enumeration.TOTAL_RECORDS.value]],
+                 os.path.getsize(CONSTANT_INPUT_FILE_NAME))
+
+        for shard_notice_string in streaming_aggregation.take_shard_notices():
+
+            print(shard_notice_string, file = sys.stderr)
+
+        with stage_profiling.measure_stage('render_terminal'):
+
+            write_data_to_terminal(summary_dictionary)
+
+        with stage_profiling.measure_stage('render_file'):
 
-read_file_and_calculate_values()
+            write_data_to_file(summary_dictionary)
 
-write_data_to_terminal()
+    if arguments_namespace.profile is not None:
 
-write_data_to_file()
+        print \
+            (stage_profiling.stop_profiling(arguments_namespace.profile, arguments_namespace.profile_dump),
+             end = '', file = sys.stderr)
@@ -0,0 +1,408 @@
+#*******************************************************************************************
+ #
+ #  File Name:  bank_numpy_backend.py
+ #
+ #  File Description:
+ #      This module is an optional NumPy backend for the budget analysis in
+ #      bank_main.py.  It reads the budget csv file's raw bytes, finds the Date and
+ #      Profit/Losses columns of every row with vectorized searches, converts the
+ #      profit/loss digits to a 64-bit integer array without Python code per row, and
+ #      calculates the summary values with sum, diff, argmax, and argmin.  It also
+ #      calculates the top-k changes with partition and the rolling averages with
+ #      cumsum.  Only the dates the summary needs are decoded.  If NumPy is not installed, the module
+ #      reports that the backend is unavailable and bank_main.py uses the csv module.
+ #      The digits are converted by parse_integer_fields in the schema parser, which 
+ #      converts the profit/loss column of each block the same way.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      is_numpy_backend_selected
+ #      find_top_change_indices
+ #      calculate_change_statistics_numpy
+ #      calculate_budget_summary_numpy
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Top-k changes and rolling averages      Nicholas J. George
+ #  10/18/2026      Schema-specialized csv parser           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import locale
+import os
+import sys
+
+try:
+
+    import numpy
+
+except ImportError:
+
+    numpy = None
+
+
+# This line of code adds the shared folder to the module search path, so the backend can
+# import the schema parser's integer conversion.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+
+import schema_parser
+
+
+# This constant is the smallest input file size, in bytes, for which the program selects
+# the NumPy backend automatically.
+CONSTANT_NUMPY_SIZE_THRESHOLD = 32 * 1024 * 1024
+
+
+# These constants are the byte values of the characters the backend searches for.
+CONSTANT_NEWLINE_BYTE = ord('\n')
+
+CONSTANT_CARRIAGE_RETURN_BYTE = ord('\r')
+
+CONSTANT_COMMA_BYTE = ord(',')
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  is_numpy_backend_selected
+ #
+ #  Subroutine Description:
+ #      This function returns True if NumPy is installed and the input file is at least
+ #      as large as the size threshold.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the input csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def is_numpy_backend_selected(input_file_name_string):
+
+    return numpy is not None \
+           and os.path.getsize(input_file_name_string) >= CONSTANT_NUMPY_SIZE_THRESHOLD
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_top_change_indices
+ #
+ #  Subroutine Description:
+ #      This function returns the indices of the k changes with the largest positive
+ #      keys, plus every change tied with the k-th largest key, from the largest key to
+ #      the smallest, with equal keys in row order.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  array   keys_array          the key of each change
+ #  int     top_count_integer   the number of top changes
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_top_change_indices(keys_array, top_count_integer):
+
+    candidate_indices_array = numpy.flatnonzero(keys_array > 0)
+
+    candidate_keys_array = keys_array[candidate_indices_array]
+
+    if len(candidate_keys_array) > top_count_integer:
+
+        threshold_integer \
+            = numpy.partition \
+                (candidate_keys_array, len(candidate_keys_array) - top_count_integer) \
+                    [len(candidate_keys_array) - top_count_integer]
+
+        candidate_indices_array = candidate_indices_array[candidate_keys_array >= threshold_integer]
+
+        candidate_keys_array = keys_array[candidate_indices_array]
+
+    return candidate_indices_array[numpy.lexsort((candidate_indices_array, -candidate_keys_array))]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_change_statistics_numpy
+ #
+ #  Subroutine Description:
+ #      This function calculates the same change statistics as bank_change_statistics.py
+ #      from the array of changes.  It returns them in the same form, except that each 
+ #      date is the index of the change, which the caller decodes.  Each rolling sum is 
+ #      the difference of two cumulative sums, so the averages are bit-identical to the 
+ #      running sums of the streaming calculation.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  array   changes_array       the changes in profit/loss
+ #  int     top_count_integer   the number of top increases and decreases
+ #  tuple   window_sizes_tuple  the rolling window sizes in months
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_change_statistics_numpy(changes_array, top_count_integer, window_sizes_tuple):
+
+    if top_count_integer > 0:
+
+        top_increase_indices_array = find_top_change_indices(changes_array, top_count_integer)
+
+        top_decrease_indices_array = find_top_change_indices(-changes_array, top_count_integer)
+
+    else:
+
+        top_increase_indices_array = top_decrease_indices_array = numpy.zeros(0, dtype = numpy.int64)
+
+
+    cumulative_sums_array = numpy.concatenate(([0], numpy.cumsum(changes_array)))
+
+    rolling_averages_list = []
+
+    for window_size_integer in window_sizes_tuple:
+
+        if len(changes_array) < window_size_integer:
+
+            rolling_averages_list.append((window_size_integer, None, None, None))
+
+            continue
+
+        # The window that ends at each change starts window_size_integer - 1 changes earlier.
+        averages_array \
+            = (cumulative_sums_array[window_size_integer:] \
+               - cumulative_sums_array[:-window_size_integer]) / window_size_integer
+
+        highest_index = int(numpy.argmax(averages_array))
+
+        lowest_index = int(numpy.argmin(averages_array))
+
+        rolling_averages_list.append \
+            ((window_size_integer,
+              float(averages_array[-1]),
+              (highest_index + window_size_integer - 1, float(averages_array[highest_index])),
+              (lowest_index + window_size_integer - 1, float(averages_array[lowest_index]))))
+
+
+    return {'Top Count': top_count_integer,
+            'Top Increases': [(int(change_index), int(changes_array[change_index])) \
+                              for change_index in top_increase_indices_array],
+            'Top Decreases': [(int(change_index), int(changes_array[change_index])) \
+                              for change_index in top_decrease_indices_array],
+            'Rolling Averages': rolling_averages_list}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_budget_summary_numpy
+ #
+ #  Subroutine Description:
+ #      This function calculates the budget summary values with the NumPy backend.  It
+ #      returns the total number of records, the net total profit/loss, the average
+ #      change, and the date and value of the greatest increase and of the greatest
+ #      decrease, with the same values and the same first-occurrence rule for ties as
+ #      the repetition loop in bank_main.py, followed by the change statistics.  It 
+ #      returns None if NumPy is not installed
+ #      or the file has fewer than two records, a quoted field, or a row the backend
+ #      cannot read, in which case the caller uses the csv module.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the input csv file
+ #  int     date_index_integer          the index of the Date column
+ #  int     profit_loss_index_integer   the index of the Profit/Losses column
+ #  int     top_count_integer           the number of top increases and decreases
+ #  tuple   window_sizes_tuple          the rolling window sizes in months
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Top-k changes and rolling averages          Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_budget_summary_numpy \
+        (input_file_name_string, 
+         date_index_integer, 
+         profit_loss_index_integer, 
+         top_count_integer = 0, 
+         window_sizes_tuple = ()):
+
+    if numpy is None:
+
+        return None
+
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        binary_file.readline()
+
+        file_bytes = binary_file.read()
+
+    # A quotation mark means a field may hold a comma or a line break, which only the csv
+    # module reads correctly.
+    if b'"' in file_bytes:
+
+        return None
+
+    if file_bytes and not file_bytes.endswith(b'\n'):
+
+        file_bytes += b'\n'
+
+
+    block_array = numpy.frombuffer(file_bytes, dtype = numpy.uint8)
+
+    row_ends_array = numpy.flatnonzero(block_array == CONSTANT_NEWLINE_BYTE)
+
+    # The backend handles only files with at least two records and no blank lines.
+    if len(row_ends_array) < 2:
+
+        return None
+
+    row_starts_array = numpy.concatenate(([0], row_ends_array[:-1] + 1))
+
+    if numpy.any(row_ends_array == row_starts_array):
+
+        return None
+
+    # A carriage return before a line break is not part of the last column.
+    row_ends_array \
+        = row_ends_array \
+          - (block_array[row_ends_array - 1] == CONSTANT_CARRIAGE_RETURN_BYTE)
+
+
+    # These lines of code find the start and end of every column in every row; each row
+    # must have the same number of columns.
+    comma_positions_array = numpy.flatnonzero(block_array == CONSTANT_COMMA_BYTE)
+
+    column_count_integer = len(comma_positions_array) // len(row_ends_array) + 1
+
+    if len(comma_positions_array) != (column_count_integer - 1) * len(row_ends_array) \
+        or max(date_index_integer, profit_loss_index_integer) >= column_count_integer:
+
+        return None
+
+    separators_array = comma_positions_array.reshape(len(row_ends_array), column_count_integer - 1)
+
+    if column_count_integer > 1 \
+        and (numpy.any(separators_array[:, 0] < row_starts_array) \
+             or numpy.any(separators_array[:, -1] >= row_ends_array)):
+
+        return None
+
+    column_starts_array = numpy.column_stack((row_starts_array, separators_array + 1))
+
+    column_ends_array = numpy.column_stack((separators_array, row_ends_array))
+
+
+    profit_losses_array \
+        = schema_parser.parse_integer_fields \
+            (block_array,
+             column_starts_array[:, profit_loss_index_integer],
+             column_ends_array[:, profit_loss_index_integer])
+
+    if profit_losses_array is None:
+
+        return None
+
+
+    # These lines of code calculate the summary values from the profit/loss array and its
+    # changes; argmax and argmin return the first occurrence, like the strict comparisons
+    # in the repetition loop, and a change must beat zero to count.
+    changes_array = numpy.diff(profit_losses_array)
+
+    total_records_integer = len(profit_losses_array)
+
+    total_profit_loss_integer = int(profit_losses_array.sum())
+
+    average_change_float \
+        = round(float(int(changes_array.sum())) / float(total_records_integer - 1), 2)
+
+    encoding_string = locale.getpreferredencoding(False)
+
+    date_starts_array = column_starts_array[:, date_index_integer]
+
+    date_ends_array = column_ends_array[:, date_index_integer]
+
+    extreme_changes_list = []
+
+    for change_index, comparison_sign_integer \
+        in ((int(numpy.argmax(changes_array)), 1), (int(numpy.argmin(changes_array)), -1)):
+
+        change_value_integer = int(changes_array[change_index])
+
+        if change_value_integer * comparison_sign_integer > 0:
+
+            row_index = change_index + 1
+
+            extreme_changes_list.append \
+                ((file_bytes[date_starts_array[row_index]:date_ends_array[row_index]].decode(encoding_string),
+                  change_value_integer))
+
+        else:
+
+            extreme_changes_list.append(('', 0))
+
+
+
+    # These lines of code calculate the change statistics and replace each change index
+    # with the date of its row, the row after the first row.
+    change_statistics_dictionary \
+        = calculate_change_statistics_numpy(changes_array, top_count_integer, window_sizes_tuple)
+
+    for top_changes_key_string in ('Top Increases', 'Top Decreases'):
+
+        change_statistics_dictionary[top_changes_key_string] \
+            = [(file_bytes[date_starts_array[change_index + 1]:date_ends_array[change_index + 1]] \
+                    .decode(encoding_string), 
+                change_value_integer) \
+               for change_index, change_value_integer in change_statistics_dictionary[top_changes_key_string]]
+
+    rolling_averages_list = []
+
+    for window_size_integer, latest_average_float, highest_tuple, lowest_tuple \
+        in change_statistics_dictionary['Rolling Averages']:
+
+        if latest_average_float is not None:
+
+            highest_tuple \
+                = (file_bytes[date_starts_array[highest_tuple[0] + 1]:date_ends_array[highest_tuple[0] + 1]] \
+                       .decode(encoding_string), 
+                   highest_tuple[1])
+
+            lowest_tuple \
+                = (file_bytes[date_starts_array[lowest_tuple[0] + 1]:date_ends_array[lowest_tuple[0] + 1]] \
+                       .decode(encoding_string), 
+                   lowest_tuple[1])
+
+        rolling_averages_list.append((window_size_integer, latest_average_float, highest_tuple, lowest_tuple))
+
+    change_statistics_dictionary['Rolling Averages'] = rolling_averages_list
+
+
+    return total_records_integer, \
+           total_profit_loss_integer, \
+           average_change_float, \
+           extreme_changes_list[0], \
+           extreme_changes_list[1], \
+           change_statistics_dictionary
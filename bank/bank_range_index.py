@@ -0,0 +1,691 @@
+#*******************************************************************************************
+ #
+ #  File Name:  bank_range_index.py
+ #
+ #  File Description:
+ #      This module builds a date-range index for a budget csv file and answers
+ #      date-range questions from it without reading the csv file again.  The index
+ #      holds the Profit/Losses values, their prefix sums, and two sparse tables over
+ #      the change in profit/loss series, one for the greatest increase and one for the
+ #      greatest decrease in any range.  After the O(n log n) build, the net total
+ #      profit/loss, the average change, and the greatest increase and decrease between
+ #      any two dates each take O(1) time.  The prefix sums of the change series are
+ #      the values themselves less the first value, so the net change between two
+ #      rows is the difference of their values, and the index stores the values once.
+ #
+ #      The index is persisted next to the csv file, for example budget_data.index for
+ #      budget_data.csv, and is laid out as follows: the magic bytes, the length of the
+ #      header as an unsigned 32-bit little-endian integer, the header as UTF-8 JSON
+ #      padded to a multiple of eight bytes, and then the values, the prefix sums, the
+ #      greatest increase table, the greatest decrease table, and the dates, each at the
+ #      byte offset the header gives.  The header records the csv file's size,
+ #      modification time, and BLAKE2 content digest, so the index is rebuilt when the
+ #      csv file changes.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      get_index_file_name
+ #      calculate_file_digest
+ #      read_index_header
+ #      is_index_valid
+ #      write_sparse_table
+ #      write_range_index
+ #      open_range_index
+ #      close_range_index
+ #      find_range_extreme
+ #      query_date_range
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import array
+import csv
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+
+# These constants identify the index file's format and version.
+CONSTANT_INDEX_MAGIC_BYTES = b'BKRIDX\x00\x01'
+
+CONSTANT_INDEX_VERSION = 1
+
+
+# This constant is the file name extension of the index file.
+CONSTANT_INDEX_FILE_EXTENSION = '.index'
+
+
+# This constant is the number of bytes the module reads at a time for the digest.
+CONSTANT_INDEX_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+# These constants are the typecodes of the arrays that hold the values and prefix sums
+# and the change indices in the sparse tables.
+CONSTANT_VALUE_TYPECODE = 'q'
+
+CONSTANT_NARROW_TABLE_TYPECODE = 'I'
+
+CONSTANT_WIDE_TABLE_TYPECODE = 'Q'
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  get_index_file_name
+ #
+ #  Subroutine Description:
+ #      This function returns the path of the index file next to a budget csv file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def get_index_file_name(input_file_name_string):
+
+    return os.path.splitext(input_file_name_string)[0] + CONSTANT_INDEX_FILE_EXTENSION
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_file_digest
+ #
+ #  Subroutine Description:
+ #      This function returns the hexadecimal BLAKE2 digest of a file's contents.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_file_digest(input_file_name_string):
+
+    digest_object = hashlib.blake2b(digest_size = 20)
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        for block_bytes in iter(lambda: binary_file.read(CONSTANT_INDEX_BLOCK_SIZE), b''):
+
+            digest_object.update(block_bytes)
+
+    return digest_object.hexdigest()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_index_header
+ #
+ #  Subroutine Description:
+ #      This function returns the index file's header dictionary and the byte offset
+ #      where its data begins, or None if the file is missing or is not an index file
+ #      of this version and byte order.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  index_file_name_string  the path of the index file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_index_header(index_file_name_string):
+
+    try:
+
+        with open(index_file_name_string, 'rb') as binary_file:
+
+            if binary_file.read(len(CONSTANT_INDEX_MAGIC_BYTES)) != CONSTANT_INDEX_MAGIC_BYTES:
+
+                return None
+
+            header_length_integer, = struct.unpack('<I', binary_file.read(4))
+
+            header_dictionary = json.loads(binary_file.read(header_length_integer).decode('utf-8'))
+
+    except (OSError, ValueError, struct.error):
+
+        return None
+
+
+    if header_dictionary.get('version') != CONSTANT_INDEX_VERSION \
+        or header_dictionary.get('byte_order') != sys.byteorder:
+
+        return None
+
+    return header_dictionary, len(CONSTANT_INDEX_MAGIC_BYTES) + 4 + header_length_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  is_index_valid
+ #
+ #  Subroutine Description:
+ #      This function returns True if the index header describes the current contents
+ #      of the csv file.  A matching size and modification time are enough; if only the
+ #      modification time differs, for example after a copy, the function compares the
+ #      content digests instead.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  String      input_file_name_string  the path of the csv file
+ #  dictionary  header_dictionary       the index file's header
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def is_index_valid(input_file_name_string, header_dictionary):
+
+    try:
+
+        file_status = os.stat(input_file_name_string)
+
+    except OSError:
+
+        return False
+
+
+    if file_status.st_size != header_dictionary['source_size']:
+
+        return False
+
+    if file_status.st_mtime_ns == header_dictionary['source_mtime_ns']:
+
+        return True
+
+    return calculate_file_digest(input_file_name_string) == header_dictionary['source_digest']
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_sparse_table
+ #
+ #  Subroutine Description:
+ #      This subroutine writes a sparse table over the change series to the index file,
+ #      one level at a time.  Level j holds, for every change, the index of the extreme
+ #      change among it and the next 2^j - 1 changes; each level combines two windows of
+ #      the level below, and on a tie the earlier change wins, so a query returns the
+ #      first occurrence like the repetition loop in bank_main.py.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  index_file              the index file open for writing
+ #  list    changes_list            the changes in profit/loss
+ #  int     level_count_integer     the number of levels
+ #  String  typecode_string         the array typecode of the change indices
+ #  bool    greatest_boolean        True for the greatest increase, False for the
+ #                                  greatest decrease
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_sparse_table \
+        (index_file, changes_list, level_count_integer, typecode_string, greatest_boolean):
+
+    level_indices_list = list(range(len(changes_list)))
+
+    for level_index in range(level_count_integer):
+
+        if level_index > 0:
+
+            half_width_integer = 1 << (level_index - 1)
+
+            if greatest_boolean:
+
+                level_indices_list \
+                    = [left_index if changes_list[left_index] >= changes_list[right_index] else right_index \
+                       for left_index, right_index \
+                       in zip(level_indices_list, level_indices_list[half_width_integer:])]
+
+            else:
+
+                level_indices_list \
+                    = [left_index if changes_list[left_index] <= changes_list[right_index] else right_index \
+                       for left_index, right_index \
+                       in zip(level_indices_list, level_indices_list[half_width_integer:])]
+
+        array.array(typecode_string, level_indices_list).tofile(index_file)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_range_index
+ #
+ #  Subroutine Description:
+ #      This subroutine reads a budget csv file once and writes its date-range index.
+ #      It writes the index to a temporary file and renames it into place, so a reader
+ #      never sees a partial file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the csv file
+ #  String  index_file_name_string      the path of the index file
+ #  int     date_index_integer          the index of the Date column
+ #  int     profit_loss_index_integer   the index of the Profit/Losses column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_range_index \
+        (input_file_name_string,
+         index_file_name_string,
+         date_index_integer,
+         profit_loss_index_integer):
+
+    source_status = os.stat(input_file_name_string)
+
+    source_digest_string = calculate_file_digest(input_file_name_string)
+
+    dates_list = []
+
+    values_array = array.array(CONSTANT_VALUE_TYPECODE)
+
+    with open(input_file_name_string) as csv_file:
+
+        csv_reader = csv.reader(csv_file)
+
+        next(csv_reader, None)
+
+        for csv_record in csv_reader:
+
+            dates_list.append(csv_record[date_index_integer])
+
+            values_array.append(int(csv_record[profit_loss_index_integer]))
+
+
+    # These lines of code calculate the prefix sums of the values and the change series.
+    prefix_sums_array = array.array(CONSTANT_VALUE_TYPECODE, [0])
+
+    for value_integer in values_array:
+
+        prefix_sums_array.append(prefix_sums_array[-1] + value_integer)
+
+    changes_list \
+        = [current_value_integer - last_value_integer \
+           for last_value_integer, current_value_integer in zip(values_array, values_array[1:])]
+
+    level_count_integer = len(changes_list).bit_length()
+
+    table_typecode_string \
+        = CONSTANT_NARROW_TABLE_TYPECODE if len(changes_list) <= 0xFFFFFFFF \
+            else CONSTANT_WIDE_TABLE_TYPECODE
+
+
+    # These lines of code calculate the byte offset of each section from the start of the
+    # data; the sections hold 8-byte values first, so every section stays aligned.
+    value_size_integer = array.array(CONSTANT_VALUE_TYPECODE).itemsize
+
+    table_size_integer \
+        = array.array(table_typecode_string).itemsize \
+          * sum(len(changes_list) - (1 << level_index) + 1 for level_index in range(level_count_integer))
+
+    values_offset_integer = 0
+
+    prefix_sums_offset_integer = values_offset_integer + len(values_array) * value_size_integer
+
+    increase_table_offset_integer = prefix_sums_offset_integer + len(prefix_sums_array) * value_size_integer
+
+    decrease_table_offset_integer = increase_table_offset_integer + table_size_integer
+
+    dates_offset_integer = decrease_table_offset_integer + table_size_integer
+
+    header_dictionary \
+        = {'version': CONSTANT_INDEX_VERSION,
+           'source_size': source_status.st_size,
+           'source_mtime_ns': source_status.st_mtime_ns,
+           'source_digest': source_digest_string,
+           'byte_order': sys.byteorder,
+           'record_count': len(values_array),
+           'level_count': level_count_integer,
+           'table_typecode': table_typecode_string,
+           'values_offset': values_offset_integer,
+           'prefix_sums_offset': prefix_sums_offset_integer,
+           'increase_table_offset': increase_table_offset_integer,
+           'decrease_table_offset': decrease_table_offset_integer,
+           'dates_offset': dates_offset_integer}
+
+    header_bytes = json.dumps(header_dictionary).encode('utf-8')
+
+    # JSON allows trailing spaces, so the header is padded to keep the data aligned.
+    header_bytes \
+        += b' ' * (-(len(CONSTANT_INDEX_MAGIC_BYTES) + 4 + len(header_bytes)) % value_size_integer)
+
+
+    temporary_index_file_name_string = index_file_name_string + '.tmp'
+
+    with open(temporary_index_file_name_string, 'wb') as index_file:
+
+        index_file.write(CONSTANT_INDEX_MAGIC_BYTES)
+
+        index_file.write(struct.pack('<I', len(header_bytes)))
+
+        index_file.write(header_bytes)
+
+        values_array.tofile(index_file)
+
+        prefix_sums_array.tofile(index_file)
+
+        write_sparse_table(index_file, changes_list, level_count_integer, table_typecode_string, True)
+
+        write_sparse_table(index_file, changes_list, level_count_integer, table_typecode_string, False)
+
+        index_file.write(json.dumps(dates_list).encode('utf-8'))
+
+    os.replace(temporary_index_file_name_string, index_file_name_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  open_range_index
+ #
+ #  Subroutine Description:
+ #      This function opens the date-range index of a budget csv file, first building
+ #      it if it is missing or the csv file has changed.  It maps the index file into
+ #      memory, so only the entries a query reads are loaded, and returns a dictionary
+ #      with the header, the arrays, the dates, and the first and last row of each date.  The
+ #      caller passes the dictionary to query_date_range and then to close_range_index.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the csv file
+ #  int     date_index_integer          the index of the Date column
+ #  int     profit_loss_index_integer   the index of the Profit/Losses column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def open_range_index(input_file_name_string, date_index_integer, profit_loss_index_integer):
+
+    index_file_name_string = get_index_file_name(input_file_name_string)
+
+    header_tuple = read_index_header(index_file_name_string)
+
+    if header_tuple is None or not is_index_valid(input_file_name_string, header_tuple[0]):
+
+        write_range_index \
+            (input_file_name_string,
+             index_file_name_string,
+             date_index_integer,
+             profit_loss_index_integer)
+
+        header_tuple = read_index_header(index_file_name_string)
+
+    header_dictionary, data_offset_integer = header_tuple
+
+
+    with open(index_file_name_string, 'rb') as binary_file:
+
+        index_mmap = mmap.mmap(binary_file.fileno(), 0, access = mmap.ACCESS_READ)
+
+    index_memoryview = memoryview(index_mmap)
+
+    record_count_integer = header_dictionary['record_count']
+
+    change_count_integer = max(record_count_integer - 1, 0)
+
+
+    # This line of code finds where each level of the sparse tables begins, in entries.
+    level_offsets_list = [0]
+
+    for level_index in range(header_dictionary['level_count']):
+
+        level_offsets_list.append(level_offsets_list[-1] + change_count_integer - (1 << level_index) + 1)
+
+    range_index_dictionary \
+        = {'Header': header_dictionary,
+           'Memory Map': index_mmap,
+           'Level Offsets': level_offsets_list}
+
+    for key_string, offset_key_string, count_integer, typecode_string \
+        in (('Values', 'values_offset', record_count_integer, CONSTANT_VALUE_TYPECODE),
+            ('Prefix Sums', 'prefix_sums_offset', record_count_integer + 1, CONSTANT_VALUE_TYPECODE),
+            ('Increase Table', 'increase_table_offset', level_offsets_list[-1], header_dictionary['table_typecode']),
+            ('Decrease Table', 'decrease_table_offset', level_offsets_list[-1], header_dictionary['table_typecode'])):
+
+        start_integer = data_offset_integer + header_dictionary[offset_key_string]
+
+        end_integer = start_integer + count_integer * array.array(typecode_string).itemsize
+
+        range_index_dictionary[key_string] = index_memoryview[start_integer:end_integer].cast(typecode_string)
+
+
+    # These dictionaries map each date to its first and its last row, so a range starts
+    # at the first row of its start date and ends at the last row of its end date.
+    dates_list = json.loads(bytes(index_memoryview[data_offset_integer + header_dictionary['dates_offset']:]))
+
+    first_rows_dictionary = {}
+
+    last_rows_dictionary = {}
+
+    for row_index, date_string in enumerate(dates_list):
+
+        first_rows_dictionary.setdefault(date_string, row_index)
+
+        last_rows_dictionary[date_string] = row_index
+
+    range_index_dictionary['First Rows'] = first_rows_dictionary
+
+    range_index_dictionary['Last Rows'] = last_rows_dictionary
+
+    range_index_dictionary['Dates'] = dates_list
+
+    return range_index_dictionary
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  close_range_index
+ #
+ #  Subroutine Description:
+ #      This subroutine releases the arrays and the memory map of an open index.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  dictionary  range_index_dictionary      the open index
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def close_range_index(range_index_dictionary):
+
+    for key_string in ('Values', 'Prefix Sums', 'Increase Table', 'Decrease Table'):
+
+        range_index_dictionary.pop(key_string).release()
+
+    range_index_dictionary.pop('Memory Map').close()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_range_extreme
+ #
+ #  Subroutine Description:
+ #      This function returns the index of the greatest or least change among a range
+ #      of changes from two overlapping windows of the sparse table; on a tie, the
+ #      earlier change wins.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  dictionary  range_index_dictionary      the open index
+ #  String      table_key_string            'Increase Table' or 'Decrease Table'
+ #  int         first_change_index          the index of the first change in the range
+ #  int         last_change_index           the index of the last change in the range
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_range_extreme \
+        (range_index_dictionary, table_key_string, first_change_index, last_change_index):
+
+    level_index = (last_change_index - first_change_index + 1).bit_length() - 1
+
+    level_offset_integer = range_index_dictionary['Level Offsets'][level_index]
+
+    sparse_table_memoryview = range_index_dictionary[table_key_string]
+
+    left_change_index = sparse_table_memoryview[level_offset_integer + first_change_index]
+
+    right_change_index \
+        = sparse_table_memoryview[level_offset_integer + last_change_index - (1 << level_index) + 1]
+
+    values_memoryview = range_index_dictionary['Values']
+
+    left_change_integer = values_memoryview[left_change_index + 1] - values_memoryview[left_change_index]
+
+    right_change_integer = values_memoryview[right_change_index + 1] - values_memoryview[right_change_index]
+
+    if table_key_string == 'Increase Table':
+
+        return left_change_index if left_change_integer >= right_change_integer else right_change_index
+
+    return left_change_index if left_change_integer <= right_change_integer else right_change_index
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  query_date_range
+ #
+ #  Subroutine Description:
+ #      This function returns the budget summary for the rows from the first row of the
+ #      start date through the last row of the end date, in the form of the summary
+ #      dictionary in bank_main.py, in O(1) time.  As in the summary of the whole file,
+ #      the first change in the range is between its first and second rows, and an
+ #      increase or decrease must beat zero to count.  A range of one row has no
+ #      changes, so its average change is zero.  The function raises a ValueError if a
+ #      date is not in the file or the end date comes before the start date.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  dictionary  range_index_dictionary      the open index
+ #  String      start_date_string           the first date of the range
+ #  String      end_date_string             the last date of the range
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def query_date_range(range_index_dictionary, start_date_string, end_date_string):
+
+    for date_string in (start_date_string, end_date_string):
+
+        if date_string not in range_index_dictionary['First Rows']:
+
+            raise ValueError(f'The date {date_string} is not in the budget data.')
+
+    first_row_index = range_index_dictionary['First Rows'][start_date_string]
+
+    last_row_index = range_index_dictionary['Last Rows'][end_date_string]
+
+    if last_row_index < first_row_index:
+
+        raise ValueError(f'The date {end_date_string} comes before {start_date_string}.')
+
+
+    values_memoryview = range_index_dictionary['Values']
+
+    prefix_sums_memoryview = range_index_dictionary['Prefix Sums']
+
+    dates_list = range_index_dictionary['Dates']
+
+    row_count_integer = last_row_index - first_row_index + 1
+
+    average_change_float \
+        = round \
+            (float(values_memoryview[last_row_index] - values_memoryview[first_row_index]) \
+             / float(row_count_integer - 1), 2) \
+          if row_count_integer > 1 else 0.0
+
+    extreme_changes_list = []
+
+    for table_key_string, comparison_sign_integer in (('Increase Table', 1), ('Decrease Table', -1)):
+
+        extreme_change_dictionary = {'Date': '', 'Value': 0 }
+
+        if row_count_integer > 1:
+
+            change_index \
+                = find_range_extreme \
+                    (range_index_dictionary, table_key_string, first_row_index, last_row_index - 1)
+
+            change_integer = values_memoryview[change_index + 1] - values_memoryview[change_index]
+
+            if change_integer * comparison_sign_integer > 0:
+
+                extreme_change_dictionary \
+                    = {'Date': dates_list[change_index + 1], 'Value': change_integer}
+
+        extreme_changes_list.append(extreme_change_dictionary)
+
+
+    return {'Total Records': row_count_integer,
+            'Total Profits': prefix_sums_memoryview[last_row_index + 1] - prefix_sums_memoryview[first_row_index],
+            'Average Change': average_change_float,
+            'Greatest Increase in Profits': extreme_changes_list[0],
+            'Greatest Decrease in Profits': extreme_changes_list[1]}
@@ -0,0 +1,822 @@
+#*******************************************************************************************
+ #
+ #  File Name:  benchmark_suite.py
+ #
+ #  File Description:
+ #      This program benchmarks bank_main.py and poll_main.py on deterministic synthetic
+ #      data.  It generates budget ledgers and ballot files of any size, from ten
+ #      thousand to a hundred million rows, with a configurable number of candidates
+ #      and counties, and keeps them in a data folder so later runs reuse them.  For
+ #      each program and size, it times each stage of the analysis: parsing the csv
+ #      rows, aggregating them, finalizing the summary dictionary, and rendering the
+ #      results to the terminal and the output file, and then the whole analysis end
+ #      to end through read_file_and_calculate_values.  Two more stages compare the
+ #      parsers: the csv module's records reduced to the fields the program reads,
+ #      with the integers converted, and the schema parser's columns of those fields.  Each stage runs in its own
+ #      process, so the peak resident set size it reports belongs to that stage and
+ #      the stages it depends on.
+ #
+ #      The program appends the rows per second, wall time, and peak resident set size
+ #      of every stage to a JSON history file.  It compares each stage's throughput
+ #      with the median of the last five runs of the same stage, size, and host that
+ #      did not regress, and it exits with status 1 if any stage is slower by more than
+ #      the threshold.  Stages that take less than a twentieth of a second are recorded
+ #      but not checked.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      get_data_file_name
+ #      generate_budget_file
+ #      generate_ballot_file
+ #      read_peak_memory
+ #      render_summary
+ #      run_benchmark_case
+ #      run_case_process
+ #      read_history
+ #      find_regressions
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Schema-specialized csv parser           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import argparse
+import collections
+import contextlib
+import csv
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# The resource module, which reports the peak resident set size, is not available on
+# every platform; without it, the program records no memory figures.
+try:
+
+    import resource
+
+except ImportError:
+
+    resource = None
+
+
+# These lines of code add the program folders to the module search path, so the
+# benchmark can import both programs.
+CONSTANT_PROGRAM_DIRECTORY_NAME = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.append(os.path.join(CONSTANT_PROGRAM_DIRECTORY_NAME, '..', 'bank'))
+
+sys.path.append(os.path.join(CONSTANT_PROGRAM_DIRECTORY_NAME, '..', 'poll'))
+
+import bank_main
+import poll_main
+import schema_parser
+import streaming_aggregation
+
+
+# These constants are the defaults of the benchmark's size and data.
+CONSTANT_DEFAULT_ROW_COUNTS = (10_000, 100_000, 1_000_000)
+
+CONSTANT_DEFAULT_CANDIDATE_COUNT = 25
+
+CONSTANT_DEFAULT_COUNTY_COUNT = 3
+
+CONSTANT_DEFAULT_SEED = 20231030
+
+CONSTANT_DEFAULT_DATA_DIRECTORY_NAME = os.path.join(tempfile.gettempdir(), 'bank_poll_benchmark')
+
+CONSTANT_DEFAULT_HISTORY_FILE_NAME = os.path.join(CONSTANT_PROGRAM_DIRECTORY_NAME, 'benchmark_history.json')
+
+
+# These constants are the programs and stages the benchmark measures.
+CONSTANT_PROGRAM_NAMES = ('bank', 'poll')
+
+CONSTANT_STAGE_NAMES = ('parse', 'csv_fields', 'schema_parse', 'aggregate', 'finalize', 'render', 'end_to_end')
+
+
+# These constants set the regression check: the default allowed slowdown in percent
+# and the number of earlier runs whose median is the baseline.
+CONSTANT_DEFAULT_THRESHOLD_PERCENT = 10.0
+
+CONSTANT_BASELINE_RUN_COUNT = 5
+
+
+# This constant is the shortest wall time, in seconds, the regression check trusts; a
+# stage that finishes faster is timed but not checked, because its rate is mostly noise.
+CONSTANT_MINIMUM_CHECKED_SECONDS = 0.05
+
+
+# This constant is the number of rows the generators write at a time.
+CONSTANT_GENERATOR_BATCH_SIZE = 100_000
+
+
+# This constant is the list of month abbreviations for the synthetic ledger dates.
+CONSTANT_MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  get_data_file_name
+ #
+ #  Subroutine Description:
+ #      This function returns the path of a synthetic data file in the data folder,
+ #      named for the program and every setting that shapes the file's contents.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  data_directory_string       the data folder
+ #  String  program_name_string         bank or poll
+ #  int     row_count_integer           the number of data rows
+ #  int     candidate_count_integer     the number of candidates
+ #  int     county_count_integer        the number of counties
+ #  int     seed_integer                the seed for the random number generator
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def get_data_file_name \
+        (data_directory_string,
+         program_name_string,
+         row_count_integer,
+         candidate_count_integer,
+         county_count_integer,
+         seed_integer):
+
+    if program_name_string == 'bank':
+
+        return os.path.join(data_directory_string, f'budget_{row_count_integer}_{seed_integer}.csv')
+
+    return os.path.join \
+                (data_directory_string,
+                 f'ballots_{row_count_integer}_{candidate_count_integer}_{county_count_integer}_{seed_integer}.csv')
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  generate_budget_file
+ #
+ #  Subroutine Description:
+ #      This subroutine writes a synthetic budget ledger with consecutive month dates
+ #      and random profits and losses.  It writes a temporary file and renames it, so
+ #      an interrupted run never leaves a partial ledger for a later run to reuse.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  output_file_name_string the path of the ledger
+ #  int     row_count_integer       the number of data rows
+ #  int     seed_integer            the seed for the random number generator
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def generate_budget_file(output_file_name_string, row_count_integer, seed_integer):
+
+    random_generator = random.Random(seed_integer)
+
+    temporary_file_name_string = output_file_name_string + '.tmp'
+
+    with open(temporary_file_name_string, 'w', newline = '') as csv_file:
+
+        csv_writer = csv.writer(csv_file, lineterminator = '\n')
+
+        csv_writer.writerow(['Date', 'Profit/Losses'])
+
+        for batch_start_integer in range(0, row_count_integer, CONSTANT_GENERATOR_BATCH_SIZE):
+
+            csv_writer.writerows \
+                ([f'{CONSTANT_MONTH_NAMES[row_index % 12]}-{10 + row_index // 12}',
+                  random_generator.randint(-1_000_000, 1_000_000)] \
+                 for row_index \
+                     in range(batch_start_integer,
+                              min(row_count_integer, batch_start_integer + CONSTANT_GENERATOR_BATCH_SIZE)))
+
+    os.replace(temporary_file_name_string, output_file_name_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  generate_ballot_file
+ #
+ #  Subroutine Description:
+ #      This subroutine writes a synthetic ballot file with consecutive Ballot IDs,
+ #      counties chosen uniformly, and candidates chosen so the first three receive
+ #      most of the votes and the rest are write-ins.  Like the ledger generator, it
+ #      writes a temporary file and renames it.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  output_file_name_string     the path of the ballot file
+ #  int     row_count_integer           the number of data rows
+ #  int     candidate_count_integer     the number of candidates
+ #  int     county_count_integer        the number of counties
+ #  int     seed_integer                the seed for the random number generator
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def generate_ballot_file \
+        (output_file_name_string,
+         row_count_integer,
+         candidate_count_integer,
+         county_count_integer,
+         seed_integer):
+
+    random_generator = random.Random(seed_integer)
+
+    candidate_names_list \
+        = [f'Candidate {candidate_index:05d}' for candidate_index in range(candidate_count_integer)]
+
+    candidate_weights_list \
+        = [100.0 if candidate_index < 3 else 1.0 for candidate_index in range(candidate_count_integer)]
+
+    county_names_list = [f'County {county_index:04d}' for county_index in range(county_count_integer)]
+
+    temporary_file_name_string = output_file_name_string + '.tmp'
+
+    with open(temporary_file_name_string, 'w', newline = '') as csv_file:
+
+        csv_writer = csv.writer(csv_file, lineterminator = '\n')
+
+        csv_writer.writerow(['Ballot ID', 'County', 'Candidate'])
+
+        for batch_start_integer in range(0, row_count_integer, CONSTANT_GENERATOR_BATCH_SIZE):
+
+            batch_size_integer \
+                = min(CONSTANT_GENERATOR_BATCH_SIZE, row_count_integer - batch_start_integer)
+
+            csv_writer.writerows \
+                (zip(range(1_000_000 + batch_start_integer, 1_000_000 + batch_start_integer + batch_size_integer),
+                     random_generator.choices(county_names_list, k = batch_size_integer),
+                     random_generator.choices \
+                        (candidate_names_list, candidate_weights_list, k = batch_size_integer)))
+
+    os.replace(temporary_file_name_string, output_file_name_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_peak_memory
+ #
+ #  Subroutine Description:
+ #      This function returns the process's peak resident set size in MiB, or None if
+ #      the platform cannot report it.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_peak_memory():
+
+    if resource is None:
+
+        return None
+
+    peak_memory_integer = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports the peak in KiB, and macOS reports it in bytes.
+    if sys.platform == 'darwin':
+
+        return peak_memory_integer / (1024 * 1024)
+
+    return peak_memory_integer / 1024
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  render_summary
+ #
+ #  Subroutine Description:
+ #      This subroutine renders a summary dictionary the way the program does: it
+ #      writes the terminal output into a string buffer and the output file into a
+ #      temporary folder.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  object      program_module          bank_main or poll_main
+ #  dictionary  summary_dictionary      the summary dictionary
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def render_summary(program_module, summary_dictionary):
+
+    with contextlib.redirect_stdout(io.StringIO()):
+
+        program_module.write_data_to_terminal(summary_dictionary)
+
+    with tempfile.TemporaryDirectory() as temporary_directory_string:
+
+        program_module.write_data_to_file \
+            (summary_dictionary, os.path.join(temporary_directory_string, 'analysis.txt'))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  run_benchmark_case
+ #
+ #  Subroutine Description:
+ #      This function runs one stage of one program over a data file, after the stages
+ #      it depends on, and returns the stage's wall time in seconds and the process's
+ #      peak resident set size in MiB.  The parse stage reads every csv record, the
+ #      csv_fields stage also takes the fields the program reads from each record and
+ #      converts the integers, the schema_parse stage parses the same fields into
+ #      columns with the schema parser, the aggregate stage runs the program's 
+ #      aggregators over the file in one pass with the schema parser, the
+ #      finalize stage turns the aggregators into the summary dictionary, the render
+ #      stage writes the terminal and file output, and the end_to_end stage runs
+ #      read_file_and_calculate_values, with whichever fast path it picks, and renders
+ #      the results.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  program_name_string     bank or poll
+ #  String  stage_name_string       the stage to time
+ #  String  input_file_name_string  the path of the data file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def run_benchmark_case(program_name_string, stage_name_string, input_file_name_string):
+
+    program_module = bank_main if program_name_string == 'bank' else poll_main
+
+    if program_name_string == 'bank':
+
+        create_aggregators_function \
+            = lambda: bank_main.create_budget_aggregators \
+                        (bank_main.bank_change_statistics.CONSTANT_DEFAULT_TOP_COUNT,
+                         bank_main.bank_change_statistics.CONSTANT_DEFAULT_WINDOW_SIZES)
+
+        csv_schema_object = bank_main.CONSTANT_BUDGET_CSV_SCHEMA
+
+        # This function takes the date and the profit/loss, as an integer, from a record.
+        select_fields_function = lambda csv_record: (csv_record[0], int(csv_record[1]))
+
+    else:
+
+        create_aggregators_function = poll_main.create_candidate_votes_aggregators
+
+        csv_schema_object = poll_main.CONSTANT_CANDIDATE_CSV_SCHEMA
+
+        # This function takes the candidate from a record.
+        select_fields_function \
+            = lambda csv_record: csv_record[poll_main.data_column_indices_enumeration.CANDIDATE_INDEX.value]
+
+
+    # This function turns the finished aggregators into the program's summary
+    # dictionary.
+    def finalize_aggregators(aggregators_list):
+
+        if program_name_string == 'bank':
+
+            summary_dictionary = bank_main.create_summary_dictionary()
+
+            bank_main.assign_summary_values \
+                (summary_dictionary, aggregators_list[0].finalize() + (aggregators_list[1].finalize(),))
+
+            return summary_dictionary
+
+        return poll_main.calculate_summary_values(*aggregators_list[0].finalize())
+
+
+    if stage_name_string == 'parse':
+
+        start_time_float = time.perf_counter()
+
+        with open(input_file_name_string) as csv_file:
+
+            csv_reader = csv.reader(csv_file)
+
+            next(csv_reader, None)
+
+            collections.deque(csv_reader, maxlen = 0)
+
+        elapsed_seconds_float = time.perf_counter() - start_time_float
+
+    elif stage_name_string == 'csv_fields':
+
+        start_time_float = time.perf_counter()
+
+        with open(input_file_name_string) as csv_file:
+
+            csv_reader = csv.reader(csv_file)
+
+            next(csv_reader, None)
+
+            collections.deque(map(select_fields_function, csv_reader), maxlen = 0)
+
+        elapsed_seconds_float = time.perf_counter() - start_time_float
+
+    elif stage_name_string == 'schema_parse':
+
+        start_time_float = time.perf_counter()
+
+        with open(input_file_name_string) as csv_file:
+
+            csv_file.readline()
+
+            collections.deque \
+                (schema_parser.parse_schema_columns \
+                    (iter(lambda: csv_file.read(schema_parser.CONSTANT_PARSE_BLOCK_SIZE), ''), csv_schema_object),
+                 maxlen = 0)
+
+        elapsed_seconds_float = time.perf_counter() - start_time_float
+
+    elif stage_name_string == 'end_to_end':
+
+        start_time_float = time.perf_counter()
+
+        render_summary(program_module, program_module.read_file_and_calculate_values(input_file_name_string))
+
+        elapsed_seconds_float = time.perf_counter() - start_time_float
+
+    else:
+
+        start_time_float = time.perf_counter()
+
+        aggregators_list \
+            = streaming_aggregation.aggregate_file \
+                (input_file_name_string, create_aggregators_function(), csv_schema_object)
+
+        elapsed_seconds_float = time.perf_counter() - start_time_float
+
+        if stage_name_string != 'aggregate':
+
+            start_time_float = time.perf_counter()
+
+            summary_dictionary = finalize_aggregators(aggregators_list)
+
+            elapsed_seconds_float = time.perf_counter() - start_time_float
+
+            if stage_name_string == 'render':
+
+                start_time_float = time.perf_counter()
+
+                render_summary(program_module, summary_dictionary)
+
+                elapsed_seconds_float = time.perf_counter() - start_time_float
+
+    return elapsed_seconds_float, read_peak_memory()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  run_case_process
+ #
+ #  Subroutine Description:
+ #      This function runs one benchmark case in a new Python process, so the peak
+ #      resident set size starts from nothing, and returns the case's wall time and
+ #      peak resident set size.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  program_name_string     bank or poll
+ #  String  stage_name_string       the stage to time
+ #  String  input_file_name_string  the path of the data file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def run_case_process(program_name_string, stage_name_string, input_file_name_string):
+
+    completed_process \
+        = subprocess.run \
+            ([sys.executable, os.path.abspath(__file__),
+              '--case', program_name_string, stage_name_string, input_file_name_string],
+             stdout = subprocess.PIPE,
+             check = True,
+             text = True)
+
+    case_dictionary = json.loads(completed_process.stdout.strip().splitlines()[-1])
+
+    return case_dictionary['Seconds'], case_dictionary['Peak RSS MiB']
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_history
+ #
+ #  Subroutine Description:
+ #      This function returns the list of runs in the JSON history file, or an empty
+ #      list if the file does not exist yet.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  history_file_name_string    the path of the history file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_history(history_file_name_string):
+
+    if not os.path.exists(history_file_name_string):
+
+        return []
+
+    with open(history_file_name_string, encoding = 'utf-8') as history_file:
+
+        return json.load(history_file)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_regressions
+ #
+ #  Subroutine Description:
+ #      This function compares each result of the current run with the median rows per
+ #      second of the last runs of the same program, stage, data, and host that did not
+ #      regress, and returns a list of (result, baseline) pairs for the results that
+ #      are slower than the baseline by more than the threshold.  It skips the results
+ #      too fast to time reliably.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  list        history_runs_list           the earlier runs from the history file
+ #  dictionary  run_dictionary              the current run
+ #  float       threshold_percent_float     the allowed slowdown in percent
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_regressions(history_runs_list, run_dictionary, threshold_percent_float):
+
+    regressions_list = []
+
+    for result_dictionary in run_dictionary['Results']:
+
+        if result_dictionary['Seconds'] < CONSTANT_MINIMUM_CHECKED_SECONDS:
+
+            continue
+
+        case_key_tuple \
+            = tuple(result_dictionary[key_string] \
+                    for key_string in ('Program', 'Stage', 'Rows', 'Candidates', 'Counties', 'Seed'))
+
+        baseline_rates_list \
+            = [history_result_dictionary['Rows Per Second'] \
+               for history_run_dictionary in history_runs_list \
+                   if history_run_dictionary['Host'] == run_dictionary['Host'] \
+                      and not history_run_dictionary.get('Regressed', False) \
+               for history_result_dictionary in history_run_dictionary['Results'] \
+                   if tuple(history_result_dictionary[key_string] \
+                            for key_string in ('Program', 'Stage', 'Rows', 'Candidates', 'Counties', 'Seed')) \
+                      == case_key_tuple] \
+              [-CONSTANT_BASELINE_RUN_COUNT:]
+
+        if len(baseline_rates_list) == 0:
+
+            continue
+
+        baseline_rate_float = statistics.median(baseline_rates_list)
+
+        if result_dictionary['Rows Per Second'] < baseline_rate_float * (1.0 - threshold_percent_float / 100.0):
+
+            regressions_list.append((result_dictionary, baseline_rate_float))
+
+    return regressions_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name: n/a
+ #
+ #  Subroutine Description:
+ #      This is the main subroutine, the beginning and end of this program's execution.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(description = 'Benchmark bank_main.py and poll_main.py.')
+
+    argument_parser.add_argument \
+        ('--rows', type = int, nargs = '+', default = list(CONSTANT_DEFAULT_ROW_COUNTS),
+         help = 'the numbers of data rows to benchmark')
+
+    argument_parser.add_argument \
+        ('--programs', nargs = '+', choices = CONSTANT_PROGRAM_NAMES, default = list(CONSTANT_PROGRAM_NAMES))
+
+    argument_parser.add_argument \
+        ('--stages', nargs = '+', choices = CONSTANT_STAGE_NAMES, default = list(CONSTANT_STAGE_NAMES))
+
+    argument_parser.add_argument('--candidates', type = int, default = CONSTANT_DEFAULT_CANDIDATE_COUNT)
+
+    argument_parser.add_argument('--counties', type = int, default = CONSTANT_DEFAULT_COUNTY_COUNT)
+
+    argument_parser.add_argument('--seed', type = int, default = CONSTANT_DEFAULT_SEED)
+
+    argument_parser.add_argument \
+        ('--repeat', type = int, default = 1,
+         help = 'the number of times to run each case, keeping the fastest')
+
+    argument_parser.add_argument('--data-dir', default = CONSTANT_DEFAULT_DATA_DIRECTORY_NAME)
+
+    argument_parser.add_argument('--history', default = CONSTANT_DEFAULT_HISTORY_FILE_NAME)
+
+    argument_parser.add_argument \
+        ('--threshold', type = float, default = CONSTANT_DEFAULT_THRESHOLD_PERCENT,
+         help = 'the allowed slowdown in percent before the run fails')
+
+    argument_parser.add_argument \
+        ('--no-record', action = 'store_true', help = 'check for regressions without adding to the history')
+
+    argument_parser.add_argument('--case', nargs = 3, help = argparse.SUPPRESS)
+
+    arguments_namespace = argument_parser.parse_args()
+
+
+    # A child process runs a single case and prints its measurements as JSON.
+    if arguments_namespace.case is not None:
+
+        elapsed_seconds_float, peak_memory_float = run_benchmark_case(*arguments_namespace.case)
+
+        print(json.dumps({'Seconds': elapsed_seconds_float, 'Peak RSS MiB': peak_memory_float}))
+
+        sys.exit(0)
+
+
+    os.makedirs(arguments_namespace.data_dir, exist_ok = True)
+
+    run_dictionary \
+        = {'Timestamp': datetime.datetime.now().isoformat(timespec = 'seconds'),
+           'Host': platform.node(),
+           'Python': platform.python_version(),
+           'Results': []}
+
+    print()
+
+    for program_name_string in arguments_namespace.programs:
+
+        for row_count_integer in arguments_namespace.rows:
+
+            input_file_name_string \
+                = get_data_file_name \
+                    (arguments_namespace.data_dir,
+                     program_name_string,
+                     row_count_integer,
+                     arguments_namespace.candidates,
+                     arguments_namespace.counties,
+                     arguments_namespace.seed)
+
+            if not os.path.exists(input_file_name_string):
+
+                if program_name_string == 'bank':
+
+                    generate_budget_file(input_file_name_string, row_count_integer, arguments_namespace.seed)
+
+                else:
+
+                    generate_ballot_file \
+                        (input_file_name_string,
+                         row_count_integer,
+                         arguments_namespace.candidates,
+                         arguments_namespace.counties,
+                         arguments_namespace.seed)
+
+
+            for stage_name_string in arguments_namespace.stages:
+
+                case_results_list \
+                    = [run_case_process(program_name_string, stage_name_string, input_file_name_string) \
+                       for repeat_index in range(max(1, arguments_namespace.repeat))]
+
+                elapsed_seconds_float = min(seconds_float for seconds_float, peak_memory_float in case_results_list)
+
+                peak_memory_float = case_results_list[0][1]
+
+                if peak_memory_float is not None:
+
+                    peak_memory_float \
+                        = max(peak_memory_float for seconds_float, peak_memory_float in case_results_list)
+
+                result_dictionary \
+                    = {'Program': program_name_string,
+                       'Stage': stage_name_string,
+                       'Rows': row_count_integer,
+                       'Candidates': arguments_namespace.candidates,
+                       'Counties': arguments_namespace.counties,
+                       'Seed': arguments_namespace.seed,
+                       'Seconds': elapsed_seconds_float,
+                       'Rows Per Second': row_count_integer / max(elapsed_seconds_float, 1e-9),
+                       'Peak RSS MiB': peak_memory_float}
+
+                run_dictionary['Results'].append(result_dictionary)
+
+                print(f'{program_name_string:<5} {stage_name_string:<12} {row_count_integer:>13,} rows ' \
+                      + f'{elapsed_seconds_float:>10.4f} s ' \
+                      + f'{result_dictionary["Rows Per Second"]:>15,.0f} rows/sec ' \
+                      + (f'{peak_memory_float:>9.1f} MiB' if peak_memory_float is not None else ''))
+
+
+    # These lines of code check the run against the history and then record it.
+    history_runs_list = read_history(arguments_namespace.history)
+
+    regressions_list = find_regressions(history_runs_list, run_dictionary, arguments_namespace.threshold)
+
+    run_dictionary['Regressed'] = len(regressions_list) > 0
+
+    if not arguments_namespace.no_record:
+
+        history_runs_list.append(run_dictionary)
+
+        temporary_history_file_name_string = arguments_namespace.history + '.tmp'
+
+        with open(temporary_history_file_name_string, 'w', encoding = 'utf-8') as history_file:
+
+            json.dump(history_runs_list, history_file, indent = 1)
+
+        os.replace(temporary_history_file_name_string, arguments_namespace.history)
+
+    print()
+
+    for result_dictionary, baseline_rate_float in regressions_list:
+
+        print(f'Regression: {result_dictionary["Program"]} {result_dictionary["Stage"]} ' \
+              + f'{result_dictionary["Rows"]:,} rows at {result_dictionary["Rows Per Second"]:,.0f} rows/sec, ' \
+              + f'{100.0 * (1.0 - result_dictionary["Rows Per Second"] / baseline_rate_float):.1f}% below ' \
+              + f'the baseline of {baseline_rate_float:,.0f} rows/sec')
+
+    if len(regressions_list) > 0:
+
+        print()
+
+        sys.exit(1)
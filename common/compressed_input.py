@@ -0,0 +1,374 @@
+#*******************************************************************************************
+ #
+ #  File Name:  compressed_input.py
+ #
+ #  File Description:
+ #      This module lets bank_main.py and poll_main.py read input csv files that are
+ #      stored gzip, bz2, or xz compressed without decompressing them to disk first.
+ #      It detects the format from the magic bytes at the start of the file, not from
+ #      the file name, and opens the file as a text stream that decompresses as the
+ #      program reads it.
+ #
+ #      A gzip file may hold several members, one after another, as produced by
+ #      concatenating gzip files, by appending to a log with gzip, or by bgzip, and
+ #      each member decompresses on its own.  For such a file, the module divides the
+ #      compressed bytes into shards at member boundaries, so worker processes can
+ #      decompress and count the shards in parallel.  Because a member need not end at
+ #      the end of a line, the generator that reads a shard sets aside the partial
+ #      line at each end of the shard for the caller to join with its neighbor's.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      detect_compression_format
+ #      open_input_file
+ #      is_gzip_member_start
+ #      split_gzip_file_into_shards
+ #      read_gzip_shard_lines
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import bz2
+import gzip
+import io
+import locale
+import lzma
+import mmap
+import os
+import zlib
+
+
+# This constant holds the magic bytes at the start of each compressed format.
+CONSTANT_COMPRESSION_MAGIC_BYTES_DICTIONARY \
+    = {'gzip': b'\x1f\x8b',
+       'bz2': b'BZh',
+       'xz': b'\xfd7zXZ\x00'}
+
+
+# This constant holds the function that opens each compressed format as a stream.
+CONSTANT_COMPRESSION_OPEN_FUNCTIONS_DICTIONARY \
+    = {'gzip': gzip.open,
+       'bz2': bz2.open,
+       'xz': lzma.open}
+
+
+# This constant is the start of a gzip member header: the magic bytes and the deflate
+# compression method.
+CONSTANT_GZIP_MEMBER_HEADER = b'\x1f\x8b\x08'
+
+
+# This constant is the number of bytes decompressed to confirm that a match of the
+# member header is the start of a member rather than bytes inside one.
+CONSTANT_GZIP_PROBE_SIZE = 64 * 1024
+
+
+# This constant is the number of compressed bytes the shard reader reads at a time.
+CONSTANT_DECOMPRESSION_BLOCK_SIZE = 1024 * 1024
+
+
+# This constant is the window bits setting with which zlib reads a gzip header and
+# checks each member's trailer.
+CONSTANT_GZIP_WINDOW_BITS = 16 + zlib.MAX_WBITS
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  detect_compression_format
+ #
+ #  Subroutine Description:
+ #      This function returns the name of the compressed format of a file, 'gzip',
+ #      'bz2', or 'xz', from the magic bytes at its start, or None if the file is not
+ #      compressed or cannot be read.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the input file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def detect_compression_format(input_file_name_string):
+
+    try:
+
+        with open(input_file_name_string, 'rb') as binary_file:
+
+            leading_bytes \
+                = binary_file.read(max(map(len, CONSTANT_COMPRESSION_MAGIC_BYTES_DICTIONARY.values())))
+
+    except OSError:
+
+        return None
+
+
+    for format_name_string, magic_bytes in CONSTANT_COMPRESSION_MAGIC_BYTES_DICTIONARY.items():
+
+        if leading_bytes.startswith(magic_bytes):
+
+            return format_name_string
+
+    return None
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  open_input_file
+ #
+ #  Subroutine Description:
+ #      This function opens an input csv file in text mode, with the same encoding and
+ #      line endings as the built-in open function, and returns the stream.  If the
+ #      file is compressed, the stream decompresses it as the caller reads.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the input file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def open_input_file(input_file_name_string):
+
+    format_name_string = detect_compression_format(input_file_name_string)
+
+    if format_name_string is None:
+
+        return open(input_file_name_string)
+
+    return CONSTANT_COMPRESSION_OPEN_FUNCTIONS_DICTIONARY[format_name_string] \
+                (input_file_name_string, 'rt', encoding = locale.getpreferredencoding(False))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  is_gzip_member_start
+ #
+ #  Subroutine Description:
+ #      This function returns whether a gzip member starts at an offset of a memory-
+ #      mapped gzip file.  The member header's magic bytes can also occur inside the
+ #      compressed data, so the function checks the header's reserved flags and
+ #      decompresses the first bytes of the member.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  memory_map      the memory map of the gzip file
+ #  int     offset_integer  the offset of a match of the member header
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def is_gzip_member_start(memory_map, offset_integer):
+
+    if offset_integer + 10 > len(memory_map) or memory_map[offset_integer + 3] & 0xe0:
+
+        return False
+
+    try:
+
+        zlib.decompressobj(CONSTANT_GZIP_WINDOW_BITS) \
+            .decompress(memory_map[offset_integer:offset_integer + CONSTANT_GZIP_PROBE_SIZE],
+                        CONSTANT_GZIP_PROBE_SIZE)
+
+    except zlib.error:
+
+        return False
+
+    return True
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  split_gzip_file_into_shards
+ #
+ #  Subroutine Description:
+ #      This function divides a gzip file into byte ranges of roughly equal size and
+ #      moves each boundary forward to the start of the next member, so no member
+ #      straddles two shards.  It returns a list of (start, end) byte offsets in file
+ #      order, which holds a single range for a file of one member.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the gzip file
+ #  int     shard_count_integer     the requested number of shards
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def split_gzip_file_into_shards(input_file_name_string, shard_count_integer):
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        file_size_integer = os.fstat(binary_file.fileno()).st_size
+
+        if file_size_integer == 0:
+
+            return []
+
+        shard_boundaries_list = [0]
+
+        shard_size_integer = max(1, file_size_integer // max(1, shard_count_integer))
+
+        with mmap.mmap(binary_file.fileno(), 0, access = mmap.ACCESS_READ) as memory_map:
+
+            # This repetition loop places each interior boundary at the first member that
+            # starts after the approximate split point; once no member follows a split
+            # point, none follows the later ones either.
+            for shard_index in range(1, shard_count_integer):
+
+                search_offset_integer \
+                    = max(shard_index * shard_size_integer, shard_boundaries_list[-1] + 1)
+
+                member_offset_integer = memory_map.find(CONSTANT_GZIP_MEMBER_HEADER, search_offset_integer)
+
+                while member_offset_integer != -1 \
+                        and not is_gzip_member_start(memory_map, member_offset_integer):
+
+                    member_offset_integer \
+                        = memory_map.find(CONSTANT_GZIP_MEMBER_HEADER, member_offset_integer + 1)
+
+                if member_offset_integer == -1:
+
+                    break
+
+                shard_boundaries_list.append(member_offset_integer)
+
+
+    shard_boundaries_list.append(file_size_integer)
+
+    return [(shard_boundaries_list[shard_index], shard_boundaries_list[shard_index + 1]) \
+            for shard_index in range(len(shard_boundaries_list) - 1)]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_gzip_shard_lines
+ #
+ #  Subroutine Description:
+ #      This generator decompresses the gzip members in one shard's byte range and
+ #      yields the decoded lines that lie wholly within the shard.  The bytes before
+ #      the shard's first line break and after its last one belong to lines shared
+ #      with the neighboring shards, so the generator stores them in the fragments
+ #      dictionary as the Head and the Tail, with a Head of None if the shard holds no
+ #      line break.  It also stores the offset where its last member ends as the End,
+ #      which matches the end of the range unless a boundary was not a member start.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  binary_file             the gzip file opened in binary mode
+ #  int     start_integer           the byte offset of the shard's first member
+ #  int     end_integer             the byte offset just past the shard's last member
+ #  dict    fragments_dictionary    the dictionary that receives the Head, the Tail,
+ #                                  and the End
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_gzip_shard_lines(binary_file, start_integer, end_integer, fragments_dictionary):
+
+    encoding_string = locale.getpreferredencoding(False)
+
+    fragments_dictionary.update({'Head': None, 'Tail': b'', 'End': start_integer})
+
+    position_integer = binary_file.seek(start_integer)
+
+    decompressor_object = zlib.decompressobj(CONSTANT_GZIP_WINDOW_BITS)
+
+    pending_bytes = b''
+
+
+    # This repetition loop decompresses the shard one block of compressed bytes at a time
+    # and yields the complete lines decompressed so far.
+    while True:
+
+        if decompressor_object.eof:
+
+            # These lines of code start the next member with the bytes the last one
+            # did not use.
+            compressed_bytes = decompressor_object.unused_data
+
+            decompressor_object = zlib.decompressobj(CONSTANT_GZIP_WINDOW_BITS)
+
+        else:
+
+            compressed_bytes = binary_file.read(CONSTANT_DECOMPRESSION_BLOCK_SIZE)
+
+            if len(compressed_bytes) == 0:
+
+                break
+
+            position_integer += len(compressed_bytes)
+
+        block_bytes = pending_bytes + decompressor_object.decompress(compressed_bytes)
+
+
+        if fragments_dictionary['Head'] is None:
+
+            line_break_index = block_bytes.find(b'\n')
+
+            if line_break_index == -1:
+
+                pending_bytes = block_bytes
+
+                block_bytes = b''
+
+            else:
+
+                fragments_dictionary['Head'] = block_bytes[:line_break_index + 1]
+
+                block_bytes = block_bytes[line_break_index + 1:]
+
+        if fragments_dictionary['Head'] is not None:
+
+            line_break_index = block_bytes.rfind(b'\n')
+
+            pending_bytes = block_bytes[line_break_index + 1:]
+
+            if line_break_index != -1:
+
+                yield from io.StringIO(block_bytes[:line_break_index + 1].decode(encoding_string), newline = '\n')
+
+
+        # If the member just ended at or past the end of the range, the shard is done.
+        if decompressor_object.eof:
+
+            fragments_dictionary['End'] = position_integer - len(decompressor_object.unused_data)
+
+            if fragments_dictionary['End'] >= end_integer:
+
+                break
+
+
+    fragments_dictionary['Tail'] = pending_bytes
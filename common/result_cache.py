@@ -0,0 +1,475 @@
+#*******************************************************************************************
+ #
+ #  File Name:  result_cache.py
+ #
+ #  File Description:
+ #      This module is the on-disk result cache shared by bank_main.py and
+ #      poll_main.py.  A cached result is a finalized summary dictionary stored in a
+ #      cache folder under a key derived from the BLAKE2 content digest of the input
+ #      file, the digests of the program's source files, and the analysis options, so
+ #      an unchanged input analyzed with the same options and the same code comes back
+ #      without being parsed, and a changed input, option, or program simply misses.
+ #      To avoid hashing an unchanged large input on every call, the cache keeps the
+ #      digest of each such file it has seen with the file's size and modification time
+ #      and hashes the file again only when either differs.  A large file rewritten at
+ #      the same size within one tick of the file system's modification time therefore
+ #      keeps its old digest and returns the old result; a file no larger than
+ #      CONSTANT_DIGEST_MEMO_SIZE is cheap to read and is hashed on every call.
+ #
+ #      Each entry is one JSON file named by its key, so reading an entry never runs
+ #      code.  The summaries are dictionaries, lists, strings, and numbers, and their
+ #      tuples come back as lists; a miss returns its result in the same JSON form, so
+ #      a hit and a miss return equal results.  A hit refreshes the entry's
+ #      modification time, and after each store the cache deletes the entries with the
+ #      oldest modification times until the folder fits within its size limit, so the
+ #      eviction order is least recently used.  Entries are written to a temporary file
+ #      and renamed into place, so concurrent processes never read a partial entry.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      calculate_file_digest
+ #      find_file_digest
+ #      calculate_result_key
+ #      read_cached_result
+ #      evict_cached_results
+ #      write_cached_result
+ #      read_or_calculate_result
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      JSON entries and small files rehashed   Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import hashlib
+import json
+import os
+
+
+# This constant is the default size limit of a cache folder in bytes.
+CONSTANT_RESULT_CACHE_SIZE_LIMIT = 64 * 1024 * 1024
+
+
+# This constant is the version of the entry format; changing it retires every entry.
+CONSTANT_RESULT_CACHE_VERSION = 2
+
+
+# These constants are the file name extension of an entry and the name of the file
+# that holds the digests of the input files.
+CONSTANT_RESULT_FILE_EXTENSION = '.result'
+
+CONSTANT_DIGESTS_FILE_NAME = 'digests.json'
+
+
+# This constant is the size of the blocks the module reads when it hashes a file.
+CONSTANT_DIGEST_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+# This constant is the size in bytes above which the cache reuses a file's recorded
+# digest while its size and modification time stay the same.
+CONSTANT_DIGEST_MEMO_SIZE = 1024 * 1024
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_file_digest
+ #
+ #  Subroutine Description:
+ #      This function returns the hexadecimal BLAKE2 digest of a file's contents.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_file_digest(input_file_name_string):
+
+    digest_object = hashlib.blake2b(digest_size = 20)
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        for block_bytes in iter(lambda: binary_file.read(CONSTANT_DIGEST_BLOCK_SIZE), b''):
+
+            digest_object.update(block_bytes)
+
+    return digest_object.hexdigest()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_file_digest
+ #
+ #  Subroutine Description:
+ #      This function returns the content digest of an input file.  A file no larger 
+ #      than CONSTANT_DIGEST_MEMO_SIZE is hashed every time.  If the cache folder
+ #      recorded a digest for a larger file at its current size and modification time,
+ #      the function returns that digest without reading the file; otherwise, it 
+ #      hashes the file and records the new digest.  A same-size rewrite of a large
+ #      file that keeps its modification time is not detected.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  cache_directory_string      the path of the cache folder
+ #  String  input_file_name_string      the path of the input file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Small files hashed every time               Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_file_digest(cache_directory_string, input_file_name_string):
+
+    digests_file_name_string = os.path.join(cache_directory_string, CONSTANT_DIGESTS_FILE_NAME)
+
+    input_file_name_string = os.path.abspath(input_file_name_string)
+
+    file_status = os.stat(input_file_name_string)
+
+    if file_status.st_size <= CONSTANT_DIGEST_MEMO_SIZE:
+
+        return calculate_file_digest(input_file_name_string)
+
+    try:
+
+        with open(digests_file_name_string) as digests_file:
+
+            digests_dictionary = json.load(digests_file)
+
+    except (OSError, ValueError):
+
+        digests_dictionary = {}
+
+
+    digest_list = digests_dictionary.get(input_file_name_string)
+
+    if digest_list is not None \
+        and digest_list[:2] == [file_status.st_size, file_status.st_mtime_ns]:
+
+        return digest_list[2]
+
+
+    digest_string = calculate_file_digest(input_file_name_string)
+
+    digests_dictionary[input_file_name_string] = [file_status.st_size, file_status.st_mtime_ns, digest_string]
+
+    # These lines of code drop the digests of input files that no longer exist, so the
+    # file does not grow without bound.
+    digests_dictionary \
+        = {file_name_string: digest_list \
+           for file_name_string, digest_list in digests_dictionary.items() \
+           if os.path.exists(file_name_string)}
+
+    temporary_file_name_string = f'{digests_file_name_string}.{os.getpid()}.tmp'
+
+    with open(temporary_file_name_string, 'w') as digests_file:
+
+        json.dump(digests_dictionary, digests_file)
+
+    os.replace(temporary_file_name_string, digests_file_name_string)
+
+    return digest_string
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_result_key
+ #
+ #  Subroutine Description:
+ #      This function returns the key of a result: the hexadecimal BLAKE2 digest of the
+ #      entry format version, the program's name, the digests of its source files, the
+ #      input file's content digest, and the analysis options.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  String      program_name_string         the name of the program
+ #  list        source_file_names_list      the paths of the program's source files
+ #  String      input_digest_string         the content digest of the input file
+ #  dictionary  options_dictionary          the analysis options, as JSON-compatible values
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_result_key(program_name_string, source_file_names_list, input_digest_string, options_dictionary):
+
+    key_dictionary \
+        = {'Version': CONSTANT_RESULT_CACHE_VERSION,
+           'Program': program_name_string,
+           'Sources': [calculate_file_digest(file_name_string) for file_name_string in source_file_names_list],
+           'Input': input_digest_string,
+           'Options': options_dictionary}
+
+    return hashlib.blake2b \
+                (json.dumps(key_dictionary, sort_keys = True).encode('utf-8'), digest_size = 20) \
+                    .hexdigest()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_cached_result
+ #
+ #  Subroutine Description:
+ #      This function returns the cached result of a key, read from its JSON entry, and
+ #      marks the entry as the most recently used, or returns None if the cache has no
+ #      readable entry for it.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  cache_directory_string      the path of the cache folder
+ #  String  result_key_string           the key of the result
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          JSON entries                                Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_cached_result(cache_directory_string, result_key_string):
+
+    result_file_name_string \
+        = os.path.join(cache_directory_string, result_key_string + CONSTANT_RESULT_FILE_EXTENSION)
+
+    try:
+
+        with open(result_file_name_string, 'rb') as result_file:
+
+            result_object = json.loads(result_file.read())
+
+        os.utime(result_file_name_string)
+
+    except FileNotFoundError:
+
+        return None
+
+    except (OSError, ValueError):
+
+        # These lines of code discard an entry that cannot be read, for example one left
+        # by an older version of the program.
+        try:
+
+            os.remove(result_file_name_string)
+
+        except OSError:
+
+            pass
+
+        return None
+
+    return result_object
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  evict_cached_results
+ #
+ #  Subroutine Description:
+ #      This subroutine deletes the least recently used entries until the total size of
+ #      the entries fits within the size limit.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  cache_directory_string      the path of the cache folder
+ #  int     size_limit_integer          the size limit of the folder in bytes
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def evict_cached_results(cache_directory_string, size_limit_integer):
+
+    entries_list = []
+
+    for directory_entry in os.scandir(cache_directory_string):
+
+        if directory_entry.name.endswith(CONSTANT_RESULT_FILE_EXTENSION):
+
+            try:
+
+                entry_status = directory_entry.stat()
+
+            except OSError:
+
+                continue
+
+            entries_list.append((entry_status.st_mtime_ns, entry_status.st_size, directory_entry.path))
+
+
+    total_size_integer = sum(entry_tuple[1] for entry_tuple in entries_list)
+
+    # This repetition loop deletes the entries from the least to the most recently used
+    # until the rest fit.
+    for _, entry_size_integer, result_file_name_string in sorted(entries_list):
+
+        if total_size_integer <= size_limit_integer:
+
+            break
+
+        try:
+
+            os.remove(result_file_name_string)
+
+        except OSError:
+
+            pass
+
+        total_size_integer -= entry_size_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_cached_result
+ #
+ #  Subroutine Description:
+ #      This subroutine stores a result under its key as JSON and then evicts the least
+ #      recently used entries beyond the size limit.  A result larger than the limit
+ #      is not stored, but the eviction still runs.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  cache_directory_string      the path of the cache folder
+ #  String  result_key_string           the key of the result
+ #  object  result_object               the result, as JSON-compatible values
+ #  int     size_limit_integer          the size limit of the folder in bytes
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          JSON entries                                Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_cached_result(cache_directory_string, result_key_string, result_object, size_limit_integer):
+
+    result_bytes = json.dumps(result_object).encode('utf-8')
+
+    if len(result_bytes) > size_limit_integer:
+
+        evict_cached_results(cache_directory_string, size_limit_integer)
+
+        return
+
+
+    result_file_name_string \
+        = os.path.join(cache_directory_string, result_key_string + CONSTANT_RESULT_FILE_EXTENSION)
+
+    temporary_file_name_string = f'{result_file_name_string}.{os.getpid()}.tmp'
+
+    with open(temporary_file_name_string, 'wb') as result_file:
+
+        result_file.write(result_bytes)
+
+    os.replace(temporary_file_name_string, result_file_name_string)
+
+
+    evict_cached_results(cache_directory_string, size_limit_integer)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_or_calculate_result
+ #
+ #  Subroutine Description:
+ #      This function returns the cached result for an input file, the program, and
+ #      the options, or, on a miss, calls the analysis function, stores its result,
+ #      and returns it in the JSON form a hit reads.  It also returns True for a hit
+ #      and False for a miss.  If the cache folder cannot be created or written, the
+ #      function still returns the calculated result.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  String      cache_directory_string      the path of the cache folder
+ #  String      input_file_name_string      the path of the input file
+ #  String      program_name_string         the name of the program
+ #  list        source_file_names_list      the paths of the program's source files
+ #  dictionary  options_dictionary          the analysis options, as JSON-compatible values
+ #  function    analysis_function           a function without parameters that calculates
+ #                                          the result
+ #  int         size_limit_integer          the size limit of the folder in bytes
+ #                                          (default: CONSTANT_RESULT_CACHE_SIZE_LIMIT)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          JSON entries                                Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_or_calculate_result \
+        (cache_directory_string,
+         input_file_name_string,
+         program_name_string,
+         source_file_names_list,
+         options_dictionary,
+         analysis_function,
+         size_limit_integer = CONSTANT_RESULT_CACHE_SIZE_LIMIT):
+
+    try:
+
+        os.makedirs(cache_directory_string, exist_ok = True)
+
+        result_key_string \
+            = calculate_result_key \
+                (program_name_string,
+                 source_file_names_list,
+                 find_file_digest(cache_directory_string, input_file_name_string),
+                 options_dictionary)
+
+    except OSError:
+
+        return analysis_function(), False
+
+
+    result_object = read_cached_result(cache_directory_string, result_key_string)
+
+    if result_object is not None:
+
+        return result_object, True
+
+
+    # This line of code turns the result's tuples into lists, as a hit returns them.
+    result_object = json.loads(json.dumps(analysis_function()))
+
+    try:
+
+        write_cached_result(cache_directory_string, result_key_string, result_object, size_limit_integer)
+
+    except OSError:
+
+        pass
+
+    return result_object, False
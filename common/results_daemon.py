@@ -0,0 +1,682 @@
+#*******************************************************************************************
+ #
+ #  File Name:  results_daemon.py
+ #
+ #  File Description:
+ #      This program is a long-running local server that keeps the results of
+ #      bank_main.py and poll_main.py in memory and answers queries about them over
+ #      HTTP, on a localhost port or a Unix socket, so a dashboard that asks every few
+ #      seconds no longer starts a program that reads the csv file again and rewrites
+ #      the analysis files.  The server analyzes each input file once at startup and
+ #      keeps the summary dictionary, the summary already encoded as JSON, each
+ #      candidate's results, and the open date-range index of the budget file, so a
+ #      query is a dictionary lookup or an O(1) range query.
+ #
+ #      A watcher task checks each input file's size and modification time at an
+ #      interval.  When they change, it compares the file's BLAKE2 content digest with
+ #      the digest of the loaded results and, only if the content changed, analyzes the
+ #      file again in a worker thread while the server goes on answering from the old
+ #      results, which it then replaces in one step.  The server handles concurrent
+ #      clients with asyncio and keeps each connection open between requests.
+ #
+ #      The server answers GET requests for these paths with JSON:
+ #
+ #      /status                         each input file, its digest, and its loads
+ #      /poll/summary                   the election summary dictionary
+ #      /poll/candidates/<name>         one candidate's percentage and vote count
+ #      /bank/summary                   the budget summary dictionary
+ #      /bank/range?start=..&end=..     the budget summary between two dates, without
+ #                                      the change statistics
+ #
+ #      Here is a List of classes, subroutines, and functions:
+ #
+ #      watched_input_file
+ #      load_poll_results
+ #      load_bank_results
+ #      release_bank_results
+ #      encode_json_response
+ #      answer_query
+ #      handle_connection
+ #      serve_results
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Range answers without change statistics Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import sys
+import time
+import urllib.parse
+
+
+# These lines of code add the program folders to the module search path, so the
+# server can import both programs.
+CONSTANT_PROGRAM_DIRECTORY_NAME = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.append(os.path.join(CONSTANT_PROGRAM_DIRECTORY_NAME, '..', 'bank'))
+
+sys.path.append(os.path.join(CONSTANT_PROGRAM_DIRECTORY_NAME, '..', 'poll'))
+
+import bank_main
+import bank_range_index
+import poll_main
+import result_cache
+
+
+# These constants are the default address of the server and the number of seconds
+# between checks of the input files.
+CONSTANT_DEFAULT_HOST = '127.0.0.1'
+
+CONSTANT_DEFAULT_PORT = 8765
+
+CONSTANT_WATCH_INTERVAL_SECONDS = 1.0
+
+
+# This constant is the largest request head, the request line and headers, the
+# server reads.
+CONSTANT_REQUEST_HEAD_LIMIT = 16 * 1024
+
+
+# This dictionary holds the reason phrase of each status code the server sends.
+CONSTANT_STATUS_REASONS_DICTIONARY \
+    = {200: 'OK',
+       400: 'Bad Request',
+       404: 'Not Found',
+       405: 'Method Not Allowed',
+       503: 'Service Unavailable'}
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  watched_input_file
+ #
+ #  Class Description:
+ #      This class holds the results of one input file and keeps them up to date.  The
+ #      load method analyzes the file with the load function and records its size,
+ #      modification time, and content digest; the watch method checks the size and
+ #      modification time at an interval and loads the file again in a worker thread
+ #      only when its digest changed.  If a load fails, the old results stay in place
+ #      and the error is kept for the status query.
+ #
+ #  Class Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  String      input_file_name_string      the path of the input csv file
+ #  function    load_function               a function that takes the path and returns
+ #                                          the results dictionary
+ #  function    release_function            a function that releases a results
+ #                                          dictionary it replaces (default: None)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class watched_input_file:
+
+    def __init__(self, input_file_name_string, load_function, release_function = None):
+
+        self.input_file_name_string = input_file_name_string
+
+        self.load_function = load_function
+
+        self.release_function = release_function
+
+        # This dictionary holds the loaded results, or None before the first load.
+        self.results_dictionary = None
+
+        self.file_signature_tuple = None
+
+        self.file_digest_string = None
+
+        self.load_count_integer = 0
+
+        self.load_seconds_float = 0.0
+
+        self.error_string = None
+
+
+    def read_file_signature(self):
+
+        try:
+
+            file_status = os.stat(self.input_file_name_string)
+
+        except OSError:
+
+            return None
+
+        return file_status.st_size, file_status.st_mtime_ns
+
+
+    def calculate_results(self):
+
+        file_signature_tuple = self.read_file_signature()
+
+        file_digest_string = result_cache.calculate_file_digest(self.input_file_name_string)
+
+        # A file whose content did not change, for example one that was only touched,
+        # keeps its results.
+        if file_digest_string == self.file_digest_string:
+
+            return file_signature_tuple, file_digest_string, None, 0.0
+
+        start_time_float = time.perf_counter()
+
+        results_dictionary = self.load_function(self.input_file_name_string)
+
+        return file_signature_tuple, file_digest_string, results_dictionary, time.perf_counter() - start_time_float
+
+
+    def replace_results(self, calculation_tuple):
+
+        file_signature_tuple, file_digest_string, results_dictionary, load_seconds_float = calculation_tuple
+
+        self.file_signature_tuple = file_signature_tuple
+
+        self.file_digest_string = file_digest_string
+
+        self.error_string = None
+
+        if results_dictionary is None:
+
+            return
+
+        if self.results_dictionary is not None and self.release_function is not None:
+
+            self.release_function(self.results_dictionary)
+
+        self.results_dictionary = results_dictionary
+
+        self.load_count_integer += 1
+
+        self.load_seconds_float = load_seconds_float
+
+
+    def load(self):
+
+        # Any failure of the analysis, such as a missing file or a malformed row, leaves 
+        # the old results in place.
+        try:
+
+            self.replace_results(self.calculate_results())
+
+        except Exception as load_error:
+
+            self.file_signature_tuple = self.read_file_signature()
+
+            self.error_string = str(load_error)
+
+
+    async def watch(self, interval_float = CONSTANT_WATCH_INTERVAL_SECONDS):
+
+        while True:
+
+            await asyncio.sleep(interval_float)
+
+            if self.read_file_signature() == self.file_signature_tuple:
+
+                continue
+
+            try:
+
+                self.replace_results(await asyncio.to_thread(self.calculate_results))
+
+            except Exception as load_error:
+
+                self.file_signature_tuple = self.read_file_signature()
+
+                self.error_string = str(load_error)
+
+
+    def format_status(self):
+
+        return {'File': self.input_file_name_string,
+                'Digest': self.file_digest_string,
+                'Loads': self.load_count_integer,
+                'Load Seconds': round(self.load_seconds_float, 6),
+                'Error': self.error_string}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  load_poll_results
+ #
+ #  Subroutine Description:
+ #      This function analyzes a ballot csv file with poll_main.py and returns the
+ #      results the server answers from: the summary dictionary, the summary encoded
+ #      as JSON, and each candidate's results encoded as JSON.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the ballot csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def load_poll_results(input_file_name_string):
+
+    summary_dictionary = poll_main.read_file_and_calculate_values(input_file_name_string)
+
+    candidates_dictionary = summary_dictionary['Candidates']
+
+    return {'Summary': summary_dictionary,
+            'Summary JSON': encode_json_response(summary_dictionary),
+            'Candidates': {candidate_name: encode_json_response \
+                                               ({'Name': candidate_name,
+                                                 'Percent': percent_float,
+                                                 'Vote Count': vote_count_integer}) \
+                           for candidate_name, percent_float, vote_count_integer \
+                               in zip(candidates_dictionary['Name'],
+                                      candidates_dictionary['Percent'],
+                                      candidates_dictionary['Vote Count'])}}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  load_bank_results
+ #
+ #  Subroutine Description:
+ #      This function analyzes a budget csv file with bank_main.py and returns the
+ #      results the server answers from: the summary dictionary, the summary encoded
+ #      as JSON, and the open date-range index of the file, which it builds first if
+ #      it is missing or out of date.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the budget csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def load_bank_results(input_file_name_string):
+
+    summary_dictionary = bank_main.read_file_and_calculate_values(input_file_name_string)
+
+    return {'Summary': summary_dictionary,
+            'Summary JSON': encode_json_response(summary_dictionary),
+            'Range Index': bank_range_index.open_range_index \
+                               (input_file_name_string,
+                                bank_main.data_column_indices_enumeration.DATE_COLUMN_INDEX.value,
+                                bank_main.data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value)}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  release_bank_results
+ #
+ #  Subroutine Description:
+ #      This subroutine closes the date-range index of budget results that the server
+ #      has replaced.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  dictionary  results_dictionary      the replaced results
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def release_bank_results(results_dictionary):
+
+    bank_range_index.close_range_index(results_dictionary['Range Index'])
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  encode_json_response
+ #
+ #  Subroutine Description:
+ #      This function returns a value encoded as a compact JSON body in UTF-8.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  value_object    the value to encode
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def encode_json_response(value_object):
+
+    return json.dumps(value_object, separators = (',', ':')).encode('utf-8')
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  answer_query
+ #
+ #  Subroutine Description:
+ #      This function answers one query from the results in memory and returns the
+ #      HTTP status code and the JSON body.  It never reads an input file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  dictionary  watched_files_dictionary    the watched input file of 'poll' and 'bank'
+ #  String      target_string               the request target: the path and the query
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def answer_query(watched_files_dictionary, target_string):
+
+    path_string, _, query_string = target_string.partition('?')
+
+    path_parts_list \
+        = [urllib.parse.unquote(path_part_string) for path_part_string in path_string.split('/') if path_part_string]
+
+    if path_parts_list == ['status']:
+
+        return 200, \
+               encode_json_response \
+                    ({program_name_string: watched_file.format_status() \
+                      for program_name_string, watched_file in watched_files_dictionary.items()})
+
+    if len(path_parts_list) < 2 or path_parts_list[0] not in watched_files_dictionary:
+
+        return 404, encode_json_response({'Error': f'There is no query {path_string}.'})
+
+
+    watched_file = watched_files_dictionary[path_parts_list[0]]
+
+    results_dictionary = watched_file.results_dictionary
+
+    if results_dictionary is None:
+
+        return 503, encode_json_response({'Error': watched_file.error_string or 'The results are not loaded.'})
+
+    if path_parts_list[1:] == ['summary']:
+
+        return 200, results_dictionary['Summary JSON']
+
+    if path_parts_list[0] == 'poll' and len(path_parts_list) == 3 and path_parts_list[1] == 'candidates':
+
+        if path_parts_list[2] in results_dictionary['Candidates']:
+
+            return 200, results_dictionary['Candidates'][path_parts_list[2]]
+
+        return 404, encode_json_response({'Error': f'There is no candidate {path_parts_list[2]}.'})
+
+    if path_parts_list[0] == 'bank' and path_parts_list[1:] == ['range']:
+
+        query_dictionary = urllib.parse.parse_qs(query_string)
+
+        if 'start' not in query_dictionary or 'end' not in query_dictionary:
+
+            return 400, encode_json_response({'Error': 'The range query needs a start and an end date.'})
+
+        # The range answer has the summary's keys but the change statistics, which the
+        # index does not hold.
+        try:
+
+            summary_dictionary \
+                = bank_range_index.query_date_range \
+                    (results_dictionary['Range Index'], query_dictionary['start'][0], query_dictionary['end'][0])
+
+        except ValueError as query_error:
+
+            return 400, encode_json_response({'Error': str(query_error)})
+
+        return 200, encode_json_response(summary_dictionary)
+
+    return 404, encode_json_response({'Error': f'There is no query {path_string}.'})
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  handle_connection
+ #
+ #  Subroutine Description:
+ #      This coroutine serves one client connection.  It reads each HTTP/1.1 request
+ #      head, answers GET requests with answer_query, and keeps the connection open for
+ #      the next request unless the client asks to close it or sends HTTP/1.0.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  dictionary  watched_files_dictionary    the watched input file of 'poll' and 'bank'
+ #  object      stream_reader               the asyncio stream reader of the connection
+ #  object      stream_writer               the asyncio stream writer of the connection
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+async def handle_connection(watched_files_dictionary, stream_reader, stream_writer):
+
+    try:
+
+        while True:
+
+            try:
+
+                request_head_bytes = await stream_reader.readuntil(b'\r\n\r\n')
+
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+
+                break
+
+            request_lines_list = request_head_bytes.decode('latin-1').split('\r\n')
+
+            request_parts_list = request_lines_list[0].split()
+
+            header_names_dictionary \
+                = {header_name_string.strip().lower(): header_value_string.strip() \
+                   for header_name_string, _, header_value_string \
+                       in (request_line_string.partition(':') for request_line_string in request_lines_list[1:] \
+                           if request_line_string)}
+
+            keep_alive_boolean \
+                = len(request_parts_list) == 3 \
+                  and request_parts_list[2] == 'HTTP/1.1' \
+                  and header_names_dictionary.get('connection', '').lower() != 'close'
+
+            if len(request_parts_list) != 3:
+
+                status_code_integer, body_bytes \
+                    = 400, encode_json_response({'Error': 'The request line is not valid.'})
+
+            elif request_parts_list[0] != 'GET':
+
+                status_code_integer, body_bytes \
+                    = 405, encode_json_response({'Error': 'The server answers GET requests only.'})
+
+            else:
+
+                status_code_integer, body_bytes = answer_query(watched_files_dictionary, request_parts_list[1])
+
+            stream_writer.write \
+                (f'HTTP/1.1 {status_code_integer} {CONSTANT_STATUS_REASONS_DICTIONARY[status_code_integer]}\r\n'
+                 f'Content-Type: application/json\r\n'
+                 f'Content-Length: {len(body_bytes)}\r\n'
+                 f'Connection: {"keep-alive" if keep_alive_boolean else "close"}\r\n\r\n'.encode('latin-1') \
+                 + body_bytes)
+
+            await stream_writer.drain()
+
+            if not keep_alive_boolean:
+
+                break
+
+    except ConnectionError:
+
+        pass
+
+    finally:
+
+        stream_writer.close()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  serve_results
+ #
+ #  Subroutine Description:
+ #      This coroutine loads the input files, starts a watcher task for each, and
+ #      serves queries on a localhost port or, if the caller gives a path, a Unix
+ #      socket until the process stops.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  dictionary  watched_files_dictionary    the watched input file of 'poll' and 'bank'
+ #  String      host_string                 the address of the server
+ #  int         port_integer                the port of the server
+ #  String      socket_file_name_string     the path of the Unix socket, or None
+ #  float       interval_float              the number of seconds between checks of
+ #                                          the input files
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+async def serve_results \
+        (watched_files_dictionary, host_string, port_integer, socket_file_name_string, interval_float):
+
+    for watched_file in watched_files_dictionary.values():
+
+        watched_file.load()
+
+    watcher_tasks_list \
+        = [asyncio.create_task(watched_file.watch(interval_float)) \
+           for watched_file in watched_files_dictionary.values()]
+
+    connection_function = functools.partial(handle_connection, watched_files_dictionary)
+
+    if socket_file_name_string is not None:
+
+        server = await asyncio.start_unix_server \
+                    (connection_function, socket_file_name_string, limit = CONSTANT_REQUEST_HEAD_LIMIT)
+
+    else:
+
+        server = await asyncio.start_server \
+                    (connection_function, host_string, port_integer, limit = CONSTANT_REQUEST_HEAD_LIMIT)
+
+    print(f'Serving the results on {socket_file_name_string or f"http://{host_string}:{port_integer}"}',
+          file = sys.stderr)
+
+    try:
+
+        async with server:
+
+            await server.serve_forever()
+
+    finally:
+
+        for watcher_task in watcher_tasks_list:
+
+            watcher_task.cancel()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name: n/a
+ #
+ #  Subroutine Description:
+ #      This is the main subroutine, the beginning and end of this program's execution.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(description = 'Serve the bank and poll results from memory.')
+
+    argument_parser.add_argument \
+        ('--host', default = CONSTANT_DEFAULT_HOST,
+         help = 'the address of the server')
+
+    argument_parser.add_argument \
+        ('--port', type = int, default = CONSTANT_DEFAULT_PORT,
+         help = 'the port of the server')
+
+    argument_parser.add_argument \
+        ('--unix-socket', metavar = 'PATH',
+         help = 'serve on a Unix socket at PATH instead of a port')
+
+    argument_parser.add_argument \
+        ('--interval', type = float, default = CONSTANT_WATCH_INTERVAL_SECONDS,
+         help = 'the number of seconds between checks of the input files')
+
+    argument_parser.add_argument \
+        ('--poll-file', default = poll_main.CONSTANT_INPUT_FILE_NAME,
+         help = 'the ballot csv file')
+
+    argument_parser.add_argument \
+        ('--bank-file', default = bank_main.CONSTANT_INPUT_FILE_NAME,
+         help = 'the budget csv file')
+
+    arguments_namespace = argument_parser.parse_args()
+
+    try:
+
+        asyncio.run \
+            (serve_results \
+                ({'poll': watched_input_file(arguments_namespace.poll_file, load_poll_results),
+                  'bank': watched_input_file(arguments_namespace.bank_file, load_bank_results, release_bank_results)},
+                 arguments_namespace.host,
+                 arguments_namespace.port,
+                 arguments_namespace.unix_socket,
+                 arguments_namespace.interval))
+
+    except KeyboardInterrupt:
+
+        pass
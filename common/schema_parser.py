@@ -0,0 +1,968 @@
+#*******************************************************************************************
+ #
+ #  File Name:  schema_parser.py
+ #
+ #  File Description:
+ #      This module is a csv parser specialized for the fixed schemas of bank_main.py
+ #      and poll_main.py: budget data in the columns Date and Profit/Losses, and ballots
+ #      in the columns Voter ID, County, and Candidate.  Instead of parsing one line at
+ #      a time with the csv module, it reads the file in large blocks of text, splits
+ #      each block into lines and fields with string operations that run in C, and
+ #      yields each block as a list of columns: a list for each column the analysis
+ #      needs and None for the others, so no row object is ever built.  The blocks are
+ #      small enough to stay in the processor's cache while the parser makes its passes
+ #      over them.  Aggregators with an update_columns method add a block's columns at
+ #      once; the others receive records rebuilt from the columns.
+ #
+ #      If NumPy is installed and the schema has integer columns, the parser finds
+ #      the delimiters in the block's bytes with a vectorized search and converts each
+ #      integer column's digits in place, without a string for each field.  The text 
+ #      columns are then lazy_text_column sequences, which split the block only when
+ #      first read; the bank aggregators read a date only for a row with a new 
+ #      extreme, so most blocks never split.  Without NumPy, the parser splits the 
+ #      block's text and converts an integer column by joining it into one array for
+ #      the json module's C scanner.
+ #
+ #      A field in quotation marks may hold a comma or a line break, and a row with a
+ #      comma inside a field has an extra column, so the parser checks each block
+ #      before it splits it: with every byte but the delimiters, quotation marks, and
+ #      carriage returns deleted, the block must be the schema's commas and line break
+ #      repeated once per row.  A block that is not goes to the csv module instead,
+ #      which parses it as it would have parsed the whole file.
+ #
+ #      A quoted field may continue past the end of a block, and a quotation mark 
+ #      inside an unquoted field is an ordinary character, so a count of quotation marks
+ #      does not tell where a record ends.  The lines of a block that holds a quotation
+ #      mark go to the csv module, which reads on into the next blocks only to finish
+ #      its last record, and the parser goes back to splitting blocks after it.
+ #
+ #      The programs that split a file at line breaks for their workers ask
+ #      find_quoted_line_breaks for the line breaks the csv module reads inside quoted
+ #      fields, in order, and split at the others.  With NumPy, the quotation marks of
+ #      a file alternate between opening and closing a field as long as each opening 
+ #      one starts a field and each closing one ends it, which a vectorized check of
+ #      their neighbors confirms; from the first window where that fails, a scan from
+ #      one quotation mark to the next follows the csv module's rules.
+ #
+ #      Here is a List of classes, subroutines, and functions:
+ #
+ #      csv_schema
+ #      lazy_text_column
+ #      csv_line_source
+ #      parse_integer_fields
+ #      convert_integer_column
+ #      parse_schema_block_numpy
+ #      parse_csv_records
+ #      parse_schema_block
+ #      parse_schema_columns
+ #      read_shard_blocks
+ #      find_quoted_line_breaks_numpy
+ #      find_quoted_line_breaks
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Vectorized integer columns              Nicholas J. George
+ #  10/18/2026      Quoted blocks read by the csv module    Nicholas J. George
+ #  10/18/2026      Line breaks inside quoted fields        Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import codecs
+import collections.abc
+import csv
+import io
+import json
+import locale
+import operator
+
+try:
+
+    import numpy
+
+except ImportError:
+
+    numpy = None
+
+
+# This constant is the number of characters, or bytes for a shard, the parser reads at
+# a time; a block of this size stays in the processor's cache while the parser checks,
+# splits, and converts it.
+CONSTANT_PARSE_BLOCK_SIZE = 64 * 1024
+
+
+# This constant holds every byte but the comma, the line break, the quotation mark, and
+# the carriage return, which the check of a block deletes.
+CONSTANT_NON_DELIMITER_BYTES = bytes(byte_integer for byte_integer in range(256) if byte_integer not in b',\n"\r')
+
+
+# This constant holds the digits, the minus sign, and the comma; a column of integers
+# made of nothing else is a JSON array once it is joined and bracketed.
+CONSTANT_INTEGER_COLUMN_BYTES = b'0123456789-,'
+
+
+# This constant is the largest number of digits the NumPy conversion accepts; longer 
+# values may not fit in a 64-bit integer, so int converts them.
+CONSTANT_MAXIMUM_DIGIT_COUNT = 18
+
+
+# These constants are the byte values of the characters the NumPy conversion reads.
+CONSTANT_COMMA_BYTE = ord(',')
+
+CONSTANT_NEWLINE_BYTE = ord('\n')
+
+CONSTANT_ZERO_BYTE = ord('0')
+
+CONSTANT_MINUS_BYTE = ord('-')
+
+CONSTANT_PLUS_BYTE = ord('+')
+
+CONSTANT_QUOTE_BYTE = ord('"')
+
+CONSTANT_CARRIAGE_RETURN_BYTE = ord('\r')
+
+
+# This constant is the number of bytes of a file the NumPy search for quoted line 
+# breaks examines at a time.
+CONSTANT_QUOTE_SCAN_WINDOW_SIZE = 16 * 1024 * 1024
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  csv_schema
+ #
+ #  Class Description:
+ #      This class describes the fixed layout of a csv file for the parser: the number
+ #      of columns in each row, the indices of the columns the analysis reads, and the
+ #      indices of the columns the parser converts to integers.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                            Description
+ #  -----   -------------                   ----------------------------------------------
+ #  int     column_count_integer            the number of columns in each row
+ #  tuple   needed_column_indices_tuple     the indices of the columns to parse
+ #  tuple   integer_column_indices_tuple    the indices of the columns to convert to
+ #                                          integers (default: none)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class csv_schema:
+
+    def __init__(self, column_count_integer, needed_column_indices_tuple, integer_column_indices_tuple = ()):
+
+        self.column_count_integer = column_count_integer
+
+        self.needed_column_indices_tuple = tuple(needed_column_indices_tuple)
+
+        self.integer_column_indices_tuple = tuple(integer_column_indices_tuple)
+
+        # This variable is what remains of a well-formed row once the check of a block
+        # deletes everything but the delimiters.
+        self.row_delimiters_bytes = b',' * (column_count_integer - 1) + b'\n'
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  lazy_text_column
+ #
+ #  Class Description:
+ #      This class is a read-only sequence of the fields of one text column of a block.
+ #      It keeps the block's text and splits it into fields the first time any field
+ #      is read, so a consumer that reads none of them never pays for the split.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  lines_string            the block's lines, each ending with a line break
+ #  int     column_index            the index of the column
+ #  int     column_count_integer    the number of columns in each row
+ #  int     row_count_integer       the number of rows in the block
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class lazy_text_column(collections.abc.Sequence):
+
+    def __init__(self, lines_string, column_index, column_count_integer, row_count_integer):
+
+        self.lines_string = lines_string
+
+        self.column_index = column_index
+
+        self.column_count_integer = column_count_integer
+
+        self.row_count_integer = row_count_integer
+
+        self.fields_list = None
+
+
+    def read_fields_list(self):
+
+        if self.fields_list is None:
+
+            self.fields_list \
+                = self.lines_string[:-1].replace('\n', ',').split(',') \
+                    [self.column_index::self.column_count_integer]
+
+            self.lines_string = None
+
+        return self.fields_list
+
+
+    def __len__(self):
+
+        return self.row_count_integer
+
+
+    def __getitem__(self, index):
+
+        return self.read_fields_list()[index]
+
+
+    def __iter__(self):
+
+        return iter(self.read_fields_list())
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  csv_line_source
+ #
+ #  Class Description:
+ #      This class is an iterator over the lines of some text and then of the blocks 
+ #      of text that follow it, each line with its line break, for the csv module.  It
+ #      reads a block only when it needs the rest of a line, so once the csv module 
+ #      stops, the text it has not read is the rest of the current block.
+ #
+ #  Class Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  String      text_string             the text before the blocks
+ #  int         lines_length_integer    the length of the whole lines at the text's 
+ #                                      start that the csv module must read
+ #  iterator    text_blocks_iterator    the blocks of text that follow
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class csv_line_source:
+
+    def __init__(self, text_string, lines_length_integer, text_blocks_iterator):
+
+        self.text_string = text_string
+
+        self.offset_integer = 0
+
+        self.lines_length_integer = lines_length_integer
+
+        self.text_blocks_iterator = text_blocks_iterator
+
+
+    def __iter__(self):
+
+        return self
+
+
+    def __next__(self):
+
+        line_break_index = self.text_string.find('\n', self.offset_integer)
+
+        if line_break_index != -1:
+
+            line_string = self.text_string[self.offset_integer:line_break_index + 1]
+
+            self.offset_integer = line_break_index + 1
+
+            return line_string
+
+
+        # Past the text's last line break, the csv module has read the whole lines.
+        line_pieces_list = [self.text_string[self.offset_integer:]]
+
+        self.lines_length_integer = 0
+
+        # This repetition loop reads blocks until one ends the line or the blocks run
+        # out.
+        for text_block_string in self.text_blocks_iterator:
+
+            line_break_index = text_block_string.find('\n')
+
+            if line_break_index == -1:
+
+                line_pieces_list.append(text_block_string)
+
+                continue
+
+            line_pieces_list.append(text_block_string[:line_break_index + 1])
+
+            self.text_string = text_block_string
+
+            self.offset_integer = line_break_index + 1
+
+            return ''.join(line_pieces_list)
+
+
+        self.text_string = ''
+
+        self.offset_integer = 0
+
+        line_string = ''.join(line_pieces_list)
+
+        if not line_string:
+
+            raise StopIteration
+
+        return line_string
+
+
+    def read_whole_lines_boolean(self):
+
+        return self.offset_integer >= self.lines_length_integer
+
+
+    def read_remaining_string(self):
+
+        return self.text_string[self.offset_integer:]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  parse_integer_fields
+ #
+ #  Subroutine Description:
+ #      This function converts the decimal integer in each field to a 64-bit integer
+ #      with NumPy.  It clears an optional leading sign and, from the widest field's 
+ #      first digit to its last, multiplies the values by ten and adds the digit at 
+ #      that distance from each field's end, or zero for a shorter field.  It returns
+ #      the array of values, or None if any field is empty, holds anything other than
+ #      an optional sign and digits, or has more digits than fit.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  array   block_array         the bytes as an array of unsigned 8-bit integers
+ #  array   field_starts_array  the byte offset of each field's first character
+ #  array   field_ends_array    the byte offset just past each field's last character
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def parse_integer_fields(block_array, field_starts_array, field_ends_array):
+
+    if len(field_starts_array) == 0:
+
+        return numpy.zeros(0, dtype = numpy.int64)
+
+    first_characters_array = block_array[field_starts_array]
+
+    digit_starts_array \
+        = field_starts_array \
+          + ((first_characters_array == CONSTANT_MINUS_BYTE) | (first_characters_array == CONSTANT_PLUS_BYTE))
+
+    digit_counts_array = field_ends_array - digit_starts_array
+
+    if digit_counts_array.min() < 1 or digit_counts_array.max() > CONSTANT_MAXIMUM_DIGIT_COUNT:
+
+        return None
+
+
+    values_array = numpy.zeros(len(field_starts_array), dtype = numpy.int64)
+
+    # This repetition loop adds one digit position of every field at a time, from the 
+    # widest field's first digit to the last digit.
+    for distance_integer in range(int(digit_counts_array.max()), 0, -1):
+
+        character_positions_array = field_ends_array - distance_integer
+
+        digits_array = block_array[character_positions_array] - numpy.uint8(CONSTANT_ZERO_BYTE)
+
+        digits_array[character_positions_array < digit_starts_array] = 0
+
+        if (digits_array > 9).any():
+
+            return None
+
+        values_array *= 10
+
+        values_array += digits_array
+
+
+    return numpy.where(first_characters_array == CONSTANT_MINUS_BYTE, -values_array, values_array)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  convert_integer_column
+ #
+ #  Subroutine Description:
+ #      This function converts a column of fields to a list of integers.  If the fields
+ #      hold only digits and minus signs, the json module parses the whole column as
+ #      one array, far faster than a call to int for each field; any other column, or
+ #      one the json module rejects, such as a field with a leading zero, goes to int,
+ #      which raises the same error for a field that is not an integer as the record-
+ #      at-a-time parse.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  list    fields_list     the fields of the column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def convert_integer_column(fields_list):
+
+    column_string = ','.join(fields_list)
+
+    if not column_string.encode('utf-8', 'surrogatepass').translate(None, CONSTANT_INTEGER_COLUMN_BYTES):
+
+        try:
+
+            integers_list = json.loads('[' + column_string + ']')
+
+        except ValueError:
+
+            integers_list = None
+
+        # A column of one empty field joins to an empty array, so the lengths must match.
+        if integers_list is not None and len(integers_list) == len(fields_list):
+
+            return integers_list
+
+    return list(map(int, fields_list))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  parse_schema_block_numpy
+ #
+ #  Subroutine Description:
+ #      This function parses a block of whole lines that passed the delimiter check 
+ #      with NumPy and returns the list of its columns, or None if an integer column
+ #      holds a field that parse_integer_fields does not convert.  Every field ends at
+ #      the next comma or line break, so one search for the delimiters gives the start
+ #      and end of every field.  The integer columns become lists of integers and the 
+ #      other needed columns lazy_text_column sequences.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  String  lines_string        the block's lines, each ending with a line break
+ #  bytes   block_bytes         the UTF-8 encoding of the lines
+ #  object  csv_schema_object   the schema of the csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def parse_schema_block_numpy(lines_string, block_bytes, csv_schema_object):
+
+    column_count_integer = csv_schema_object.column_count_integer
+
+    columns_list = [None] * column_count_integer
+
+    block_array = numpy.frombuffer(block_bytes, dtype = numpy.uint8)
+
+    field_ends_array \
+        = numpy.flatnonzero((block_array == CONSTANT_COMMA_BYTE) | (block_array == CONSTANT_NEWLINE_BYTE))
+
+    field_starts_array = numpy.concatenate(([0], field_ends_array[:-1] + 1))
+
+    row_count_integer = len(field_ends_array) // column_count_integer
+
+
+    for column_index in csv_schema_object.needed_column_indices_tuple:
+
+        if column_index in csv_schema_object.integer_column_indices_tuple:
+
+            values_array \
+                = parse_integer_fields \
+                    (block_array,
+                     field_starts_array[column_index::column_count_integer],
+                     field_ends_array[column_index::column_count_integer])
+
+            if values_array is None:
+
+                return None
+
+            columns_list[column_index] = values_array.tolist()
+
+        else:
+
+            columns_list[column_index] \
+                = lazy_text_column(lines_string, column_index, column_count_integer, row_count_integer)
+
+    return columns_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  parse_csv_records
+ #
+ #  Subroutine Description:
+ #      This function returns the list of columns of records the csv module parsed,
+ #      with a list of fields for each needed column, converted for an integer column,
+ #      and None for the others.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  list    csv_records_list    the records from the csv module
+ #  object  csv_schema_object   the schema of the csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def parse_csv_records(csv_records_list, csv_schema_object):
+
+    columns_list = [None] * csv_schema_object.column_count_integer
+
+    for column_index in csv_schema_object.needed_column_indices_tuple:
+
+        columns_list[column_index] = list(map(operator.itemgetter(column_index), csv_records_list))
+
+        if column_index in csv_schema_object.integer_column_indices_tuple:
+
+            columns_list[column_index] = convert_integer_column(columns_list[column_index])
+
+    return columns_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  parse_schema_block
+ #
+ #  Subroutine Description:
+ #      This function parses a block of whole lines of csv text and returns the list of
+ #      its columns, with a list of fields for each needed column and None for the
+ #      others.  If the block holds a quotation mark or a carriage return, or a row
+ #      does not have the schema's number of columns, the csv module parses the block
+ #      and the function takes the columns from the csv module's records.  The UTF-8
+ #      encoding of a comma or a line break never occurs inside another character, so
+ #      the check reads the block's UTF-8 bytes.  A block that passes goes to 
+ #      parse_schema_block_numpy if NumPy is installed and the schema has integer 
+ #      columns, and is split as text otherwise.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  String  block_string        the block of csv text
+ #  object  csv_schema_object   the schema of the csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Vectorized integer columns                  Nicholas J. George
+ #  10/18/2026          Quoted blocks read by the csv module        Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def parse_schema_block(block_string, csv_schema_object):
+
+    column_count_integer = csv_schema_object.column_count_integer
+
+    columns_list = [None] * column_count_integer
+
+    # This variable is the block with a line break after its last row, if the file
+    # does not end with one.
+    lines_string = block_string if block_string.endswith('\n') else block_string + '\n'
+
+
+    block_bytes = lines_string.encode('utf-8', 'surrogatepass')
+
+    delimiters_bytes = block_bytes.translate(None, CONSTANT_NON_DELIMITER_BYTES)
+
+    row_delimiters_bytes = csv_schema_object.row_delimiters_bytes
+
+
+    # If the block's delimiters are not those of well-formed rows, the csv module parses
+    # the block.
+    if delimiters_bytes != row_delimiters_bytes * (len(delimiters_bytes) // len(row_delimiters_bytes)):
+
+        return parse_csv_records(list(csv.reader(io.StringIO(block_string, newline = '\n'))), csv_schema_object)
+
+    if numpy is not None and csv_schema_object.integer_column_indices_tuple:
+
+        numpy_columns_list = parse_schema_block_numpy(lines_string, block_bytes, csv_schema_object)
+
+        if numpy_columns_list is not None:
+
+            return numpy_columns_list
+
+
+    # The fields of the block, split in one pass, fall into the columns in order.
+    fields_list = lines_string[:-1].replace('\n', ',').split(',')
+
+    for column_index in csv_schema_object.needed_column_indices_tuple:
+
+        columns_list[column_index] = fields_list[column_index::column_count_integer]
+
+        if column_index in csv_schema_object.integer_column_indices_tuple:
+
+            columns_list[column_index] = convert_integer_column(columns_list[column_index])
+
+    return columns_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  parse_schema_columns
+ #
+ #  Subroutine Description:
+ #      This generator joins blocks of csv text, in any sizes, into blocks of whole
+ #      lines, parses each with parse_schema_block, and yields each block's list of
+ #      columns.  If the lines hold a quotation mark, the csv module parses them
+ #      instead, and goes on reading lines from the next blocks while its last record
+ #      continues in a quoted field; the generator then goes on after that record.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  iterable    text_blocks             the blocks of csv text after the header row
+ #  object      csv_schema_object       the schema of the csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Quoted blocks read by the csv module        Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def parse_schema_columns(text_blocks, csv_schema_object):
+
+    text_blocks_iterator = iter(text_blocks)
+
+    pending_strings_list = []
+
+    pending_quote_boolean = False
+
+    for text_block_string in text_blocks_iterator:
+
+        pending_strings_list.append(text_block_string)
+
+        pending_quote_boolean = pending_quote_boolean or '"' in text_block_string
+
+        line_break_index = text_block_string.rfind('\n')
+
+        if line_break_index == -1:
+
+            continue
+
+
+        lines_string = ''.join(pending_strings_list[:-1]) + text_block_string[:line_break_index + 1]
+
+        remaining_string = text_block_string[line_break_index + 1:]
+
+        if not pending_quote_boolean:
+
+            pending_strings_list = [remaining_string]
+
+            yield parse_schema_block(lines_string, csv_schema_object)
+
+            continue
+
+
+        csv_line_source_object \
+            = csv_line_source(lines_string + remaining_string, len(lines_string), text_blocks_iterator)
+
+        csv_records_list = []
+
+        # This repetition loop reads records until the csv module has read the whole 
+        # lines and stands at the end of a record.
+        for csv_record_list in csv.reader(csv_line_source_object):
+
+            csv_records_list.append(csv_record_list)
+
+            if csv_line_source_object.read_whole_lines_boolean():
+
+                break
+
+        pending_strings_list = [csv_line_source_object.read_remaining_string()]
+
+        pending_quote_boolean = '"' in pending_strings_list[0]
+
+        yield parse_csv_records(csv_records_list, csv_schema_object)
+
+
+    pending_string = ''.join(pending_strings_list)
+
+    if pending_string:
+
+        yield parse_schema_block(pending_string, csv_schema_object)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_shard_blocks
+ #
+ #  Subroutine Description:
+ #      This generator yields the decoded text of one shard's byte range of the input
+ #      csv file in large blocks.  An incremental decoder carries a character split
+ #      between two blocks over to the next.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  binary_file             the input csv file opened in binary mode
+ #  int     start_integer           the byte offset of the shard's first line
+ #  int     end_integer             the byte offset just past the shard's last line
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_shard_blocks(binary_file, start_integer, end_integer):
+
+    decoder_object = codecs.getincrementaldecoder(locale.getpreferredencoding(False))()
+
+    position_integer = binary_file.seek(start_integer)
+
+    while position_integer < end_integer:
+
+        block_bytes = binary_file.read(min(CONSTANT_PARSE_BLOCK_SIZE, end_integer - position_integer))
+
+        if len(block_bytes) == 0:
+
+            break
+
+        position_integer += len(block_bytes)
+
+        yield decoder_object.decode(block_bytes, position_integer >= end_integer)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_quoted_line_breaks_numpy
+ #
+ #  Subroutine Description:
+ #      This generator yields, in order, the byte offsets of the line breaks inside 
+ #      quoted fields in a byte range that starts at the start of a row, on the 
+ #      assumption that the quotation marks alternate between opening and closing a
+ #      field: a line break after an odd number of them is inside a field.  It checks
+ #      the assumption with NumPy a window of the range at a time: each opening 
+ #      quotation mark must start the range or follow a comma, a line break, or the
+ #      closing quotation mark of a doubled pair, and each closing one must end the
+ #      range or come before a comma, a line break, a carriage return, or the opening
+ #      quotation mark of a pair.  If a quotation mark in a window fails the check, it
+ #      stops and returns where an exact scan can resume: just past the last opening
+ #      quotation mark, inside its field, or at the range's start if there is none,
+ #      and the window's start, before which it has yielded every line break.  
+ #      Otherwise it returns None.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  memory_map      the memory map of the csv file
+ #  int     start_integer   the byte offset of the range's first row
+ #  int     end_integer     the byte offset just past the range's last row
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_quoted_line_breaks_numpy(memory_map, start_integer, end_integer):
+
+    file_array = numpy.frombuffer(memory_map, dtype = numpy.uint8)
+
+    quote_count_integer = 0
+
+    # The scan resumes inside the last field opened, since a window may start between
+    # the two quotation marks of a pair.
+    resume_tuple = (start_integer, False)
+
+    for window_start_integer in range(start_integer, end_integer, CONSTANT_QUOTE_SCAN_WINDOW_SIZE):
+
+        window_array = file_array[window_start_integer:min(window_start_integer + CONSTANT_QUOTE_SCAN_WINDOW_SIZE, end_integer)]
+
+        quote_offsets_array = numpy.flatnonzero(window_array == CONSTANT_QUOTE_BYTE) + window_start_integer
+
+        # A window without quotation marks outside a quoted field has no line breaks 
+        # inside one.
+        if len(quote_offsets_array) == 0 and quote_count_integer % 2 == 0:
+
+            continue
+
+
+        opening_offsets_array = quote_offsets_array[quote_count_integer % 2::2]
+
+        closing_offsets_array = quote_offsets_array[1 - quote_count_integer % 2::2]
+
+        preceding_bytes_array = file_array[opening_offsets_array[opening_offsets_array > start_integer] - 1]
+
+        next_bytes_array = file_array[closing_offsets_array[closing_offsets_array < end_integer - 1] + 1]
+
+        if not numpy.isin(preceding_bytes_array, (CONSTANT_COMMA_BYTE, CONSTANT_NEWLINE_BYTE, CONSTANT_QUOTE_BYTE)).all() \
+            or not numpy.isin(next_bytes_array,
+                              (CONSTANT_COMMA_BYTE, CONSTANT_NEWLINE_BYTE, CONSTANT_CARRIAGE_RETURN_BYTE, CONSTANT_QUOTE_BYTE)).all():
+
+            return resume_tuple + (window_start_integer,)
+
+
+        # A line break after an odd number of quotation marks is inside a field.
+        line_break_offsets_array = numpy.flatnonzero(window_array == CONSTANT_NEWLINE_BYTE) + window_start_integer
+
+        quoted_mask_array \
+            = (numpy.searchsorted(quote_offsets_array, line_break_offsets_array) + quote_count_integer) % 2 == 1
+
+        yield from line_break_offsets_array[quoted_mask_array].tolist()
+
+        quote_count_integer += len(quote_offsets_array)
+
+        if len(opening_offsets_array) > 0:
+
+            resume_tuple = (int(opening_offsets_array[-1]) + 1, True)
+
+
+    return None
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_quoted_line_breaks
+ #
+ #  Subroutine Description:
+ #      This generator yields, in order, the byte offsets of the line breaks the csv
+ #      module reads inside quoted fields in a byte range that starts at the start of
+ #      a row, so a caller can split the range at any other line break.  A range
+ #      without quotation marks has none.  find_quoted_line_breaks_numpy answers as 
+ #      far as the quotation marks all open or close fields; from there, the generator
+ #      goes from one quotation mark to the next as the csv module reads them: one at
+ #      the start of a field opens a quoted field, which ends at a quotation mark that
+ #      is not doubled, and any other is an ordinary character.  It skips the line 
+ #      breaks find_quoted_line_breaks_numpy already yielded.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  memory_map      the memory map of the csv file
+ #  int     start_integer   the byte offset of the range's first row
+ #  int     end_integer     the byte offset just past the range's last row
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_quoted_line_breaks(memory_map, start_integer, end_integer):
+
+    if memory_map.find(b'"', start_integer, end_integer) == -1:
+
+        return
+
+    position_integer, quoted_boolean, yielded_end_integer = start_integer, False, start_integer
+
+    if numpy is not None:
+
+        resume_tuple = yield from find_quoted_line_breaks_numpy(memory_map, start_integer, end_integer)
+
+        if resume_tuple is None:
+
+            return
+
+        position_integer, quoted_boolean, yielded_end_integer = resume_tuple
+
+
+    # This repetition loop goes from each quotation mark outside a quoted field to the
+    # next one, and reads each quoted field to its end.
+    while True:
+
+        if quoted_boolean:
+
+            field_start_integer = position_integer
+
+            quoted_boolean = False
+
+        else:
+
+            opening_offset_integer = memory_map.find(b'"', position_integer, end_integer)
+
+            if opening_offset_integer == -1:
+
+                return
+
+            position_integer = opening_offset_integer + 1
+
+            if opening_offset_integer > start_integer \
+                and memory_map[opening_offset_integer - 1] not in (CONSTANT_COMMA_BYTE, CONSTANT_NEWLINE_BYTE):
+
+                continue
+
+            field_start_integer = opening_offset_integer + 1
+
+
+        closing_offset_integer = memory_map.find(b'"', field_start_integer, end_integer)
+
+        while closing_offset_integer != -1 \
+            and closing_offset_integer + 1 < end_integer \
+            and memory_map[closing_offset_integer + 1] == CONSTANT_QUOTE_BYTE:
+
+            closing_offset_integer = memory_map.find(b'"', closing_offset_integer + 2, end_integer)
+
+        field_end_integer = end_integer if closing_offset_integer == -1 else closing_offset_integer
+
+        line_break_offset_integer = memory_map.find(b'\n', field_start_integer, field_end_integer)
+
+        while line_break_offset_integer != -1:
+
+            if line_break_offset_integer >= yielded_end_integer:
+
+                yield line_break_offset_integer
+
+            line_break_offset_integer = memory_map.find(b'\n', line_break_offset_integer + 1, field_end_integer)
+
+        if closing_offset_integer == -1:
+
+            return
+
+        position_integer = closing_offset_integer + 1
@@ -0,0 +1,501 @@
+#*******************************************************************************************
+ #
+ #  File Name:  stage_profiling.py
+ #
+ #  File Description:
+ #      This module is the instrumentation layer shared by bank_main.py and
+ #      poll_main.py.  While profiling is off, measure_stage returns a single do-nothing
+ #      stage object and record_stage returns at once, so the instrumented code costs
+ #      one function call per stage.  Once start_profiling turns it on, every stage
+ #      accumulates its number of calls, wall time, rows, and bytes read, and the peak
+ #      memory tracemalloc traced while it ran; stages may nest, and each enclosing
+ #      stage's peak includes its inner stages.  The streaming aggregation core also
+ #      reports the time it spends parsing csv records and updating the aggregators.
+ #      stop_profiling returns the report as JSON or as Prometheus text with the
+ #      throughput of each stage, and it can also save a cProfile dump of the run.
+ #
+ #      Here is a List of classes, subroutines, and functions:
+ #
+ #      null_stage
+ #      profiled_stage
+ #      stage_profiler
+ #      measure_stage
+ #      record_stage
+ #      start_profiling
+ #      stop_profiling
+ #      format_json_report
+ #      format_prometheus_report
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import cProfile
+import json
+import time
+import tracemalloc
+
+
+# These constants are the report formats.
+CONSTANT_REPORT_FORMATS = ('json', 'prometheus')
+
+
+# This variable is the active profiler, or None while profiling is off.
+active_profiler = None
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  null_stage
+ #
+ #  Class Description:
+ #      This class is the do-nothing stage that measure_stage returns while profiling
+ #      is off.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class null_stage:
+
+    def __enter__(self):
+
+        return self
+
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+
+        return False
+
+
+    def record(self, rows_integer = 0, bytes_integer = 0):
+
+        pass
+
+
+# This constant is the single do-nothing stage.
+CONSTANT_NULL_STAGE = null_stage()
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  profiled_stage
+ #
+ #  Class Description:
+ #      This class times one run of a stage as a context manager.  On entry, it hands
+ #      the memory peak so far to the stages that enclose it and restarts tracemalloc's
+ #      peak; on exit, it adds its wall time, rows, bytes, and peak to the profiler's
+ #      totals for the stage and to the stages that enclose it.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  profiler            the active stage profiler
+ #  String  stage_name_string   the name of the stage
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class profiled_stage:
+
+    def __init__(self, profiler, stage_name_string):
+
+        self.profiler = profiler
+
+        self.stage_name_string = stage_name_string
+
+        self.rows_integer = 0
+
+        self.bytes_integer = 0
+
+        self.peak_memory_integer = 0
+
+
+    def __enter__(self):
+
+        if self.profiler.memory_boolean:
+
+            self.profiler.propagate_peak_memory(tracemalloc.get_traced_memory()[1])
+
+            tracemalloc.reset_peak()
+
+        self.profiler.open_stages_list.append(self)
+
+        self.start_time_float = time.perf_counter()
+
+        return self
+
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+
+        elapsed_seconds_float = time.perf_counter() - self.start_time_float
+
+        self.profiler.open_stages_list.pop()
+
+        if self.profiler.memory_boolean:
+
+            self.peak_memory_integer = max(self.peak_memory_integer, tracemalloc.get_traced_memory()[1])
+
+            self.profiler.propagate_peak_memory(self.peak_memory_integer)
+
+        self.profiler.add_stage_totals \
+            (self.stage_name_string,
+             elapsed_seconds_float,
+             self.rows_integer,
+             self.bytes_integer,
+             self.peak_memory_integer)
+
+        return False
+
+
+    def record(self, rows_integer = 0, bytes_integer = 0):
+
+        self.rows_integer += rows_integer
+
+        self.bytes_integer += bytes_integer
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  stage_profiler
+ #
+ #  Class Description:
+ #      This class holds the totals of each stage, in the order the stages first ran,
+ #      and the stages that are running.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  String  program_name_string the name of the program for the report
+ #  bool    memory_boolean      whether tracemalloc traces the peak memory
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class stage_profiler:
+
+    def __init__(self, program_name_string, memory_boolean):
+
+        self.program_name_string = program_name_string
+
+        self.memory_boolean = memory_boolean
+
+        # This dictionary maps each stage's name to its totals.
+        self.stage_totals_dictionary = {}
+
+        self.open_stages_list = []
+
+        self.start_time_float = time.perf_counter()
+
+
+    def propagate_peak_memory(self, peak_memory_integer):
+
+        for open_stage in self.open_stages_list:
+
+            open_stage.peak_memory_integer = max(open_stage.peak_memory_integer, peak_memory_integer)
+
+
+    def add_stage_totals \
+            (self, stage_name_string, elapsed_seconds_float, rows_integer, bytes_integer, peak_memory_integer = None):
+
+        stage_totals_dictionary \
+            = self.stage_totals_dictionary.setdefault \
+                (stage_name_string,
+                 {'Stage': stage_name_string, 'Calls': 0, 'Seconds': 0.0, 'Rows': 0, 'Bytes': 0, 'Peak Bytes': None})
+
+        stage_totals_dictionary['Calls'] += 1
+
+        stage_totals_dictionary['Seconds'] += elapsed_seconds_float
+
+        stage_totals_dictionary['Rows'] += rows_integer
+
+        stage_totals_dictionary['Bytes'] += bytes_integer
+
+        # A stage the caller times itself has no peak of its own; it shares the peak of
+        # the stage that encloses it.
+        if peak_memory_integer is not None and self.memory_boolean:
+
+            stage_totals_dictionary['Peak Bytes'] \
+                = max(stage_totals_dictionary['Peak Bytes'] or 0, peak_memory_integer)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  measure_stage
+ #
+ #  Subroutine Description:
+ #      This function returns a context manager that times a stage, or the do-nothing
+ #      stage while profiling is off.  Inside the with statement, the stage's record
+ #      method adds rows and bytes to the stage.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  String  stage_name_string   the name of the stage
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def measure_stage(stage_name_string):
+
+    if active_profiler is None:
+
+        return CONSTANT_NULL_STAGE
+
+    return profiled_stage(active_profiler, stage_name_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  record_stage
+ #
+ #  Subroutine Description:
+ #      This subroutine adds a time already measured by the caller, with its rows and
+ #      bytes, to a stage's totals, for work the caller interleaves with other stages
+ #      and times itself.  It does nothing while profiling is off.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  stage_name_string       the name of the stage
+ #  float   elapsed_seconds_float   the wall time in seconds
+ #  int     rows_integer            the number of rows (default: 0)
+ #  int     bytes_integer           the number of bytes read (default: 0)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def record_stage(stage_name_string, elapsed_seconds_float, rows_integer = 0, bytes_integer = 0):
+
+    if active_profiler is not None:
+
+        active_profiler.add_stage_totals(stage_name_string, elapsed_seconds_float, rows_integer, bytes_integer)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  start_profiling
+ #
+ #  Subroutine Description:
+ #      This subroutine turns profiling on: it creates the active profiler, starts
+ #      tracemalloc if the caller traces memory, and starts cProfile if the caller
+ #      asks for a dump.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  program_name_string     the name of the program for the report
+ #  bool    memory_boolean          whether to trace the peak memory (default: True)
+ #  bool    cprofile_boolean        whether to run cProfile (default: False)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def start_profiling(program_name_string, memory_boolean = True, cprofile_boolean = False):
+
+    global active_profiler
+
+    active_profiler = stage_profiler(program_name_string, memory_boolean)
+
+    if memory_boolean:
+
+        tracemalloc.start()
+
+    active_profiler.cprofile_profile = None
+
+    if cprofile_boolean:
+
+        active_profiler.cprofile_profile = cProfile.Profile()
+
+        active_profiler.cprofile_profile.enable()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  stop_profiling
+ #
+ #  Subroutine Description:
+ #      This function turns profiling off, saves the cProfile dump if the caller gives
+ #      a file name, and returns the report in the requested format.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  format_string           json or prometheus (default: json)
+ #  String  dump_file_name_string   the path of the cProfile dump (default: None)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def stop_profiling(format_string = 'json', dump_file_name_string = None):
+
+    global active_profiler
+
+    profiler, active_profiler = active_profiler, None
+
+    if profiler.cprofile_profile is not None:
+
+        profiler.cprofile_profile.disable()
+
+        if dump_file_name_string is not None:
+
+            profiler.cprofile_profile.dump_stats(dump_file_name_string)
+
+    if profiler.memory_boolean:
+
+        tracemalloc.stop()
+
+
+    report_dictionary \
+        = {'Program': profiler.program_name_string,
+           'Seconds': time.perf_counter() - profiler.start_time_float,
+           'Memory Traced': profiler.memory_boolean,
+           'Stages': []}
+
+    for stage_totals_dictionary in profiler.stage_totals_dictionary.values():
+
+        seconds_float = max(stage_totals_dictionary['Seconds'], 1e-9)
+
+        report_dictionary['Stages'].append \
+            (dict(stage_totals_dictionary,
+                  **{'Rows Per Second': stage_totals_dictionary['Rows'] / seconds_float,
+                     'MiB Per Second': stage_totals_dictionary['Bytes'] / (1024 * 1024) / seconds_float}))
+
+    if format_string == 'prometheus':
+
+        return format_prometheus_report(report_dictionary)
+
+    return format_json_report(report_dictionary)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  format_json_report
+ #
+ #  Subroutine Description:
+ #      This function returns the profiling report as indented JSON text.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  dictionary  report_dictionary       the profiling report
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def format_json_report(report_dictionary):
+
+    return json.dumps(report_dictionary, indent = 1) + '\n'
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  format_prometheus_report
+ #
+ #  Subroutine Description:
+ #      This function returns the profiling report in the Prometheus text exposition
+ #      format, with one gauge per measure and a stage label on each sample.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  dictionary  report_dictionary       the profiling report
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def format_prometheus_report(report_dictionary):
+
+    metric_prefix_string = report_dictionary['Program'].replace('.py', '').replace('-', '_')
+
+    report_lines_list \
+        = [f'# HELP {metric_prefix_string}_run_seconds Wall time of the profiled run in seconds.',
+           f'# TYPE {metric_prefix_string}_run_seconds gauge',
+           f'{metric_prefix_string}_run_seconds {report_dictionary["Seconds"]:.6f}']
+
+    for metric_name_string, key_string, help_string \
+        in (('stage_calls', 'Calls', 'Number of times the stage ran.'),
+            ('stage_seconds', 'Seconds', 'Wall time of the stage in seconds.'),
+            ('stage_rows', 'Rows', 'Rows the stage processed.'),
+            ('stage_bytes_read', 'Bytes', 'Bytes the stage read.'),
+            ('stage_rows_per_second', 'Rows Per Second', 'Rows per second of the stage.'),
+            ('stage_mib_per_second', 'MiB Per Second', 'MiB read per second by the stage.'),
+            ('stage_peak_traced_bytes', 'Peak Bytes', 'Peak memory traced by tracemalloc during the stage.')):
+
+        if key_string == 'Peak Bytes' and not report_dictionary['Memory Traced']:
+
+            continue
+
+        report_lines_list.append(f'# HELP {metric_prefix_string}_{metric_name_string} {help_string}')
+
+        report_lines_list.append(f'# TYPE {metric_prefix_string}_{metric_name_string} gauge')
+
+        for stage_dictionary in report_dictionary['Stages']:
+
+            metric_value = stage_dictionary[key_string]
+
+            if metric_value is None:
+
+                continue
+
+            # This line of code writes counts as integers and times and rates with six decimals.
+            metric_value_string \
+                = str(metric_value) if isinstance(metric_value, int) else f'{metric_value:.6f}'
+
+            report_lines_list.append \
+                (f'{metric_prefix_string}_{metric_name_string}{{stage="{stage_dictionary["Stage"]}"}} ' \
+                 + metric_value_string)
+
+    return '\n'.join(report_lines_list) + '\n'
@@ -0,0 +1,909 @@
+#*******************************************************************************************
+ #
+ #  File Name:  streaming_aggregation.py
+ #
+ #  File Description:
+ #      This module is the streaming aggregation core shared by bank_main.py and
+ #      poll_main.py.  An analysis is an aggregator object with four methods:
+ #      initialize, which sets up its running state; update, which adds a batch of csv
+ #      records to the state; merge, which folds in the state of an aggregator that ran
+ #      over the records that follow; and finalize, which returns the result.  The
+ #      module runs any number of aggregators together over a single pass through a csv
+ #      file, and, because the states merge, it also splits a file into shards, runs a
+ #      set of aggregators over each shard in a process pool, and merges the shards'
+ #      states in file order.  The same merge lets a program keep an aggregator's state
+ #      and add the records appended to a file later.  The module reads gzip, bz2, and
+ #      xz compressed files as it reads plain ones, and it shards a gzip file of
+ #      several members at member boundaries.  Given the csv schema of the file, it
+ #      parses the file in blocks with the schema parser and hands the aggregators
+ #      whole columns instead of records.  The module prints nothing: when a file runs
+ #      as fewer shards than were requested, it records a notice, which the command-line
+ #      programs take and print.
+ #
+ #      The scripts add this folder to the module search path, so the module is imported
+ #      as streaming_aggregation from either folder.
+ #
+ #      Here is a List of classes, subroutines, and functions:
+ #
+ #      streaming_aggregator
+ #      take_shard_notices
+ #      split_file_into_shards
+ #      read_shard_lines
+ #      update_aggregators
+ #      update_aggregators_with_profiling
+ #      update_aggregators_with_columns
+ #      aggregate_stream
+ #      aggregate_file
+ #      aggregate_file_shard
+ #      aggregate_gzip_shard
+ #      merge_aggregator_lists
+ #      aggregate_gzip_shards
+ #      aggregate_file_shards
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Aggregation of file-like streams        Nicholas J. George
+ #  10/18/2026      Stage profiling instrumentation         Nicholas J. George
+ #  10/18/2026      Compressed input files                  Nicholas J. George
+ #  10/18/2026      Schema-specialized csv parser           Nicholas J. George
+ #  10/18/2026      Shard boundaries outside quoted fields  Nicholas J. George
+ #  10/18/2026      Shard notices recorded, not printed     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import abc
+import contextlib
+import csv
+import itertools
+import locale
+import mmap
+import multiprocessing
+import os
+import time
+
+import compressed_input
+import schema_parser
+import stage_profiling
+
+
+# This constant is the number of records the module hands to each aggregator at a time
+# when several aggregators share one pass.
+CONSTANT_RECORD_BATCH_SIZE = 4096
+
+
+# This variable is the list of notices of the files that ran as fewer shards than
+# were requested, in the order they ran, since the command-line programs last took it.
+shard_notices_list = []
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  streaming_aggregator
+ #
+ #  Class Description:
+ #      This class is the base class of the aggregators.  A subclass stores its settings,
+ #      such as column indices, before it calls this class's constructor, and then
+ #      implements the four methods:
+ #
+ #      initialize  sets the running state to that of an empty file
+ #      update      adds an iterable of csv records, in file order, to the state
+ #      merge       folds in the state of an aggregator of the same class and settings
+ #                  that ran over the records following this aggregator's records, and
+ #                  returns this aggregator
+ #      finalize    returns the result for all of the records so far
+ #
+ #      A subclass may also override update_columns, which adds a block of records as
+ #      the schema parser's list of columns; by default, it rebuilds the records from
+ #      the columns, with None in the columns the schema does not parse, and calls
+ #      update.  The four methods are abstract, so a subclass that leaves one out
+ #      cannot be created.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #  10/18/2026          Abstract aggregator methods                 Nicholas J. George
+ #  10/18/2026          Abstract methods without bodies             Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class streaming_aggregator(abc.ABC):
+
+    def __init__(self):
+
+        self.initialize()
+
+
+    @abc.abstractmethod
+    def initialize(self):
+
+        pass
+
+
+    @abc.abstractmethod
+    def update(self, csv_records):
+
+        pass
+
+
+    def update_columns(self, columns_list):
+
+        self.update \
+            (zip(*[itertools.repeat(None) if column_list is None else column_list \
+                   for column_list in columns_list]))
+
+
+    @abc.abstractmethod
+    def merge(self, following_aggregator):
+
+        pass
+
+
+    @abc.abstractmethod
+    def finalize(self):
+
+        pass
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  take_shard_notices
+ #
+ #  Subroutine Description:
+ #      This function returns the list of the shard notices recorded since it last ran,
+ #      and empties it, so a command-line program can print them.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def take_shard_notices():
+
+    shard_notices_taken_list = shard_notices_list[:]
+
+    shard_notices_list.clear()
+
+    return shard_notices_taken_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  split_file_into_shards
+ #
+ #  Subroutine Description:
+ #      This function divides the input csv file, after its header row, into byte ranges
+ #      of roughly equal size and moves each boundary forward to the start of the next
+ #      row, so no row straddles two shards.  A quoted field may hold a line break, so
+ #      a boundary moves past the line breaks the schema parser finds inside quoted
+ #      fields.  If that leaves fewer shards than requested, the function records a
+ #      notice in shard_notices_list.  It returns a list of (start, end) byte offsets in
+ #      file order.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the input csv file
+ #  int     shard_count_integer     the requested number of shards
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Moved from poll_main.py                     Nicholas J. George
+ #  10/18/2026          Quoted line breaks stay in one shard        Nicholas J. George
+ #  10/18/2026          Boundaries outside quoted fields            Nicholas J. George
+ #  10/18/2026          Notice recorded, not printed                Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def split_file_into_shards(input_file_name_string, shard_count_integer):
+
+    shard_boundaries_list = []
+
+    quoted_boundary_boolean = False
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        # This line of code skips the header row, so the first shard starts at the first
+        # row of data.
+        binary_file.readline()
+
+        data_start_integer = binary_file.tell()
+
+        file_size_integer = binary_file.seek(0, os.SEEK_END)
+
+        shard_size_integer \
+            = max(1, (file_size_integer - data_start_integer) // max(1, shard_count_integer))
+
+        shard_boundaries_list.append(data_start_integer)
+
+
+        if file_size_integer > data_start_integer and shard_count_integer > 1:
+
+            with mmap.mmap(binary_file.fileno(), 0, access = mmap.ACCESS_READ) as memory_map, \
+                 contextlib.closing \
+                    (schema_parser.find_quoted_line_breaks(memory_map, data_start_integer, file_size_integer)) \
+                        as quoted_line_breaks_iterator:
+
+                quoted_line_break_integer = next(quoted_line_breaks_iterator, file_size_integer)
+
+
+                # This repetition loop places each interior boundary at the start of the
+                # row following the approximate split point, past any line break inside
+                # a quoted field.
+                for shard_index in range(1, shard_count_integer):
+
+                    approximate_boundary_integer = data_start_integer + shard_index * shard_size_integer
+
+                    if approximate_boundary_integer >= file_size_integer:
+
+                        break
+
+                    # A split point the last boundary has already passed would land
+                    # behind the quoted line breaks read so far.
+                    if approximate_boundary_integer <= shard_boundaries_list[-1]:
+
+                        continue
+
+                    boundary_integer = memory_map.find(b'\n', approximate_boundary_integer - 1) + 1 or file_size_integer
+
+                    while True:
+
+                        while quoted_line_break_integer < boundary_integer - 1:
+
+                            quoted_line_break_integer = next(quoted_line_breaks_iterator, file_size_integer)
+
+                        if quoted_line_break_integer != boundary_integer - 1:
+
+                            break
+
+                        quoted_boundary_boolean = True
+
+                        boundary_integer = memory_map.find(b'\n', boundary_integer) + 1 or file_size_integer
+
+                    if boundary_integer >= file_size_integer:
+
+                        break
+
+                    shard_boundaries_list.append(boundary_integer)
+
+
+        shard_boundaries_list.append(file_size_integer)
+
+
+    shard_ranges_list \
+        = [(shard_boundaries_list[shard_index], shard_boundaries_list[shard_index + 1]) \
+           for shard_index in range(len(shard_boundaries_list) - 1) \
+           if shard_boundaries_list[shard_index] < shard_boundaries_list[shard_index + 1]]
+
+    if quoted_boundary_boolean and len(shard_ranges_list) < shard_count_integer:
+
+        shard_notices_list.append \
+            (f'{os.path.basename(input_file_name_string)} runs as {len(shard_ranges_list)} of the '
+             f'{shard_count_integer} shards requested: quoted fields hold the line breaks where it would split.')
+
+    return shard_ranges_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_shard_lines
+ #
+ #  Subroutine Description:
+ #      This generator yields the decoded lines of the input csv file that fall within
+ #      one shard's byte range.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  binary_file             the input csv file opened in binary mode
+ #  int     start_integer           the byte offset of the shard's first line
+ #  int     end_integer             the byte offset just past the shard's last line
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Moved from poll_main.py                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_shard_lines(binary_file, start_integer, end_integer):
+
+    encoding_string = locale.getpreferredencoding(False)
+
+    position_integer = binary_file.seek(start_integer)
+
+    for line_bytes in binary_file:
+
+        if position_integer >= end_integer:
+
+            break
+
+        position_integer += len(line_bytes)
+
+        yield line_bytes.decode(encoding_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  update_aggregators
+ #
+ #  Subroutine Description:
+ #      This function adds the csv records to every aggregator in one pass and returns
+ #      the list of aggregators.  A single aggregator reads the records directly;
+ #      several aggregators receive the same batches of records in turn.  While
+ #      profiling is on, every aggregator receives batches, so the time spent reading
+ #      and parsing each batch and the time spent updating the aggregators go to the
+ #      parse and aggregate stages.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  csv_reader          the csv records after the header row
+ #  list    aggregators_list    the aggregators
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Stage profiling instrumentation             Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def update_aggregators(csv_reader, aggregators_list):
+
+    if stage_profiling.active_profiler is not None:
+
+        return update_aggregators_with_profiling(csv_reader, aggregators_list)
+
+
+    if len(aggregators_list) == 1:
+
+        aggregators_list[0].update(csv_reader)
+
+        return aggregators_list
+
+
+    csv_reader = iter(csv_reader)
+
+    for csv_records_list in iter(lambda: list(itertools.islice(csv_reader, CONSTANT_RECORD_BATCH_SIZE)), []):
+
+        for aggregator in aggregators_list:
+
+            aggregator.update(csv_records_list)
+
+    return aggregators_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  update_aggregators_with_profiling
+ #
+ #  Subroutine Description:
+ #      This function is update_aggregators while profiling is on: it times the
+ #      reading and parsing of each batch of records apart from the updates of the
+ #      aggregators and adds both times, with the number of rows, to the parse and
+ #      aggregate stages.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  csv_reader          the csv records after the header row
+ #  list    aggregators_list    the aggregators
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def update_aggregators_with_profiling(csv_reader, aggregators_list):
+
+    csv_reader = iter(csv_reader)
+
+    parse_seconds_float = aggregate_seconds_float = 0.0
+
+    row_count_integer = 0
+
+
+    while True:
+
+        start_time_float = time.perf_counter()
+
+        csv_records_list = list(itertools.islice(csv_reader, CONSTANT_RECORD_BATCH_SIZE))
+
+        parse_end_time_float = time.perf_counter()
+
+        parse_seconds_float += parse_end_time_float - start_time_float
+
+        if len(csv_records_list) == 0:
+
+            break
+
+        for aggregator in aggregators_list:
+
+            aggregator.update(csv_records_list)
+
+        aggregate_seconds_float += time.perf_counter() - parse_end_time_float
+
+        row_count_integer += len(csv_records_list)
+
+
+    stage_profiling.record_stage('parse', parse_seconds_float, row_count_integer)
+
+    stage_profiling.record_stage('aggregate', aggregate_seconds_float, row_count_integer)
+
+    return aggregators_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  update_aggregators_with_columns
+ #
+ #  Subroutine Description:
+ #      This function adds the blocks of columns from the schema parser to every
+ #      aggregator, one block at a time, and returns the list of aggregators.  While
+ #      profiling is on, it adds the time spent reading and parsing the blocks and the
+ #      time spent updating the aggregators, with the number of rows, to the parse and
+ #      aggregate stages.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                Description
+ #  -----       -------------       ----------------------------------------------
+ #  iterable    column_blocks       the schema parser's lists of columns
+ #  list        aggregators_list    the aggregators
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def update_aggregators_with_columns(column_blocks, aggregators_list):
+
+    if stage_profiling.active_profiler is None:
+
+        for columns_list in column_blocks:
+
+            for aggregator in aggregators_list:
+
+                aggregator.update_columns(columns_list)
+
+        return aggregators_list
+
+
+    column_blocks = iter(column_blocks)
+
+    parse_seconds_float = aggregate_seconds_float = 0.0
+
+    row_count_integer = 0
+
+
+    while True:
+
+        start_time_float = time.perf_counter()
+
+        columns_list = next(column_blocks, None)
+
+        parse_end_time_float = time.perf_counter()
+
+        parse_seconds_float += parse_end_time_float - start_time_float
+
+        if columns_list is None:
+
+            break
+
+        for aggregator in aggregators_list:
+
+            aggregator.update_columns(columns_list)
+
+        aggregate_seconds_float += time.perf_counter() - parse_end_time_float
+
+        row_count_integer += max(map(len, filter(None, columns_list)), default = 0)
+
+
+    stage_profiling.record_stage('parse', parse_seconds_float, row_count_integer)
+
+    stage_profiling.record_stage('aggregate', aggregate_seconds_float, row_count_integer)
+
+    return aggregators_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  aggregate_stream
+ #
+ #  Subroutine Description:
+ #      This function runs the aggregators over the records of a text stream in csv
+ #      format, after its header row, in a single pass and returns the list of 
+ #      aggregators.  The caller opens and closes the stream.  Given the csv schema of
+ #      the stream, the schema parser reads the stream in blocks of text, and the
+ #      aggregators receive its columns.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  text_stream             a file-like object open in text mode
+ #  list    aggregators_list        the aggregators
+ #  object  csv_schema_object       the csv schema of the stream (default: None)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def aggregate_stream(text_stream, aggregators_list, csv_schema_object = None):
+
+    if csv_schema_object is not None:
+
+        text_stream.readline()
+
+        return update_aggregators_with_columns \
+                    (schema_parser.parse_schema_columns \
+                        (iter(lambda: text_stream.read(schema_parser.CONSTANT_PARSE_BLOCK_SIZE), ''),
+                         csv_schema_object),
+                     aggregators_list)
+
+
+    csv_reader = csv.reader(text_stream)
+
+    next(csv_reader, None)
+
+    return update_aggregators(csv_reader, aggregators_list)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  aggregate_file
+ #
+ #  Subroutine Description:
+ #      This function runs the aggregators over the records of a csv file, after its
+ #      header row, in a single pass and returns the list of aggregators.  A compressed
+ #      file decompresses as the aggregators read it.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the input csv file
+ #  list    aggregators_list        the aggregators
+ #  object  csv_schema_object       the csv schema of the file (default: None)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Aggregation of file-like streams            Nicholas J. George
+ #  10/18/2026          Compressed input files                      Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def aggregate_file(input_file_name_string, aggregators_list, csv_schema_object = None):
+
+    with compressed_input.open_input_file(input_file_name_string) as csv_file:
+
+        return aggregate_stream(csv_file, aggregators_list, csv_schema_object)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  aggregate_file_shard
+ #
+ #  Subroutine Description:
+ #      This function runs in a worker process.  It creates a set of aggregators with
+ #      the factory function, runs them over one shard of the input csv file, and
+ #      returns them.  Given the csv schema of the file, the schema parser reads the
+ #      shard in blocks.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  tuple   shard_tuple     the input file path, the shard's start and end byte
+ #                          offsets, a module-level function, or a partial of
+ #                          one, that returns a new list of aggregators, and the
+ #                          csv schema of the file or None
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def aggregate_file_shard(shard_tuple):
+
+    input_file_name_string, start_integer, end_integer, aggregators_factory_function, csv_schema_object \
+        = shard_tuple
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        if csv_schema_object is not None:
+
+            return update_aggregators_with_columns \
+                        (schema_parser.parse_schema_columns \
+                            (schema_parser.read_shard_blocks(binary_file, start_integer, end_integer),
+                             csv_schema_object),
+                         aggregators_factory_function())
+
+        return update_aggregators \
+                    (csv.reader(read_shard_lines(binary_file, start_integer, end_integer)),
+                     aggregators_factory_function())
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  aggregate_gzip_shard
+ #
+ #  Subroutine Description:
+ #      This function runs in a worker process.  It creates a set of aggregators with
+ #      the factory function, runs them over the lines that lie wholly within one shard
+ #      of gzip members, and returns them with the shard's fragments dictionary, which
+ #      holds the partial lines at the ends of the shard and the offset where its last
+ #      member ends.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  tuple   shard_tuple     the input file path, the shard's start and end byte
+ #                          offsets, and a module-level function, or a partial of
+ #                          one, that returns a new list of aggregators
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def aggregate_gzip_shard(shard_tuple):
+
+    input_file_name_string, start_integer, end_integer, aggregators_factory_function = shard_tuple
+
+    fragments_dictionary = {}
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        aggregators_list \
+            = update_aggregators \
+                (csv.reader \
+                    (compressed_input.read_gzip_shard_lines \
+                        (binary_file, start_integer, end_integer, fragments_dictionary)),
+                 aggregators_factory_function())
+
+    return aggregators_list, fragments_dictionary
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  merge_aggregator_lists
+ #
+ #  Subroutine Description:
+ #      This function merges lists of aggregators, one list per shard in file order,
+ #      into the first list and returns it.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  list    aggregator_lists_list       the lists of aggregators in file order
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def merge_aggregator_lists(aggregator_lists_list):
+
+    merged_aggregators_list = aggregator_lists_list[0]
+
+    for following_aggregators_list in aggregator_lists_list[1:]:
+
+        for aggregator, following_aggregator in zip(merged_aggregators_list, following_aggregators_list):
+
+            aggregator.merge(following_aggregator)
+
+    return merged_aggregators_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  aggregate_gzip_shards
+ #
+ #  Subroutine Description:
+ #      This function splits a gzip file of several members into shards at member
+ #      boundaries, runs a new set of aggregators over each shard in a process pool,
+ #      and returns the merged list of aggregators.  Between each pair of shards, it
+ #      joins the partial lines at their ends and runs another set of aggregators over
+ #      the joined line, so every record is counted once and in file order, and it
+ #      skips the first line, the header row.  A file of one member, or one whose 
+ #      shards do not end where the next begins, is read in one pass instead, with the
+ #      schema parser if the caller gives the csv schema.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                            Description
+ #  -----       -------------                   ----------------------------------------------
+ #  String      input_file_name_string          the path of the gzip file
+ #  function    aggregators_factory_function    a module-level function, or a partial of
+ #                                              one, that returns a new list of aggregators
+ #  int         worker_count_integer            the number of worker processes
+ #  object      csv_schema_object               the csv schema of the file (default: None)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def aggregate_gzip_shards \
+        (input_file_name_string, aggregators_factory_function, worker_count_integer, csv_schema_object = None):
+
+    shard_tuples_list \
+        = [(input_file_name_string, start_integer, end_integer, aggregators_factory_function) \
+           for start_integer, end_integer \
+               in compressed_input.split_gzip_file_into_shards(input_file_name_string, worker_count_integer)]
+
+    if len(shard_tuples_list) <= 1:
+
+        return aggregate_file(input_file_name_string, aggregators_factory_function(), csv_schema_object)
+
+
+    with multiprocessing.Pool(min(worker_count_integer, len(shard_tuples_list))) as process_pool:
+
+        shard_results_list = process_pool.map(aggregate_gzip_shard, shard_tuples_list)
+
+    # If a shard's last member did not end where the next shard begins, a boundary was
+    # not a member start, and the function reads the file in one pass instead.
+    if any(fragments_dictionary['End'] != shard_tuple[2] \
+           for (_, fragments_dictionary), shard_tuple in zip(shard_results_list, shard_tuples_list)):
+
+        return aggregate_file(input_file_name_string, aggregators_factory_function(), csv_schema_object)
+
+
+    encoding_string = locale.getpreferredencoding(False)
+
+    aggregator_lists_list = []
+
+    pending_bytes = b''
+
+    header_boolean = True
+
+
+    # This repetition loop lists the shards' aggregators in file order, with those of
+    # each line joined from the partial lines at the ends of neighboring shards in 
+    # between; the first line, the header row, has no aggregators.
+    for aggregators_list, fragments_dictionary in shard_results_list:
+
+        if fragments_dictionary['Head'] is None:
+
+            pending_bytes += fragments_dictionary['Tail']
+
+            continue
+
+        if header_boolean:
+
+            header_boolean = False
+
+        else:
+
+            aggregator_lists_list.append \
+                (update_aggregators \
+                    (csv.reader([(pending_bytes + fragments_dictionary['Head']).decode(encoding_string)]),
+                     aggregators_factory_function()))
+
+        aggregator_lists_list.append(aggregators_list)
+
+        pending_bytes = fragments_dictionary['Tail']
+
+    if pending_bytes and not header_boolean:
+
+        aggregator_lists_list.append \
+            (update_aggregators \
+                (csv.reader([pending_bytes.decode(encoding_string)]), aggregators_factory_function()))
+
+
+    if len(aggregator_lists_list) == 0:
+
+        return aggregators_factory_function()
+
+    return merge_aggregator_lists(aggregator_lists_list)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  aggregate_file_shards
+ #
+ #  Subroutine Description:
+ #      This function splits a csv file into shards, runs a new set of aggregators over
+ #      each shard in a process pool, and returns the merged list of aggregators.  A
+ #      gzip file is split at member boundaries; a bz2 or xz file is read in one pass.
+ #      Given the csv schema of the file, the schema parser reads the shards of a
+ #      plain file and the one-pass reads.  With more than one worker, a one-pass read
+ #      records a notice in shard_notices_list.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                            Description
+ #  -----       -------------                   ----------------------------------------------
+ #  String      input_file_name_string          the path of the input csv file
+ #  function    aggregators_factory_function    a module-level function, or a partial of
+ #                                              one, that returns a new list of aggregators
+ #  int         worker_count_integer            the number of worker processes
+ #  object      csv_schema_object               the csv schema of the file (default: None)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Compressed input files                      Nicholas J. George
+ #  10/18/2026          Schema-specialized csv parser               Nicholas J. George
+ #  10/18/2026          Notice of a one-pass compressed file        Nicholas J. George
+ #  10/18/2026          Notice recorded, not printed                Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def aggregate_file_shards \
+        (input_file_name_string, aggregators_factory_function, worker_count_integer, csv_schema_object = None):
+
+    format_name_string = compressed_input.detect_compression_format(input_file_name_string)
+
+    if format_name_string == 'gzip':
+
+        return aggregate_gzip_shards \
+                    (input_file_name_string, aggregators_factory_function, worker_count_integer, csv_schema_object)
+
+    elif format_name_string is not None:
+
+        if worker_count_integer > 1:
+
+            shard_notices_list.append \
+                (f'{os.path.basename(input_file_name_string)} runs as 1 of the {worker_count_integer} shards '
+                 f'requested: a {format_name_string} file is read in one pass.')
+
+        return aggregate_file(input_file_name_string, aggregators_factory_function(), csv_schema_object)
+
+
+    shard_tuples_list \
+        = [(input_file_name_string, start_integer, end_integer, aggregators_factory_function, csv_schema_object) \
+           for start_integer, end_integer \
+               in split_file_into_shards(input_file_name_string, worker_count_integer)]
+
+    if len(shard_tuples_list) == 0:
+
+        return aggregators_factory_function()
+
+    with multiprocessing.Pool(max(1, min(worker_count_integer, len(shard_tuples_list)))) as process_pool:
+
+        return merge_aggregator_lists(process_pool.map(aggregate_file_shard, shard_tuples_list))
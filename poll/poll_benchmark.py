@@ -0,0 +1,369 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_benchmark.py
+ #
+ #  File Description:
+ #      This program measures the throughput, in rows per second, of the candidate vote
+ #      tally in poll_main.py.  It builds a synthetic set of ballot rows in memory with a
+ #      configurable number of rows and candidates, then times the original repetition
+ #      loop, which searched the list of candidate names for every ballot, against the
+ #      hash-indexed tally, tally_candidate_votes.  The program also checks that both
+ #      approaches produce the same candidates, in the same order, with the same vote
+ #      counts before it prints the results to the terminal.  It then writes the rows to
+ #      a temporary csv file and compares the csv module against the program's file
+ #      tally in the same way: the memory-mapped candidate column scanner for up to
+ #      CONSTANT_SCAN_SUFFIX_COUNT_LIMIT candidates and the schema parser for more.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      generate_ballot_rows
+ #      tally_candidate_votes_by_list_search
+ #      time_tally_function
+ #      time_file_scans
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Memory-mapped scanner benchmark         Nicholas J. George
+ #  10/18/2026      Schema parser for many candidates       Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+import poll_main
+
+
+# These constants are the default size of the synthetic ballot data.
+CONSTANT_DEFAULT_ROW_COUNT = 1_000_000
+
+CONSTANT_DEFAULT_CANDIDATE_COUNT = 300
+
+CONSTANT_DEFAULT_SEED = 20231030
+
+
+# This constant is the header row for the synthetic ballot data.
+CONSTANT_HEADER_ROW = ['Voter ID', 'County', 'Candidate']
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  generate_ballot_rows
+ #
+ #  Subroutine Description:
+ #      This function returns a list of synthetic ballot rows, including the header row,
+ #      where a few leading candidates receive most of the votes and the remaining
+ #      candidates are write-ins.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  int     row_count_integer       the number of ballots
+ #  int     candidate_count_integer the number of distinct candidates
+ #  int     seed_integer            the seed for the random number generator
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def generate_ballot_rows(row_count_integer, candidate_count_integer, seed_integer):
+
+    random_generator = random.Random(seed_integer)
+
+    candidate_names_list \
+        = [f'Candidate {candidate_index:05d}' for candidate_index in range(candidate_count_integer)]
+
+    # The first three candidates receive most of the votes; the rest share the remainder.
+    candidate_weights_list \
+        = [100.0 if candidate_index < 3 else 1.0 for candidate_index in range(candidate_count_integer)]
+
+    ballot_rows_list = [CONSTANT_HEADER_ROW]
+
+    for row_index, candidate_name \
+        in enumerate \
+            (random_generator.choices \
+                (candidate_names_list, candidate_weights_list, k = row_count_integer)):
+
+        ballot_rows_list.append([str(1_000_000 + row_index), 'County', candidate_name])
+
+    return ballot_rows_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tally_candidate_votes_by_list_search
+ #
+ #  Subroutine Description:
+ #      This function reproduces the original tally from read_file_and_calculate_values:
+ #      for every ballot, it searches the list of candidate names, which it rebuilds from
+ #      the summary dictionary, and increments the matching vote count.  It returns the
+ #      summary dictionary and the number of rows it counted.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  csv_reader      the rows of ballot data after the header row
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tally_candidate_votes_by_list_search(csv_reader):
+
+    summary_dictionary \
+        = {'Total Votes': 0,
+           'Candidates': {'Name': [], 'Percent': [], 'Vote Count': []},
+           'Winner' : ''}
+
+    csv_index = 0
+
+    for csv_index, csv_record in enumerate(csv_reader, 1):
+
+        current_candidate_name_string \
+            = csv_record[poll_main.data_column_indices_enumeration.CANDIDATE_INDEX.value]
+
+        candidate_found_boolean = False
+
+        for candidate_index, candidate_name \
+            in enumerate \
+                (summary_dictionary \
+                    [list(summary_dictionary.keys())[1]] \
+                    [list(list(summary_dictionary.items())[1][1].keys())[0]]):
+
+            if candidate_name == current_candidate_name_string:
+
+                summary_dictionary \
+                    [list(summary_dictionary.keys())[1]] \
+                    [list(list(summary_dictionary.items())[1][1].keys())[2]] \
+                    [candidate_index] \
+                        += 1
+
+                candidate_found_boolean = True
+
+                break
+
+        if candidate_found_boolean == False:
+
+            summary_dictionary \
+                [list(summary_dictionary.keys())[1]] \
+                [list(list(summary_dictionary.items())[1][1].keys())[0]] \
+                .append(current_candidate_name_string)
+
+            summary_dictionary \
+                [list(summary_dictionary.keys())[1]] \
+                [list(list(summary_dictionary.items())[1][1].keys())[2]] \
+                .append(1)
+
+    return summary_dictionary, csv_index
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  time_tally_function
+ #
+ #  Subroutine Description:
+ #      This function runs a tally function over the ballot rows after the header row and
+ #      returns its result and its elapsed wall time in seconds.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                Description
+ #  -----       -------------       ----------------------------------------------
+ #  function    tally_function      the tally function to time
+ #  list        ballot_rows_list    the rows of ballot data, including the header row
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def time_tally_function(tally_function, ballot_rows_list):
+
+    ballot_rows_iterator = iter(ballot_rows_list)
+
+    next(ballot_rows_iterator)
+
+    start_time_float = time.perf_counter()
+
+    tally_result_tuple = tally_function(ballot_rows_iterator)
+
+    return tally_result_tuple, time.perf_counter() - start_time_float
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  time_file_scans
+ #
+ #  Subroutine Description:
+ #      This function writes the ballot rows to a temporary csv file, then times the csv
+ #      module tally and the program's file tally, tally_file_shard, which runs the
+ #      memory-mapped scanner or, for many candidates, the schema parser, over the file.
+ #      It returns both results and both elapsed wall times in seconds.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  list    ballot_rows_list    the rows of ballot data, including the header row
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Schema parser for many candidates           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def time_file_scans(ballot_rows_list):
+
+    with tempfile.TemporaryDirectory() as temporary_directory_string:
+
+        input_file_name_string = os.path.join(temporary_directory_string, 'election_data.csv')
+
+        with open(input_file_name_string, 'w', newline = '') as csv_file:
+
+            csv.writer(csv_file, lineterminator = '\n').writerows(ballot_rows_list)
+
+
+        start_time_float = time.perf_counter()
+
+        with open(input_file_name_string) as csv_file:
+
+            csv_reader = csv.reader(csv_file)
+
+            next(csv_reader, None)
+
+            csv_result_tuple = poll_main.tally_candidate_votes(csv_reader)
+
+        csv_seconds_float = time.perf_counter() - start_time_float
+
+
+        start_time_float = time.perf_counter()
+
+        with open(input_file_name_string, 'rb') as binary_file:
+
+            data_start_integer = len(binary_file.readline())
+
+        scan_result_tuple \
+            = poll_main.tally_file_shard \
+                ((input_file_name_string, data_start_integer, os.path.getsize(input_file_name_string)))
+
+        scan_seconds_float = time.perf_counter() - start_time_float
+
+
+    return csv_result_tuple, csv_seconds_float, scan_result_tuple, scan_seconds_float
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name: n/a
+ #
+ #  Subroutine Description:
+ #      This is the main subroutine, the beginning and end of this program's execution.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(description = 'Benchmark the candidate vote tally.')
+
+    argument_parser.add_argument('--rows', type = int, default = CONSTANT_DEFAULT_ROW_COUNT)
+
+    argument_parser.add_argument('--candidates', type = int, default = CONSTANT_DEFAULT_CANDIDATE_COUNT)
+
+    argument_parser.add_argument('--seed', type = int, default = CONSTANT_DEFAULT_SEED)
+
+    arguments_namespace = argument_parser.parse_args()
+
+
+    ballot_rows_list \
+        = generate_ballot_rows \
+            (arguments_namespace.rows, arguments_namespace.candidates, arguments_namespace.seed)
+
+    (list_summary_dictionary, list_row_count_integer), list_seconds_float \
+        = time_tally_function(tally_candidate_votes_by_list_search, ballot_rows_list)
+
+    (candidate_votes_dictionary, hash_row_count_integer), hash_seconds_float \
+        = time_tally_function(poll_main.tally_candidate_votes, ballot_rows_list)
+
+
+    # The program stops if the two tallies disagree on the candidates, their order, their
+    # vote counts, or the total number of votes.
+    assert list_row_count_integer == hash_row_count_integer
+
+    assert list_summary_dictionary['Candidates']['Name'] == list(candidate_votes_dictionary.keys())
+
+    assert list_summary_dictionary['Candidates']['Vote Count'] == list(candidate_votes_dictionary.values())
+
+
+    print()
+
+    print(f'Rows: {arguments_namespace.rows:,}  Candidates: {arguments_namespace.candidates:,}')
+
+    print()
+
+    print(f'List search tally: {list_seconds_float:,.3f} s ' \
+          + f'({arguments_namespace.rows / list_seconds_float:,.0f} rows/sec)')
+
+    print(f'Hash-indexed tally: {hash_seconds_float:,.3f} s ' \
+          + f'({arguments_namespace.rows / hash_seconds_float:,.0f} rows/sec)')
+
+    print()
+
+    print(f'Speedup: {list_seconds_float / hash_seconds_float:,.1f}x')
+
+    print()
+
+
+    csv_result_tuple, csv_seconds_float, scan_result_tuple, scan_seconds_float \
+        = time_file_scans(ballot_rows_list)
+
+    # The program stops if the file tally disagrees with the csv module.
+    assert csv_result_tuple == scan_result_tuple
+
+    assert list(csv_result_tuple[0].keys()) == list(scan_result_tuple[0].keys())
+
+
+    print(f'csv module file tally: {csv_seconds_float:,.3f} s ' \
+          + f'({arguments_namespace.rows / csv_seconds_float:,.0f} rows/sec)')
+
+    # The scanner counts up to its limit of candidates, and the schema parser the rest.
+    file_tally_name_string \
+        = 'Memory-mapped file scan' \
+          if len(scan_result_tuple[0]) <= poll_main.CONSTANT_SCAN_SUFFIX_COUNT_LIMIT else 'Schema parser file tally'
+
+    print(f'{file_tally_name_string}: {scan_seconds_float:,.3f} s ' \
+          + f'({arguments_namespace.rows / scan_seconds_float:,.0f} rows/sec)')
+
+    print()
+
+    print(f'Speedup: {csv_seconds_float / scan_seconds_float:,.1f}x')
+
+    print()
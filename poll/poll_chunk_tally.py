@@ -0,0 +1,673 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_chunk_tally.py
+ #
+ #  File Description:
+ #      This module lets poll_main.py recount an amended ballot csv file by counting
+ #      only the parts of the file that changed.  It divides the rows after the header
+ #      row into chunks of whole lines and keeps, in a JSON sidecar file next to the
+ #      csv file, the BLAKE2 digest, candidate votes, and row count of each chunk in
+ #      file order, a list of digests much like the leaves of a Merkle tree, together
+ #      with the totals.  On the next run, the module digests the chunks again,
+ #      subtracts the votes of the chunks whose digests disappeared from the totals,
+ #      counts only the chunks whose digests are new, and adds their votes, so the
+ #      cost of counting grows with the size of the amendment rather than the file.
+ #
+ #      A chunk ends after a row whose CRC-32 is a multiple of the chunk divisor, or
+ #      once it reaches the maximum number of rows.  A row is a line, or the lines 
+ #      joined at the line breaks inside its quoted fields, so no chunk ends inside a
+ #      quoted field.  Because the boundaries depend on the lines themselves rather
+ #      than on byte offsets, a correction that changes the length of a row, or
+ #      inserts or deletes rows, changes the digests of only the chunks around it, and
+ #      the later chunks keep their boundaries and digests.
+ #
+ #      The sidecar file also keeps each chunk's byte offsets, so the next run does
+ #      not split the lines of the chunks that did not change.  It digests each saved
+ #      chunk's bytes, in large slices of a memory map, where the chunk would start 
+ #      now, and finds the boundaries line by line only from a chunk that differs to
+ #      the next chunk that has a saved digest.  A run after a small amendment
+ #      therefore costs about one BLAKE2 pass over the file, which is several times
+ #      cheaper than parsing and counting it.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      get_chunks_file_name
+ #      find_range_chunks
+ #      find_file_chunks
+ #      read_chunk_tallies
+ #      write_chunk_tallies
+ #      recount_file_chunks
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Chunks end outside quoted fields        Nicholas J. George
+ #  10/18/2026      Unchanged chunks digested in place      Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import collections
+import contextlib
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import sys
+import zlib
+
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+
+import schema_parser
+
+
+# This constant is the file name extension of the sidecar file.
+CONSTANT_CHUNKS_FILE_EXTENSION = '.chunks'
+
+CONSTANT_CHUNKS_VERSION = 2
+
+
+# These constants are the average and the maximum number of rows in a chunk.
+CONSTANT_CHUNK_LINE_DIVISOR = 4096
+
+CONSTANT_CHUNK_LINE_LIMIT = 16 * CONSTANT_CHUNK_LINE_DIVISOR
+
+
+# This constant is the number of bytes the module reads at a time, which is also about
+# the most it reads past the end of an amendment.
+CONSTANT_CHUNK_BLOCK_SIZE = 1024 * 1024
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  get_chunks_file_name
+ #
+ #  Subroutine Description:
+ #      This function returns the path of the sidecar file for an input csv file: the
+ #      input path with its extension replaced by .chunks.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the input csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def get_chunks_file_name(input_file_name_string):
+
+    return os.path.splitext(input_file_name_string)[0] + CONSTANT_CHUNKS_FILE_EXTENSION
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_range_chunks
+ #
+ #  Subroutine Description:
+ #      This generator reads a byte range of the input csv file that starts at the
+ #      start of a row and yields a (start, end, digest) tuple for each chunk in file
+ #      order, with the byte offsets of the chunk's first row and of the
+ #      end of its last row.  The last chunk ends at the end of the range, and a final
+ #      row without a line break belongs to it.  The rows are the lines of the range,
+ #      except that the line breaks inside quoted fields, which 
+ #      find_quoted_line_breaks finds in a memory map of the file, join their lines
+ #      into one row.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  binary_file     the input csv file opened in binary mode
+ #  object  memory_map      the memory map of the input csv file
+ #  int     start_integer   the byte offset of the range's first row
+ #  int     end_integer     the byte offset just past the range's last row
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Quoted line breaks stay in one chunk        Nicholas J. George
+ #  10/18/2026          Rows joined at quoted line breaks           Nicholas J. George
+ #  10/18/2026          Chunks of a byte range                      Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_range_chunks(binary_file, memory_map, start_integer, end_integer):
+
+    if end_integer <= start_integer:
+
+        return
+
+    binary_file.seek(start_integer)
+
+    chunk_start_integer = start_integer
+
+    # The block offset is the byte offset of the first byte of the current block, which
+    # begins with the partial row left over from the previous block.
+    block_offset_integer = chunk_start_integer
+
+    chunk_digest_object = hashlib.blake2b(digest_size = 16)
+
+    chunk_line_count_integer = 0
+
+    remainder_bytes = b''
+
+    # This list holds the byte offsets of the line breaks inside quoted fields that have
+    # been found at or after the block offset.
+    quoted_line_breaks_list = []
+
+
+    with contextlib.closing \
+            (schema_parser.find_quoted_line_breaks(memory_map, start_integer, end_integer)) \
+                as quoted_line_breaks_iterator:
+
+        quoted_line_break_integer = next(quoted_line_breaks_iterator, end_integer)
+
+
+        for block_bytes \
+            in iter(lambda: binary_file.read(min(CONSTANT_CHUNK_BLOCK_SIZE, end_integer - binary_file.tell())), b''):
+
+            block_bytes = remainder_bytes + block_bytes
+
+            complete_length_integer = block_bytes.rfind(b'\n') + 1
+
+            remainder_bytes = block_bytes[complete_length_integer:]
+
+            if complete_length_integer == 0:
+
+                continue
+
+
+            lines_list = block_bytes[:complete_length_integer - 1].split(b'\n')
+
+            # This line of code finds the byte offset, within the block, of the end of each
+            # line, including its line break.
+            line_ends_list = list(itertools.accumulate(len(line_bytes) + 1 for line_bytes in lines_list))
+
+            while quoted_line_break_integer < block_offset_integer + complete_length_integer:
+
+                quoted_line_breaks_list.append(quoted_line_break_integer)
+
+                quoted_line_break_integer = next(quoted_line_breaks_iterator, end_integer)
+
+
+            # These lines of code join the lines at the line breaks inside quoted fields
+            # into rows, and leave a last row that continues past the block to the next
+            # block, with the quoted line breaks still ahead.
+            if len(quoted_line_breaks_list) > 0:
+
+                quoted_line_ends_set \
+                    = {line_break_integer - block_offset_integer + 1 for line_break_integer in quoted_line_breaks_list}
+
+                line_ends_list = [line_end for line_end in line_ends_list if line_end not in quoted_line_ends_set]
+
+                complete_length_integer = line_ends_list[-1] if len(line_ends_list) > 0 else 0
+
+                remainder_bytes = block_bytes[complete_length_integer:]
+
+                quoted_line_breaks_list \
+                    = [line_break_integer for line_break_integer in quoted_line_breaks_list \
+                       if line_break_integer >= block_offset_integer + complete_length_integer]
+
+                if complete_length_integer == 0:
+
+                    continue
+
+                lines_list \
+                    = [block_bytes[line_start:line_end - 1] \
+                       for line_start, line_end in zip([0] + line_ends_list[:-1], line_ends_list)]
+
+
+            block_memoryview = memoryview(block_bytes)
+
+
+            # These lines of code find the index of each line in the block that ends a
+            # chunk: each line whose CRC-32 is a multiple of the divisor, and, between
+            # them, each line that brings a chunk to the line limit.  The line index 
+            # starts before the block by the number of lines already in the chunk, and
+            # an index of -1 ends the chunk at the start of the block.
+            boundary_indices_list = []
+
+            line_index_integer = -1 - chunk_line_count_integer
+
+            crc_boundary_indices_list \
+                = [line_index \
+                   for line_index, crc_integer in enumerate(map(zlib.crc32, lines_list)) \
+                   if crc_integer % CONSTANT_CHUNK_LINE_DIVISOR == 0]
+
+            for crc_boundary_index in itertools.chain(crc_boundary_indices_list, [None]):
+
+                last_index_integer = len(lines_list) - 1 if crc_boundary_index is None else crc_boundary_index
+
+                while last_index_integer - line_index_integer > CONSTANT_CHUNK_LINE_LIMIT:
+
+                    line_index_integer += CONSTANT_CHUNK_LINE_LIMIT
+
+                    boundary_indices_list.append(line_index_integer)
+
+                if crc_boundary_index is not None:
+
+                    boundary_indices_list.append(crc_boundary_index)
+
+                    line_index_integer = crc_boundary_index
+
+            chunk_line_count_integer = len(lines_list) - 1 - line_index_integer
+
+
+            # This repetition loop ends the chunks and starts the next ones.
+            piece_start_integer = 0
+
+            for boundary_index in boundary_indices_list:
+
+                piece_end_integer = line_ends_list[boundary_index] if boundary_index >= 0 else 0
+
+                chunk_digest_object.update(block_memoryview[piece_start_integer:piece_end_integer])
+
+                yield chunk_start_integer, block_offset_integer + piece_end_integer, chunk_digest_object.hexdigest()
+
+                chunk_start_integer = block_offset_integer + piece_end_integer
+
+                chunk_digest_object = hashlib.blake2b(digest_size = 16)
+
+                piece_start_integer = piece_end_integer
+
+            chunk_digest_object.update(block_memoryview[piece_start_integer:complete_length_integer])
+
+            block_memoryview.release()
+
+            block_offset_integer += complete_length_integer
+
+
+    # These lines of code end the last chunk, with the final line if it has no line
+    # break, unless the chunk is already at the line limit.
+    if len(remainder_bytes) > 0 and chunk_line_count_integer >= CONSTANT_CHUNK_LINE_LIMIT:
+
+        yield chunk_start_integer, block_offset_integer, chunk_digest_object.hexdigest()
+
+        chunk_start_integer = block_offset_integer
+
+        chunk_digest_object = hashlib.blake2b(digest_size = 16)
+
+    chunk_digest_object.update(remainder_bytes)
+
+    chunk_end_integer = block_offset_integer + len(remainder_bytes)
+
+    if chunk_end_integer > chunk_start_integer:
+
+        yield chunk_start_integer, chunk_end_integer, chunk_digest_object.hexdigest()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_file_chunks
+ #
+ #  Subroutine Description:
+ #      This function returns the hexadecimal BLAKE2 digest of the input csv file's
+ #      header row and a list of (start, end, digest) tuples, one per chunk in file
+ #      order, as find_range_chunks finds them after the header row.
+ #
+ #      Given the saved chunk tallies of the same header row, the function splits
+ #      lines only around the amendments.  It takes the saved chunks in order and
+ #      digests each one's bytes where it would start now, right after the last chunk
+ #      found, and keeps the chunk if they are the same.  At the first chunk that
+ #      differs, it finds chunks with find_range_chunks until one has the digest of a
+ #      later saved chunk, which marks the end of the amendment and the distance that
+ #      the chunks after it moved, and goes on digesting saved chunks from there.
+ #      A kept chunk starts a row, because the one before it ends a row, so it ends
+ #      the same row it ended before; the last saved chunk, whose final line break may
+ #      be inside a quoted field that the file now goes on with, is kept only at the
+ #      end of the file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  String      input_file_name_string      the path of the input csv file
+ #  dictionary  saved_tallies_dictionary    the saved chunk tallies, or None 
+ #                                          (default: None)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Quoted line breaks stay in one chunk        Nicholas J. George
+ #  10/18/2026          Rows joined at quoted line breaks           Nicholas J. George
+ #  10/18/2026          Unchanged chunks found by their digests     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_file_chunks(input_file_name_string, saved_tallies_dictionary = None):
+
+    chunks_list = []
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        header_digest_string = hashlib.blake2b(binary_file.readline(), digest_size = 16).hexdigest()
+
+        position_integer = binary_file.tell()
+
+        file_size_integer = os.fstat(binary_file.fileno()).st_size
+
+        if file_size_integer <= position_integer:
+
+            return header_digest_string, chunks_list
+
+
+        if saved_tallies_dictionary is None or saved_tallies_dictionary['Header Digest'] != header_digest_string:
+
+            saved_chunks_list = []
+
+        else:
+
+            saved_chunks_list \
+                = [(chunk_start_integer, chunk_end_integer, digest_string) \
+                   for chunk_start_integer, chunk_end_integer, digest_string, _, _ \
+                       in saved_tallies_dictionary['Chunks']]
+
+        # This dictionary maps the digest of each saved chunk to the indices of the saved
+        # chunks with that digest, in file order.
+        saved_indices_dictionary = collections.defaultdict(list)
+
+        for saved_index, (_, _, digest_string) in enumerate(saved_chunks_list):
+
+            saved_indices_dictionary[digest_string].append(saved_index)
+
+        saved_index = 0
+
+
+        with mmap.mmap(binary_file.fileno(), 0, access = mmap.ACCESS_READ) as memory_map, \
+             memoryview(memory_map) as file_memoryview:
+
+            while position_integer < file_size_integer:
+
+                # These lines of code keep each saved chunk, from the saved index on, whose
+                # bytes are the same at the current position.
+                while saved_index < len(saved_chunks_list):
+
+                    chunk_start_integer, chunk_end_integer, digest_string = saved_chunks_list[saved_index]
+
+                    chunk_end_integer += position_integer - chunk_start_integer
+
+                    if chunk_end_integer > file_size_integer \
+                        or (chunk_end_integer < file_size_integer and saved_index == len(saved_chunks_list) - 1) \
+                        or hashlib.blake2b(file_memoryview[position_integer:chunk_end_integer], digest_size = 16) \
+                               .hexdigest() != digest_string:
+
+                        break
+
+                    chunks_list.append((position_integer, chunk_end_integer, digest_string))
+
+                    position_integer = chunk_end_integer
+
+                    saved_index += 1
+
+
+                # These lines of code find the chunks of the amended bytes, up to and 
+                # including the first chunk that has the digest of a later saved chunk, and
+                # continue with the saved chunk after that one.
+                with contextlib.closing \
+                        (find_range_chunks(binary_file, memory_map, position_integer, file_size_integer)) \
+                            as range_chunks_iterator:
+
+                    for chunk_tuple in range_chunks_iterator:
+
+                        chunks_list.append(chunk_tuple)
+
+                        position_integer = chunk_tuple[1]
+
+                        later_indices_list \
+                            = [later_index for later_index in saved_indices_dictionary.get(chunk_tuple[2], []) \
+                               if later_index >= saved_index]
+
+                        if len(later_indices_list) > 0:
+
+                            saved_index = later_indices_list[0] + 1
+
+                            break
+
+
+    return header_digest_string, chunks_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_chunk_tallies
+ #
+ #  Subroutine Description:
+ #      This function returns the chunk tallies saved in the sidecar file: a dictionary
+ #      with the header digest, the size of the file, the chunks as a list of (start,
+ #      end, digest, candidate votes, row count) tuples in file order, and the total
+ #      candidate votes and row count.  It returns None if the sidecar file is missing,
+ #      of another version, or unreadable.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  chunks_file_name_string the path of the sidecar file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_chunk_tallies(chunks_file_name_string):
+
+    try:
+
+        with open(chunks_file_name_string, encoding = 'utf-8') as chunks_file:
+
+            chunks_dictionary = json.load(chunks_file)
+
+        if chunks_dictionary.get('version') != CONSTANT_CHUNKS_VERSION:
+
+            return None
+
+        return {'Header Digest': chunks_dictionary['header_digest'],
+                'File Size': chunks_dictionary['file_size'],
+                'Chunks': [(chunk_start_integer,
+                            chunk_end_integer,
+                            digest_string,
+                            dict(candidate_votes_list),
+                            row_count_integer) \
+                           for chunk_start_integer, chunk_end_integer, digest_string, candidate_votes_list, row_count_integer \
+                               in chunks_dictionary['chunks']],
+                'Candidate Votes': dict(chunks_dictionary['candidate_votes']),
+                'Row Count': chunks_dictionary['row_count']}
+
+    except (OSError, ValueError, KeyError, TypeError):
+
+        return None
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_chunk_tallies
+ #
+ #  Subroutine Description:
+ #      This subroutine saves the chunk tallies to the sidecar file.  It writes a
+ #      temporary file and renames it over the sidecar, so a program stopped in the
+ #      middle of a write leaves the previous tallies intact.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  String      chunks_file_name_string     the path of the sidecar file
+ #  dictionary  chunk_tallies_dictionary    the chunk tallies
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_chunk_tallies(chunks_file_name_string, chunk_tallies_dictionary):
+
+    chunks_dictionary \
+        = {'version': CONSTANT_CHUNKS_VERSION,
+           'header_digest': chunk_tallies_dictionary['Header Digest'],
+           'file_size': chunk_tallies_dictionary['File Size'],
+           'chunks': [(chunk_start_integer,
+                       chunk_end_integer,
+                       digest_string,
+                       list(candidate_votes_dictionary.items()),
+                       row_count_integer) \
+                      for chunk_start_integer, chunk_end_integer, digest_string, candidate_votes_dictionary, row_count_integer \
+                          in chunk_tallies_dictionary['Chunks']],
+           'candidate_votes': list(chunk_tallies_dictionary['Candidate Votes'].items()),
+           'row_count': chunk_tallies_dictionary['Row Count']}
+
+
+    temporary_chunks_file_name_string = chunks_file_name_string + '.tmp'
+
+    with open(temporary_chunks_file_name_string, 'w', encoding = 'utf-8') as chunks_file:
+
+        json.dump(chunks_dictionary, chunks_file)
+
+    os.replace(temporary_chunks_file_name_string, chunks_file_name_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  recount_file_chunks
+ #
+ #  Subroutine Description:
+ #      This function brings the saved chunk tallies up to date with the input csv
+ #      file and saves them.  It subtracts the votes of each chunk whose digest no
+ #      longer occurs in the file from the saved totals and adds the votes of each
+ #      chunk whose digest is new, which the tally function counts; chunks that did not
+ #      change are not counted again.  If there are no saved tallies, or the header row
+ #      changed, every chunk is new.  The function returns the candidate votes, with
+ #      the candidates in the order they first appear in the file, the row count, and
+ #      the number of chunks it counted and the number of chunks in the file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  String      input_file_name_string      the path of the input csv file
+ #  String      chunks_file_name_string     the path of the sidecar file
+ #  function    tally_function              a function that takes a tuple of the input
+ #                                          file path and a chunk's start and end byte
+ #                                          offsets and returns the chunk's candidate
+ #                                          votes and row count
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def recount_file_chunks(input_file_name_string, chunks_file_name_string, tally_function):
+
+    saved_tallies_dictionary = read_chunk_tallies(chunks_file_name_string)
+
+    header_digest_string, chunks_list = find_file_chunks(input_file_name_string, saved_tallies_dictionary)
+
+    if saved_tallies_dictionary is None \
+        or saved_tallies_dictionary['Header Digest'] != header_digest_string:
+
+        saved_tallies_dictionary \
+            = {'Header Digest': header_digest_string, 'File Size': 0, 'Chunks': [], 'Candidate Votes': {}, 'Row Count': 0}
+
+
+    # This dictionary maps the digest of each saved chunk to its candidate votes and row
+    # count.
+    saved_chunks_dictionary \
+        = {digest_string: (candidate_votes_dictionary, row_count_integer) \
+           for _, _, digest_string, candidate_votes_dictionary, row_count_integer \
+               in saved_tallies_dictionary['Chunks']}
+
+    saved_digests_counter \
+        = collections.Counter(chunk_tuple[2] for chunk_tuple in saved_tallies_dictionary['Chunks'])
+
+    current_digests_counter = collections.Counter(chunk_tuple[2] for chunk_tuple in chunks_list)
+
+    candidate_votes_counter = collections.Counter(saved_tallies_dictionary['Candidate Votes'])
+
+    row_count_integer = saved_tallies_dictionary['Row Count']
+
+
+    # These lines of code subtract the votes of the chunks that are gone.
+    for digest_string, chunk_count_integer \
+        in (saved_digests_counter - current_digests_counter).items():
+
+        chunk_votes_dictionary, chunk_row_count_integer = saved_chunks_dictionary[digest_string]
+
+        for candidate_name_string, vote_count_integer in chunk_votes_dictionary.items():
+
+            candidate_votes_counter[candidate_name_string] -= chunk_count_integer * vote_count_integer
+
+        row_count_integer -= chunk_count_integer * chunk_row_count_integer
+
+
+    # These lines of code count the new chunks and add their votes.  A new digest that
+    # occurs more often than before adds only its extra occurrences.
+    added_digests_counter = current_digests_counter - saved_digests_counter
+
+    counted_chunk_count_integer = 0
+
+    for chunk_start_integer, chunk_end_integer, digest_string in chunks_list:
+
+        if digest_string in added_digests_counter \
+            and (digest_string not in saved_chunks_dictionary \
+                 or added_digests_counter[digest_string] > 0):
+
+            if digest_string not in saved_chunks_dictionary:
+
+                saved_chunks_dictionary[digest_string] \
+                    = tally_function((input_file_name_string, chunk_start_integer, chunk_end_integer))
+
+                counted_chunk_count_integer += 1
+
+            chunk_votes_dictionary, chunk_row_count_integer = saved_chunks_dictionary[digest_string]
+
+            candidate_votes_counter.update(chunk_votes_dictionary)
+
+            row_count_integer += chunk_row_count_integer
+
+            added_digests_counter[digest_string] -= 1
+
+
+    # These lines of code order the candidates by their first appearance in the file and
+    # drop the candidates left with no votes.
+    candidate_votes_dictionary = {}
+
+    chunk_tallies_list = []
+
+    for chunk_start_integer, chunk_end_integer, digest_string in chunks_list:
+
+        chunk_votes_dictionary, chunk_row_count_integer = saved_chunks_dictionary[digest_string]
+
+        chunk_tallies_list.append \
+            ((chunk_start_integer, chunk_end_integer, digest_string, chunk_votes_dictionary, chunk_row_count_integer))
+
+        for candidate_name_string in chunk_votes_dictionary:
+
+            if candidate_name_string not in candidate_votes_dictionary \
+                and candidate_votes_counter[candidate_name_string] > 0:
+
+                candidate_votes_dictionary[candidate_name_string] = candidate_votes_counter[candidate_name_string]
+
+
+    write_chunk_tallies \
+        (chunks_file_name_string,
+         {'Header Digest': header_digest_string,
+          'File Size': chunks_list[-1][1] if len(chunks_list) > 0 else 0,
+          'Chunks': chunk_tallies_list,
+          'Candidate Votes': candidate_votes_dictionary,
+          'Row Count': row_count_integer})
+
+    return candidate_votes_dictionary, row_count_integer, counted_chunk_count_integer, len(chunks_list)
@@ -0,0 +1,773 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_columnar_cache.py
+ #
+ #  File Description:
+ #      This module converts a ballot csv file into a compact binary columnar sidecar
+ #      file and reads the candidate votes, or the candidate-by-county votes, back 
+ #      from it.  The sidecar stores the Candidate and County columns as 
+ #      dictionary-encoded arrays of unsigned 8-, 16-, or 32-bit codes, with the codes 
+ #      assigned in first-seen order, and the Voter ID column as packed unsigned 
+ #      64-bit integers when every ID is a plain decimal number or otherwise as UTF-8
+ #      text, each ID after its length as an unsigned 32-bit little-endian integer.  
+ #      A header records the csv file's size, modification time, and
+ #      BLAKE2 content digest, so the program can tell when the csv file has changed 
+ #      and the sidecar is no longer valid.
+ #
+ #      The sidecar file is laid out as follows: the magic bytes, the length of the
+ #      header as an unsigned 32-bit little-endian integer, the header as UTF-8 JSON,
+ #      and then the candidate codes, the county codes, and the voter IDs, each at the
+ #      byte offset and length the header gives.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      get_cache_file_name
+ #      calculate_file_digest
+ #      read_cache_header
+ #      is_cache_valid
+ #      encode_voter_id
+ #      write_text_voter_ids
+ #      copy_narrowed_codes
+ #      write_columnar_cache
+ #      tally_cached_candidate_votes
+ #      tally_cached_county_votes
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Sidecar path for any input file         Nicholas J. George
+ #  10/18/2026      Candidate by county votes               Nicholas J. George
+ #  10/18/2026      32-bit lengths of text voter IDs        Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import array
+import collections
+import csv
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+
+
+# This constant is the file name extension of the sidecar file.
+CONSTANT_CACHE_FILE_EXTENSION = '.columns'
+
+
+# These constants identify the sidecar file's format and version.
+CONSTANT_CACHE_MAGIC_BYTES = b'PLCOLS\x00\x01'
+
+CONSTANT_CACHE_VERSION = 2
+
+
+# This constant is the number of bytes the module reads or writes at a time.
+CONSTANT_CACHE_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+# This constant is the number of rows the converter buffers before it writes them out.
+CONSTANT_CACHE_ROW_BATCH_SIZE = 65536
+
+
+# These constants are the typecodes of the arrays that hold the codes and voter IDs.
+CONSTANT_WIDE_CODE_TYPECODE = 'I'
+
+CONSTANT_VOTER_ID_TYPECODE = 'Q'
+
+
+# This constant is the largest number of candidates the module counts by searching the
+# 8-bit candidate codes for each one in turn.
+CONSTANT_CACHE_SEARCH_COUNT_LIMIT = 16
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  get_cache_file_name
+ #
+ #  Subroutine Description:
+ #      This function returns the path of the sidecar file next to a ballot csv file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def get_cache_file_name(input_file_name_string):
+
+    return os.path.splitext(input_file_name_string)[0] + CONSTANT_CACHE_FILE_EXTENSION
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_file_digest
+ #
+ #  Subroutine Description:
+ #      This function returns the hexadecimal BLAKE2 digest of a file's contents.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_file_digest(input_file_name_string):
+
+    digest_object = hashlib.blake2b(digest_size = 20)
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        for block_bytes in iter(lambda: binary_file.read(CONSTANT_CACHE_BLOCK_SIZE), b''):
+
+            digest_object.update(block_bytes)
+
+    return digest_object.hexdigest()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_cache_header
+ #
+ #  Subroutine Description:
+ #      This function returns the sidecar file's header dictionary and the byte offset
+ #      where its column data begins, or None if the file is missing or is not a
+ #      sidecar file of this version.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  cache_file_name_string  the path of the sidecar file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_cache_header(cache_file_name_string):
+
+    try:
+
+        with open(cache_file_name_string, 'rb') as binary_file:
+
+            if binary_file.read(len(CONSTANT_CACHE_MAGIC_BYTES)) != CONSTANT_CACHE_MAGIC_BYTES:
+
+                return None
+
+            header_length_integer, = struct.unpack('<I', binary_file.read(4))
+
+            header_dictionary = json.loads(binary_file.read(header_length_integer).decode('utf-8'))
+
+    except (OSError, ValueError, struct.error):
+
+        return None
+
+
+    if header_dictionary.get('version') != CONSTANT_CACHE_VERSION:
+
+        return None
+
+    return header_dictionary, len(CONSTANT_CACHE_MAGIC_BYTES) + 4 + header_length_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  is_cache_valid
+ #
+ #  Subroutine Description:
+ #      This function returns True if the sidecar header describes the current contents
+ #      of the csv file.  A matching size and modification time are enough; if only the
+ #      modification time differs, for example after a copy, the function compares the
+ #      content digests instead.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  String      input_file_name_string  the path of the csv file
+ #  dictionary  header_dictionary       the sidecar file's header
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def is_cache_valid(input_file_name_string, header_dictionary):
+
+    try:
+
+        file_status = os.stat(input_file_name_string)
+
+    except OSError:
+
+        return False
+
+
+    if file_status.st_size != header_dictionary['source_size']:
+
+        return False
+
+    if file_status.st_mtime_ns == header_dictionary['source_mtime_ns']:
+
+        return True
+
+    return calculate_file_digest(input_file_name_string) == header_dictionary['source_digest']
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  encode_voter_id
+ #
+ #  Subroutine Description:
+ #      This function returns a voter ID as an integer if it is a plain decimal number
+ #      that fits in 64 bits and converts back to the same text, or None otherwise.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  String  voter_id_string     the voter ID from the csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def encode_voter_id(voter_id_string):
+
+    if voter_id_string.isascii() \
+        and voter_id_string.isdigit() \
+        and (voter_id_string == '0' or voter_id_string[0] != '0'):
+
+        voter_id_integer = int(voter_id_string)
+
+        if voter_id_integer < 2 ** 64:
+
+            return voter_id_integer
+
+    return None
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_text_voter_ids
+ #
+ #  Subroutine Description:
+ #      This subroutine writes voter IDs to a file as UTF-8 text, each after its length
+ #      in bytes as an unsigned 32-bit little-endian integer.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  voter_ids_file      the file open for binary writing
+ #  object  voter_ids_iterable  the voter ID strings in file order
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_text_voter_ids(voter_ids_file, voter_ids_iterable):
+
+    for voter_id_string in voter_ids_iterable:
+
+        voter_id_bytes = voter_id_string.encode('utf-8')
+
+        voter_ids_file.write(struct.pack('<I', len(voter_id_bytes)) + voter_id_bytes)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  copy_narrowed_codes
+ #
+ #  Subroutine Description:
+ #      This subroutine copies a temporary file of 32-bit codes to the sidecar file,
+ #      converting them to the narrower typecode chosen for the dictionary's size.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  codes_file          the temporary file of 32-bit codes
+ #  object  cache_file          the sidecar file open for writing
+ #  String  typecode_string     the array typecode for the sidecar file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def copy_narrowed_codes(codes_file, cache_file, typecode_string):
+
+    codes_file.seek(0)
+
+    item_size_integer = array.array(CONSTANT_WIDE_CODE_TYPECODE).itemsize
+
+    block_size_integer = CONSTANT_CACHE_BLOCK_SIZE - CONSTANT_CACHE_BLOCK_SIZE % item_size_integer
+
+    for block_bytes in iter(lambda: codes_file.read(block_size_integer), b''):
+
+        wide_codes_array = array.array(CONSTANT_WIDE_CODE_TYPECODE)
+
+        wide_codes_array.frombytes(block_bytes)
+
+        array.array(typecode_string, wide_codes_array).tofile(cache_file)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_columnar_cache
+ #
+ #  Subroutine Description:
+ #      This subroutine reads a ballot csv file once and writes its columnar sidecar
+ #      file.  The columns go to temporary files in batches as the program reads the
+ #      rows, so memory use stays flat; the subroutine then writes the header and the
+ #      columns to a temporary sidecar file and renames it into place, so a reader
+ #      never sees a partial file.  The voter IDs go to a file of packed integers 
+ #      until the first one that is not a plain number; then the packed IDs are copied
+ #      to a file of text IDs a batch at a time, and the rest follow them there.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the csv file
+ #  String  cache_file_name_string      the path of the sidecar file
+ #  int     ballot_id_index_integer     the index of the Voter ID column
+ #  int     county_index_integer        the index of the County column
+ #  int     candidate_index_integer     the index of the Candidate column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Text voter IDs rewritten in batches         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_columnar_cache \
+        (input_file_name_string,
+         cache_file_name_string,
+         ballot_id_index_integer,
+         county_index_integer,
+         candidate_index_integer):
+
+    source_status = os.stat(input_file_name_string)
+
+    source_digest_string = calculate_file_digest(input_file_name_string)
+
+
+    # These dictionaries assign each distinct candidate and county a code in first-seen
+    # order.
+    candidate_codes_dictionary = {}
+
+    county_codes_dictionary = {}
+
+    row_count_integer = 0
+
+    # This variable tells the program whether every voter ID so far is a plain decimal
+    # number that fits in 64 bits.
+    numeric_voter_ids_boolean = True
+
+
+    with tempfile.TemporaryFile() as candidate_codes_file, \
+         tempfile.TemporaryFile() as county_codes_file, \
+         tempfile.TemporaryFile() as numeric_voter_ids_file, \
+         tempfile.TemporaryFile() as text_voter_ids_file:
+
+        candidate_codes_array = array.array(CONSTANT_WIDE_CODE_TYPECODE)
+
+        county_codes_array = array.array(CONSTANT_WIDE_CODE_TYPECODE)
+
+        voter_ids_array = array.array(CONSTANT_VOTER_ID_TYPECODE)
+
+        voter_ids_list = []
+
+
+        with open(input_file_name_string) as csv_file:
+
+            csv_reader = csv.reader(csv_file)
+
+            next(csv_reader, None)
+
+            for csv_record in csv_reader:
+
+                row_count_integer += 1
+
+                candidate_codes_array.append \
+                    (candidate_codes_dictionary.setdefault \
+                        (csv_record[candidate_index_integer], len(candidate_codes_dictionary)))
+
+                county_codes_array.append \
+                    (county_codes_dictionary.setdefault \
+                        (csv_record[county_index_integer], len(county_codes_dictionary)))
+
+                voter_id_string = csv_record[ballot_id_index_integer]
+
+
+                if numeric_voter_ids_boolean:
+
+                    voter_id_integer = encode_voter_id(voter_id_string)
+
+                    if voter_id_integer is not None:
+
+                        voter_ids_array.append(voter_id_integer)
+
+                    # The first voter ID that is not a plain number switches the column to
+                    # length-prefixed text, so the packed IDs so far are rewritten as text,
+                    # one batch of rows at a time.
+                    else:
+
+                        numeric_voter_ids_boolean = False
+
+                        voter_ids_array.tofile(numeric_voter_ids_file)
+
+                        numeric_voter_ids_file.seek(0)
+
+                        packed_batch_length_integer \
+                            = CONSTANT_CACHE_ROW_BATCH_SIZE * voter_ids_array.itemsize
+
+                        for packed_voter_ids_bytes \
+                            in iter(lambda: numeric_voter_ids_file.read(packed_batch_length_integer), b''):
+
+                            packed_voter_ids_array = array.array(CONSTANT_VOTER_ID_TYPECODE)
+
+                            packed_voter_ids_array.frombytes(packed_voter_ids_bytes)
+
+                            write_text_voter_ids(text_voter_ids_file, map(str, packed_voter_ids_array))
+
+                        numeric_voter_ids_file.truncate(0)
+
+                        voter_ids_list.append(voter_id_string)
+
+                        voter_ids_array = array.array(CONSTANT_VOTER_ID_TYPECODE)
+
+                else:
+
+                    voter_ids_list.append(voter_id_string)
+
+
+                # This line of code writes the buffered rows to the temporary files.
+                if len(candidate_codes_array) >= CONSTANT_CACHE_ROW_BATCH_SIZE:
+
+                    candidate_codes_array.tofile(candidate_codes_file)
+
+                    county_codes_array.tofile(county_codes_file)
+
+                    voter_ids_array.tofile(numeric_voter_ids_file)
+
+                    write_text_voter_ids(text_voter_ids_file, voter_ids_list)
+
+                    del candidate_codes_array[:], county_codes_array[:], voter_ids_array[:], voter_ids_list[:]
+
+
+        candidate_codes_array.tofile(candidate_codes_file)
+
+        county_codes_array.tofile(county_codes_file)
+
+        voter_ids_array.tofile(numeric_voter_ids_file)
+
+        write_text_voter_ids(text_voter_ids_file, voter_ids_list)
+
+        voter_ids_file = numeric_voter_ids_file if numeric_voter_ids_boolean else text_voter_ids_file
+
+
+        # These lines of code choose the narrowest typecode for each dictionary's codes.
+        candidate_typecode_string \
+            = 'B' if len(candidate_codes_dictionary) <= 0x100 \
+                else 'H' if len(candidate_codes_dictionary) <= 0x10000 \
+                else CONSTANT_WIDE_CODE_TYPECODE
+
+        county_typecode_string \
+            = 'B' if len(county_codes_dictionary) <= 0x100 \
+                else 'H' if len(county_codes_dictionary) <= 0x10000 \
+                else CONSTANT_WIDE_CODE_TYPECODE
+
+        candidate_codes_length_integer \
+            = row_count_integer * array.array(candidate_typecode_string).itemsize
+
+        county_codes_length_integer \
+            = row_count_integer * array.array(county_typecode_string).itemsize
+
+        header_dictionary \
+            = {'version': CONSTANT_CACHE_VERSION,
+               'source_size': source_status.st_size,
+               'source_mtime_ns': source_status.st_mtime_ns,
+               'source_digest': source_digest_string,
+               'byte_order': sys.byteorder,
+               'row_count': row_count_integer,
+               'candidates': list(candidate_codes_dictionary),
+               'counties': list(county_codes_dictionary),
+               'candidate_typecode': candidate_typecode_string,
+               'county_typecode': county_typecode_string,
+               'voter_id_encoding': 'uint64' if numeric_voter_ids_boolean else 'text',
+               'candidate_codes_offset': 0,
+               'county_codes_offset': candidate_codes_length_integer,
+               'voter_ids_offset': candidate_codes_length_integer + county_codes_length_integer}
+
+        header_bytes = json.dumps(header_dictionary).encode('utf-8')
+
+
+        temporary_cache_file_name_string = cache_file_name_string + '.tmp'
+
+        with open(temporary_cache_file_name_string, 'wb') as cache_file:
+
+            cache_file.write(CONSTANT_CACHE_MAGIC_BYTES)
+
+            cache_file.write(struct.pack('<I', len(header_bytes)))
+
+            cache_file.write(header_bytes)
+
+            copy_narrowed_codes(candidate_codes_file, cache_file, candidate_typecode_string)
+
+            copy_narrowed_codes(county_codes_file, cache_file, county_typecode_string)
+
+            voter_ids_file.seek(0)
+
+            shutil.copyfileobj(voter_ids_file, cache_file, CONSTANT_CACHE_BLOCK_SIZE)
+
+        os.replace(temporary_cache_file_name_string, cache_file_name_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tally_cached_candidate_votes
+ #
+ #  Subroutine Description:
+ #      This function counts the candidate votes from a valid sidecar file without
+ #      reading the csv file.  It reads only the candidate codes, in blocks, and either
+ #      counts each code's occurrences in the block or, with many candidates, counts
+ #      the codes in one pass.  The function returns the candidate vote dictionary in
+ #      first-seen order and the number of rows, or None if the sidecar file is
+ #      missing or no longer matches the csv file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the csv file
+ #  String  cache_file_name_string  the path of the sidecar file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tally_cached_candidate_votes(input_file_name_string, cache_file_name_string):
+
+    header_tuple = read_cache_header(cache_file_name_string)
+
+    if header_tuple is None:
+
+        return None
+
+    header_dictionary, data_offset_integer = header_tuple
+
+    if not is_cache_valid(input_file_name_string, header_dictionary):
+
+        return None
+
+
+    candidate_names_list = header_dictionary['candidates']
+
+    typecode_string = header_dictionary['candidate_typecode']
+
+    item_size_integer = array.array(typecode_string).itemsize
+
+    remaining_bytes_integer = header_dictionary['row_count'] * item_size_integer
+
+    block_size_integer = CONSTANT_CACHE_BLOCK_SIZE - CONSTANT_CACHE_BLOCK_SIZE % item_size_integer
+
+    vote_counts_list = [0] * len(candidate_names_list)
+
+    # With a handful of 8-bit codes, searching the raw bytes for each code runs at memory
+    # speed; otherwise the program counts the codes in one pass per block.
+    search_codes_boolean \
+        = typecode_string == 'B' \
+          and len(candidate_names_list) <= CONSTANT_CACHE_SEARCH_COUNT_LIMIT
+
+
+    with open(cache_file_name_string, 'rb') as binary_file:
+
+        binary_file.seek(data_offset_integer + header_dictionary['candidate_codes_offset'])
+
+        while remaining_bytes_integer > 0:
+
+            block_bytes = binary_file.read(min(block_size_integer, remaining_bytes_integer))
+
+            if not block_bytes:
+
+                return None
+
+            remaining_bytes_integer -= len(block_bytes)
+
+
+            if search_codes_boolean:
+
+                for candidate_code_integer in range(len(candidate_names_list)):
+
+                    vote_counts_list[candidate_code_integer] \
+                        += block_bytes.count(bytes((candidate_code_integer,)))
+
+            else:
+
+                codes_array = array.array(typecode_string)
+
+                codes_array.frombytes(block_bytes)
+
+                if header_dictionary['byte_order'] != sys.byteorder:
+
+                    codes_array.byteswap()
+
+                for candidate_code_integer, vote_count_integer \
+                    in collections.Counter(codes_array).items():
+
+                    vote_counts_list[candidate_code_integer] += vote_count_integer
+
+
+    candidate_votes_dictionary \
+        = {sys.intern(candidate_name_string): vote_count_integer \
+           for candidate_name_string, vote_count_integer \
+               in zip(candidate_names_list, vote_counts_list)}
+
+    return candidate_votes_dictionary, header_dictionary['row_count']
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tally_cached_county_votes
+ #
+ #  Subroutine Description:
+ #      This function counts the candidate-by-county votes from a valid sidecar file
+ #      without reading the csv file.  It reads the candidate codes and the county
+ #      codes in lockstep, in blocks of rows, and counts each pair of codes.  The 
+ #      function returns a county cube dictionary with the candidate names, the county
+ #      names, each county's vote counts by candidate, and the total votes, in the 
+ #      same first-seen order as poll_main.py's candidate-by-county aggregator, or None
+ #      if the sidecar file is missing or no longer matches the csv file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the csv file
+ #  String  cache_file_name_string  the path of the sidecar file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tally_cached_county_votes(input_file_name_string, cache_file_name_string):
+
+    header_tuple = read_cache_header(cache_file_name_string)
+
+    if header_tuple is None:
+
+        return None
+
+    header_dictionary, data_offset_integer = header_tuple
+
+    if not is_cache_valid(input_file_name_string, header_dictionary):
+
+        return None
+
+
+    candidate_names_list = header_dictionary['candidates']
+
+    county_names_list = header_dictionary['counties']
+
+    candidate_typecode_string = header_dictionary['candidate_typecode']
+
+    county_typecode_string = header_dictionary['county_typecode']
+
+    candidate_item_size_integer = array.array(candidate_typecode_string).itemsize
+
+    county_item_size_integer = array.array(county_typecode_string).itemsize
+
+    row_block_size_integer \
+        = CONSTANT_CACHE_BLOCK_SIZE // max(candidate_item_size_integer, county_item_size_integer)
+
+    remaining_rows_integer = header_dictionary['row_count']
+
+    code_pair_counter = collections.Counter()
+
+
+    with open(cache_file_name_string, 'rb') as candidate_binary_file, \
+         open(cache_file_name_string, 'rb') as county_binary_file:
+
+        candidate_binary_file.seek(data_offset_integer + header_dictionary['candidate_codes_offset'])
+
+        county_binary_file.seek(data_offset_integer + header_dictionary['county_codes_offset'])
+
+        while remaining_rows_integer > 0:
+
+            block_rows_integer = min(row_block_size_integer, remaining_rows_integer)
+
+            candidate_block_bytes = candidate_binary_file.read(block_rows_integer * candidate_item_size_integer)
+
+            county_block_bytes = county_binary_file.read(block_rows_integer * county_item_size_integer)
+
+            if len(candidate_block_bytes) != block_rows_integer * candidate_item_size_integer \
+                or len(county_block_bytes) != block_rows_integer * county_item_size_integer:
+
+                return None
+
+            remaining_rows_integer -= block_rows_integer
+
+
+            candidate_codes_array = array.array(candidate_typecode_string, candidate_block_bytes)
+
+            county_codes_array = array.array(county_typecode_string, county_block_bytes)
+
+            if header_dictionary['byte_order'] != sys.byteorder:
+
+                candidate_codes_array.byteswap()
+
+                county_codes_array.byteswap()
+
+            code_pair_counter.update(zip(county_codes_array, candidate_codes_array))
+
+
+    vote_counts_list = [[0] * len(candidate_names_list) for county_name_string in county_names_list]
+
+    for (county_code_integer, candidate_code_integer), vote_count_integer in code_pair_counter.items():
+
+        vote_counts_list[county_code_integer][candidate_code_integer] = vote_count_integer
+
+    return {'Candidates': [sys.intern(candidate_name_string) for candidate_name_string in candidate_names_list],
+            'Counties': [sys.intern(county_name_string) for county_name_string in county_names_list],
+            'Vote Counts': vote_counts_list,
+            'Total Votes': header_dictionary['row_count']}
@@ -0,0 +1,331 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_contest_tally.py
+ #
+ #  File Description:
+ #      This module counts the votes of every contest in a multi-contest ballot csv
+ #      file for poll_main.py in a single pass.  Such a file has a Contest column, so
+ #      each row is one voter's choice in one contest: the president, a senate seat,
+ #      or a measure.  The module counts each pair of contest and candidate, with a
+ #      memory-mapped scanner and a compiled expression that captures both columns
+ #      when it can and the csv module otherwise, and returns each contest's
+ #      candidate votes, with the contests and each contest's candidates in the order
+ #      they first appear.  With more than one worker, the module splits the file
+ #      into shards of whole lines, each worker counts every contest in its shard, and
+ #      the module merges the counts in file order, so the file is still read once
+ #      however many contests it holds.
+ #
+ #      Here is a List of classes, subroutines, and functions:
+ #
+ #      contest_votes_aggregator
+ #      scan_contest_columns
+ #      tally_contest_shard
+ #      read_contest_votes
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import collections
+import csv
+import locale
+import mmap
+import multiprocessing
+import operator
+import os
+import re
+import sys
+
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+
+import streaming_aggregation
+
+
+# This constant is the number of bytes the scanner reads at a time.
+CONSTANT_CONTEST_SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  contest_votes_aggregator
+ #
+ #  Class Description:
+ #      This class is the streaming aggregator for the votes of every contest.  It
+ #      counts each pair of contest and candidate in first-seen order and merges the
+ #      counts of the records that follow by adding them.  The finalize method returns
+ #      a dictionary with each contest's dictionary of candidate votes, and the
+ #      restore method loads one.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  int     candidate_index_integer     the index of the Candidate column
+ #  int     contest_index_integer       the index of the Contest column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class contest_votes_aggregator(streaming_aggregation.streaming_aggregator):
+
+    def __init__(self, candidate_index_integer, contest_index_integer):
+
+        self.candidate_index_integer = candidate_index_integer
+
+        self.contest_index_integer = contest_index_integer
+
+        super().__init__()
+
+
+    def initialize(self):
+
+        # This counter holds each (contest, candidate) pair and its number of votes.
+        self.contest_votes_counter = collections.Counter()
+
+
+    def update(self, csv_records):
+
+        self.contest_votes_counter.update \
+            (map(operator.itemgetter(self.contest_index_integer, self.candidate_index_integer), csv_records))
+
+
+    def merge(self, following_aggregator):
+
+        self.contest_votes_counter.update(following_aggregator.contest_votes_counter)
+
+        return self
+
+
+    def finalize(self):
+
+        contest_votes_dictionary = {}
+
+        for (contest_name, candidate_name), vote_count_integer in self.contest_votes_counter.items():
+
+            contest_votes_dictionary.setdefault(contest_name, {})[candidate_name] = vote_count_integer
+
+        return contest_votes_dictionary
+
+
+    def restore(self, contest_votes_dictionary):
+
+        self.contest_votes_counter \
+            = collections.Counter \
+                ({(contest_name, candidate_name): vote_count_integer \
+                  for contest_name, candidate_votes_dictionary in contest_votes_dictionary.items() \
+                  for candidate_name, vote_count_integer in candidate_votes_dictionary.items()})
+
+        return self
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  scan_contest_columns
+ #
+ #  Subroutine Description:
+ #      This function counts the votes of every contest in a byte range of the input
+ #      csv file with a memory map and a compiled expression that captures the raw
+ #      bytes of the Candidate and Contest columns, which must follow each other in
+ #      that order.  It returns the dictionary of each contest's candidate votes, or
+ #      None if the range needs the csv module.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the input csv file
+ #  int     start_integer               the byte offset of the first row
+ #  int     end_integer                 the byte offset of the end of the range
+ #  int     candidate_index_integer     the index of the Candidate column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def scan_contest_columns(input_file_name_string, start_integer, end_integer, candidate_index_integer):
+
+    contest_columns_pattern \
+        = re.compile(rb'^(?:[^,\n]*,){%d}([^,\r\n]*),([^,\r\n]*)' % candidate_index_integer, re.MULTILINE)
+
+    contest_votes_counter = collections.Counter()
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        if end_integer <= start_integer:
+
+            return {}
+
+        with mmap.mmap(binary_file.fileno(), 0, access = mmap.ACCESS_READ) as memory_map:
+
+            # A quotation mark means a field may hold a comma or a line break, which only
+            # the csv module reads correctly.
+            if memory_map.find(b'"', start_integer, end_integer) != -1:
+
+                return None
+
+
+            block_start_integer = start_integer
+
+            # This repetition loop scans the byte range one block of whole lines at a time.
+            while block_start_integer < end_integer:
+
+                block_end_integer \
+                    = memory_map.find \
+                        (b'\n',
+                         min(block_start_integer + CONSTANT_CONTEST_SCAN_BLOCK_SIZE, end_integer) - 1,
+                         end_integer) + 1 \
+                      or end_integer
+
+                block_bytes = memory_map[block_start_integer:block_end_integer]
+
+                block_start_integer = block_end_integer
+
+                if not block_bytes.endswith(b'\n'):
+
+                    block_bytes += b'\n'
+
+                column_pairs_list = contest_columns_pattern.findall(block_bytes)
+
+                # If a row did not match, for example a blank line or a row with too few
+                # columns, the csv module handles the whole range.
+                if len(column_pairs_list) != block_bytes.count(b'\n'):
+
+                    return None
+
+                contest_votes_counter.update(column_pairs_list)
+
+
+    encoding_string = locale.getpreferredencoding(False)
+
+    contest_votes_dictionary = {}
+
+    for (candidate_name_bytes, contest_name_bytes), vote_count_integer in contest_votes_counter.items():
+
+        contest_votes_dictionary.setdefault(sys.intern(contest_name_bytes.decode(encoding_string)), {}) \
+            [sys.intern(candidate_name_bytes.decode(encoding_string))] = vote_count_integer
+
+    return contest_votes_dictionary
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tally_contest_shard
+ #
+ #  Subroutine Description:
+ #      This function runs in a worker process, or in the main process for a single
+ #      shard, and counts the votes of every contest in one shard of the input csv
+ #      file, with the memory-mapped scanner when it can and the csv module otherwise.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  tuple   shard_tuple     the input file path, the shard's start and end byte
+ #                          offsets, and the indices of the Candidate and Contest
+ #                          columns
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tally_contest_shard(shard_tuple):
+
+    input_file_name_string, start_integer, end_integer, candidate_index_integer, contest_index_integer \
+        = shard_tuple
+
+    if contest_index_integer == candidate_index_integer + 1:
+
+        contest_votes_dictionary \
+            = scan_contest_columns(input_file_name_string, start_integer, end_integer, candidate_index_integer)
+
+        if contest_votes_dictionary is not None:
+
+            return contest_votes_dictionary
+
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        return streaming_aggregation.update_aggregators \
+                    (csv.reader \
+                        (streaming_aggregation.read_shard_lines(binary_file, start_integer, end_integer)),
+                     [contest_votes_aggregator(candidate_index_integer, contest_index_integer)]) \
+                        [0].finalize()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_contest_votes
+ #
+ #  Subroutine Description:
+ #      This function reads a multi-contest ballot csv file, or a text stream in csv
+ #      format, in one pass and returns the dictionary of each contest's candidate
+ #      votes.  With more than one worker, it counts the shards of the file in a
+ #      process pool and merges their counts in file order.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the input csv file or a text stream
+ #  int     candidate_index_integer     the index of the Candidate column
+ #  int     contest_index_integer       the index of the Contest column
+ #  int     worker_count_integer        the number of worker processes (default: 1)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_contest_votes \
+        (input_file_name_string, candidate_index_integer, contest_index_integer, worker_count_integer = 1):
+
+    if hasattr(input_file_name_string, 'read'):
+
+        return streaming_aggregation.aggregate_stream \
+                    (input_file_name_string,
+                     [contest_votes_aggregator(candidate_index_integer, contest_index_integer)]) \
+                        [0].finalize()
+
+
+    shard_tuples_list \
+        = [(input_file_name_string, start_integer, end_integer, candidate_index_integer, contest_index_integer) \
+           for start_integer, end_integer \
+               in streaming_aggregation.split_file_into_shards \
+                    (input_file_name_string, max(1, worker_count_integer))]
+
+    if len(shard_tuples_list) <= 1 or worker_count_integer <= 1:
+
+        shard_results_list = [tally_contest_shard(shard_tuple) for shard_tuple in shard_tuples_list]
+
+    else:
+
+        with multiprocessing.Pool(min(worker_count_integer, len(shard_tuples_list))) as process_pool:
+
+            shard_results_list = process_pool.map(tally_contest_shard, shard_tuples_list)
+
+
+    contest_aggregator = contest_votes_aggregator(candidate_index_integer, contest_index_integer)
+
+    for contest_votes_dictionary in shard_results_list:
+
+        contest_aggregator.merge \
+            (contest_votes_aggregator(candidate_index_integer, contest_index_integer) \
+                .restore(contest_votes_dictionary))
+
+    return contest_aggregator.finalize()
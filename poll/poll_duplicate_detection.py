@@ -0,0 +1,406 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_duplicate_detection.py
+ #
+ #  File Description:
+ #      This module finds the ballots whose Voter ID appeared on an earlier ballot,
+ #      within a memory budget.  While every Voter ID is a plain run of ASCII digits,
+ #      the module marks each ID in a bitmap, split into pages of 64 KiB that it
+ #      allocates only for the ranges of IDs that occur, so a hundred million
+ #      consecutive IDs take about 12 MiB instead of the many gigabytes a set of
+ #      strings would need.  The bitmap keys each ID by its number of digits as well
+ #      as its value, so IDs with leading zeros stay distinct from the same number
+ #      without them.
+ #
+ #      A page pays for itself only if it holds enough IDs: 64 KiB is the size of a set
+ #      of about 650 IDs.  Beyond a sixteenth of the memory budget, the module adds a
+ #      page only while the bitmap is no larger than a set of the IDs it holds would be,
+ #      so sparse IDs, such as random 19-digit numbers, each of which would take a page
+ #      of its own, do not fill the budget with nearly empty pages.
+ #
+ #      When an ID is not numeric, or the bitmap would outgrow the memory budget or
+ #      become too sparse, the module spills: it writes the IDs already marked, taking
+ #      the set bits of each nonzero 64-bit word and skipping the blocks of zero bytes,
+ #      and every later ID, with its row number and a caller's payload, to 256
+ #      partition files on disk chosen by bits of each ID's CRC-32.  Every copy of an ID lands in the same partition, in
+ #      row order, so after the pass the module reads one partition at a time into a
+ #      set and reports every copy after the first.  A partition too large for the
+ #      budget is split again on the next bits of the CRC-32 before it is read.
+ #
+ #      Here is a List of classes, subroutines, and functions:
+ #
+ #      voter_id_deduplicator
+ #      find_partition_duplicates
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Bitmap kept only while dense enough     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import os
+import shutil
+import struct
+import tempfile
+import zlib
+
+
+# This constant is the default memory budget for duplicate detection in bytes.
+CONSTANT_DUPLICATE_MEMORY_BUDGET = 256 * 1024 * 1024
+
+
+# These constants are the number of Voter IDs in each bitmap page, a power of two, and
+# the page's size in bytes.
+CONSTANT_BITMAP_PAGE_SHIFT = 19
+
+CONSTANT_BITMAP_PAGE_BYTES = (1 << CONSTANT_BITMAP_PAGE_SHIFT) // 8
+
+
+# This constant is the largest number of digits of a Voter ID the bitmap holds.
+CONSTANT_BITMAP_DIGIT_LIMIT = 19
+
+
+# This constant is the fraction of the memory budget the bitmap may take before its
+# pages must be as dense as a set of the same IDs.
+CONSTANT_BITMAP_FREE_FRACTION = 16
+
+
+# These constants are the size of the blocks of a bitmap page that a spill compares
+# with zero bytes before it reads their words, and such a block of zero bytes.
+CONSTANT_ZERO_BLOCK_BYTES = 512
+
+CONSTANT_ZERO_BLOCK = bytes(CONSTANT_ZERO_BLOCK_BYTES)
+
+
+# These constants are the number of CRC-32 bits that choose a partition at each level
+# of spilling and the number of partitions at each level.
+CONSTANT_PARTITION_BITS = 8
+
+CONSTANT_PARTITION_COUNT = 1 << CONSTANT_PARTITION_BITS
+
+
+# This constant is the layout of a spilled record's fixed part: the row number, the
+# caller's payload, and the length of the Voter ID's UTF-8 bytes that follow it.
+CONSTANT_SPILL_RECORD_STRUCT = struct.Struct('<QQH')
+
+
+# This constant is the estimated number of bytes a Voter ID takes in a partition's set,
+# apart from the ID's own characters.
+CONSTANT_SET_ENTRY_BYTES = 100
+
+
+# This constant is the number of bytes the module reads from a partition file at a time.
+CONSTANT_PARTITION_BLOCK_SIZE = 1024 * 1024
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  voter_id_deduplicator
+ #
+ #  Class Description:
+ #      This class finds the duplicate Voter IDs in a sequence of ballots.  The add
+ #      method takes each ballot's Voter ID, row number, and payload, an unsigned
+ #      64-bit integer the caller uses to identify the ballot's contents.  The class
+ #      calls the duplicate function with the row number, Voter ID, and payload of
+ #      every ballot whose Voter ID appeared on an earlier ballot: during the add
+ #      method while the IDs are in the bitmap, or during the finish method after a
+ #      spill.  The bitmap takes a new page only while the pages fit the memory budget
+ #      and either fit a sixteenth of it or are no larger than a set of the IDs marked
+ #      so far.  The finish method returns the number of duplicate ballots and removes
+ #      the partition files.
+ #
+ #  Class Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  int         memory_budget_integer       the memory budget in bytes
+ #  function    duplicate_function          the function called for each duplicate
+ #  String      spill_directory_string      the folder for the partition files
+ #                                          (default: the system's temporary folder)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Bitmap kept only while dense enough         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class voter_id_deduplicator:
+
+    def __init__(self, memory_budget_integer, duplicate_function, spill_directory_string = None):
+
+        self.memory_budget_integer = memory_budget_integer
+
+        self.duplicate_function = duplicate_function
+
+        self.spill_directory_string = spill_directory_string
+
+        # This dictionary maps each (digit count, page index) pair to its bitmap page.
+        self.bitmap_pages_dictionary = {}
+
+        self.marked_count_integer = 0
+
+        self.partition_files_list = None
+
+        self.temporary_directory_string = None
+
+        self.duplicate_count_integer = 0
+
+
+    def add(self, voter_id_string, row_integer, payload_integer):
+
+        if self.partition_files_list is None:
+
+            digit_count_integer = len(voter_id_string)
+
+            if 0 < digit_count_integer <= CONSTANT_BITMAP_DIGIT_LIMIT \
+                and voter_id_string.isascii() \
+                and voter_id_string.isdigit():
+
+                page_index_integer, bit_index_integer \
+                    = divmod(int(voter_id_string), 1 << CONSTANT_BITMAP_PAGE_SHIFT)
+
+                bitmap_page = self.bitmap_pages_dictionary.get((digit_count_integer, page_index_integer))
+
+                if bitmap_page is None:
+
+                    pages_size_integer = (len(self.bitmap_pages_dictionary) + 1) * CONSTANT_BITMAP_PAGE_BYTES
+
+                    if pages_size_integer <= self.memory_budget_integer \
+                        and (pages_size_integer <= self.memory_budget_integer // CONSTANT_BITMAP_FREE_FRACTION
+                             or pages_size_integer <= (self.marked_count_integer + 1) * CONSTANT_SET_ENTRY_BYTES):
+
+                        bitmap_page \
+                            = self.bitmap_pages_dictionary[(digit_count_integer, page_index_integer)] \
+                            = bytearray(CONSTANT_BITMAP_PAGE_BYTES)
+
+                if bitmap_page is not None:
+
+                    bit_mask_integer = 1 << (bit_index_integer & 7)
+
+                    if bitmap_page[bit_index_integer >> 3] & bit_mask_integer:
+
+                        self.duplicate_count_integer += 1
+
+                        self.duplicate_function(row_integer, voter_id_string, payload_integer)
+
+                    else:
+
+                        bitmap_page[bit_index_integer >> 3] |= bit_mask_integer
+
+                        self.marked_count_integer += 1
+
+                    return
+
+            self.spill_bitmap()
+
+
+        voter_id_bytes = voter_id_string.encode('utf-8')
+
+        self.partition_files_list[zlib.crc32(voter_id_bytes) & (CONSTANT_PARTITION_COUNT - 1)] \
+            .write(CONSTANT_SPILL_RECORD_STRUCT.pack(row_integer, payload_integer, len(voter_id_bytes)) \
+                   + voter_id_bytes)
+
+
+    def spill_bitmap(self):
+
+        self.temporary_directory_string \
+            = tempfile.mkdtemp(prefix = 'poll_duplicates_', dir = self.spill_directory_string)
+
+        # Each partition file's buffer gets an equal share of a sixteenth of the budget.
+        buffer_size_integer \
+            = max(4096, self.memory_budget_integer // (16 * CONSTANT_PARTITION_COUNT))
+
+        self.partition_files_list \
+            = [open(os.path.join(self.temporary_directory_string, f'{partition_index_integer}.part'),
+                    'wb', buffering = buffer_size_integer) \
+               for partition_index_integer in range(CONSTANT_PARTITION_COUNT)]
+
+
+        # This repetition loop writes every Voter ID marked in the bitmap to its partition
+        # as a first copy, so the spilled records that follow find it.  It skips the 
+        # blocks of zero bytes and takes the set bits of each nonzero 64-bit word in the
+        # rest, lowest first.
+        bitmap_pages_dictionary, self.bitmap_pages_dictionary = self.bitmap_pages_dictionary, {}
+
+        for (digit_count_integer, page_index_integer), bitmap_page in bitmap_pages_dictionary.items():
+
+            page_start_integer = page_index_integer << CONSTANT_BITMAP_PAGE_SHIFT
+
+            # Every ID of a page has the page's number of digits, so the records share
+            # their fixed part.
+            record_header_bytes = CONSTANT_SPILL_RECORD_STRUCT.pack(0, 0, digit_count_integer)
+
+            for block_start_integer in range(0, CONSTANT_BITMAP_PAGE_BYTES, CONSTANT_ZERO_BLOCK_BYTES):
+
+                if bitmap_page[block_start_integer:block_start_integer + CONSTANT_ZERO_BLOCK_BYTES] \
+                    == CONSTANT_ZERO_BLOCK:
+
+                    continue
+
+                for word_start_integer in range(block_start_integer, block_start_integer + CONSTANT_ZERO_BLOCK_BYTES, 8):
+
+                    word_integer = int.from_bytes(bitmap_page[word_start_integer:word_start_integer + 8], 'little')
+
+                    while word_integer:
+
+                        lowest_bit_integer = word_integer & -word_integer
+
+                        word_integer ^= lowest_bit_integer
+
+                        voter_id_bytes \
+                            = str(page_start_integer + (word_start_integer << 3) + lowest_bit_integer.bit_length() - 1) \
+                                .zfill(digit_count_integer).encode('ascii')
+
+                        self.partition_files_list \
+                            [zlib.crc32(voter_id_bytes) & (CONSTANT_PARTITION_COUNT - 1)] \
+                            .write(record_header_bytes + voter_id_bytes)
+
+        self.marked_count_integer = 0
+
+
+    def is_spilled(self):
+
+        return self.temporary_directory_string is not None
+
+
+    def finish(self):
+
+        if self.partition_files_list is not None:
+
+            try:
+
+                for partition_file in self.partition_files_list:
+
+                    partition_file.close()
+
+                for partition_file in self.partition_files_list:
+
+                    self.duplicate_count_integer \
+                        += find_partition_duplicates \
+                            (partition_file.name,
+                             CONSTANT_PARTITION_BITS,
+                             self.memory_budget_integer,
+                             self.duplicate_function)
+
+            finally:
+
+                shutil.rmtree(self.temporary_directory_string, ignore_errors = True)
+
+                self.partition_files_list = None
+
+        self.bitmap_pages_dictionary = {}
+
+        return self.duplicate_count_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_partition_duplicates
+ #
+ #  Subroutine Description:
+ #      This function reads a partition file's records in row order, calls the
+ #      duplicate function for every record whose Voter ID appeared in an earlier
+ #      record, and returns the number of duplicates.  If the partition's set of IDs
+ #      might outgrow the memory budget, the function first splits the partition on
+ #      the next bits of the IDs' CRC-32 and reads the smaller partitions one at a
+ #      time instead.  After all 32 bits are used, it reads the partition as it is.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  String      partition_file_name_string  the path of the partition file
+ #  int         bit_shift_integer           the CRC-32 bits already used for partitions
+ #  int         memory_budget_integer       the memory budget in bytes
+ #  function    duplicate_function          the function called for each duplicate
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_partition_duplicates \
+        (partition_file_name_string, bit_shift_integer, memory_budget_integer, duplicate_function):
+
+    partition_size_integer = os.path.getsize(partition_file_name_string)
+
+    # The estimate assumes every record's ID is distinct and counts the ID's own bytes
+    # along with the fixed overhead of a set entry.
+    if partition_size_integer * (1 + CONSTANT_SET_ENTRY_BYTES // CONSTANT_SPILL_RECORD_STRUCT.size) \
+        > memory_budget_integer \
+        and bit_shift_integer < 32:
+
+        subpartition_file_names_list \
+            = [f'{partition_file_name_string}.{partition_index_integer}' \
+               for partition_index_integer in range(CONSTANT_PARTITION_COUNT)]
+
+        subpartition_files_list \
+            = [open(subpartition_file_name_string, 'wb') \
+               for subpartition_file_name_string in subpartition_file_names_list]
+
+        with open(partition_file_name_string, 'rb', buffering = CONSTANT_PARTITION_BLOCK_SIZE) \
+            as partition_file:
+
+            for record_header_bytes in iter(lambda: partition_file.read(CONSTANT_SPILL_RECORD_STRUCT.size), b''):
+
+                voter_id_bytes \
+                    = partition_file.read(CONSTANT_SPILL_RECORD_STRUCT.unpack(record_header_bytes)[2])
+
+                subpartition_files_list \
+                    [zlib.crc32(voter_id_bytes) >> bit_shift_integer & (CONSTANT_PARTITION_COUNT - 1)] \
+                    .write(record_header_bytes + voter_id_bytes)
+
+        for subpartition_file in subpartition_files_list:
+
+            subpartition_file.close()
+
+        os.remove(partition_file_name_string)
+
+
+        duplicate_count_integer = 0
+
+        for subpartition_file_name_string in subpartition_file_names_list:
+
+            duplicate_count_integer \
+                += find_partition_duplicates \
+                    (subpartition_file_name_string,
+                     bit_shift_integer + CONSTANT_PARTITION_BITS,
+                     memory_budget_integer,
+                     duplicate_function)
+
+            os.remove(subpartition_file_name_string)
+
+        return duplicate_count_integer
+
+
+    voter_ids_set = set()
+
+    duplicate_count_integer = 0
+
+    with open(partition_file_name_string, 'rb', buffering = CONSTANT_PARTITION_BLOCK_SIZE) \
+        as partition_file:
+
+        for record_header_bytes in iter(lambda: partition_file.read(CONSTANT_SPILL_RECORD_STRUCT.size), b''):
+
+            row_integer, payload_integer, voter_id_length_integer \
+                = CONSTANT_SPILL_RECORD_STRUCT.unpack(record_header_bytes)
+
+            voter_id_bytes = partition_file.read(voter_id_length_integer)
+
+            if voter_id_bytes in voter_ids_set:
+
+                duplicate_count_integer += 1
+
+                duplicate_function(row_integer, voter_id_bytes.decode('utf-8'), payload_integer)
+
+            else:
+
+                voter_ids_set.add(voter_id_bytes)
+
+    return duplicate_count_integer
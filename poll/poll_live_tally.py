@@ -0,0 +1,418 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_live_tally.py
+ #
+ #  File Description:
+ #      This module keeps the state of a live tally for poll_main.py's follow mode, in
+ #      which the ballot csv file grows while precincts report.  The state records how
+ #      far the program has read the file: the byte offset of the first data row after
+ #      the header row, the byte offset it has read up to, the partial line at the end
+ #      of the bytes read so far, and the candidate votes and row count of the complete
+ #      lines before that partial line.  Each time the file grows, the module finds the
+ #      byte range of the newly completed lines, so poll_main.py counts only those.  A
+ #      line break inside a quoted field does not complete a line: the ballot stays in
+ #      the partial line until its field is closed.
+ #
+ #      The module also saves the state to a small JSON checkpoint file next to the csv
+ #      file and loads it again, so a restarted program resumes from the saved offset
+ #      instead of counting every ballot from the start.  The checkpoint holds a BLAKE2
+ #      digest of the start of the file and of the bytes just before the partial line.
+ #      The follow state keeps the same digest, and the module checks it each time it 
+ #      looks for appended lines as well as when it loads a checkpoint; if the file has
+ #      been replaced, rewritten, or truncated, the program counts it again.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      get_checkpoint_file_name
+ #      create_follow_state
+ #      calculate_boundary_digest
+ #      read_checkpoint
+ #      write_checkpoint
+ #      find_appended_lines
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Boundary digest checked on every poll   Nicholas J. George
+ #  10/18/2026      Lines end outside quoted fields         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import base64
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import sys
+
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+
+import schema_parser
+
+
+# This constant is the file name extension of the checkpoint file.
+CONSTANT_CHECKPOINT_FILE_EXTENSION = '.checkpoint'
+
+CONSTANT_CHECKPOINT_VERSION = 1
+
+
+# This constant is the number of bytes at the start of the file and before the partial
+# line that the boundary digest covers.
+CONSTANT_BOUNDARY_DIGEST_SIZE = 4096
+
+
+# This constant is the number of bytes the module reads at a time while it searches
+# backward for the last line break.
+CONSTANT_FOLLOW_BLOCK_SIZE = 64 * 1024
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  get_checkpoint_file_name
+ #
+ #  Subroutine Description:
+ #      This function returns the path of the checkpoint file next to a ballot csv file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def get_checkpoint_file_name(input_file_name_string):
+
+    return os.path.splitext(input_file_name_string)[0] + CONSTANT_CHECKPOINT_FILE_EXTENSION
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_follow_state
+ #
+ #  Subroutine Description:
+ #      This function returns a new follow state for a file the program has not read.
+ #      A data start of zero means the program has not yet read a complete header row;
+ #      the boundary digest identifies the file up to the start of the partial line.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_follow_state():
+
+    return {'Data Start': 0,
+            'Offset': 0,
+            'Remainder': b'',
+            'Boundary Digest': '',
+            'Candidate Votes': {},
+            'Row Count': 0}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_boundary_digest
+ #
+ #  Subroutine Description:
+ #      This function returns the hexadecimal BLAKE2 digest of the first bytes of a file
+ #      and of the bytes just before a line offset, which identifies the file's contents
+ #      up to that offset without reading all of them.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  binary_file             the csv file opened in binary mode
+ #  int     line_start_integer      the byte offset of the partial line
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_boundary_digest(binary_file, line_start_integer):
+
+    digest_object = hashlib.blake2b(digest_size = 20)
+
+    binary_file.seek(0)
+
+    digest_object.update(binary_file.read(min(CONSTANT_BOUNDARY_DIGEST_SIZE, line_start_integer)))
+
+    boundary_start_integer = max(0, line_start_integer - CONSTANT_BOUNDARY_DIGEST_SIZE)
+
+    binary_file.seek(boundary_start_integer)
+
+    digest_object.update(binary_file.read(line_start_integer - boundary_start_integer))
+
+    return digest_object.hexdigest()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_checkpoint
+ #
+ #  Subroutine Description:
+ #      This function returns the follow state saved in a checkpoint file, or None if
+ #      the checkpoint is missing, unreadable, from another version, or no longer
+ #      matches the csv file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the csv file
+ #  String  checkpoint_file_name_string the path of the checkpoint file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_checkpoint(input_file_name_string, checkpoint_file_name_string):
+
+    try:
+
+        with open(checkpoint_file_name_string, encoding = 'utf-8') as checkpoint_file:
+
+            checkpoint_dictionary = json.load(checkpoint_file)
+
+        if checkpoint_dictionary.get('version') != CONSTANT_CHECKPOINT_VERSION:
+
+            return None
+
+        follow_state_dictionary \
+            = {'Data Start': checkpoint_dictionary['data_start'],
+               'Offset': checkpoint_dictionary['offset'],
+               'Remainder': base64.b64decode(checkpoint_dictionary['remainder']),
+               'Boundary Digest': checkpoint_dictionary['boundary_digest'],
+               'Candidate Votes': dict(checkpoint_dictionary['candidate_votes']),
+               'Row Count': checkpoint_dictionary['row_count']}
+
+        line_start_integer \
+            = follow_state_dictionary['Offset'] - len(follow_state_dictionary['Remainder'])
+
+
+        with open(input_file_name_string, 'rb') as binary_file:
+
+            if binary_file.seek(0, os.SEEK_END) < follow_state_dictionary['Offset']:
+
+                return None
+
+            if calculate_boundary_digest(binary_file, line_start_integer) \
+                != follow_state_dictionary['Boundary Digest']:
+
+                return None
+
+            binary_file.seek(line_start_integer)
+
+            if binary_file.read(len(follow_state_dictionary['Remainder'])) \
+                != follow_state_dictionary['Remainder']:
+
+                return None
+
+    except (OSError, ValueError, KeyError, TypeError):
+
+        return None
+
+    return follow_state_dictionary
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_checkpoint
+ #
+ #  Subroutine Description:
+ #      This subroutine saves the follow state to a checkpoint file.  It writes a
+ #      temporary file and renames it over the checkpoint, so a program stopped in the
+ #      middle of a write leaves the previous checkpoint intact.  The checkpoint keeps
+ #      the state's boundary digest, of the bytes the program counted, rather than a 
+ #      digest of the file as it is now.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  String      checkpoint_file_name_string the path of the checkpoint file
+ #  dictionary  follow_state_dictionary     the follow state
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Boundary digest from the follow state       Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_checkpoint(checkpoint_file_name_string, follow_state_dictionary):
+
+    checkpoint_dictionary \
+        = {'version': CONSTANT_CHECKPOINT_VERSION,
+           'data_start': follow_state_dictionary['Data Start'],
+           'offset': follow_state_dictionary['Offset'],
+           'remainder': base64.b64encode(follow_state_dictionary['Remainder']).decode('ascii'),
+           'boundary_digest': follow_state_dictionary['Boundary Digest'],
+           'candidate_votes': list(follow_state_dictionary['Candidate Votes'].items()),
+           'row_count': follow_state_dictionary['Row Count']}
+
+
+    temporary_checkpoint_file_name_string = checkpoint_file_name_string + '.tmp'
+
+    with open(temporary_checkpoint_file_name_string, 'w', encoding = 'utf-8') as checkpoint_file:
+
+        json.dump(checkpoint_dictionary, checkpoint_file)
+
+    os.replace(temporary_checkpoint_file_name_string, checkpoint_file_name_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_appended_lines
+ #
+ #  Subroutine Description:
+ #      This function reads the bytes appended to the csv file since the last call and
+ #      returns the (start, end) byte offsets of the lines they complete, or None if
+ #      they complete no line.  It moves the state's offset to the end of the file and
+ #      keeps the partial line after the last line break outside a quoted field as the
+ #      state's remainder, so a ballot whose quoted field is still arriving waits for
+ #      the next call.
+ #      It reads the header row first, and if the file is shorter than the offset, the
+ #      remainder no longer matches the file, or the boundary digest no longer matches
+ #      the bytes before the remainder, the file has been replaced or rewritten, so the
+ #      function resets the state and the program counts the file from the start.  It
+ #      then moves the boundary digest to the new start of the partial line.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  String      input_file_name_string      the path of the csv file
+ #  dictionary  follow_state_dictionary     the follow state, which the function updates
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Boundary digest checked on every poll       Nicholas J. George
+ #  10/18/2026          Lines end outside quoted fields             Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_appended_lines(input_file_name_string, follow_state_dictionary):
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        file_size_integer = binary_file.seek(0, os.SEEK_END)
+
+        line_start_integer \
+            = follow_state_dictionary['Offset'] - len(follow_state_dictionary['Remainder'])
+
+        binary_file.seek(line_start_integer)
+
+        if file_size_integer < follow_state_dictionary['Offset'] \
+            or binary_file.read(len(follow_state_dictionary['Remainder'])) \
+                != follow_state_dictionary['Remainder'] \
+            or (follow_state_dictionary['Data Start'] > 0 \
+                and calculate_boundary_digest(binary_file, line_start_integer) \
+                    != follow_state_dictionary['Boundary Digest']):
+
+            follow_state_dictionary.update(create_follow_state())
+
+            line_start_integer = 0
+
+
+        # If the program has not read a complete header row, it reads it first and
+        # starts counting at the line after it.
+        if follow_state_dictionary['Data Start'] == 0:
+
+            binary_file.seek(0)
+
+            header_bytes = binary_file.readline()
+
+            if not header_bytes.endswith(b'\n'):
+
+                return None
+
+            follow_state_dictionary['Data Start'] = len(header_bytes)
+
+            line_start_integer = len(header_bytes)
+
+
+        # This set holds the byte offsets of the line breaks inside quoted fields after
+        # the start of the partial line, which cannot end a line.
+        quoted_line_breaks_set = set()
+
+        if file_size_integer > line_start_integer:
+
+            with mmap.mmap(binary_file.fileno(), 0, access = mmap.ACCESS_READ) as memory_map, \
+                 contextlib.closing \
+                    (schema_parser.find_quoted_line_breaks(memory_map, line_start_integer, file_size_integer)) \
+                        as quoted_line_breaks_iterator:
+
+                quoted_line_breaks_set.update(quoted_line_breaks_iterator)
+
+
+        # This repetition loop searches backward from the end of the file, one block at
+        # a time, for the last line break outside a quoted field after the start of the
+        # partial line.
+        end_integer = line_start_integer
+
+        position_integer = file_size_integer
+
+        while position_integer > line_start_integer:
+
+            block_start_integer = max(line_start_integer, position_integer - CONSTANT_FOLLOW_BLOCK_SIZE)
+
+            binary_file.seek(block_start_integer)
+
+            block_bytes = binary_file.read(position_integer - block_start_integer)
+
+            line_break_index = block_bytes.rfind(b'\n')
+
+            while line_break_index != -1 and block_start_integer + line_break_index in quoted_line_breaks_set:
+
+                line_break_index = block_bytes.rfind(b'\n', 0, line_break_index)
+
+            if line_break_index != -1:
+
+                end_integer = block_start_integer + line_break_index + 1
+
+                break
+
+            position_integer = block_start_integer
+
+
+        binary_file.seek(end_integer)
+
+        follow_state_dictionary['Remainder'] = binary_file.read(file_size_integer - end_integer)
+
+        follow_state_dictionary['Offset'] = file_size_integer
+
+        follow_state_dictionary['Boundary Digest'] = calculate_boundary_digest(binary_file, end_integer)
+
+
+    if end_integer > line_start_integer:
+
+        return line_start_integer, end_integer
+
+    return None
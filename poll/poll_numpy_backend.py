@@ -0,0 +1,366 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_numpy_backend.py
+ #
+ #  File Description:
+ #      This module is an optional NumPy backend for the candidate vote tally in
+ #      poll_main.py.  It reads the ballot csv file in blocks of whole lines, finds the
+ #      candidate column of every row with vectorized searches over the raw bytes,
+ #      encodes the candidate names to integer codes, and counts the codes with
+ #      bincount, so no Python code runs per row.  The bytes of the csv file are not
+ #      decoded; only the distinct candidate names are, at the end.  If NumPy is not installed, the
+ #      module reports that the backend is unavailable and poll_main.py uses its other
+ #      paths.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      is_numpy_backend_selected
+ #      find_field_bounds
+ #      tally_block_candidate_votes
+ #      tally_candidate_votes_numpy
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import locale
+import os
+import sys
+
+try:
+
+    import numpy
+
+except ImportError:
+
+    numpy = None
+
+
+# This constant is the smallest input file size, in bytes, for which the program selects
+# the NumPy backend automatically.
+CONSTANT_NUMPY_SIZE_THRESHOLD = 32 * 1024 * 1024
+
+
+# This constant is the number of bytes the backend reads per block.
+CONSTANT_NUMPY_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+# These constants are the byte values of the characters the backend searches for.
+CONSTANT_NEWLINE_BYTE = ord('\n')
+
+CONSTANT_CARRIAGE_RETURN_BYTE = ord('\r')
+
+CONSTANT_COMMA_BYTE = ord(',')
+
+
+# This constant is the odd multiplier that combines a field's 64-bit words into one hash.
+CONSTANT_HASH_MULTIPLIER = numpy.uint64(0x100000001B3) if numpy is not None else None
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  is_numpy_backend_selected
+ #
+ #  Subroutine Description:
+ #      This function returns True if NumPy is installed and the input file is at least
+ #      as large as the size threshold.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the input csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def is_numpy_backend_selected(input_file_name_string):
+
+    return numpy is not None \
+           and os.path.getsize(input_file_name_string) >= CONSTANT_NUMPY_SIZE_THRESHOLD
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_field_bounds
+ #
+ #  Subroutine Description:
+ #      This function returns the start and end byte offsets of one column in every row
+ #      of a block of whole lines, or None if any row has too few columns.  A carriage
+ #      return before a line break is not part of the last column.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  array   block_array         the block's bytes as an array of unsigned 8-bit integers
+ #  int     column_index        the index of the column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_field_bounds(block_array, column_index):
+
+    row_ends_array = numpy.flatnonzero(block_array == CONSTANT_NEWLINE_BYTE)
+
+    row_starts_array = numpy.concatenate(([0], row_ends_array[:-1] + 1))
+
+    comma_positions_array \
+        = numpy.concatenate \
+            ((numpy.flatnonzero(block_array == CONSTANT_COMMA_BYTE), [len(block_array)]))
+
+
+    # This line of code finds each row's first comma; the row's column separators follow it
+    # in order.  Indices past the last comma point at the end-of-block sentinel.
+    first_comma_indices_array = numpy.searchsorted(comma_positions_array, row_starts_array)
+
+    last_comma_index_integer = len(comma_positions_array) - 1
+
+    if column_index > 0:
+
+        separator_indices_array \
+            = numpy.minimum(first_comma_indices_array + column_index - 1, last_comma_index_integer)
+
+        if numpy.any(comma_positions_array[separator_indices_array] >= row_ends_array):
+
+            return None
+
+        field_starts_array = comma_positions_array[separator_indices_array] + 1
+
+    else:
+
+        field_starts_array = row_starts_array
+
+
+    field_ends_array \
+        = numpy.minimum \
+            (comma_positions_array \
+                [numpy.minimum(first_comma_indices_array + column_index, last_comma_index_integer)],
+             row_ends_array)
+
+    # A blank line has no columns at all.
+    if numpy.any(row_ends_array == row_starts_array):
+
+        return None
+
+
+    carriage_returns_boolean_array \
+        = (field_ends_array == row_ends_array) \
+          & (field_ends_array > field_starts_array) \
+          & (block_array[numpy.maximum(field_ends_array - 1, 0)] == CONSTANT_CARRIAGE_RETURN_BYTE)
+
+    field_ends_array = field_ends_array - carriage_returns_boolean_array
+
+
+    return field_starts_array, field_ends_array
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tally_block_candidate_votes
+ #
+ #  Subroutine Description:
+ #      This function counts the candidate votes in a block of whole lines.  It gathers 
+ #      each row's candidate field into a zero-padded matrix whose rows are whole 64-bit 
+ #      words, hashes the words of each row into one integer, and encodes the distinct 
+ #      hashes to integer codes with unique.  It then checks every row against the 
+ #      first row with the same code, so a hash collision can never merge two names; 
+ #      if one occurs, the function encodes the rows' full bytes instead.  Finally, it 
+ #      counts the codes with bincount.  The function returns the raw candidate names 
+ #      in first-seen order, their vote counts, and the number of rows, or None if a 
+ #      row has too few columns.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  bytes   block_bytes             the block's whole lines
+ #  int     candidate_index_integer the index of the Candidate column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tally_block_candidate_votes(block_bytes, candidate_index_integer):
+
+    block_array = numpy.frombuffer(block_bytes, dtype = numpy.uint8)
+
+    field_bounds_tuple = find_field_bounds(block_array, candidate_index_integer)
+
+    if field_bounds_tuple is None:
+
+        return None
+
+    field_starts_array, field_ends_array = field_bounds_tuple
+
+    field_lengths_array = field_ends_array - field_starts_array
+
+    field_width_integer = (int(field_lengths_array.max(initial = 0)) + 8) // 8 * 8
+
+
+    # These lines of code copy the bytes at each field's start into a row of the matrix, 
+    # then clear the bytes past the field's end with a mask chosen by the field's length.
+    padded_block_array \
+        = numpy.concatenate((block_array, numpy.zeros(field_width_integer, dtype = numpy.uint8)))
+
+    characters_array \
+        = numpy.lib.stride_tricks.sliding_window_view \
+            (padded_block_array, field_width_integer)[field_starts_array]
+
+    length_masks_array \
+        = numpy.where \
+            (numpy.arange(field_width_integer) \
+                < numpy.arange(field_width_integer + 1)[:, None], 0xFF, 0).astype(numpy.uint8)
+
+    characters_array &= length_masks_array[field_lengths_array]
+
+    words_array = characters_array.view(numpy.uint64)
+
+
+    hashes_array = words_array[:, 0].copy()
+
+    for word_index in range(1, words_array.shape[1]):
+
+        hashes_array = hashes_array * CONSTANT_HASH_MULTIPLIER ^ words_array[:, word_index]
+
+    first_indices_array, candidate_codes_array \
+        = numpy.unique(hashes_array, return_index = True, return_inverse = True)[1:]
+
+    candidate_codes_array = candidate_codes_array.ravel()
+
+    if not numpy.array_equal(words_array, words_array[first_indices_array][candidate_codes_array]):
+
+        first_indices_array, candidate_codes_array \
+            = numpy.unique \
+                (characters_array.view(f'V{field_width_integer}').ravel(), 
+                 return_index = True, return_inverse = True)[1:]
+
+        candidate_codes_array = candidate_codes_array.ravel()
+
+
+    vote_counts_array \
+        = numpy.bincount(candidate_codes_array, minlength = len(first_indices_array))
+
+    first_seen_order_array = numpy.argsort(first_indices_array, kind = 'stable')
+
+
+    return [characters_array[first_indices_array[code_index]] \
+                [:field_lengths_array[first_indices_array[code_index]]].tobytes() \
+            for code_index in first_seen_order_array], \
+           [int(vote_counts_array[code_index]) for code_index in first_seen_order_array], \
+           len(field_starts_array)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tally_candidate_votes_numpy
+ #
+ #  Subroutine Description:
+ #      This function counts the candidate votes in the input csv file with the NumPy
+ #      backend.  It returns the candidate vote dictionary in first-seen order and the
+ #      number of rows after the header row, or None if NumPy is not installed or the
+ #      file has a quoted field or a row the backend cannot read, in which case the
+ #      caller uses its other paths.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the input csv file
+ #  int     candidate_index_integer the index of the Candidate column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tally_candidate_votes_numpy(input_file_name_string, candidate_index_integer):
+
+    if numpy is None:
+
+        return None
+
+
+    candidate_votes_dictionary = {}
+
+    row_count_integer = 0
+
+    remainder_bytes = b''
+
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        binary_file.readline()
+
+        while True:
+
+            read_bytes = binary_file.read(CONSTANT_NUMPY_BLOCK_SIZE)
+
+            # This line of code keeps the partial last line of the block for the next
+            # block; at the end of the file, the partial line gets its line break.
+            if read_bytes:
+
+                read_bytes = remainder_bytes + read_bytes
+
+                block_end_integer = read_bytes.rfind(b'\n') + 1
+
+                block_bytes = read_bytes[:block_end_integer]
+
+                remainder_bytes = read_bytes[block_end_integer:]
+
+            else:
+
+                block_bytes = remainder_bytes + b'\n' if remainder_bytes else b''
+
+                remainder_bytes = b''
+
+
+            if block_bytes:
+
+                # A quotation mark means a field may hold a comma or a line break, which
+                # only the csv module reads correctly.
+                if b'"' in block_bytes:
+
+                    return None
+
+                block_result_tuple \
+                    = tally_block_candidate_votes(block_bytes, candidate_index_integer)
+
+                if block_result_tuple is None:
+
+                    return None
+
+                for candidate_name_bytes, vote_count_integer \
+                    in zip(block_result_tuple[0], block_result_tuple[1]):
+
+                    candidate_votes_dictionary[candidate_name_bytes] \
+                        = candidate_votes_dictionary.get(candidate_name_bytes, 0) + vote_count_integer
+
+                row_count_integer += block_result_tuple[2]
+
+            if not read_bytes:
+
+                break
+
+
+    encoding_string = locale.getpreferredencoding(False)
+
+    return {sys.intern(candidate_name_bytes.decode(encoding_string)): vote_count_integer \
+            for candidate_name_bytes, vote_count_integer in candidate_votes_dictionary.items()}, \
+           row_count_integer
@@ -0,0 +1,233 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_precinct_ingestion.py
+ #
+ #  File Description:
+ #      This module lets poll_main.py count the ballots of many precinct csv files, one
+ #      per precinct, without concatenating them first.  It finds the files in a
+ #      folder or by a glob pattern and counts them concurrently: an asyncio event
+ #      loop hands each file to a bounded pool of threads, which open, read, and count
+ #      the files while others wait on the disk, so thousands of small files take
+ #      about as long as reading them rather than as long as opening them one after
+ #      another.  The loop adds each precinct's votes to the running totals as soon as
+ #      its file is counted.  Because the files finish in any order, the module lists
+ #      the candidates, once every file is counted, in the order they first appear in
+ #      the files sorted by path, so the results match those of the concatenated file.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      find_precinct_files
+ #      tally_indexed_precinct_file
+ #      tally_precinct_files_concurrently
+ #      tally_precinct_files
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import asyncio
+import concurrent.futures
+import glob
+import os
+
+
+# This constant is the default number of precinct files counted at the same time.
+CONSTANT_PRECINCT_CONCURRENCY = 32
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_precinct_files
+ #
+ #  Subroutine Description:
+ #      This function returns a list of tuples, one per ballot csv file in a directory
+ #      or matching a glob pattern, sorted by path.  Each tuple holds the precinct name
+ #      and the input file path.  The precinct name is the file's path relative to the
+ #      folder the files share, without the extension and with path separators
+ #      replaced by underscores.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  precinct_path_string        a directory of csv files or a glob pattern
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_precinct_files(precinct_path_string):
+
+    if os.path.isdir(precinct_path_string):
+
+        precinct_path_string = os.path.join(precinct_path_string, '*.csv')
+
+    input_file_names_list \
+        = sorted \
+            (os.path.abspath(file_name_string) \
+             for file_name_string in glob.glob(precinct_path_string, recursive = True) \
+             if os.path.isfile(file_name_string))
+
+    if len(input_file_names_list) == 0:
+
+        return []
+
+
+    common_directory_string \
+        = os.path.commonpath \
+            ([os.path.dirname(file_name_string) for file_name_string in input_file_names_list])
+
+    return [(os.path.splitext \
+                (os.path.relpath(input_file_name_string, common_directory_string))[0] \
+                    .replace(os.sep, '_'),
+             input_file_name_string) \
+            for input_file_name_string in input_file_names_list]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tally_indexed_precinct_file
+ #
+ #  Subroutine Description:
+ #      This function runs in a thread of the pool, counts one precinct file with the
+ #      tally function, and returns the precinct's index with its tally, so the files
+ #      can finish in any order.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  function    tally_function              a function that takes a file path and
+ #                                          returns the file's candidate votes and row
+ #                                          count
+ #  int         precinct_index              the index of the precinct in path order
+ #  String      input_file_name_string      the path of the precinct csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tally_indexed_precinct_file(tally_function, precinct_index, input_file_name_string):
+
+    return precinct_index, tally_function(input_file_name_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tally_precinct_files_concurrently
+ #
+ #  Subroutine Description:
+ #      This coroutine counts the precinct files in a pool of threads, at most the
+ #      concurrency limit at a time, and adds each file's candidate votes and row
+ #      count to the totals as the file is counted.  It returns the totals, with the
+ #      candidates in the order they first appear in the files in path order, and a
+ #      list with each precinct's name, candidate votes, and row count in path order.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  list        precinct_tuples_list        the (precinct name, file path) tuples
+ #  function    tally_function              a function that takes a file path and
+ #                                          returns the file's candidate votes and row
+ #                                          count
+ #  int         concurrency_integer         the number of files counted at the same time
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+async def tally_precinct_files_concurrently(precinct_tuples_list, tally_function, concurrency_integer):
+
+    event_loop = asyncio.get_running_loop()
+
+    precinct_results_list = [None] * len(precinct_tuples_list)
+
+    total_votes_dictionary = {}
+
+    total_rows_integer = 0
+
+    with concurrent.futures.ThreadPoolExecutor(max(1, concurrency_integer)) as thread_pool:
+
+        tally_futures_list \
+            = [event_loop.run_in_executor \
+                (thread_pool, tally_indexed_precinct_file, tally_function, precinct_index, input_file_name_string) \
+               for precinct_index, (_, input_file_name_string) in enumerate(precinct_tuples_list)]
+
+
+        # This repetition loop adds each precinct's tally to the totals as soon as its
+        # file is counted.
+        for tally_future in asyncio.as_completed(tally_futures_list):
+
+            precinct_index, (candidate_votes_dictionary, row_count_integer) = await tally_future
+
+            for candidate_name, vote_count_integer in candidate_votes_dictionary.items():
+
+                total_votes_dictionary[candidate_name] \
+                    = total_votes_dictionary.get(candidate_name, 0) + vote_count_integer
+
+            total_rows_integer += row_count_integer
+
+            precinct_results_list[precinct_index] \
+                = (precinct_tuples_list[precinct_index][0], candidate_votes_dictionary, row_count_integer)
+
+
+    # These lines of code put the candidates in the order they first appear in the files
+    # in path order, as in the concatenated file.
+    candidate_votes_dictionary = {}
+
+    for _, precinct_votes_dictionary, _ in precinct_results_list:
+
+        for candidate_name in precinct_votes_dictionary:
+
+            if candidate_name not in candidate_votes_dictionary:
+
+                candidate_votes_dictionary[candidate_name] = total_votes_dictionary[candidate_name]
+
+    return candidate_votes_dictionary, total_rows_integer, precinct_results_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tally_precinct_files
+ #
+ #  Subroutine Description:
+ #      This function runs tally_precinct_files_concurrently in a new event loop and
+ #      returns its results.  A caller that already runs an event loop awaits the
+ #      coroutine instead.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  list        precinct_tuples_list        the (precinct name, file path) tuples
+ #  function    tally_function              a function that takes a file path and
+ #                                          returns the file's candidate votes and row
+ #                                          count
+ #  int         concurrency_integer         the number of files counted at the same time
+ #                                          (default: CONSTANT_PRECINCT_CONCURRENCY)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tally_precinct_files \
+        (precinct_tuples_list, tally_function, concurrency_integer = CONSTANT_PRECINCT_CONCURRENCY):
+
+    return asyncio.run \
+                (tally_precinct_files_concurrently(precinct_tuples_list, tally_function, concurrency_integer))
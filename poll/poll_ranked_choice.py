@@ -0,0 +1,597 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_ranked_choice.py
+ #
+ #  File Description:
+ #      This module tabulates ranked-choice ballots by instant runoff for poll_main.py.
+ #      A ranked ballot csv file has the usual columns followed by optional preference
+ #      columns, "Rank 2", "Rank 3", and so on; the Candidate column holds the first
+ #      choice, and a blank preference means the voter ranked no one there.  Most
+ #      voters rank the candidates in one of a few orders, so the module reads the file
+ #      once and collapses identical rankings into weighted groups: the memory-mapped
+ #      scanner counts the raw text of each row's rankings, and the csv module counts
+ #      their tuples when the file needs it.  Each round of the runoff then moves the
+ #      eliminated candidates' groups, with their weights, to their next continuing
+ #      choices, so a round costs time in proportion to the number of groups rather
+ #      than the number of ballots.
+ #
+ #      A candidate wins with more than half of the continuing ballots, the ballots
+ #      that still rank a continuing candidate.  Otherwise, every candidate without
+ #      votes, or else the candidate with the fewest votes, is eliminated.  A tie for
+ #      the fewest votes goes to the candidate with fewer votes in the latest earlier
+ #      round in which the tied candidates' votes differ and, failing that, to the
+ #      candidate first seen last.  If every continuing candidate has the same number
+ #      of votes, the election is a tie.
+ #
+ #      Here is a List of classes, subroutines, and functions:
+ #
+ #      find_preference_column_indices
+ #      ranked_ballots_aggregator
+ #      scan_ranked_ballots
+ #      count_ranked_ballot_shard
+ #      read_ranked_ballot_groups
+ #      normalize_ranked_ballot_groups
+ #      tabulate_instant_runoff
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import collections
+import csv
+import locale
+import mmap
+import multiprocessing
+import operator
+import os
+import re
+import sys
+
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+
+import streaming_aggregation
+
+
+# This compiled expression matches the header of a preference column and captures its
+# rank.
+PREFERENCE_COLUMN_PATTERN = re.compile(r'^\s*Rank\s+(\d+)\s*$', re.IGNORECASE)
+
+
+# This constant is the number of bytes the scanner reads at a time.
+CONSTANT_RANKED_SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_preference_column_indices
+ #
+ #  Subroutine Description:
+ #      This function returns the indices of a ballot csv file's preference columns in
+ #      order of rank: the Candidate column, for the first choice, and then each "Rank
+ #      N" column, for N of 2 or more, in order of N.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  list    header_list                 the column names of the header row
+ #  int     candidate_index_integer     the index of the Candidate column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_preference_column_indices(header_list, candidate_index_integer):
+
+    rank_columns_list = []
+
+    for column_index_integer, column_name_string in enumerate(header_list):
+
+        rank_match = PREFERENCE_COLUMN_PATTERN.match(column_name_string)
+
+        if rank_match is not None \
+            and int(rank_match.group(1)) >= 2 \
+            and column_index_integer != candidate_index_integer:
+
+            rank_columns_list.append((int(rank_match.group(1)), column_index_integer))
+
+    return [candidate_index_integer] \
+           + [column_index_integer for _, column_index_integer in sorted(rank_columns_list)]
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  ranked_ballots_aggregator
+ #
+ #  Class Description:
+ #      This class is the streaming aggregator for the weighted groups of ranked
+ #      ballots.  It counts each distinct tuple of raw preferences, in first-seen
+ #      order, and merges the groups of the records that follow by adding their
+ #      counts.  The finalize method returns the group dictionary and the row count,
+ #      and the restore method loads them.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  list    preference_indices_list     the indices of the preference columns in order
+ #                                      of rank
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class ranked_ballots_aggregator(streaming_aggregation.streaming_aggregator):
+
+    def __init__(self, preference_indices_list):
+
+        self.preference_indices_list = list(preference_indices_list)
+
+        super().__init__()
+
+
+    def initialize(self):
+
+        # This counter holds each distinct tuple of preferences and its number of ballots.
+        self.ballot_groups_counter = collections.Counter()
+
+
+    def update(self, csv_records):
+
+        # A single item getter returns the field itself rather than a tuple, so the
+        # aggregator then wraps it.
+        if len(self.preference_indices_list) > 1:
+
+            self.ballot_groups_counter.update \
+                (map(operator.itemgetter(*self.preference_indices_list), csv_records))
+
+        else:
+
+            self.ballot_groups_counter.update \
+                ((csv_record[self.preference_indices_list[0]],) for csv_record in csv_records)
+
+
+    def merge(self, following_aggregator):
+
+        self.ballot_groups_counter.update(following_aggregator.ballot_groups_counter)
+
+        return self
+
+
+    def finalize(self):
+
+        return dict(self.ballot_groups_counter), sum(self.ballot_groups_counter.values())
+
+
+    def restore(self, groups_result_tuple):
+
+        self.ballot_groups_counter = collections.Counter(groups_result_tuple[0])
+
+        return self
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  scan_ranked_ballots
+ #
+ #  Subroutine Description:
+ #      This function counts the weighted groups of ranked ballots in a byte range of
+ #      the csv file with a memory map and a compiled expression, which captures the
+ #      raw text from the Candidate column to the end of each row.  The caller uses it
+ #      only when the preference columns are the Candidate column and the columns
+ #      after it, in order.  It returns the group dictionary, with tuples of names as
+ #      keys, and the row count, or None if the range needs the csv module.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the input csv file
+ #  int     start_integer               the byte offset of the first row
+ #  int     end_integer                 the byte offset of the end of the range
+ #  int     candidate_index_integer     the index of the Candidate column
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def scan_ranked_ballots(input_file_name_string, start_integer, end_integer, candidate_index_integer):
+
+    rankings_pattern \
+        = re.compile(rb'^(?:[^,\n]*,){%d}([^\r\n]*)' % candidate_index_integer, re.MULTILINE)
+
+    ballot_groups_counter = collections.Counter()
+
+    row_count_integer = 0
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        if end_integer <= start_integer:
+
+            return {}, 0
+
+        with mmap.mmap(binary_file.fileno(), 0, access = mmap.ACCESS_READ) as memory_map:
+
+            # A quotation mark means a field may hold a comma or a line break, which only
+            # the csv module reads correctly.
+            if memory_map.find(b'"', start_integer, end_integer) != -1:
+
+                return None
+
+
+            block_start_integer = start_integer
+
+            # This repetition loop scans the byte range one block of whole lines at a time.
+            while block_start_integer < end_integer:
+
+                block_end_integer \
+                    = memory_map.find \
+                        (b'\n',
+                         min(block_start_integer + CONSTANT_RANKED_SCAN_BLOCK_SIZE, end_integer) - 1,
+                         end_integer) + 1 \
+                      or end_integer
+
+                block_bytes = memory_map[block_start_integer:block_end_integer]
+
+                block_start_integer = block_end_integer
+
+                if not block_bytes.endswith(b'\n'):
+
+                    block_bytes += b'\n'
+
+                rankings_list = rankings_pattern.findall(block_bytes)
+
+                # If a row did not match, for example a blank line or a row with too few
+                # columns, the csv module handles the whole range.
+                if len(rankings_list) != block_bytes.count(b'\n'):
+
+                    return None
+
+                ballot_groups_counter.update(rankings_list)
+
+                row_count_integer += len(rankings_list)
+
+
+    encoding_string = locale.getpreferredencoding(False)
+
+    ballot_groups_dictionary \
+        = {tuple(rankings_bytes.decode(encoding_string).split(',')): ballot_count_integer \
+           for rankings_bytes, ballot_count_integer in ballot_groups_counter.items()}
+
+    return ballot_groups_dictionary, row_count_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  count_ranked_ballot_shard
+ #
+ #  Subroutine Description:
+ #      This function runs in a worker process, or in the main process for a single
+ #      shard, and counts the weighted groups of ranked ballots in one shard of the
+ #      input csv file, with the memory-mapped scanner when it can and the csv module
+ #      otherwise.  It returns the shard's group dictionary and row count.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  tuple   shard_tuple     the input file path, the shard's start and end byte
+ #                          offsets, the indices of the preference columns, and
+ #                          whether the scanner can read the file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def count_ranked_ballot_shard(shard_tuple):
+
+    input_file_name_string, start_integer, end_integer, preference_indices_list, scanner_boolean \
+        = shard_tuple
+
+    if scanner_boolean:
+
+        scan_result_tuple \
+            = scan_ranked_ballots \
+                (input_file_name_string, start_integer, end_integer, preference_indices_list[0])
+
+        if scan_result_tuple is not None:
+
+            return scan_result_tuple
+
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        return streaming_aggregation.update_aggregators \
+                    (csv.reader \
+                        (streaming_aggregation.read_shard_lines(binary_file, start_integer, end_integer)),
+                     [ranked_ballots_aggregator(preference_indices_list)]) \
+                        [0].finalize()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_ranked_ballot_groups
+ #
+ #  Subroutine Description:
+ #      This function reads a ranked ballot csv file, or a text stream in csv format,
+ #      in one pass and returns the weighted groups of its ballots, in first-seen
+ #      order, with tuples of the raw preferences as keys, and the row count.  With
+ #      more than one worker, it counts the shards of the file in a process pool and
+ #      merges the groups in file order.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                        Description
+ #  -----   -------------               ----------------------------------------------
+ #  String  input_file_name_string      the path of the input csv file or a text stream
+ #  int     candidate_index_integer     the index of the Candidate column
+ #  int     worker_count_integer        the number of worker processes (default: 1)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_ranked_ballot_groups(input_file_name_string, candidate_index_integer, worker_count_integer = 1):
+
+    if hasattr(input_file_name_string, 'read'):
+
+        csv_reader = csv.reader(input_file_name_string)
+
+        preference_indices_list \
+            = find_preference_column_indices(next(csv_reader, []), candidate_index_integer)
+
+        return streaming_aggregation.update_aggregators \
+                    (csv_reader, [ranked_ballots_aggregator(preference_indices_list)])[0].finalize()
+
+
+    with open(input_file_name_string, newline = '') as csv_file:
+
+        header_list = next(csv.reader(csv_file), [])
+
+    preference_indices_list = find_preference_column_indices(header_list, candidate_index_integer)
+
+
+    # The scanner captures everything after the Candidate column's comma, so it can
+    # read the file only if the preference columns are the last columns, in order.
+    scanner_boolean = preference_indices_list == list(range(candidate_index_integer, len(header_list)))
+
+    shard_tuples_list \
+        = [(input_file_name_string, start_integer, end_integer, preference_indices_list, scanner_boolean) \
+           for start_integer, end_integer \
+               in streaming_aggregation.split_file_into_shards \
+                    (input_file_name_string, max(1, worker_count_integer))]
+
+    if len(shard_tuples_list) <= 1 or worker_count_integer <= 1:
+
+        shard_results_list = [count_ranked_ballot_shard(shard_tuple) for shard_tuple in shard_tuples_list]
+
+    else:
+
+        with multiprocessing.Pool(min(worker_count_integer, len(shard_tuples_list))) as process_pool:
+
+            shard_results_list = process_pool.map(count_ranked_ballot_shard, shard_tuples_list)
+
+
+    groups_aggregator = ranked_ballots_aggregator(preference_indices_list)
+
+    for shard_result_tuple in shard_results_list:
+
+        groups_aggregator.merge \
+            (ranked_ballots_aggregator(preference_indices_list).restore(shard_result_tuple))
+
+    return groups_aggregator.finalize()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  normalize_ranked_ballot_groups
+ #
+ #  Subroutine Description:
+ #      This function returns the weighted groups of ranked ballots with the blank
+ #      preferences and the repeated rankings of a candidate removed, so each group's
+ #      tuple lists the distinct candidates a ballot ranks, in order, and it combines
+ #      the groups that become the same.  A blank first choice is skipped like any
+ #      other blank preference, and a ballot that ranks no one has an empty tuple.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  dictionary  ballot_groups_dictionary    the number of ballots of each tuple of raw
+ #                                          preferences
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def normalize_ranked_ballot_groups(ballot_groups_dictionary):
+
+    normalized_groups_dictionary = {}
+
+    for preferences_tuple, ballot_count_integer in ballot_groups_dictionary.items():
+
+        normalized_preferences_tuple \
+            = tuple(dict.fromkeys \
+                        (candidate_name for candidate_name in preferences_tuple if candidate_name.strip()))
+
+        normalized_groups_dictionary[normalized_preferences_tuple] \
+            = normalized_groups_dictionary.get(normalized_preferences_tuple, 0) + ballot_count_integer
+
+    return normalized_groups_dictionary
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tabulate_instant_runoff
+ #
+ #  Subroutine Description:
+ #      This function runs the instant runoff over the weighted groups of ranked
+ #      ballots and returns a dictionary with the list of rounds and the winner, or
+ #      None if the election is a tie.  Each round holds its number, each continuing
+ #      candidate's votes from the most to the fewest, the number of continuing and
+ #      exhausted ballots, and the candidates eliminated after it.  Each candidate
+ #      holds a pile of the groups that count for it, and the function moves only the
+ #      eliminated candidates' piles, group by group.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  dictionary  ballot_groups_dictionary    the number of ballots of each tuple of raw
+ #                                          preferences
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tabulate_instant_runoff(ballot_groups_dictionary):
+
+    ballot_groups_list = list(normalize_ranked_ballot_groups(ballot_groups_dictionary).items())
+
+
+    # These lines of code list the candidates in first-seen order and place each group in
+    # the pile of its first choice; the groups that rank no one are exhausted from the
+    # start.
+    candidate_votes_dictionary = {}
+
+    for preferences_tuple, _ in ballot_groups_list:
+
+        for candidate_name in preferences_tuple:
+
+            candidate_votes_dictionary.setdefault(candidate_name, 0)
+
+    candidate_order_dictionary \
+        = {candidate_name: candidate_order_integer \
+           for candidate_order_integer, candidate_name in enumerate(candidate_votes_dictionary)}
+
+    candidate_piles_dictionary = {candidate_name: [] for candidate_name in candidate_votes_dictionary}
+
+    group_positions_list = [0] * len(ballot_groups_list)
+
+    exhausted_ballots_integer = 0
+
+    for group_index_integer, (preferences_tuple, ballot_count_integer) in enumerate(ballot_groups_list):
+
+        if preferences_tuple:
+
+            candidate_piles_dictionary[preferences_tuple[0]].append(group_index_integer)
+
+            candidate_votes_dictionary[preferences_tuple[0]] += ballot_count_integer
+
+        else:
+
+            exhausted_ballots_integer += ballot_count_integer
+
+
+    rounds_list = []
+
+    winner_name = None
+
+    # This repetition loop runs one round of the runoff at a time until a candidate wins
+    # or the continuing candidates are tied.
+    while candidate_votes_dictionary:
+
+        continuing_ballots_integer = sum(candidate_votes_dictionary.values())
+
+        round_dictionary \
+            = {'Round': len(rounds_list) + 1,
+               'Votes': dict(sorted(candidate_votes_dictionary.items(), key = lambda item_tuple: -item_tuple[1])),
+               'Continuing Ballots': continuing_ballots_integer,
+               'Exhausted Ballots': exhausted_ballots_integer,
+               'Eliminated': []}
+
+        rounds_list.append(round_dictionary)
+
+        leader_name, leader_votes_integer = next(iter(round_dictionary['Votes'].items()))
+
+        if 2 * leader_votes_integer > continuing_ballots_integer:
+
+            winner_name = leader_name
+
+            break
+
+        fewest_votes_integer = min(candidate_votes_dictionary.values())
+
+        if fewest_votes_integer == leader_votes_integer:
+
+            break
+
+
+        # If some candidates have no votes, they are all eliminated at once; otherwise,
+        # the candidate with the fewest votes is, after the tie-break.
+        if fewest_votes_integer == 0:
+
+            eliminated_names_list \
+                = [candidate_name for candidate_name, vote_count_integer in candidate_votes_dictionary.items() \
+                   if vote_count_integer == 0]
+
+        else:
+
+            eliminated_names_list \
+                = [max((candidate_name for candidate_name, vote_count_integer in candidate_votes_dictionary.items() \
+                        if vote_count_integer == fewest_votes_integer),
+                       key = lambda candidate_name: \
+                                 (tuple(-earlier_round_dictionary['Votes'][candidate_name] \
+                                        for earlier_round_dictionary in reversed(rounds_list[:-1])),
+                                  candidate_order_dictionary[candidate_name]))]
+
+        round_dictionary['Eliminated'] = eliminated_names_list
+
+        for eliminated_name in eliminated_names_list:
+
+            del candidate_votes_dictionary[eliminated_name]
+
+
+        # This repetition loop moves each group in the eliminated candidates' piles to its
+        # next continuing choice, or exhausts it.
+        for eliminated_name in eliminated_names_list:
+
+            for group_index_integer in candidate_piles_dictionary.pop(eliminated_name):
+
+                preferences_tuple, ballot_count_integer = ballot_groups_list[group_index_integer]
+
+                position_integer = group_positions_list[group_index_integer] + 1
+
+                while position_integer < len(preferences_tuple) \
+                    and preferences_tuple[position_integer] not in candidate_votes_dictionary:
+
+                    position_integer += 1
+
+                group_positions_list[group_index_integer] = position_integer
+
+                if position_integer < len(preferences_tuple):
+
+                    candidate_piles_dictionary[preferences_tuple[position_integer]].append(group_index_integer)
+
+                    candidate_votes_dictionary[preferences_tuple[position_integer]] += ballot_count_integer
+
+                else:
+
+                    exhausted_ballots_integer += ballot_count_integer
+
+    return {'Rounds': rounds_list, 'Winner': winner_name}
@@ -0,0 +1,613 @@
+#*******************************************************************************************
+ #
+ #  File Name:  poll_sketches.py
+ #
+ #  File Description:
+ #      This module holds the fixed-memory, mergeable summaries behind poll_main.py's
+ #      approximate mode.  The sampler reads a systematic sample of rows from a ballot
+ #      csv file by seeking to evenly spaced byte offsets, one random start apart, and
+ #      taking the line that contains each offset.  A line is picked in proportion to
+ #      its length, so each sampled row carries a weight of one over its length; the
+ #      weighted shares estimate each candidate's share of the votes, and the mean
+ #      weight times the file's size estimates the number of rows.  The sample's state
+ #      is a few sums per candidate, so it merges across shards by addition.  The
+ #      sampler assumes one record per line, as the sharding and the byte scanner do.
+ #
+ #      The HyperLogLog sketch estimates the number of distinct values in 16 KiB with
+ #      a relative standard error of about 0.8%, and two sketches merge by taking the
+ #      larger of each register.  The Count-Min sketch estimates how often each key
+ #      occurs, never below the true count, with tables that merge by addition, and it
+ #      tracks a fixed number of its heaviest keys.
+ #
+ #      Here is a List of classes, subroutines, and functions:
+ #
+ #      calculate_hash_value
+ #      read_line_at_offset
+ #      sample_file_rows
+ #      candidate_share_sample
+ #      sample_candidate_shares
+ #      hyperloglog_sketch
+ #      count_min_sketch
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import array
+import collections
+import csv
+import hashlib
+import math
+import os
+
+
+# This constant is the z-score of the confidence intervals, 95% two-sided.
+CONSTANT_CONFIDENCE_Z_SCORE = 1.959963984540054
+
+CONSTANT_CONFIDENCE_PERCENT = 95
+
+
+# This constant is the default number of rows the sampler reads.
+CONSTANT_SAMPLE_ROW_COUNT = 10000
+
+
+# This constant is the number of bytes the sampler first reads on each side of an offset
+# while it looks for the surrounding line breaks.
+CONSTANT_SAMPLE_WINDOW_SIZE = 256
+
+
+# This constant is the number of index bits of the HyperLogLog sketch, which has two to
+# this power one-byte registers.
+CONSTANT_HYPERLOGLOG_PRECISION = 14
+
+
+# These constants are the width and depth of the Count-Min sketch's tables and the
+# number of keys the sketch tracks as its heaviest.
+CONSTANT_COUNT_MIN_WIDTH = 2048
+
+CONSTANT_COUNT_MIN_DEPTH = 4
+
+CONSTANT_HEAVY_HITTER_CAPACITY = 64
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_hash_value
+ #
+ #  Subroutine Description:
+ #      This function returns a 64-bit BLAKE2 hash of a string's UTF-8 bytes as an
+ #      unsigned integer, the same in every process.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  String  value_string    the string to hash
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_hash_value(value_string):
+
+    return int.from_bytes(hashlib.blake2b(value_string.encode('utf-8'), digest_size = 8).digest(), 'little')
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_line_at_offset
+ #
+ #  Subroutine Description:
+ #      This function returns the bytes of the line that contains a byte offset, with
+ #      its line break, reading a small window around the offset and widening it until
+ #      it holds the whole line.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  binary_file         the csv file opened in binary mode
+ #  int     offset_integer      the byte offset
+ #  int     start_integer       the byte offset of the first data row
+ #  int     end_integer         the byte offset of the end of the data
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_line_at_offset(binary_file, offset_integer, start_integer, end_integer):
+
+    window_size_integer = CONSTANT_SAMPLE_WINDOW_SIZE
+
+    while True:
+
+        window_start_integer = max(start_integer, offset_integer - window_size_integer)
+
+        window_end_integer = min(end_integer, offset_integer + window_size_integer)
+
+        binary_file.seek(window_start_integer)
+
+        window_bytes = binary_file.read(window_end_integer - window_start_integer)
+
+        line_break_index = window_bytes.rfind(b'\n', 0, offset_integer - window_start_integer)
+
+        next_line_break_index = window_bytes.find(b'\n', offset_integer - window_start_integer)
+
+        if (line_break_index != -1 or window_start_integer == start_integer) \
+            and (next_line_break_index != -1 or window_end_integer == end_integer):
+
+            return window_bytes \
+                [line_break_index + 1: \
+                 next_line_break_index + 1 if next_line_break_index != -1 else len(window_bytes)]
+
+        window_size_integer *= 2
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  sample_file_rows
+ #
+ #  Subroutine Description:
+ #      This generator function yields a systematic sample of the csv records in a byte
+ #      range of the ballot csv file as (record, weight) pairs, where the weight is one
+ #      over the length of the record's line in bytes.  It yields nothing for an empty
+ #      range.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the csv file
+ #  int     sample_count_integer    the number of offsets to sample
+ #  object  random_generator        the random.Random object for the random start
+ #  int     start_integer           the byte offset of the start of a line
+ #  int     end_integer             the byte offset of the end of the range
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def sample_file_rows \
+        (input_file_name_string, sample_count_integer, random_generator, start_integer, end_integer):
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        if end_integer <= start_integer or sample_count_integer <= 0:
+
+            return
+
+
+        step_size_float = (end_integer - start_integer) / sample_count_integer
+
+        random_start_float = random_generator.random()
+
+        for sample_index_integer in range(sample_count_integer):
+
+            line_bytes \
+                = read_line_at_offset \
+                    (binary_file,
+                     start_integer + int((sample_index_integer + random_start_float) * step_size_float),
+                     start_integer,
+                     end_integer)
+
+            line_string = line_bytes.decode('utf-8', errors = 'replace').rstrip('\r\n')
+
+            if line_string:
+
+                yield next(csv.reader([line_string])), 1.0 / len(line_bytes)
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  candidate_share_sample
+ #
+ #  Class Description:
+ #      This class accumulates a weighted sample of candidate votes and estimates each
+ #      candidate's share, with the ratio estimator and its linearized variance, and
+ #      the number of rows, with the confidence margins at 95%.  Its state is the
+ #      sample's size, the number of bytes it covers, the sums of the weights and of
+ #      their squares overall, and the same sums for each candidate, so two samples
+ #      taken at the same rate from adjacent ranges merge by addition.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class candidate_share_sample:
+
+    def __init__(self):
+
+        self.sample_count_integer = 0
+
+        self.data_size_integer = 0
+
+        self.weight_sum_float = 0.0
+
+        self.weight_square_sum_float = 0.0
+
+        # This dictionary maps each candidate to the sums of its weights and of their
+        # squares, in first-sampled order.
+        self.candidate_weights_dictionary = {}
+
+
+    def add(self, candidate_name_string, weight_float):
+
+        self.sample_count_integer += 1
+
+        self.weight_sum_float += weight_float
+
+        self.weight_square_sum_float += weight_float * weight_float
+
+        candidate_weights_list \
+            = self.candidate_weights_dictionary.setdefault(candidate_name_string, [0.0, 0.0])
+
+        candidate_weights_list[0] += weight_float
+
+        candidate_weights_list[1] += weight_float * weight_float
+
+
+    def merge(self, following_sample):
+
+        self.sample_count_integer += following_sample.sample_count_integer
+
+        self.data_size_integer += following_sample.data_size_integer
+
+        self.weight_sum_float += following_sample.weight_sum_float
+
+        self.weight_square_sum_float += following_sample.weight_square_sum_float
+
+        for candidate_name_string, following_weights_list \
+            in following_sample.candidate_weights_dictionary.items():
+
+            candidate_weights_list \
+                = self.candidate_weights_dictionary.setdefault(candidate_name_string, [0.0, 0.0])
+
+            candidate_weights_list[0] += following_weights_list[0]
+
+            candidate_weights_list[1] += following_weights_list[1]
+
+        return self
+
+
+    def estimate(self):
+
+        sample_count_integer = self.sample_count_integer
+
+        if sample_count_integer == 0:
+
+            return {'Sample Rows': 0, 'Total Votes': 0, 'Total Votes Margin': 0.0, 'Candidates': {}}
+
+
+        mean_weight_float = self.weight_sum_float / sample_count_integer
+
+        weight_variance_float \
+            = max(0.0, self.weight_square_sum_float / sample_count_integer - mean_weight_float ** 2) \
+              * sample_count_integer / max(1, sample_count_integer - 1)
+
+        # The share's variance is the sum of the squared weighted residuals over the
+        # squared weight sum, with the small-sample correction.
+        candidates_dictionary = {}
+
+        for candidate_name_string, (weight_sum_float, weight_square_sum_float) \
+            in self.candidate_weights_dictionary.items():
+
+            share_float = weight_sum_float / self.weight_sum_float
+
+            share_variance_float \
+                = max(0.0, weight_square_sum_float * (1.0 - 2.0 * share_float) \
+                           + share_float ** 2 * self.weight_square_sum_float) \
+                  / self.weight_sum_float ** 2 \
+                  * sample_count_integer / max(1, sample_count_integer - 1)
+
+            candidates_dictionary[candidate_name_string] \
+                = (share_float, CONSTANT_CONFIDENCE_Z_SCORE * math.sqrt(share_variance_float))
+
+        return {'Sample Rows': sample_count_integer,
+                'Total Votes': self.data_size_integer * mean_weight_float,
+                'Total Votes Margin': CONSTANT_CONFIDENCE_Z_SCORE * self.data_size_integer \
+                                      * math.sqrt(weight_variance_float / sample_count_integer),
+                'Candidates': candidates_dictionary}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  sample_candidate_shares
+ #
+ #  Subroutine Description:
+ #      This function samples the data rows of a byte range of the ballot csv file, or
+ #      of the whole file after its header row, and returns the candidate share 
+ #      sample of their Candidate column.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  input_file_name_string  the path of the csv file
+ #  int     candidate_index_integer the index of the Candidate column
+ #  int     sample_count_integer    the number of offsets to sample
+ #  object  random_generator        the random.Random object for the random start
+ #  int     start_integer           the byte offset of the first row (default: the
+ #                                  row after the header row)
+ #  int     end_integer             the byte offset of the end of the range
+ #                                  (default: the end of the file)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def sample_candidate_shares \
+        (input_file_name_string,
+         candidate_index_integer,
+         sample_count_integer,
+         random_generator,
+         start_integer = None,
+         end_integer = None):
+
+    with open(input_file_name_string, 'rb') as binary_file:
+
+        if start_integer is None:
+
+            start_integer = len(binary_file.readline())
+
+        if end_integer is None:
+
+            end_integer = binary_file.seek(0, os.SEEK_END)
+
+
+    share_sample = candidate_share_sample()
+
+    share_sample.data_size_integer = max(0, end_integer - start_integer)
+
+    for csv_record, weight_float \
+        in sample_file_rows \
+            (input_file_name_string, sample_count_integer, random_generator, start_integer, end_integer):
+
+        if len(csv_record) > candidate_index_integer:
+
+            share_sample.add(csv_record[candidate_index_integer], weight_float)
+
+    return share_sample
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  hyperloglog_sketch
+ #
+ #  Class Description:
+ #      This class is a HyperLogLog sketch of the distinct values added to it.  Each
+ #      value's 64-bit hash picks a register with its first bits and records the
+ #      position of the first one bit in the rest, and the estimate is the bias-
+ #      corrected harmonic mean of the registers, or linear counting while many
+ #      registers are still zero.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  int     precision_integer   the number of index bits
+ #                              (default: CONSTANT_HYPERLOGLOG_PRECISION)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class hyperloglog_sketch:
+
+    def __init__(self, precision_integer = CONSTANT_HYPERLOGLOG_PRECISION):
+
+        self.precision_integer = precision_integer
+
+        self.registers_bytearray = bytearray(1 << precision_integer)
+
+
+    def add(self, value_string):
+
+        hash_value_integer = calculate_hash_value(value_string)
+
+        remaining_bits_integer = 64 - self.precision_integer
+
+        register_index_integer = hash_value_integer >> remaining_bits_integer
+
+        rank_integer \
+            = remaining_bits_integer \
+              - (hash_value_integer & ((1 << remaining_bits_integer) - 1)).bit_length() + 1
+
+        if rank_integer > self.registers_bytearray[register_index_integer]:
+
+            self.registers_bytearray[register_index_integer] = rank_integer
+
+
+    def merge(self, following_sketch):
+
+        self.registers_bytearray \
+            = bytearray(map(max, self.registers_bytearray, following_sketch.registers_bytearray))
+
+        return self
+
+
+    def estimate(self):
+
+        register_count_integer = len(self.registers_bytearray)
+
+        alpha_float = 0.7213 / (1.0 + 1.079 / register_count_integer)
+
+        raw_estimate_float \
+            = alpha_float * register_count_integer ** 2 \
+              / sum(count_integer * 2.0 ** -rank_integer \
+                    for rank_integer, count_integer in collections.Counter(self.registers_bytearray).items())
+
+        zero_count_integer = self.registers_bytearray.count(0)
+
+        if raw_estimate_float <= 2.5 * register_count_integer and zero_count_integer > 0:
+
+            return register_count_integer * math.log(register_count_integer / zero_count_integer)
+
+        return raw_estimate_float
+
+
+    def relative_error(self):
+
+        return 1.04 / math.sqrt(len(self.registers_bytearray))
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  count_min_sketch
+ #
+ #  Class Description:
+ #      This class is a Count-Min sketch of how often each key occurs.  Each key adds
+ #      its count to one counter in every row of the table, chosen by a slice of the
+ #      key's hash, and the estimate is the smallest of those counters, which exceeds
+ #      the true count by at most e / width of the total with probability 1 - e^-depth.
+ #      The sketch also keeps the estimates of its heaviest keys, up to the capacity;
+ #      merging adds the tables and re-estimates the union of both sketches' keys.  The
+ #      find_heavy_hitters method returns the tracked keys, re-estimated, whose counts
+ #      are at least a fraction of the total, heaviest first.
+ #
+ #  Class Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  int     width_integer       the number of counters in each row
+ #                              (default: CONSTANT_COUNT_MIN_WIDTH)
+ #  int     depth_integer       the number of rows (default: CONSTANT_COUNT_MIN_DEPTH)
+ #  int     capacity_integer    the number of keys to track
+ #                              (default: CONSTANT_HEAVY_HITTER_CAPACITY)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class count_min_sketch:
+
+    def __init__ \
+            (self,
+             width_integer = CONSTANT_COUNT_MIN_WIDTH,
+             depth_integer = CONSTANT_COUNT_MIN_DEPTH,
+             capacity_integer = CONSTANT_HEAVY_HITTER_CAPACITY):
+
+        self.width_integer = width_integer
+
+        self.depth_integer = depth_integer
+
+        self.capacity_integer = capacity_integer
+
+        self.counters_list = [array.array('Q', bytes(8 * width_integer)) for row_index in range(depth_integer)]
+
+        self.total_count_integer = 0
+
+        # This dictionary maps each tracked key to its estimated count.
+        self.heavy_hitters_dictionary = {}
+
+
+    def get_counter_indices(self, key_string):
+
+        digest_bytes = hashlib.blake2b(key_string.encode('utf-8'), digest_size = 4 * self.depth_integer).digest()
+
+        return [int.from_bytes(digest_bytes[4 * row_index: 4 * row_index + 4], 'little') % self.width_integer \
+                for row_index in range(self.depth_integer)]
+
+
+    def estimate(self, key_string):
+
+        return min(counters_array[counter_index_integer] \
+                   for counters_array, counter_index_integer \
+                       in zip(self.counters_list, self.get_counter_indices(key_string)))
+
+
+    def add(self, key_string, count_integer = 1):
+
+        self.total_count_integer += count_integer
+
+        counter_indices_list = self.get_counter_indices(key_string)
+
+        for counters_array, counter_index_integer in zip(self.counters_list, counter_indices_list):
+
+            counters_array[counter_index_integer] += count_integer
+
+        estimate_integer \
+            = min(counters_array[counter_index_integer] \
+                  for counters_array, counter_index_integer in zip(self.counters_list, counter_indices_list))
+
+
+        # The key replaces the lightest tracked key if the sketch is full and the key's
+        # estimate is heavier.
+        if key_string in self.heavy_hitters_dictionary \
+            or len(self.heavy_hitters_dictionary) < self.capacity_integer:
+
+            self.heavy_hitters_dictionary[key_string] = estimate_integer
+
+        else:
+
+            lightest_key_string \
+                = min(self.heavy_hitters_dictionary, key = self.heavy_hitters_dictionary.get)
+
+            if estimate_integer > self.heavy_hitters_dictionary[lightest_key_string]:
+
+                del self.heavy_hitters_dictionary[lightest_key_string]
+
+                self.heavy_hitters_dictionary[key_string] = estimate_integer
+
+
+    def merge(self, following_sketch):
+
+        for counters_array, following_counters_array in zip(self.counters_list, following_sketch.counters_list):
+
+            for counter_index_integer, count_integer in enumerate(following_counters_array):
+
+                if count_integer:
+
+                    counters_array[counter_index_integer] += count_integer
+
+        self.total_count_integer += following_sketch.total_count_integer
+
+        heavy_hitters_dictionary \
+            = {key_string: self.estimate(key_string) \
+               for key_string in list(self.heavy_hitters_dictionary) + list(following_sketch.heavy_hitters_dictionary)}
+
+        self.heavy_hitters_dictionary \
+            = dict(sorted(heavy_hitters_dictionary.items(), key = lambda item_tuple: -item_tuple[1]) \
+                   [:self.capacity_integer])
+
+        return self
+
+
+    def find_heavy_hitters(self, fraction_float):
+
+        heavy_hitters_dictionary \
+            = {key_string: self.estimate(key_string) for key_string in self.heavy_hitters_dictionary}
+
+        return [(key_string, estimate_integer) \
+                for key_string, estimate_integer \
+                    in sorted(heavy_hitters_dictionary.items(), key = lambda item_tuple: -item_tuple[1]) \
+                if estimate_integer >= fraction_float * self.total_count_integer]
@@ -0,0 +1,32 @@
+#*******************************************************************************************
+ #
+ #  File Name:  conftest.py
+ #
+ #  File Description:
+ #      This file configures pytest for the repository's tests.  The programs import
+ #      one another by module name from the bank, poll, and common folders, so it adds
+ #      the three folders to the module search path before the tests import them.
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import os
+import sys
+
+
+# This constant is the repository's top folder, one level above this file.
+CONSTANT_REPOSITORY_DIRECTORY_NAME = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# This repetition loop adds the program folders to the module search path.
+for folder_name_string in ('bank', 'poll', 'common'):
+
+    folder_path_string = os.path.join(CONSTANT_REPOSITORY_DIRECTORY_NAME, folder_name_string)
+
+    if folder_path_string not in sys.path:
+
+        sys.path.insert(0, folder_path_string)
@@ -0,0 +1,341 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_bank_change_statistics.py
+ #
+ #  File Description:
+ #      These tests check the budget analysis of bank_main.py, and the top-k changes
+ #      and rolling averages of bank_change_statistics.py, against a reference that
+ #      reads the csv file with csv.reader and calculates every value from the whole
+ #      list of changes.  The random budgets draw their amounts from a small range, so
+ #      equal changes and equal averages test the ties, and the analysis runs in one
+ #      pass, over shards, with the NumPy backend, and block by block with merges.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      create_random_budget_text
+ #      calculate_reference_values
+ #      test_budget_summary_matches_csv_reader
+ #      test_change_statistics_blocks_and_merges_match_reference
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import csv
+import io
+import random
+
+import pytest
+
+import bank_change_statistics
+import bank_main
+import bank_numpy_backend
+
+
+# These constants are the top count and the rolling window sizes of the tests, which
+# include a window longer than some of the budgets.
+CONSTANT_TEST_TOP_COUNT = 3
+
+CONSTANT_TEST_WINDOW_SIZES = (1, 3, 6, 12, 40)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_random_budget_text
+ #
+ #  Subroutine Description:
+ #      This function returns the text of a budget csv file with the header and the
+ #      number of rows, whose amounts come from a small range so that changes tie.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  random_object       the random number generator
+ #  int     row_count_integer   the number of rows
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_random_budget_text(random_object, row_count_integer):
+
+    return 'Date,Profit/Losses\n' \
+           + ''.join(f'M-{row_index},{random_object.randint(-5, 5) * 1000}\n' \
+                     for row_index in range(row_count_integer))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_reference_values
+ #
+ #  Subroutine Description:
+ #      This function reads budget csv text with csv.reader and returns the total
+ #      records, the total profit/loss, the average change, the greatest increase and
+ #      decrease, and the change statistics, calculated directly from all the changes.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  String  budget_text_string  the budget csv text
+ #  int     top_count_integer   the number of top increases and decreases
+ #  tuple   window_sizes_tuple  the rolling window sizes in months
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_reference_values(budget_text_string, top_count_integer, window_sizes_tuple):
+
+    records_list = list(csv.reader(io.StringIO(budget_text_string)))[1:]
+
+    dates_list = [record_list[0] for record_list in records_list]
+
+    amounts_list = [int(record_list[1]) for record_list in records_list]
+
+    changes_list = [following - preceding for preceding, following in zip(amounts_list, amounts_list[1:])]
+
+    change_dates_list = dates_list[1:]
+
+
+    # The top increases, or decreases, are every change above, or below, zero whose key 
+    # is at least the k-th largest key, from the largest key down and in row order among
+    # equal keys.
+    top_changes_lists = []
+
+    for sign_integer in (1, -1):
+
+        keys_list \
+            = sorted((sign_integer * change_integer for change_integer in changes_list \
+                      if sign_integer * change_integer > 0), 
+                     reverse = True)
+
+        if top_count_integer == 0 or len(keys_list) == 0:
+
+            top_changes_lists.append([])
+
+            continue
+
+        threshold_integer = keys_list[min(top_count_integer, len(keys_list)) - 1]
+
+        top_changes_lists.append \
+            ([(change_dates_list[change_index], changes_list[change_index]) \
+              for change_index \
+                  in sorted((change_index for change_index in range(len(changes_list)) \
+                             if sign_integer * changes_list[change_index] >= threshold_integer),
+                            key = lambda change_index: (-sign_integer * changes_list[change_index], change_index))])
+
+
+    # Each window's averages are evaluated in file order, and the first of several equal
+    # averages is the highest or lowest.
+    rolling_averages_list = []
+
+    for window_size_integer in window_sizes_tuple:
+
+        averages_list \
+            = [(change_dates_list[end_index], sum(changes_list[end_index - window_size_integer + 1:end_index + 1]) / window_size_integer) \
+               for end_index in range(window_size_integer - 1, len(changes_list))]
+
+        if len(averages_list) == 0:
+
+            rolling_averages_list.append((window_size_integer, None, None, None))
+
+            continue
+
+        rolling_averages_list.append \
+            ((window_size_integer,
+              averages_list[-1][1],
+              max(averages_list, key = lambda average_tuple: average_tuple[1]),
+              min(averages_list, key = lambda average_tuple: average_tuple[1])))
+
+
+    # The greatest increase and decrease start at zero, so only a change above, or 
+    # below, zero replaces them, and the first of several equal changes stays.
+    greatest_increase_tuple = greatest_decrease_tuple = ('', 0)
+
+    for change_date_string, change_integer in zip(change_dates_list, changes_list):
+
+        if change_integer > greatest_increase_tuple[1]:
+
+            greatest_increase_tuple = (change_date_string, change_integer)
+
+        if change_integer < greatest_decrease_tuple[1]:
+
+            greatest_decrease_tuple = (change_date_string, change_integer)
+
+    average_change_float = round(sum(changes_list) / len(changes_list), 2) if len(changes_list) > 0 else 0.0
+
+    return {'Total Records': len(records_list),
+            'Total Profits': sum(amounts_list),
+            'Average Change': average_change_float,
+            'Greatest Increase in Profits': greatest_increase_tuple,
+            'Greatest Decrease in Profits': greatest_decrease_tuple,
+            'Change Statistics': {'Top Count': top_count_integer,
+                                  'Top Increases': top_changes_lists[0],
+                                  'Top Decreases': top_changes_lists[1],
+                                  'Rolling Averages': rolling_averages_list}}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_budget_summary_matches_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test analyzes random budget files in one pass, over three shards, and with
+ #      the NumPy backend, and compares each summary with the csv.reader reference.  A
+ #      budget of one record has no change, so its average change is zero.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  tmp_path        the pytest fixture with a temporary folder
+ #  object  monkeypatch     the pytest fixture that restores the NumPy threshold
+ #  String  backend_string  the analysis path to test
+ #  int     seed_integer    the seed of the random budgets
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          One-record budget                           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(4))
+@pytest.mark.parametrize('backend_string', ['single', 'sharded', 'numpy'])
+def test_budget_summary_matches_csv_reader(tmp_path, monkeypatch, backend_string, seed_integer):
+
+    if backend_string == 'numpy':
+
+        pytest.importorskip('numpy')
+
+        monkeypatch.setattr(bank_numpy_backend, 'CONSTANT_NUMPY_SIZE_THRESHOLD', 0)
+
+    else:
+
+        monkeypatch.setattr(bank_numpy_backend, 'numpy', None)
+
+
+    random_object = random.Random(seed_integer)
+
+    for row_count_integer in (1, 2, 3, 13, random_object.randint(40, 400)):
+
+        budget_text_string = create_random_budget_text(random_object, row_count_integer)
+
+        input_file_path = tmp_path / f'budget_{row_count_integer}.csv'
+
+        input_file_path.write_text(budget_text_string)
+
+        summary_dictionary \
+            = bank_main.read_file_and_calculate_values \
+                (str(input_file_path),
+                 CONSTANT_TEST_TOP_COUNT,
+                 CONSTANT_TEST_WINDOW_SIZES,
+                 3 if backend_string == 'sharded' else 1)
+
+        reference_dictionary \
+            = calculate_reference_values(budget_text_string, CONSTANT_TEST_TOP_COUNT, CONSTANT_TEST_WINDOW_SIZES)
+
+        for key_string in ('Greatest Increase in Profits', 'Greatest Decrease in Profits'):
+
+            summary_dictionary[key_string] = (summary_dictionary[key_string]['Date'], summary_dictionary[key_string]['Value'])
+
+        assert summary_dictionary == reference_dictionary
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_change_statistics_blocks_and_merges_match_reference
+ #
+ #  Subroutine Description:
+ #      This test cuts random budgets into parts and the parts into blocks of random
+ #      sizes, updates each part's change statistics block by block, merges the parts
+ #      in file order, and compares the results with the csv.reader reference.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  int     seed_integer    the seed of the random budgets and cuts
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(4))
+def test_change_statistics_blocks_and_merges_match_reference(seed_integer):
+
+    random_object = random.Random(seed_integer)
+
+    for _ in range(50):
+
+        row_count_integer = random_object.randint(1, 120)
+
+        top_count_integer = random_object.randint(0, 4)
+
+        budget_text_string = create_random_budget_text(random_object, row_count_integer)
+
+        records_list = list(csv.reader(io.StringIO(budget_text_string)))[1:]
+
+        dates_list = [record_list[0] for record_list in records_list]
+
+        amounts_list = [int(record_list[1]) for record_list in records_list]
+
+
+        # Each part holds at least one row, as merge_change_statistics requires.
+        part_starts_list \
+            = [0] + sorted(random_object.sample(range(1, row_count_integer), min(row_count_integer - 1, random_object.randint(0, 4))))
+
+        change_statistics_object = None
+
+        for part_start_index, part_end_index in zip(part_starts_list, part_starts_list[1:] + [row_count_integer]):
+
+            part_statistics_object \
+                = bank_change_statistics.create_change_statistics(top_count_integer, CONSTANT_TEST_WINDOW_SIZES)
+
+            block_start_index = part_start_index + 1
+
+            while block_start_index < part_end_index:
+
+                block_end_index = min(part_end_index, block_start_index + random_object.randint(1, 30))
+
+                bank_change_statistics.update_change_statistics \
+                    (part_statistics_object,
+                     block_start_index - part_start_index,
+                     dates_list[block_start_index:block_end_index],
+                     [amounts_list[row_index] - amounts_list[row_index - 1] \
+                      for row_index in range(block_start_index, block_end_index)])
+
+                block_start_index = block_end_index
+
+            if change_statistics_object is None:
+
+                change_statistics_object = part_statistics_object
+
+            else:
+
+                change_statistics_object \
+                    = bank_change_statistics.merge_change_statistics \
+                        (change_statistics_object,
+                         part_statistics_object,
+                         part_start_index,
+                         dates_list[part_start_index],
+                         amounts_list[part_start_index] - amounts_list[part_start_index - 1])
+
+        assert bank_change_statistics.finalize_change_statistics(change_statistics_object) \
+            == calculate_reference_values(budget_text_string, top_count_integer, CONSTANT_TEST_WINDOW_SIZES) \
+                ['Change Statistics']
@@ -0,0 +1,336 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_bank_range_index.py
+ #
+ #  File Description:
+ #      These tests check the date-range queries of bank_range_index.py against a
+ #      brute-force reference that reads the budget csv file with csv.reader and
+ #      walks the rows of each range.  The random budgets repeat dates, so a range
+ #      runs from the first row of its start date to the last row of its end date,
+ #      and draw their amounts from a small range, so equal changes test the ties.
+ #      The tests also check that the index file is rebuilt when the csv file's size
+ #      or contents change and kept when only its modification time changes.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      create_random_budget_text
+ #      calculate_reference_range
+ #      query_whole_budget
+ #      test_range_queries_match_brute_force
+ #      test_index_rebuilt_after_csv_changes
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import csv
+import io
+import os
+import random
+
+import pytest
+
+import bank_main
+import bank_range_index
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_random_budget_text
+ #
+ #  Subroutine Description:
+ #      This function returns the text of a budget csv file with the header and the
+ #      number of rows.  Each date repeats the one before it a quarter of the time,
+ #      and the amounts come from a small range so that changes tie.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  random_object       the random number generator
+ #  int     row_count_integer   the number of rows
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_random_budget_text(random_object, row_count_integer):
+
+    date_index = 0
+
+    budget_lines_list = ['Date,Profit/Losses\n']
+
+    for _ in range(row_count_integer):
+
+        date_index += random_object.random() >= 0.25
+
+        budget_lines_list.append(f'M-{date_index},{random_object.randint(-5, 5) * 1000}\n')
+
+    return ''.join(budget_lines_list)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  calculate_reference_range
+ #
+ #  Subroutine Description:
+ #      This function returns the budget summary of the rows from the first row of the
+ #      start date through the last row of the end date by walking every row, in the
+ #      form of query_date_range's result, or None if the end comes before the start.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  list    records_list        the csv records after the header
+ #  String  start_date_string   the first date of the range
+ #  String  end_date_string     the last date of the range
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def calculate_reference_range(records_list, start_date_string, end_date_string):
+
+    dates_list = [record_list[0] for record_list in records_list]
+
+    first_row_index = dates_list.index(start_date_string)
+
+    last_row_index = len(dates_list) - 1 - dates_list[::-1].index(end_date_string)
+
+    if last_row_index < first_row_index:
+
+        return None
+
+    amounts_list = [int(record_list[1]) for record_list in records_list[first_row_index:last_row_index + 1]]
+
+    changes_list = [following - preceding for preceding, following in zip(amounts_list, amounts_list[1:])]
+
+    greatest_increase_dictionary = {'Date': '', 'Value': 0}
+
+    greatest_decrease_dictionary = {'Date': '', 'Value': 0}
+
+    for change_index, change_integer in enumerate(changes_list):
+
+        if change_integer > greatest_increase_dictionary['Value']:
+
+            greatest_increase_dictionary = {'Date': dates_list[first_row_index + change_index + 1], 'Value': change_integer}
+
+        if change_integer < greatest_decrease_dictionary['Value']:
+
+            greatest_decrease_dictionary = {'Date': dates_list[first_row_index + change_index + 1], 'Value': change_integer}
+
+    return {'Total Records': len(amounts_list),
+            'Total Profits': sum(amounts_list),
+            'Average Change': round(sum(changes_list) / len(changes_list), 2) if len(changes_list) > 0 else 0.0,
+            'Greatest Increase in Profits': greatest_increase_dictionary,
+            'Greatest Decrease in Profits': greatest_decrease_dictionary}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  query_whole_budget
+ #
+ #  Subroutine Description:
+ #      This function queries the range from the first date to the last date of a 
+ #      budget through bank_main.py, compares the answer with the brute-force 
+ #      reference, and returns the header of the index file the query used.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  file_path_object    the path of the budget csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def query_whole_budget(file_path_object):
+
+    records_list = list(csv.reader(io.StringIO(file_path_object.read_text())))[1:]
+
+    summary_dictionary \
+        = bank_main.read_date_range_and_calculate_values \
+            (records_list[0][0], records_list[-1][0], str(file_path_object))
+
+    reference_dictionary = calculate_reference_range(records_list, records_list[0][0], records_list[-1][0])
+
+    assert {key_string: summary_dictionary[key_string] for key_string in reference_dictionary} \
+        == reference_dictionary
+
+    return bank_range_index.read_index_header(bank_range_index.get_index_file_name(str(file_path_object)))[0]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_range_queries_match_brute_force
+ #
+ #  Subroutine Description:
+ #      This test builds the index of random budgets of many lengths and compares the
+ #      answer for every pair of dates, or for a random sample of pairs in a long
+ #      budget, with the brute-force reference.  A pair whose end comes before its
+ #      start, and a date that is not in the budget, must raise a ValueError.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  tmp_path        the pytest fixture with a temporary folder
+ #  int     seed_integer    the seed of the random budgets
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(4))
+def test_range_queries_match_brute_force(tmp_path, seed_integer):
+
+    random_object = random.Random(seed_integer)
+
+    input_file_path = tmp_path / 'budget_data.csv'
+
+    for ledger_index in range(50):
+
+        budget_text_string \
+            = create_random_budget_text \
+                (random_object, random_object.randint(1, 400) if ledger_index % 5 == 0 else random_object.randint(1, 30))
+
+        input_file_path.write_text(budget_text_string)
+
+        records_list = list(csv.reader(io.StringIO(budget_text_string)))[1:]
+
+        dates_list = list(dict.fromkeys(record_list[0] for record_list in records_list))
+
+        date_pairs_list = [(start_date_string, end_date_string) \
+                           for start_date_string in dates_list for end_date_string in dates_list]
+
+        if len(date_pairs_list) > 2000:
+
+            date_pairs_list = random_object.sample(date_pairs_list, 2000)
+
+
+        range_index_dictionary \
+            = bank_range_index.open_range_index \
+                (str(input_file_path),
+                 bank_main.data_column_indices_enumeration.DATE_COLUMN_INDEX.value,
+                 bank_main.data_column_indices_enumeration.PROFIT_LOSS_COLUMN_INDEX.value)
+
+        try:
+
+            for start_date_string, end_date_string in date_pairs_list:
+
+                reference_dictionary = calculate_reference_range(records_list, start_date_string, end_date_string)
+
+                if reference_dictionary is None:
+
+                    with pytest.raises(ValueError):
+
+                        bank_range_index.query_date_range \
+                            (range_index_dictionary, start_date_string, end_date_string)
+
+                else:
+
+                    assert bank_range_index.query_date_range \
+                               (range_index_dictionary, start_date_string, end_date_string) \
+                           == reference_dictionary
+
+            with pytest.raises(ValueError):
+
+                bank_range_index.query_date_range(range_index_dictionary, dates_list[0], 'M-missing')
+
+        finally:
+
+            bank_range_index.close_range_index(range_index_dictionary)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_index_rebuilt_after_csv_changes
+ #
+ #  Subroutine Description:
+ #      This test queries a budget through bank_main.py, which builds the index file,
+ #      and then touches the csv file, which must keep the index, rewrites an amount
+ #      in place with the same size, and appends a row, each of which must rebuild
+ #      the index, so the answers match the brute-force reference of the new file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_index_rebuilt_after_csv_changes(tmp_path):
+
+    input_file_path = tmp_path / 'budget_data.csv'
+
+    index_file_name_string = bank_range_index.get_index_file_name(str(input_file_path))
+
+    budget_lines_list = ['Date,Profit/Losses\n'] + [f'M-{row_index},{row_index * 100}\n' for row_index in range(20)]
+
+
+    input_file_path.write_text(''.join(budget_lines_list))
+
+    assert bank_range_index.read_index_header(index_file_name_string) is None
+
+    header_dictionary = query_whole_budget(input_file_path)
+
+    index_mtime_integer = os.stat(index_file_name_string).st_mtime_ns
+
+
+    # A touch leaves the contents, so the index stays.
+    os.utime(input_file_path, ns = (header_dictionary['source_mtime_ns'] + 10 ** 9,) * 2)
+
+    assert bank_range_index.is_index_valid(str(input_file_path), header_dictionary)
+
+    query_whole_budget(input_file_path)
+
+    assert os.stat(index_file_name_string).st_mtime_ns == index_mtime_integer
+
+
+    # An amount rewritten in place keeps the size but changes the digest.
+    budget_lines_list[10] = 'M-9,999\n'
+
+    input_file_path.write_text(''.join(budget_lines_list))
+
+    assert os.path.getsize(input_file_path) == header_dictionary['source_size']
+
+    assert not bank_range_index.is_index_valid(str(input_file_path), header_dictionary)
+
+    header_dictionary = query_whole_budget(input_file_path)
+
+    assert header_dictionary['source_digest'] == bank_range_index.calculate_file_digest(str(input_file_path))
+
+
+    # An appended row changes the size.
+    budget_lines_list.append('M-20,-50000\n')
+
+    input_file_path.write_text(''.join(budget_lines_list))
+
+    header_dictionary = query_whole_budget(input_file_path)
+
+    assert header_dictionary['source_size'] == os.path.getsize(input_file_path)
+
+    assert header_dictionary['record_count'] == 21
@@ -0,0 +1,386 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_poll_columnar_cache.py
+ #
+ #  File Description:
+ #      These tests check the columnar sidecar file of poll_columnar_cache.py against a
+ #      plain csv.reader reference.  They write random ballot files with plain numeric
+ #      voter IDs and with text voter IDs, some longer than a 16-bit length allows,
+ #      convert them with a small row batch size, and compare the sidecar's candidate
+ #      votes, candidate-by-county votes, and voter IDs with csv.reader's.  They also
+ #      check that the sidecar stays valid after a touch and a copy, and that it goes
+ #      stale when the csv file's size or contents change.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      select_small_batches
+ #      write_ballot_file
+ #      count_reference_votes
+ #      read_cached_voter_ids
+ #      test_cached_tallies_match_csv_reader
+ #      test_cache_validity_follows_file_changes
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import array
+import csv
+import os
+import random
+import shutil
+import struct
+import sys
+
+import pytest
+
+import poll_columnar_cache
+
+
+# These constants are the candidates and counties of the random ballots.
+CONSTANT_CANDIDATE_NAMES = ('Charles Casper Stockham', 'Diana DeGette', 'Raymon Anthony Doane', 'Zoë Ñúñez')
+
+CONSTANT_COUNTY_NAMES = ('Jefferson', 'Denver', 'Arapahoe', '"Rio\nBlanco"')
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  select_small_batches
+ #
+ #  Subroutine Description:
+ #      This fixture shrinks the row batch size and the block size, so a file of a few
+ #      hundred rows goes to the temporary files in many batches and the tallies read
+ #      the sidecar in many blocks.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  monkeypatch     the pytest fixture that restores the module afterward
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.fixture
+def select_small_batches(monkeypatch):
+
+    monkeypatch.setattr(poll_columnar_cache, 'CONSTANT_CACHE_ROW_BATCH_SIZE', 7)
+
+    monkeypatch.setattr(poll_columnar_cache, 'CONSTANT_CACHE_BLOCK_SIZE', 64)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_ballot_file
+ #
+ #  Subroutine Description:
+ #      This subroutine writes a header row and ballot rows to a csv file.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  file_path_object    the path of the ballot csv file
+ #  list    ballot_rows_list    the ballot rows, each a list of three fields
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_ballot_file(file_path_object, ballot_rows_list):
+
+    with open(file_path_object, 'w', newline = '', encoding = 'utf-8') as output_file:
+
+        csv_writer = csv.writer(output_file)
+
+        csv_writer.writerow(['Ballot ID', 'County', 'Candidate'])
+
+        csv_writer.writerows(ballot_rows_list)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  count_reference_votes
+ #
+ #  Subroutine Description:
+ #      This function reads a ballot csv file with csv.reader and returns the
+ #      candidate votes and the candidate-by-county votes, each in first-seen order,
+ #      the number of ballots, and the voter IDs.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  file_path_object    the path of the ballot csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def count_reference_votes(file_path_object):
+
+    candidate_votes_dictionary = {}
+
+    county_votes_dictionary = {}
+
+    voter_ids_list = []
+
+    with open(file_path_object, newline = '', encoding = 'utf-8') as input_file:
+
+        csv_reader = csv.reader(input_file)
+
+        next(csv_reader)
+
+        for voter_id_string, county_name_string, candidate_name_string in csv_reader:
+
+            candidate_votes_dictionary[candidate_name_string] \
+                = candidate_votes_dictionary.get(candidate_name_string, 0) + 1
+
+            county_votes_dictionary.setdefault(county_name_string, {})
+
+            county_votes_dictionary[county_name_string][candidate_name_string] \
+                = county_votes_dictionary[county_name_string].get(candidate_name_string, 0) + 1
+
+            voter_ids_list.append(voter_id_string)
+
+    return candidate_votes_dictionary, county_votes_dictionary, len(voter_ids_list), voter_ids_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_cached_voter_ids
+ #
+ #  Subroutine Description:
+ #      This function reads the voter IDs back from a sidecar file, as packed 64-bit
+ #      integers or as text after 32-bit lengths, and returns them as strings.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  String  cache_file_name_string  the path of the sidecar file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_cached_voter_ids(cache_file_name_string):
+
+    header_dictionary, data_offset_integer = poll_columnar_cache.read_cache_header(cache_file_name_string)
+
+    with open(cache_file_name_string, 'rb') as binary_file:
+
+        binary_file.seek(data_offset_integer + header_dictionary['voter_ids_offset'])
+
+        voter_ids_bytes = binary_file.read()
+
+
+    if header_dictionary['voter_id_encoding'] == 'uint64':
+
+        voter_ids_array = array.array(poll_columnar_cache.CONSTANT_VOTER_ID_TYPECODE, voter_ids_bytes)
+
+        if header_dictionary['byte_order'] != sys.byteorder:
+
+            voter_ids_array.byteswap()
+
+        return [str(voter_id_integer) for voter_id_integer in voter_ids_array]
+
+
+    voter_ids_list = []
+
+    byte_offset_integer = 0
+
+    while byte_offset_integer < len(voter_ids_bytes):
+
+        voter_id_length_integer, = struct.unpack_from('<I', voter_ids_bytes, byte_offset_integer)
+
+        byte_offset_integer += 4
+
+        voter_ids_list.append \
+            (voter_ids_bytes[byte_offset_integer:byte_offset_integer + voter_id_length_integer].decode('utf-8'))
+
+        byte_offset_integer += voter_id_length_integer
+
+    return voter_ids_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_cached_tallies_match_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test converts random ballot files to sidecar files and compares the
+ #      cached candidate votes, candidate-by-county votes, and voter IDs with
+ #      csv.reader's.  Text voter IDs first appear at a random row, so the packed IDs
+ #      before them are rewritten as text across several batches.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  tmp_path                the pytest fixture with a temporary folder
+ #  object  select_small_batches    the fixture with the small batch sizes
+ #  String  voter_id_kind_string    whether the voter IDs are numbers, text, or both
+ #  int     seed_integer            the seed of the random ballots
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(3))
+@pytest.mark.parametrize('voter_id_kind_string', ['numeric', 'text', 'mixed'])
+def test_cached_tallies_match_csv_reader(tmp_path, select_small_batches, voter_id_kind_string, seed_integer):
+
+    random_object = random.Random(seed_integer)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    cache_file_name_string = poll_columnar_cache.get_cache_file_name(str(input_file_path))
+
+    row_count_integer = random_object.randint(0, 300)
+
+    text_start_index = {'numeric': row_count_integer, 'text': 0, 'mixed': random_object.randint(0, row_count_integer)} \
+        [voter_id_kind_string]
+
+    ballot_rows_list \
+        = [[str(random_object.randrange(2 ** 64)) if row_index < text_start_index \
+                else random_object.choice((f'v{row_index}', f'ñ{row_index}', '0' + str(row_index), 'x' * 70000)),
+            random_object.choice(CONSTANT_COUNTY_NAMES),
+            random_object.choice(CONSTANT_CANDIDATE_NAMES)] \
+           for row_index in range(row_count_integer)]
+
+    write_ballot_file(input_file_path, ballot_rows_list)
+
+    poll_columnar_cache.write_columnar_cache(str(input_file_path), cache_file_name_string, 0, 1, 2)
+
+
+    candidate_votes_dictionary, county_votes_dictionary, reference_row_count_integer, voter_ids_list \
+        = count_reference_votes(input_file_path)
+
+    assert poll_columnar_cache.read_cache_header(cache_file_name_string)[0]['voter_id_encoding'] \
+        == ('uint64' if text_start_index == row_count_integer else 'text')
+
+    assert read_cached_voter_ids(cache_file_name_string) == voter_ids_list
+
+    cached_votes_dictionary, cached_row_count_integer \
+        = poll_columnar_cache.tally_cached_candidate_votes(str(input_file_path), cache_file_name_string)
+
+    assert list(cached_votes_dictionary.items()) == list(candidate_votes_dictionary.items())
+
+    assert cached_row_count_integer == reference_row_count_integer
+
+    county_cube_dictionary \
+        = poll_columnar_cache.tally_cached_county_votes(str(input_file_path), cache_file_name_string)
+
+    assert county_cube_dictionary['Candidates'] == list(candidate_votes_dictionary)
+
+    assert county_cube_dictionary['Counties'] == list(county_votes_dictionary)
+
+    assert county_cube_dictionary['Vote Counts'] \
+        == [[county_votes_dictionary[county_name_string].get(candidate_name_string, 0) \
+             for candidate_name_string in candidate_votes_dictionary] \
+            for county_name_string in county_votes_dictionary]
+
+    assert county_cube_dictionary['Total Votes'] == reference_row_count_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_cache_validity_follows_file_changes
+ #
+ #  Subroutine Description:
+ #      This test checks that a sidecar file stays valid when only the csv file's
+ #      modification time changes, and that it goes stale when a row is rewritten in
+ #      place with the same size or when rows are added, until the program rebuilds
+ #      it.  A stale sidecar makes both tallies return None.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_cache_validity_follows_file_changes(tmp_path):
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    input_file_name_string = str(input_file_path)
+
+    cache_file_name_string = poll_columnar_cache.get_cache_file_name(input_file_name_string)
+
+    ballot_rows_list = [[str(row_index), 'Denver', CONSTANT_CANDIDATE_NAMES[row_index % 2]] for row_index in range(50)]
+
+    assert poll_columnar_cache.tally_cached_candidate_votes(input_file_name_string, cache_file_name_string) is None
+
+    write_ballot_file(input_file_path, ballot_rows_list)
+
+    poll_columnar_cache.write_columnar_cache(input_file_name_string, cache_file_name_string, 0, 1, 2)
+
+    header_dictionary = poll_columnar_cache.read_cache_header(cache_file_name_string)[0]
+
+    assert poll_columnar_cache.is_cache_valid(input_file_name_string, header_dictionary)
+
+
+    # A touch, or a copy with a new modification time, leaves the contents unchanged.
+    os.utime(input_file_path, ns = (header_dictionary['source_mtime_ns'] + 10 ** 9,) * 2)
+
+    assert poll_columnar_cache.is_cache_valid(input_file_name_string, header_dictionary)
+
+    copied_file_path = tmp_path / 'copied_data.csv'
+
+    shutil.copy(input_file_path, copied_file_path)
+
+    assert poll_columnar_cache.is_cache_valid(str(copied_file_path), header_dictionary)
+
+
+    # A row rewritten in place keeps the size but changes the digest.
+    ballot_rows_list[25][1] = 'Pueblo'
+
+    write_ballot_file(input_file_path, ballot_rows_list)
+
+    assert os.path.getsize(input_file_path) == header_dictionary['source_size']
+
+    assert not poll_columnar_cache.is_cache_valid(input_file_name_string, header_dictionary)
+
+    assert poll_columnar_cache.tally_cached_candidate_votes(input_file_name_string, cache_file_name_string) is None
+
+    assert poll_columnar_cache.tally_cached_county_votes(input_file_name_string, cache_file_name_string) is None
+
+
+    # A rebuilt sidecar counts the new contents, and added rows make it stale again.
+    poll_columnar_cache.write_columnar_cache(input_file_name_string, cache_file_name_string, 0, 1, 2)
+
+    assert poll_columnar_cache.tally_cached_candidate_votes(input_file_name_string, cache_file_name_string) \
+        == (count_reference_votes(input_file_path)[0], 50)
+
+    write_ballot_file(input_file_path, ballot_rows_list + [['50', 'Denver', CONSTANT_CANDIDATE_NAMES[0]]])
+
+    assert poll_columnar_cache.tally_cached_candidate_votes(input_file_name_string, cache_file_name_string) is None
+
+    assert poll_columnar_cache.read_cache_header(str(tmp_path / 'missing.columns')) is None
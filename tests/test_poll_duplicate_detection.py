@@ -0,0 +1,354 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_poll_duplicate_detection.py
+ #
+ #  File Description:
+ #      These tests check the duplicate Voter IDs that poll_duplicate_detection.py
+ #      finds against a reference that keeps every ID in a set.  They cover the
+ #      bitmap, with IDs on the edges of words and pages and with leading zeros; the
+ #      spill of the marked IDs to partition files, followed by more copies of them;
+ #      the partitions split again under a small budget; and the switch from the
+ #      bitmap to the partitions when sparse IDs would fill it with nearly empty
+ #      pages.  A last test checks that poll_main.py's aggregator of the duplicates
+ #      merges only an aggregator that counted no rows.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      find_reference_duplicates
+ #      find_duplicates
+ #      test_bitmap_matches_set
+ #      test_spill_matches_set
+ #      test_sparse_ids_switch_to_partitions
+ #      test_aggregator_merges_only_empty_parts
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Merge of an empty aggregator            Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import random
+
+import pytest
+
+import poll_duplicate_detection
+import poll_main
+
+
+# This constant holds Voter IDs on the edges of bitmap words and pages, some with
+# leading zeros that keep them apart from the same number without them.
+CONSTANT_EDGE_VOTER_IDS \
+    = ('0', '1', '63', '64', '127', '128', '511', '512', '524287', '524288', '1048575',
+       '00', '063', '0064', '0524288', '9' * 19, '0' * 19)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_reference_duplicates
+ #
+ #  Subroutine Description:
+ #      This function returns the sorted list of (row, Voter ID, payload) tuples of the
+ #      ballots whose Voter ID is in a set of the IDs of earlier ballots.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  list    voter_ids_list  the Voter ID of each ballot in row order
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_reference_duplicates(voter_ids_list):
+
+    voter_ids_set = set()
+
+    duplicates_list = []
+
+    for row_integer, voter_id_string in enumerate(voter_ids_list, 1):
+
+        if voter_id_string in voter_ids_set:
+
+            duplicates_list.append((row_integer, voter_id_string, row_integer * 7))
+
+        voter_ids_set.add(voter_id_string)
+
+    return duplicates_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  find_duplicates
+ #
+ #  Subroutine Description:
+ #      This function adds each ballot's Voter ID to a deduplicator with a memory
+ #      budget and returns the sorted list of (row, Voter ID, payload) tuples of the
+ #      duplicates it reports, the count it returns, whether it spilled, and the
+ #      largest number of bitmap pages it held.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  list    voter_ids_list          the Voter ID of each ballot in row order
+ #  int     memory_budget_integer   the memory budget in bytes
+ #  String  spill_directory_string  the folder for the partition files
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def find_duplicates(voter_ids_list, memory_budget_integer, spill_directory_string):
+
+    duplicates_list = []
+
+    voter_id_deduplicator \
+        = poll_duplicate_detection.voter_id_deduplicator \
+            (memory_budget_integer,
+             lambda row_integer, voter_id_string, payload_integer: \
+                 duplicates_list.append((row_integer, voter_id_string, payload_integer)),
+             spill_directory_string)
+
+    page_count_integer = 0
+
+    for row_integer, voter_id_string in enumerate(voter_ids_list, 1):
+
+        voter_id_deduplicator.add(voter_id_string, row_integer, row_integer * 7)
+
+        page_count_integer = max(page_count_integer, len(voter_id_deduplicator.bitmap_pages_dictionary))
+
+    duplicate_count_integer = voter_id_deduplicator.finish()
+
+    return sorted(duplicates_list), duplicate_count_integer, voter_id_deduplicator.is_spilled(), page_count_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_bitmap_matches_set
+ #
+ #  Subroutine Description:
+ #      This test adds numeric Voter IDs, dense runs with repeats and the IDs on the
+ #      edges of words and pages, within a budget that holds their bitmap, and checks
+ #      that the deduplicator never spills and reports the duplicates the set does.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  tmp_path        the pytest fixture with a temporary folder
+ #  int     seed_integer    the seed of the random IDs
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(3))
+def test_bitmap_matches_set(tmp_path, seed_integer):
+
+    random_object = random.Random(seed_integer)
+
+    voter_ids_list \
+        = [str(random_object.randrange(2000000)) for _ in range(20000)] \
+          + list(CONSTANT_EDGE_VOTER_IDS) * 2
+
+    random_object.shuffle(voter_ids_list)
+
+    duplicates_list, duplicate_count_integer, spilled_boolean, _ \
+        = find_duplicates(voter_ids_list, 16 * 1024 * 1024, str(tmp_path))
+
+    assert not spilled_boolean
+
+    assert duplicates_list == find_reference_duplicates(voter_ids_list)
+
+    assert duplicate_count_integer == len(duplicates_list)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_spill_matches_set
+ #
+ #  Subroutine Description:
+ #      This test marks numeric Voter IDs in the bitmap, adds a text ID that makes the
+ #      deduplicator spill the marked IDs to partition files, and then adds more text
+ #      and numeric IDs, among them copies of the marked ones, which the partitions
+ #      must find.  A small budget with four partitions also splits each partition
+ #      again before it reads it.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  tmp_path                the pytest fixture with a temporary folder
+ #  object  monkeypatch             the pytest fixture that restores the module
+ #  int     memory_budget_integer   the memory budget in bytes
+ #  int     partition_bits_integer  the number of CRC-32 bits that choose a partition
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('memory_budget_integer, partition_bits_integer', [(16 * 1024 * 1024, 8), (256 * 1024, 2)])
+def test_spill_matches_set(tmp_path, monkeypatch, memory_budget_integer, partition_bits_integer):
+
+    monkeypatch.setattr(poll_duplicate_detection, 'CONSTANT_PARTITION_BITS', partition_bits_integer)
+
+    monkeypatch.setattr(poll_duplicate_detection, 'CONSTANT_PARTITION_COUNT', 1 << partition_bits_integer)
+
+    random_object = random.Random(memory_budget_integer)
+
+    marked_voter_ids_list \
+        = list(CONSTANT_EDGE_VOTER_IDS[:11]) + [str(random_object.randrange(524288)) for _ in range(5000)]
+
+    later_voter_ids_list \
+        = ['V-1'] \
+          + random_object.sample(marked_voter_ids_list, 2000) \
+          + list(CONSTANT_EDGE_VOTER_IDS) \
+          + [random_object.choice(('V-', 'Ñ-', '')) + str(random_object.randrange(10000)) for _ in range(5000)]
+
+    voter_ids_list = marked_voter_ids_list + later_voter_ids_list
+
+    duplicates_list, duplicate_count_integer, spilled_boolean, _ \
+        = find_duplicates(voter_ids_list, memory_budget_integer, str(tmp_path))
+
+    assert spilled_boolean
+
+    assert duplicates_list == find_reference_duplicates(voter_ids_list)
+
+    assert duplicate_count_integer == len(duplicates_list)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_sparse_ids_switch_to_partitions
+ #
+ #  Subroutine Description:
+ #      This test adds dense Voter IDs, which stay in the bitmap, and then random
+ #      19-digit IDs, each of which would take a page of its own.  The deduplicator
+ #      must spill once the pages pass a sixteenth of the budget and outgrow a set of
+ #      the marked IDs, long before the budget, and report the duplicates the set
+ #      does.  Sparse IDs alone must spill after the same number of pages.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_sparse_ids_switch_to_partitions(tmp_path):
+
+    random_object = random.Random(11)
+
+    memory_budget_integer = 64 * 1024 * 1024
+
+    free_page_count_integer \
+        = memory_budget_integer \
+          // poll_duplicate_detection.CONSTANT_BITMAP_FREE_FRACTION \
+          // poll_duplicate_detection.CONSTANT_BITMAP_PAGE_BYTES
+
+    dense_voter_ids_list = [str(voter_id_integer) for voter_id_integer in range(1, 300001)]
+
+    sparse_voter_ids_list = [str(random_object.randrange(10 ** 18, 10 ** 19)) for _ in range(3000)]
+
+
+    duplicates_list, _, spilled_boolean, page_count_integer \
+        = find_duplicates(dense_voter_ids_list[::3] + dense_voter_ids_list, memory_budget_integer, str(tmp_path))
+
+    # The IDs of one to six digits take a page each.
+    assert not spilled_boolean and page_count_integer == 6
+
+    assert len(duplicates_list) == 100000
+
+
+    voter_ids_list \
+        = dense_voter_ids_list \
+          + sparse_voter_ids_list \
+          + random_object.sample(dense_voter_ids_list, 1000) \
+          + random_object.sample(sparse_voter_ids_list, 1000)
+
+    duplicates_list, duplicate_count_integer, spilled_boolean, page_count_integer \
+        = find_duplicates(voter_ids_list, memory_budget_integer, str(tmp_path))
+
+    assert spilled_boolean
+
+    # The pages stop at the size of a set of the dense IDs and the sparse IDs before
+    # them.
+    assert free_page_count_integer \
+        < page_count_integer \
+        <= (300000 + page_count_integer) * poll_duplicate_detection.CONSTANT_SET_ENTRY_BYTES \
+           // poll_duplicate_detection.CONSTANT_BITMAP_PAGE_BYTES \
+        < memory_budget_integer // poll_duplicate_detection.CONSTANT_BITMAP_PAGE_BYTES
+
+    assert duplicates_list == find_reference_duplicates(voter_ids_list)
+
+    assert duplicate_count_integer == len(duplicates_list)
+
+
+    duplicates_list, _, spilled_boolean, page_count_integer \
+        = find_duplicates(sparse_voter_ids_list * 2, memory_budget_integer, str(tmp_path))
+
+    assert spilled_boolean and page_count_integer == free_page_count_integer
+
+    assert duplicates_list == find_reference_duplicates(sparse_voter_ids_list * 2)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_aggregator_merges_only_empty_parts
+ #
+ #  Subroutine Description:
+ #      This test checks that poll_main.py's duplicate ballots aggregator folds in an
+ #      aggregator that counted no rows and refuses one that counted rows, whose 
+ #      duplicates of earlier Voter IDs it could not have found.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  n/a     n/a         n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_aggregator_merges_only_empty_parts():
+
+    aggregators_list = [poll_main.duplicate_ballots_aggregator(0, 1, 2) for _ in range(3)]
+
+    aggregators_list[0].update([['1', 'Denver', 'Diana DeGette'], ['1', 'Denver', 'Diana DeGette']])
+
+    aggregators_list[2].update([['1', 'Denver', 'Diana DeGette']])
+
+    assert aggregators_list[0].merge(aggregators_list[1]) is aggregators_list[0]
+
+    with pytest.raises(ValueError):
+
+        aggregators_list[0].merge(aggregators_list[2])
+
+    assert aggregators_list[0].finalize()['Duplicate Ballots'] == 1
@@ -0,0 +1,517 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_poll_live_tally.py
+ #
+ #  File Description:
+ #      These tests check the follow mode of poll_main.py and the follow state and
+ #      checkpoints of poll_live_tally.py against a plain csv.reader reference.  They
+ #      grow a ballot file a few rows at a time, sometimes ending in a partial line,
+ #      and compare each live tally with a count of the file's complete lines.  They
+ #      also save and load checkpoints, resume from them after more rows arrive, and
+ #      check that a file truncated, rewritten in place, or replaced by a larger file,
+ #      while the program runs or while it is stopped, is counted again from the start,
+ #      and that a ballot with a quoted line break counts once its field is closed.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      count_reference_votes
+ #      summarize_candidate_votes
+ #      create_ballot_lines
+ #      test_follow_matches_csv_reader
+ #      test_checkpoint_round_trip
+ #      test_resume_from_checkpoint
+ #      test_replaced_file_is_recounted
+ #      test_quoted_field_across_polls
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Quoted field across polls               Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import csv
+import io
+import random
+
+import pytest
+
+import poll_live_tally
+import poll_main
+
+
+# These constants are the candidates and counties of the random ballots.
+CONSTANT_CANDIDATE_NAMES = ('Charles Casper Stockham', 'Diana DeGette', 'Raymon Anthony Doane')
+
+CONSTANT_COUNTY_NAMES = ('Jefferson', 'Denver', 'Arapahoe')
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  count_reference_votes
+ #
+ #  Subroutine Description:
+ #      This function reads the complete lines of a ballot csv file with csv.reader
+ #      and returns each candidate's votes in first-seen order and the number of
+ #      ballots.  A partial line after the last line break does not count.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  file_path_object    the path of the ballot csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def count_reference_votes(file_path_object):
+
+    file_text_string = file_path_object.read_bytes().decode()
+
+    candidate_votes_dictionary = {}
+
+    row_count_integer = 0
+
+    csv_reader = csv.reader(io.StringIO(file_text_string[:file_text_string.rfind('\n') + 1], newline = ''))
+
+    next(csv_reader, None)
+
+    for ballot_fields_list in csv_reader:
+
+        candidate_votes_dictionary[ballot_fields_list[2]] \
+            = candidate_votes_dictionary.get(ballot_fields_list[2], 0) + 1
+
+        row_count_integer += 1
+
+    return list(candidate_votes_dictionary.items()), row_count_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  summarize_candidate_votes
+ #
+ #  Subroutine Description:
+ #      This function returns a summary dictionary's candidates and their votes, in
+ #      order, and the total votes, in the form of count_reference_votes.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  dictionary  summary_dictionary      the summary dictionary
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def summarize_candidate_votes(summary_dictionary):
+
+    return list(zip(summary_dictionary['Candidates']['Name'], summary_dictionary['Candidates']['Vote Count'])), \
+           summary_dictionary['Total Votes']
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_ballot_lines
+ #
+ #  Subroutine Description:
+ #      This function returns the text of a number of random ballot lines, each with
+ #      its line break.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  random_object       the random number generator
+ #  int     line_count_integer  the number of lines
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_ballot_lines(random_object, line_count_integer):
+
+    return ''.join(f'{random_object.randrange(10 ** 7)},{random_object.choice(CONSTANT_COUNTY_NAMES)},'
+                   f'{random_object.choice(CONSTANT_CANDIDATE_NAMES)}\n' \
+                   for _ in range(line_count_integer))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_follow_matches_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test grows a ballot file a random number of bytes at a time, so rows and
+ #      the header row arrive in pieces, and compares each live tally with the
+ #      csv.reader reference whenever a line is completed.  Small digest and block
+ #      sizes make the boundary digest and the backward search cover several blocks.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  tmp_path        the pytest fixture with a temporary folder
+ #  object  monkeypatch     the pytest fixture that restores the module's constants
+ #  int     seed_integer    the seed of the random ballots
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(3))
+def test_follow_matches_csv_reader(tmp_path, monkeypatch, seed_integer):
+
+    monkeypatch.setattr(poll_live_tally, 'CONSTANT_BOUNDARY_DIGEST_SIZE', 37)
+
+    monkeypatch.setattr(poll_live_tally, 'CONSTANT_FOLLOW_BLOCK_SIZE', 11)
+
+    random_object = random.Random(seed_integer)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    follow_state_dictionary = poll_live_tally.create_follow_state()
+
+    file_bytes = ('Ballot ID,County,Candidate\n' + create_ballot_lines(random_object, 200)).encode()
+
+    file_size_integer = 0
+
+    candidate_aggregator \
+        = poll_main.candidate_votes_aggregator(poll_main.data_column_indices_enumeration.CANDIDATE_INDEX.value)
+
+    while file_size_integer < len(file_bytes):
+
+        file_size_integer = min(len(file_bytes), file_size_integer + random_object.randint(1, 200))
+
+        input_file_path.write_bytes(file_bytes[:file_size_integer])
+
+        line_range_tuple = poll_live_tally.find_appended_lines(str(input_file_path), follow_state_dictionary)
+
+        if line_range_tuple is not None:
+
+            candidate_aggregator.merge \
+                (poll_main.candidate_votes_aggregator(candidate_aggregator.candidate_index_integer) \
+                    .restore(poll_main.tally_file_shard((str(input_file_path),) + line_range_tuple)))
+
+        candidate_votes_dictionary, row_count_integer = candidate_aggregator.finalize()
+
+        assert (list(candidate_votes_dictionary.items()), row_count_integer) \
+            == count_reference_votes(input_file_path)
+
+        assert follow_state_dictionary['Offset'] == file_size_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_checkpoint_round_trip
+ #
+ #  Subroutine Description:
+ #      This test saves follow states, with and without a partial line, to checkpoint
+ #      files and checks that loading them returns the same states, and that a
+ #      missing, damaged, or outdated checkpoint loads as None.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_checkpoint_round_trip(tmp_path):
+
+    random_object = random.Random(4)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    checkpoint_file_name_string = poll_live_tally.get_checkpoint_file_name(str(input_file_path))
+
+    assert poll_live_tally.read_checkpoint(str(input_file_path), checkpoint_file_name_string) is None
+
+    for partial_line_string in ('', '17,Denver,Dia'):
+
+        input_file_path.write_bytes \
+            (('Ballot ID,County,Candidate\n' + create_ballot_lines(random_object, 50) + partial_line_string).encode())
+
+        follow_state_dictionary = poll_live_tally.create_follow_state()
+
+        poll_live_tally.find_appended_lines(str(input_file_path), follow_state_dictionary)
+
+        follow_state_dictionary['Candidate Votes'], follow_state_dictionary['Row Count'] \
+            = {'Zoë Ñúñez': 20, 'Diana DeGette': 30}, 50
+
+        poll_live_tally.write_checkpoint(checkpoint_file_name_string, follow_state_dictionary)
+
+        assert poll_live_tally.read_checkpoint(str(input_file_path), checkpoint_file_name_string) \
+            == follow_state_dictionary
+
+        assert follow_state_dictionary['Remainder'] == partial_line_string.encode()
+
+
+    with open(checkpoint_file_name_string, 'w') as checkpoint_file:
+
+        checkpoint_file.write('{"version": 1, "offset": ')
+
+    assert poll_live_tally.read_checkpoint(str(input_file_path), checkpoint_file_name_string) is None
+
+    poll_live_tally.write_checkpoint(checkpoint_file_name_string, follow_state_dictionary)
+
+    checkpoint_text_string = open(checkpoint_file_name_string).read()
+
+    with open(checkpoint_file_name_string, 'w') as checkpoint_file:
+
+        checkpoint_file.write(checkpoint_text_string.replace('"version": 1', '"version": 0'))
+
+    assert poll_live_tally.read_checkpoint(str(input_file_path), checkpoint_file_name_string) is None
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_resume_from_checkpoint
+ #
+ #  Subroutine Description:
+ #      This test follows a ballot file, stops, appends rows that end in a partial
+ #      line, and follows the file again from the checkpoint.  The resumed tally must
+ #      match the reference without counting the rows before the checkpoint again,
+ #      and completing the partial line must add its ballot.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_resume_from_checkpoint(tmp_path):
+
+    random_object = random.Random(5)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    checkpoint_file_name_string = poll_live_tally.get_checkpoint_file_name(str(input_file_path))
+
+    input_file_path.write_bytes(('Ballot ID,County,Candidate\n' + create_ballot_lines(random_object, 80)).encode())
+
+    summary_generator \
+        = poll_main.follow_file_and_calculate_values(str(input_file_path), checkpoint_file_name_string, 0)
+
+    assert summarize_candidate_votes(next(summary_generator)) == count_reference_votes(input_file_path)
+
+    summary_generator.close()
+
+    checkpoint_offset_integer \
+        = poll_live_tally.read_checkpoint(str(input_file_path), checkpoint_file_name_string)['Offset']
+
+
+    with open(input_file_path, 'ab') as binary_file:
+
+        binary_file.write((create_ballot_lines(random_object, 40) + '99,Denver,Diana De').encode())
+
+    shard_ranges_list = []
+
+    tally_file_shard_function = poll_main.tally_file_shard
+
+    def record_shard_range(shard_tuple):
+
+        shard_ranges_list.append(shard_tuple[1:])
+
+        return tally_file_shard_function(shard_tuple)
+
+    poll_main.tally_file_shard = record_shard_range
+
+    try:
+
+        summary_generator \
+            = poll_main.follow_file_and_calculate_values(str(input_file_path), checkpoint_file_name_string, 0)
+
+        assert summarize_candidate_votes(next(summary_generator)) == count_reference_votes(input_file_path)
+
+        with open(input_file_path, 'ab') as binary_file:
+
+            binary_file.write(b'Gette\n')
+
+        assert summarize_candidate_votes(next(summary_generator)) == count_reference_votes(input_file_path)
+
+        summary_generator.close()
+
+    finally:
+
+        poll_main.tally_file_shard = tally_file_shard_function
+
+    assert shard_ranges_list[0][0] == checkpoint_offset_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_replaced_file_is_recounted
+ #
+ #  Subroutine Description:
+ #      This test follows a ballot file and then truncates it, rewrites a row near
+ #      its end in place with the same size, or replaces it with a larger file that
+ #      shares its first rows, each while the program runs and while it is stopped.  Every
+ #      change must start the count over, so the tally matches the reference instead
+ #      of adding the new rows to the old tally.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  tmp_path            the pytest fixture with a temporary folder
+ #  String  change_string       the change to the file
+ #  bool    restart_boolean     whether the program stops before the change
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('restart_boolean', [False, True])
+@pytest.mark.parametrize('change_string', ['truncate', 'rewrite', 'replace'])
+def test_replaced_file_is_recounted(tmp_path, change_string, restart_boolean):
+
+    random_object = random.Random(6)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    checkpoint_file_name_string = poll_live_tally.get_checkpoint_file_name(str(input_file_path))
+
+    ballot_lines_list \
+        = ['Ballot ID,County,Candidate\n'] + create_ballot_lines(random_object, 300).splitlines(keepends = True)
+
+    input_file_path.write_bytes(''.join(ballot_lines_list).encode())
+
+    summary_generator \
+        = poll_main.follow_file_and_calculate_values(str(input_file_path), checkpoint_file_name_string, 0)
+
+    assert summarize_candidate_votes(next(summary_generator)) == count_reference_votes(input_file_path)
+
+
+    if change_string == 'truncate':
+
+        ballot_lines_list = ballot_lines_list[:100]
+
+    elif change_string == 'rewrite':
+
+        # The row the test rewrites lies within the bytes the boundary digest covers.
+        row_index = next(row_index for row_index in range(290, 0, -1) \
+                         if not ballot_lines_list[row_index].endswith(',Diana DeGette\n'))
+
+        ballot_lines_list[row_index] \
+            = '9' * (len(ballot_lines_list[row_index]) - len(',Denver,Diana DeGette\n')) + ',Denver,Diana DeGette\n'
+
+    else:
+
+        ballot_lines_list[200:] = create_ballot_lines(random_object, 150).splitlines(keepends = True)
+
+    # A ballot appended after the change makes the program yield a tally even if it 
+    # misses the change.
+    ballot_lines_list.append(create_ballot_lines(random_object, 1))
+
+    if restart_boolean:
+
+        summary_generator.close()
+
+    input_file_path.write_bytes(''.join(ballot_lines_list).encode())
+
+    if restart_boolean:
+
+        summary_generator \
+            = poll_main.follow_file_and_calculate_values(str(input_file_path), checkpoint_file_name_string, 0)
+
+    summary_dictionary = next(summary_generator)
+
+    summary_generator.close()
+
+    assert summarize_candidate_votes(summary_dictionary) == count_reference_votes(input_file_path)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_quoted_field_across_polls
+ #
+ #  Subroutine Description:
+ #      This test appends a ballot whose quoted Candidate field holds a line break, 
+ #      first up to the line break and then the rest of it with another ballot, and
+ #      checks that the first poll keeps the unfinished ballot as the partial line and
+ #      the second counts it once, with its whole name.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_quoted_field_across_polls(tmp_path):
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    follow_state_dictionary = poll_live_tally.create_follow_state()
+
+    candidate_aggregator \
+        = poll_main.candidate_votes_aggregator(poll_main.data_column_indices_enumeration.CANDIDATE_INDEX.value)
+
+    line_ranges_list = []
+
+    for appended_bytes in (b'Ballot ID,County,Candidate\n1,X,A\n', b'2,X,"Smith\n', b'Jones"\n3,X,A\n'):
+
+        with open(input_file_path, 'ab') as binary_file:
+
+            binary_file.write(appended_bytes)
+
+        line_range_tuple = poll_live_tally.find_appended_lines(str(input_file_path), follow_state_dictionary)
+
+        line_ranges_list.append(line_range_tuple)
+
+        if line_range_tuple is not None:
+
+            candidate_aggregator.merge \
+                (poll_main.candidate_votes_aggregator(candidate_aggregator.candidate_index_integer) \
+                    .restore(poll_main.tally_file_shard((str(input_file_path),) + line_range_tuple)))
+
+        if appended_bytes == b'2,X,"Smith\n':
+
+            assert line_range_tuple is None
+
+            assert follow_state_dictionary['Remainder'] == b'2,X,"Smith\n'
+
+            assert candidate_aggregator.finalize() == ({'A': 1}, 1)
+
+
+    assert line_ranges_list[2] == (33, input_file_path.stat().st_size)
+
+    assert follow_state_dictionary['Remainder'] == b''
+
+    assert candidate_aggregator.finalize() == ({'A': 2, 'Smith\nJones': 1}, 3)
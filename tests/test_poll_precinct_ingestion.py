@@ -0,0 +1,215 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_poll_precinct_ingestion.py
+ #
+ #  File Description:
+ #      These tests check the concurrent precinct file ingestion of poll_main.py against
+ #      the csv module.  They write a folder of random precinct files, including one
+ #      with only its header, count the folder, and compare the totals and each
+ #      precinct's results with the votes csv.reader returns.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      write_precinct_file
+ #      count_reference_votes
+ #      test_precinct_totals_match_csv_reader
+ #      test_empty_precinct_has_no_winner
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import csv
+import random
+
+import poll_main
+
+
+# These constants are the header and the candidates and counties of the random ballots.
+CONSTANT_BALLOT_HEADER_STRING = 'Ballot ID,County,Candidate\n'
+
+CONSTANT_CANDIDATE_NAMES = ('Charles Casper Stockham', 'Diana DeGette', 'Raymon Anthony Doane')
+
+CONSTANT_COUNTY_NAMES = ('Jefferson', 'Denver', 'Arapahoe')
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_precinct_file
+ #
+ #  Subroutine Description:
+ #      This subroutine writes a precinct file with the header and the number of random
+ #      ballots.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  file_path_object        the path of the precinct file
+ #  object  random_object           the random number generator
+ #  int     ballot_count_integer    the number of ballots
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_precinct_file(file_path_object, random_object, ballot_count_integer):
+
+    file_path_object.write_text \
+        (CONSTANT_BALLOT_HEADER_STRING \
+         + ''.join \
+            (f'{ballot_index},{random_object.choice(CONSTANT_COUNTY_NAMES)},'
+             f'{random_object.choice(CONSTANT_CANDIDATE_NAMES)}\n' \
+             for ballot_index in range(ballot_count_integer)))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  count_reference_votes
+ #
+ #  Subroutine Description:
+ #      This function returns a dictionary with each candidate's votes in a csv file,
+ #      in first-seen order, read with csv.reader.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  file_path_object    the path of the csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def count_reference_votes(file_path_object):
+
+    candidate_votes_dictionary = {}
+
+    with open(file_path_object, newline = '') as input_file:
+
+        csv_reader = csv.reader(input_file)
+
+        next(csv_reader)
+
+        for ballot_fields_list in csv_reader:
+
+            candidate_votes_dictionary[ballot_fields_list[2]] \
+                = candidate_votes_dictionary.get(ballot_fields_list[2], 0) + 1
+
+    return candidate_votes_dictionary
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_precinct_totals_match_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test counts a folder of precinct files, one of them empty, and compares
+ #      the totals and each non-empty precinct's votes with csv.reader's.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_precinct_totals_match_csv_reader(tmp_path):
+
+    random_object = random.Random(0)
+
+    for precinct_name_string, ballot_count_integer in (('p1', 500), ('p2', 0), ('p3', 37)):
+
+        write_precinct_file(tmp_path / f'{precinct_name_string}.csv', random_object, ballot_count_integer)
+
+
+    summary_dictionary \
+        = poll_main.read_precinct_files_and_calculate_values \
+            (str(tmp_path), concurrency_integer = 2, precinct_results_boolean = True)
+
+    reference_votes_dictionary = {}
+
+    for precinct_summary_dictionary in summary_dictionary['Precincts']:
+
+        precinct_votes_dictionary \
+            = count_reference_votes(tmp_path / f'{precinct_summary_dictionary["Precinct"]}.csv')
+
+        assert dict(zip(precinct_summary_dictionary['Candidates']['Name'],
+                        precinct_summary_dictionary['Candidates']['Vote Count'])) \
+            == precinct_votes_dictionary
+
+        assert precinct_summary_dictionary['Total Votes'] == sum(precinct_votes_dictionary.values())
+
+        for candidate_name_string, vote_count_integer in precinct_votes_dictionary.items():
+
+            reference_votes_dictionary[candidate_name_string] \
+                = reference_votes_dictionary.get(candidate_name_string, 0) + vote_count_integer
+
+    assert [precinct_summary_dictionary['Precinct'] \
+            for precinct_summary_dictionary in summary_dictionary['Precincts']] == ['p1', 'p2', 'p3']
+
+    assert summary_dictionary['Candidates']['Name'] == list(reference_votes_dictionary)
+
+    assert summary_dictionary['Candidates']['Vote Count'] == list(reference_votes_dictionary.values())
+
+    assert summary_dictionary['Total Votes'] == 537
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_empty_precinct_has_no_winner
+ #
+ #  Subroutine Description:
+ #      This test checks that a precinct file with only its header reports zero votes
+ #      and the no-ballots message, and that the precinct results still format.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_empty_precinct_has_no_winner(tmp_path):
+
+    random_object = random.Random(1)
+
+    write_precinct_file(tmp_path / 'a.csv', random_object, 20)
+
+    write_precinct_file(tmp_path / 'b.csv', random_object, 0)
+
+
+    summary_dictionary \
+        = poll_main.read_precinct_files_and_calculate_values(str(tmp_path), precinct_results_boolean = True)
+
+    empty_precinct_dictionary = summary_dictionary['Precincts'][1]
+
+    assert empty_precinct_dictionary['Total Votes'] == 0
+
+    assert empty_precinct_dictionary['Candidates'] == {'Name': [], 'Percent': [], 'Vote Count': []}
+
+    assert empty_precinct_dictionary['Winner'] == poll_main.CONSTANT_NO_BALLOTS_MESSAGE
+
+    assert f'    Winner: {poll_main.CONSTANT_NO_BALLOTS_MESSAGE}' \
+        in '\n'.join(poll_main.format_precinct_results_lines(summary_dictionary))
@@ -0,0 +1,310 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_poll_ranked_choice.py
+ #
+ #  File Description:
+ #      These tests check the instant runoff of poll_ranked_choice.py against a plain
+ #      reference that reads the ballots with csv.reader and recounts every ballot in
+ #      every round.  The random elections are small, so ties for the fewest votes,
+ #      candidates without votes, exhausted ballots, and tied elections all occur, and
+ #      the ballots have blank and repeated rankings, quoted fields, and preference
+ #      columns in and out of order.  A last test checks that poll_main.py's ranked
+ #      candidate votes are the first round's.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      create_random_ranked_text
+ #      tabulate_reference_runoff
+ #      test_instant_runoff_matches_reference
+ #      test_first_choices_match_first_round
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      First choices match the first round     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import csv
+import io
+import random
+
+import pytest
+
+import poll_main
+import poll_ranked_choice
+
+
+# These constants are the rankings of the random ballots: a few candidates, a quoted
+# candidate with a comma, and blank preferences.
+CONSTANT_RANKING_NAMES = ('Ada', 'Bo', 'Cy', 'Di', 'Ed', '', ' ')
+
+CONSTANT_QUOTED_RANKING_NAME = '"Fay, Jr."'
+
+CONSTANT_HEADER_LISTS \
+    = (['Ballot ID', 'County', 'Candidate', 'Rank 2', 'Rank 3'],
+       ['Ballot ID', 'County', 'Candidate', 'Rank 3', 'Rank 2', 'Notes'],
+       ['Ballot ID', 'County', 'Candidate'])
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_random_ranked_text
+ #
+ #  Subroutine Description:
+ #      This function returns the text of a random ranked ballot csv file with one of
+ #      the test headers.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  random_object   the random number generator
+ #  bool    quoted_boolean  whether the rankings may be quoted
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_random_ranked_text(random_object, quoted_boolean):
+
+    header_list = random_object.choice(CONSTANT_HEADER_LISTS)
+
+    ranking_names_tuple \
+        = CONSTANT_RANKING_NAMES[:random_object.randint(2, 5)] + CONSTANT_RANKING_NAMES[5:] \
+          + ((CONSTANT_QUOTED_RANKING_NAME,) if quoted_boolean else ())
+
+    ballot_lines_list \
+        = [','.join([str(ballot_index), 'Denver'] \
+                    + [random_object.choice(ranking_names_tuple) for _ in range(len(header_list) - 2)]) \
+           for ballot_index in range(random_object.randint(1, 60))]
+
+    return ','.join(header_list) + '\n' + '\n'.join(ballot_lines_list) + '\n'
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  tabulate_reference_runoff
+ #
+ #  Subroutine Description:
+ #      This function reads ranked ballot csv text with csv.reader and runs the instant
+ #      runoff by recounting every ballot in every round.  It returns the rounds and
+ #      the winner in the form of tabulate_instant_runoff.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  String  ranked_text_string  the ranked ballot csv text
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def tabulate_reference_runoff(ranked_text_string):
+
+    csv_records_list = list(csv.reader(io.StringIO(ranked_text_string)))
+
+    # The preference columns are the Candidate column and the Rank columns by rank.
+    preference_indices_list \
+        = [2] + [column_index \
+                 for _, column_index \
+                     in sorted((int(column_name_string.split()[1]), column_index) \
+                               for column_index, column_name_string in enumerate(csv_records_list[0]) \
+                               if column_name_string.startswith('Rank '))]
+
+    ballots_list \
+        = [list(dict.fromkeys(record_list[column_index] for column_index in preference_indices_list \
+                              if record_list[column_index].strip())) \
+           for record_list in csv_records_list[1:]]
+
+    continuing_names_list = list(dict.fromkeys(name for ballot_list in ballots_list for name in ballot_list))
+
+    first_seen_list = list(continuing_names_list)
+
+    rounds_list = []
+
+    while continuing_names_list:
+
+        votes_dictionary = dict.fromkeys(continuing_names_list, 0)
+
+        exhausted_ballots_integer = 0
+
+        for ballot_list in ballots_list:
+
+            continuing_choices_list = [name for name in ballot_list if name in votes_dictionary]
+
+            if continuing_choices_list:
+
+                votes_dictionary[continuing_choices_list[0]] += 1
+
+            else:
+
+                exhausted_ballots_integer += 1
+
+        continuing_ballots_integer = sum(votes_dictionary.values())
+
+        # The candidates are listed from the most votes to the fewest, in first-seen
+        # order among equal votes.
+        rounds_list.append \
+            ({'Round': len(rounds_list) + 1,
+              'Votes': {name: votes_dictionary[name] \
+                        for name in sorted(continuing_names_list,
+                                           key = lambda name: (-votes_dictionary[name], first_seen_list.index(name)))},
+              'Continuing Ballots': continuing_ballots_integer,
+              'Exhausted Ballots': exhausted_ballots_integer,
+              'Eliminated': []})
+
+        most_votes_integer = max(votes_dictionary.values())
+
+        fewest_votes_integer = min(votes_dictionary.values())
+
+        if 2 * most_votes_integer > continuing_ballots_integer:
+
+            return {'Rounds': rounds_list, 'Winner': next(iter(rounds_list[-1]['Votes']))}
+
+        if fewest_votes_integer == most_votes_integer:
+
+            return {'Rounds': rounds_list, 'Winner': None}
+
+        if fewest_votes_integer == 0:
+
+            eliminated_names_list = [name for name in continuing_names_list if votes_dictionary[name] == 0]
+
+        else:
+
+            # A tie for the fewest votes goes to the fewest votes in the latest earlier
+            # round where the tied candidates differ, and then to the candidate seen last.
+            tied_names_list = [name for name in continuing_names_list if votes_dictionary[name] == fewest_votes_integer]
+
+            for earlier_round_dictionary in reversed(rounds_list[:-1]):
+
+                earlier_fewest_integer = min(earlier_round_dictionary['Votes'][name] for name in tied_names_list)
+
+                tied_names_list \
+                    = [name for name in tied_names_list if earlier_round_dictionary['Votes'][name] == earlier_fewest_integer]
+
+            eliminated_names_list = [max(tied_names_list, key = first_seen_list.index)]
+
+        rounds_list[-1]['Eliminated'] = eliminated_names_list
+
+        continuing_names_list = [name for name in continuing_names_list if name not in eliminated_names_list]
+
+    return {'Rounds': rounds_list, 'Winner': None}
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_instant_runoff_matches_reference
+ #
+ #  Subroutine Description:
+ #      This test groups random ranked ballot files in one pass and over shards,
+ #      tabulates the runoff, and compares the rounds and the winner with the
+ #      reference.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  object  tmp_path                the pytest fixture with a temporary folder
+ #  bool    quoted_boolean          whether the rankings may be quoted
+ #  int     worker_count_integer    the number of worker processes
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('worker_count_integer', [1, 3])
+@pytest.mark.parametrize('quoted_boolean', [False, True])
+def test_instant_runoff_matches_reference(tmp_path, quoted_boolean, worker_count_integer):
+
+    random_object = random.Random(40 + worker_count_integer)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    for trial_index in range(60 if worker_count_integer == 1 else 6):
+
+        ranked_text_string = create_random_ranked_text(random_object, quoted_boolean)
+
+        input_file_path.write_text(ranked_text_string)
+
+        ballot_groups_dictionary, row_count_integer \
+            = poll_ranked_choice.read_ranked_ballot_groups(str(input_file_path), 2, worker_count_integer)
+
+        assert row_count_integer == ranked_text_string.count('\n') - 1
+
+        assert poll_ranked_choice.tabulate_instant_runoff(ballot_groups_dictionary) \
+            == tabulate_reference_runoff(ranked_text_string)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_first_choices_match_first_round
+ #
+ #  Subroutine Description:
+ #      This test analyzes ranked ballot files whose first preference is often blank 
+ #      with poll_main.py and checks that the candidates' votes are the votes of the
+ #      first round's, with no blank candidate, and that a file whose ballots rank no one
+ #      has no candidates and no winner.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_first_choices_match_first_round(tmp_path):
+
+    random_object = random.Random(19)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    ranked_texts_list \
+        = ['Ballot ID,County,Candidate,Rank 2\n1,X,,Bo\n2,X,Ada,Bo\n3,X, ,Ada\n4,X,,\n'] \
+          + [create_random_ranked_text(random_object, True) for _ in range(30)]
+
+    for ranked_text_string in ranked_texts_list:
+
+        input_file_path.write_text(ranked_text_string)
+
+        summary_dictionary = poll_main.read_file_and_calculate_values(str(input_file_path), ranked_choice_boolean = True)
+
+        candidate_votes_dictionary \
+            = dict(zip(summary_dictionary['Candidates']['Name'], summary_dictionary['Candidates']['Vote Count']))
+
+        # The first round also lists the candidates ranked only after the first choice.
+        assert candidate_votes_dictionary \
+            == {candidate_name: vote_count_integer \
+                for round_dictionary in summary_dictionary['Rounds'][:1] \
+                for candidate_name, vote_count_integer in round_dictionary['Votes'].items() \
+                if vote_count_integer > 0}
+
+        assert not any(candidate_name.strip() == '' for candidate_name in candidate_votes_dictionary)
+
+        assert summary_dictionary['Total Votes'] == ranked_text_string.count('\n') - 1
+
+
+    input_file_path.write_text('Ballot ID,County,Candidate,Rank 2\n1,X,,\n2,X, ,\n')
+
+    summary_dictionary = poll_main.read_file_and_calculate_values(str(input_file_path), ranked_choice_boolean = True)
+
+    assert summary_dictionary['Candidates']['Name'] == [] and summary_dictionary['Total Votes'] == 2
+
+    assert summary_dictionary['Winner'] == poll_main.CONSTANT_NO_BALLOTS_MESSAGE
@@ -0,0 +1,144 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_poll_sketches.py
+ #
+ #  File Description:
+ #      These tests check the provisional estimates of poll_main.py's approximate mode.
+ #      The estimate of a plain csv file must lie within its confidence margins of the
+ #      shares csv.reader counts, and a compressed file, which has no byte offsets to
+ #      sample, must be rejected with ValueError instead of a csv error.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      write_ballot_file
+ #      test_estimate_matches_csv_reader_shares
+ #      test_estimate_rejects_compressed_file
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import bz2
+import collections
+import csv
+import gzip
+import lzma
+import random
+
+import pytest
+
+import poll_main
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_ballot_file
+ #
+ #  Subroutine Description:
+ #      This function returns the text of a ballot csv file with the header and the
+ #      number of random ballots, two thirds of them for the first candidate.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                    Description
+ #  -----   -------------           ----------------------------------------------
+ #  int     ballot_count_integer    the number of ballots
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_ballot_file(ballot_count_integer):
+
+    random_object = random.Random(0)
+
+    return 'Ballot ID,County,Candidate\n' \
+           + ''.join(f'{ballot_index},County {random_object.randint(1, 4)},'
+                     f'{random_object.choice(("Diana DeGette", "Diana DeGette", "Raymon Anthony Doane"))}\n' \
+                     for ballot_index in range(ballot_count_integer))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_estimate_matches_csv_reader_shares
+ #
+ #  Subroutine Description:
+ #      This test checks that each estimated share lies within a few of its margins of
+ #      the share csv.reader counts, and that the exact pass matches csv.reader.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_estimate_matches_csv_reader_shares(tmp_path):
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    input_file_path.write_text(write_ballot_file(20000))
+
+    with open(input_file_path, newline = '') as input_file:
+
+        reference_counter = collections.Counter(ballot_fields_list[2] for ballot_fields_list in list(csv.reader(input_file))[1:])
+
+
+    provisional_dictionary, exact_dictionary \
+        = poll_main.estimate_file_and_calculate_values(str(input_file_path), 1, 2000, 7)
+
+    for candidate_name_string, percent_float, margin_float \
+        in zip(provisional_dictionary['Candidates']['Name'],
+               provisional_dictionary['Candidates']['Percent'],
+               provisional_dictionary['Estimates']['Percent Margins']):
+
+        assert abs(percent_float - 100.0 * reference_counter[candidate_name_string] / 20000) <= 3 * margin_float
+
+    assert dict(zip(exact_dictionary['Candidates']['Name'], exact_dictionary['Candidates']['Vote Count'])) \
+        == dict(reference_counter)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_estimate_rejects_compressed_file
+ #
+ #  Subroutine Description:
+ #      This test checks that the provisional estimate of a gzip, bz2, or xz file
+ #      raises ValueError.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                Description
+ #  -----       --------            ----------------------------------------------
+ #  object      tmp_path            the pytest fixture with a temporary folder
+ #  function    compress_function   the function that compresses the file's bytes
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('compress_function', [gzip.compress, bz2.compress, lzma.compress])
+def test_estimate_rejects_compressed_file(tmp_path, compress_function):
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    input_file_path.write_bytes(compress_function(write_ballot_file(1000).encode()))
+
+    with pytest.raises(ValueError):
+
+        poll_main.calculate_provisional_values(str(input_file_path), 100, 7)
@@ -0,0 +1,508 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_poll_tally.py
+ #
+ #  File Description:
+ #      These tests check the candidate vote tallies of poll_main.py against a plain
+ #      csv.reader reference.  They write random ballot files, some with quoted fields
+ #      that hold commas or line breaks and quotation marks inside unquoted fields,
+ #      some with carriage returns or without a final line break, and compare each
+ #      tally's candidates, in first-seen order, their votes, and the row count with 
+ #      the reference.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      create_random_ballot_text
+ #      count_reference_votes
+ #      summarize_candidate_votes
+ #      test_candidate_tally_matches_csv_reader
+ #      test_sharded_tally_matches_csv_reader
+ #      test_quoted_shards_report_shortfall
+ #      test_memory_mapped_scan_matches_csv_reader
+ #      test_numpy_tally_matches_csv_reader
+ #      test_header_only_file_has_no_winner
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Shards of files with quoted fields      Nicholas J. George
+ #  10/18/2026      Header-only files                       Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import csv
+import random
+
+import pytest
+
+import poll_main
+
+
+# These constants are the candidates and counties of the random ballots; the quoted
+# candidate holds a comma, the quoted county a line break, and the last county a 
+# quotation mark that the csv module reads as an ordinary character.
+CONSTANT_CANDIDATE_NAMES \
+    = ('Charles Casper Stockham', 'Diana DeGette', 'Raymon Anthony Doane', 'Zoë Ñúñez', '"Doe, Jane"')
+
+CONSTANT_COUNTY_NAMES = ('Jefferson', 'Denver', 'Arapahoe', '"Rio\nBlanco"', 'Cty"')
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_random_ballot_text
+ #
+ #  Subroutine Description:
+ #      This function returns the text of a ballot csv file with the header and a
+ #      random number of ballots, with or without quoted fields, with a random line
+ #      ending, and with or without a final line break.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  random_object       the random number generator
+ #  bool    quoted_boolean      whether the ballots may have quoted fields
+ #  int     row_count_integer   the largest number of ballots
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_random_ballot_text(random_object, quoted_boolean, row_count_integer = 400):
+
+    candidate_count_integer = len(CONSTANT_CANDIDATE_NAMES) if quoted_boolean else len(CONSTANT_CANDIDATE_NAMES) - 1
+
+    county_count_integer = len(CONSTANT_COUNTY_NAMES) if quoted_boolean else len(CONSTANT_COUNTY_NAMES) - 2
+
+    line_ending_string = random_object.choice(('\n', '\r\n'))
+
+    ballot_lines_list \
+        = [f'{ballot_index},'
+           f'{CONSTANT_COUNTY_NAMES[random_object.randrange(county_count_integer)]},'
+           f'{CONSTANT_CANDIDATE_NAMES[random_object.randrange(candidate_count_integer)]}' \
+           for ballot_index in range(random_object.randint(1, row_count_integer))]
+
+    return 'Ballot ID,County,Candidate' + line_ending_string \
+           + line_ending_string.join(ballot_lines_list) \
+           + random_object.choice((line_ending_string, ''))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  count_reference_votes
+ #
+ #  Subroutine Description:
+ #      This function reads a ballot csv file with csv.reader and returns each
+ #      candidate's votes in first-seen order and the number of ballots.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  file_path_object    the path of the ballot csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def count_reference_votes(file_path_object):
+
+    candidate_votes_dictionary = {}
+
+    row_count_integer = 0
+
+    with open(file_path_object, newline = '') as input_file:
+
+        csv_reader = csv.reader(input_file)
+
+        next(csv_reader)
+
+        for ballot_fields_list in csv_reader:
+
+            candidate_votes_dictionary[ballot_fields_list[2]] \
+                = candidate_votes_dictionary.get(ballot_fields_list[2], 0) + 1
+
+            row_count_integer += 1
+
+    return list(candidate_votes_dictionary.items()), row_count_integer
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  summarize_candidate_votes
+ #
+ #  Subroutine Description:
+ #      This function returns the candidates' votes, in order, and the total votes of
+ #      a summary dictionary, or of a tally's dictionary and row count, in the form of
+ #      count_reference_votes.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name            Description
+ #  -----       -------------   ----------------------------------------------
+ #  object      tally_result    a summary dictionary or a (dictionary, row count)
+ #                              tuple
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def summarize_candidate_votes(tally_result):
+
+    if isinstance(tally_result, dict):
+
+        return list(zip(tally_result['Candidates']['Name'], tally_result['Candidates']['Vote Count'])), \
+               tally_result['Total Votes']
+
+    return list(tally_result[0].items()), tally_result[1]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_candidate_tally_matches_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test counts random ballot files in a single process, from the path and
+ #      from an open text stream, and compares the tallies with the csv.reader
+ #      reference.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  tmp_path        the pytest fixture with a temporary folder
+ #  bool    quoted_boolean  whether the ballots may have quoted fields
+ #  int     seed_integer    the seed of the random ballots
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(3))
+@pytest.mark.parametrize('quoted_boolean', [False, True])
+def test_candidate_tally_matches_csv_reader(tmp_path, quoted_boolean, seed_integer):
+
+    random_object = random.Random(seed_integer)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    for _ in range(10):
+
+        input_file_path.write_bytes(create_random_ballot_text(random_object, quoted_boolean).encode())
+
+        reference_tuple = count_reference_votes(input_file_path)
+
+        assert summarize_candidate_votes(poll_main.read_file_and_calculate_values(str(input_file_path))) \
+            == reference_tuple
+
+        with open(input_file_path, newline = '') as input_file:
+
+            input_file.readline()
+
+            assert summarize_candidate_votes(poll_main.tally_candidate_votes(csv.reader(input_file))) \
+                == reference_tuple
+
+        with open(input_file_path, newline = '') as input_file:
+
+            assert summarize_candidate_votes(poll_main.read_file_and_calculate_values(input_file)) \
+                == reference_tuple
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_sharded_tally_matches_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test counts random ballot files over shards, in a process pool and one
+ #      shard at a time with the merge, and compares the tallies with the csv.reader
+ #      reference.  A file of many ballots splits into several shards even with 
+ #      quoted fields.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  tmp_path        the pytest fixture with a temporary folder
+ #  bool    quoted_boolean  whether the ballots may have quoted fields
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('quoted_boolean', [False, True])
+def test_sharded_tally_matches_csv_reader(tmp_path, quoted_boolean):
+
+    random_object = random.Random(10)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    for trial_index in range(10):
+
+        input_file_path.write_bytes(create_random_ballot_text(random_object, quoted_boolean).encode())
+
+        reference_tuple = count_reference_votes(input_file_path)
+
+        if trial_index < 2:
+
+            assert summarize_candidate_votes \
+                        (poll_main.read_file_and_calculate_values(str(input_file_path), worker_count_integer = 3)) \
+                == reference_tuple
+
+        for shard_count_integer in (2, 5, 17):
+
+            shard_ranges_list \
+                = poll_main.streaming_aggregation.split_file_into_shards(str(input_file_path), shard_count_integer)
+
+            assert summarize_candidate_votes \
+                        (poll_main.merge_candidate_votes \
+                            ([poll_main.tally_file_shard((str(input_file_path), start_integer, end_integer)) \
+                              for start_integer, end_integer in shard_ranges_list])) \
+                == reference_tuple
+
+            if reference_tuple[1] >= 100:
+
+                assert len(shard_ranges_list) > 1
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_quoted_shards_report_shortfall
+ #
+ #  Subroutine Description:
+ #      This test splits a ballot file whose rows after the first are all inside one
+ #      quoted field, so every boundary moves to the end of the file, and checks that
+ #      the split leaves one shard and records a notice of it, which it does not 
+ #      print.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #  object  capsys      the pytest fixture that captures the output
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Notice recorded, not printed                Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_quoted_shards_report_shortfall(tmp_path, capsys):
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    input_file_path.write_text \
+        ('Ballot ID,County,Candidate\n1,Denver,"Diana\n' + 'DeGette\n' * 200 + '"\n')
+
+    assert poll_main.streaming_aggregation.split_file_into_shards(str(input_file_path), 4) \
+        == [(len('Ballot ID,County,Candidate\n'), input_file_path.stat().st_size)]
+
+    shard_notices_list = poll_main.streaming_aggregation.take_shard_notices()
+
+    assert len(shard_notices_list) == 1
+
+    assert shard_notices_list[0].startswith('election_data.csv runs as 1 of the 4 shards requested')
+
+    assert poll_main.streaming_aggregation.take_shard_notices() == []
+
+    assert capsys.readouterr().err == ''
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_memory_mapped_scan_matches_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test counts random ballot files with the memory-mapped scanner, with small
+ #      blocks so that the suffix counts and the expression both run across many
+ #      blocks, with as many candidates as the suffix count limit, and with more.  The
+ #      scanner must match the csv.reader reference, or return None for a file with
+ #      quoted fields or with more candidates than the limit, which the schema parser
+ #      then counts through read_file_and_calculate_values.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  tmp_path            the pytest fixture with a temporary folder
+ #  object  monkeypatch         the pytest fixture that restores the block sizes
+ #  bool    quoted_boolean      whether the ballots may have quoted fields
+ #  int     block_size_integer  the scanner's block size in bytes
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          Schema parser for many candidates           Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('block_size_integer', [1, 97, 4096])
+@pytest.mark.parametrize('quoted_boolean', [False, True])
+def test_memory_mapped_scan_matches_csv_reader(tmp_path, monkeypatch, quoted_boolean, block_size_integer):
+
+    monkeypatch.setattr(poll_main, 'CONSTANT_SCAN_FIRST_BLOCK_SIZE', block_size_integer)
+
+    monkeypatch.setattr(poll_main, 'CONSTANT_SCAN_BLOCK_SIZE', 4 * block_size_integer)
+
+    random_object = random.Random(20 + block_size_integer)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    for trial_index in range(12):
+
+        ballot_text_string = create_random_ballot_text(random_object, quoted_boolean)
+
+        # Some files have write-in candidates up to the suffix count limit, and some 
+        # have more than it handles.
+        write_in_count_integer \
+            = (0, poll_main.CONSTANT_SCAN_SUFFIX_COUNT_LIMIT - 4, 20)[trial_index % 3] if not quoted_boolean else 0
+
+        if write_in_count_integer > 0:
+
+            ballot_text_string \
+                = ballot_text_string.rstrip('\r\n') + '\n' \
+                  + ''.join(f'x{candidate_index},Denver,Write-in {candidate_index % write_in_count_integer}\n' \
+                            for candidate_index in range(200))
+
+        input_file_path.write_bytes(ballot_text_string.encode())
+
+        scan_result_tuple = poll_main.scan_candidate_column(str(input_file_path))
+
+        if scan_result_tuple is None:
+
+            assert '"' in ballot_text_string or write_in_count_integer == 20
+
+            assert summarize_candidate_votes(poll_main.read_file_and_calculate_values(str(input_file_path))) \
+                == count_reference_votes(input_file_path)
+
+            continue
+
+        assert write_in_count_integer < 20
+
+        assert summarize_candidate_votes(scan_result_tuple) == count_reference_votes(input_file_path)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_numpy_tally_matches_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test counts random ballot files with the NumPy backend, with small blocks
+ #      so rows straddle block boundaries, directly and through
+ #      read_file_and_calculate_values.  The backend must match the csv.reader
+ #      reference, or return None for a file with quoted fields.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  tmp_path            the pytest fixture with a temporary folder
+ #  object  monkeypatch         the pytest fixture that restores the backend's constants
+ #  bool    quoted_boolean      whether the ballots may have quoted fields
+ #  int     block_size_integer  the backend's block size in bytes
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('block_size_integer', [1, 97, 4096])
+@pytest.mark.parametrize('quoted_boolean', [False, True])
+def test_numpy_tally_matches_csv_reader(tmp_path, monkeypatch, quoted_boolean, block_size_integer):
+
+    pytest.importorskip('numpy')
+
+    monkeypatch.setattr(poll_main.poll_numpy_backend, 'CONSTANT_NUMPY_BLOCK_SIZE', block_size_integer)
+
+    monkeypatch.setattr(poll_main.poll_numpy_backend, 'CONSTANT_NUMPY_SIZE_THRESHOLD', 0)
+
+    random_object = random.Random(30 + block_size_integer)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    for _ in range(12):
+
+        ballot_text_string = create_random_ballot_text(random_object, quoted_boolean)
+
+        input_file_path.write_bytes(ballot_text_string.encode())
+
+        reference_tuple = count_reference_votes(input_file_path)
+
+        numpy_result_tuple \
+            = poll_main.poll_numpy_backend.tally_candidate_votes_numpy \
+                (str(input_file_path), poll_main.data_column_indices_enumeration.CANDIDATE_INDEX.value)
+
+        if numpy_result_tuple is None:
+
+            assert '"' in ballot_text_string
+
+        else:
+
+            assert summarize_candidate_votes(numpy_result_tuple) == reference_tuple
+
+        assert summarize_candidate_votes(poll_main.read_file_and_calculate_values(str(input_file_path))) \
+            == reference_tuple
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_header_only_file_has_no_winner
+ #
+ #  Subroutine Description:
+ #      This test analyzes a ballot file with only its header, from the path, over
+ #      shards, by instant runoff, and from an open text stream, and checks that each
+ #      summary has no votes, no candidates, and the no-ballots message.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                    Description
+ #  -----       -------------           ----------------------------------------------
+ #  object      tmp_path                the pytest fixture with a temporary folder
+ #  dictionary  keyword_dictionary      the keyword arguments of the analysis
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize \
+    ('keyword_dictionary', 
+     [{}, {'worker_count_integer': 2}, {'county_results_boolean': True}, {'ranked_choice_boolean': True}])
+def test_header_only_file_has_no_winner(tmp_path, keyword_dictionary):
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    input_file_path.write_bytes(b'Ballot ID,County,Candidate\n')
+
+    with open(input_file_path, newline = '') as input_file:
+
+        for summary_dictionary \
+            in (poll_main.read_file_and_calculate_values(str(input_file_path), **keyword_dictionary),
+                poll_main.read_file_and_calculate_values(input_file, **keyword_dictionary)):
+
+            assert summarize_candidate_votes(summary_dictionary) == ([], 0)
+
+            assert summary_dictionary['Winner'] == poll_main.CONSTANT_NO_BALLOTS_MESSAGE
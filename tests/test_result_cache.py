@@ -0,0 +1,362 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_result_cache.py
+ #
+ #  File Description:
+ #      These tests check the result cache of result_cache.py.  They analyze an input
+ #      file again and again with an analysis function that counts its calls, and
+ #      check that a result comes back from the cache until the input's contents, an
+ #      option, a source file, or the program changes, and not after a touch alone,
+ #      and that a small file rewritten at the same size and modification time misses.
+ #      They check that entries are JSON and that a hit returns what the miss did.
+ #      They also fill a small cache folder and check that the least recently used
+ #      entries are evicted by size and that a result larger than the limit is not
+ #      stored.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      test_key_follows_input_options_and_sources
+ #      test_digest_reused_until_file_changes
+ #      test_small_file_rewrite_detected
+ #      test_entries_are_json
+ #      test_least_recently_used_entries_evicted
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      JSON entries and small files rehashed   Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import json
+import os
+
+import result_cache
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_key_follows_input_options_and_sources
+ #
+ #  Subroutine Description:
+ #      This test checks that a result is calculated on the first call, returned from
+ #      the cache on a repeated call or after a touch of the input file, and
+ #      calculated again after a change to the input's contents, the options, a
+ #      source file, or the program's name.  Returning to earlier options hits their
+ #      entry again.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_key_follows_input_options_and_sources(tmp_path):
+
+    cache_directory_string = str(tmp_path / 'result_cache')
+
+    input_file_path = tmp_path / 'budget_data.csv'
+
+    source_file_path = tmp_path / 'program.py'
+
+    input_file_path.write_text('Date,Profit/Losses\nJan-10,100\n')
+
+    source_file_path.write_text('VERSION = 1\n')
+
+    calls_list = []
+
+    def analyze_input():
+
+        calls_list.append(input_file_path.read_text())
+
+        return {'Total Records': len(calls_list)}
+
+    def read_result(options_dictionary = {'Top Count': 3}, program_name_string = 'bank_main.py'):
+
+        return result_cache.read_or_calculate_result \
+                    (cache_directory_string,
+                     str(input_file_path),
+                     program_name_string,
+                     [str(source_file_path)],
+                     options_dictionary,
+                     analyze_input)
+
+
+    assert read_result() == ({'Total Records': 1}, False)
+
+    assert read_result() == ({'Total Records': 1}, True)
+
+
+    # A touch changes the modification time but not the contents.
+    file_status = os.stat(input_file_path)
+
+    os.utime(input_file_path, ns = (file_status.st_atime_ns, file_status.st_mtime_ns + 10 ** 9))
+
+    assert read_result() == ({'Total Records': 1}, True)
+
+
+    # A change to the contents of the same size misses.
+    input_file_path.write_text('Date,Profit/Losses\nJan-10,200\n')
+
+    assert read_result() == ({'Total Records': 2}, False)
+
+    assert read_result() == ({'Total Records': 2}, True)
+
+
+    assert read_result({'Top Count': 5}) == ({'Total Records': 3}, False)
+
+    assert read_result({'Top Count': 3}) == ({'Total Records': 2}, True)
+
+
+    source_file_path.write_text('VERSION = 2\n')
+
+    assert read_result() == ({'Total Records': 4}, False)
+
+    assert read_result(program_name_string = 'poll_main.py') == ({'Total Records': 5}, False)
+
+    assert len(calls_list) == 5
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_digest_reused_until_file_changes
+ #
+ #  Subroutine Description:
+ #      This test checks that the cache hashes an input file above the memo size once
+ #      and reuses the recorded digest while the file's size and modification time
+ #      stay the same, and hashes it again after either changes.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  tmp_path        the pytest fixture with a temporary folder
+ #  object  monkeypatch     the pytest fixture that restores the digest function
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #  10/18/2026          File above the memo size                    Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_digest_reused_until_file_changes(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(result_cache, 'CONSTANT_DIGEST_MEMO_SIZE', 0)
+
+    cache_directory_string = str(tmp_path)
+
+    input_file_path = tmp_path / 'election_data.csv'
+
+    input_file_path.write_text('Ballot ID,County,Candidate\n1,Denver,Diana DeGette\n')
+
+    hashed_files_list = []
+
+    calculate_file_digest_function = result_cache.calculate_file_digest
+
+    def record_file_digest(input_file_name_string):
+
+        hashed_files_list.append(input_file_name_string)
+
+        return calculate_file_digest_function(input_file_name_string)
+
+    monkeypatch.setattr(result_cache, 'calculate_file_digest', record_file_digest)
+
+
+    digest_string = result_cache.find_file_digest(cache_directory_string, str(input_file_path))
+
+    assert result_cache.find_file_digest(cache_directory_string, str(input_file_path)) == digest_string
+
+    assert len(hashed_files_list) == 1
+
+    with open(input_file_path, 'a') as input_file:
+
+        input_file.write('2,Denver,Diana DeGette\n')
+
+    assert result_cache.find_file_digest(cache_directory_string, str(input_file_path)) != digest_string
+
+    assert len(hashed_files_list) == 2
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_small_file_rewrite_detected
+ #
+ #  Subroutine Description:
+ #      This test rewrites a small input file with different contents of the same size
+ #      and restores its modification time, which the recorded digest of a large file
+ #      would not notice, and checks that the small file misses.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_small_file_rewrite_detected(tmp_path):
+
+    cache_directory_string = str(tmp_path / 'result_cache')
+
+    input_file_path = tmp_path / 'budget_data.csv'
+
+    input_file_path.write_text('Date,Profit/Losses\nJan-10,100\n')
+
+    file_status = os.stat(input_file_path)
+
+    def read_result():
+
+        return result_cache.read_or_calculate_result \
+                    (cache_directory_string, str(input_file_path), 'bank_main.py', [], {},
+                     lambda: {'Text': input_file_path.read_text()})
+
+
+    assert read_result() == ({'Text': 'Date,Profit/Losses\nJan-10,100\n'}, False)
+
+    input_file_path.write_text('Date,Profit/Losses\nJan-10,200\n')
+
+    os.utime(input_file_path, ns = (file_status.st_atime_ns, file_status.st_mtime_ns))
+
+    assert os.stat(input_file_path)[:9] == file_status[:9]
+
+    assert read_result() == ({'Text': 'Date,Profit/Losses\nJan-10,200\n'}, False)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_entries_are_json
+ #
+ #  Subroutine Description:
+ #      This test stores a result with tuples, a nested dictionary, None, and a float,
+ #      and checks that its entry is a JSON file, that the miss and the hit return the
+ #      same lists, and that an entry that is not JSON is discarded as a miss.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_entries_are_json(tmp_path):
+
+    cache_directory_string = str(tmp_path / 'result_cache')
+
+    input_file_path = tmp_path / 'budget_data.csv'
+
+    input_file_path.write_text('Date,Profit/Losses\nJan-10,100\n')
+
+    summary_dictionary \
+        = {'Total Records': 1,
+           'Change Statistics': {'Top Increases': [('Feb-10', 5)], 'Rolling Averages': [(3, None, None, None)]},
+           'Average Change': 0.25}
+
+    json_summary_dictionary \
+        = {'Total Records': 1,
+           'Change Statistics': {'Top Increases': [['Feb-10', 5]], 'Rolling Averages': [[3, None, None, None]]},
+           'Average Change': 0.25}
+
+    def read_result():
+
+        return result_cache.read_or_calculate_result \
+                    (cache_directory_string, str(input_file_path), 'bank_main.py', [], {}, lambda: summary_dictionary)
+
+
+    assert read_result() == (json_summary_dictionary, False)
+
+    assert read_result() == (json_summary_dictionary, True)
+
+    result_file_names_list \
+        = [file_name_string for file_name_string in os.listdir(cache_directory_string) \
+           if file_name_string.endswith(result_cache.CONSTANT_RESULT_FILE_EXTENSION)]
+
+    assert len(result_file_names_list) == 1
+
+    result_file_path = tmp_path / 'result_cache' / result_file_names_list[0]
+
+    assert json.loads(result_file_path.read_text()) == json_summary_dictionary
+
+
+    result_file_path.write_bytes(b'\x80\x04\x95 not JSON')
+
+    assert read_result() == (json_summary_dictionary, False)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_least_recently_used_entries_evicted
+ #
+ #  Subroutine Description:
+ #      This test stores entries of equal size in a folder that holds three of them,
+ #      reads the oldest, which makes it the most recently used, and stores a fourth,
+ #      which must evict the least recently used entry and keep the rest.  A result
+ #      larger than the whole limit is not stored.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_least_recently_used_entries_evicted(tmp_path):
+
+    cache_directory_string = str(tmp_path)
+
+    entry_size_integer = len(json.dumps('a' * 1000).encode('utf-8'))
+
+    size_limit_integer = entry_size_integer * 3 + entry_size_integer // 2
+
+    for entry_index, result_key_string in enumerate(('first', 'second', 'third')):
+
+        result_cache.write_cached_result \
+            (cache_directory_string, result_key_string, result_key_string[0] * 1000, size_limit_integer)
+
+        # These lines of code give the entries distinct modification times in the past.
+        os.utime \
+            (os.path.join(cache_directory_string, result_key_string + result_cache.CONSTANT_RESULT_FILE_EXTENSION),
+             ns = ((entry_index + 1) * 10 ** 9,) * 2)
+
+
+    assert result_cache.read_cached_result(cache_directory_string, 'first') == 'f' * 1000
+
+    result_cache.write_cached_result(cache_directory_string, 'fourth', 'o' * 1000, size_limit_integer)
+
+    assert sorted(file_name_string for file_name_string in os.listdir(cache_directory_string)) \
+        == ['first.result', 'fourth.result', 'third.result']
+
+    assert result_cache.read_cached_result(cache_directory_string, 'second') is None
+
+
+    result_cache.write_cached_result(cache_directory_string, 'fifth', 'x' * size_limit_integer, size_limit_integer)
+
+    assert result_cache.read_cached_result(cache_directory_string, 'fifth') is None
+
+    assert len(os.listdir(cache_directory_string)) == 3
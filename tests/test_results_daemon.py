@@ -0,0 +1,484 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_results_daemon.py
+ #
+ #  File Description:
+ #      These tests check the query server of results_daemon.py.  They load a small
+ #      ballot file and budget file, answer every route from memory and compare the
+ #      answers with poll_main.py, bank_main.py, and bank_range_index.py, check the
+ #      error answers, and send requests over a real connection.  They also run the
+ #      watcher and check that it analyzes a file again after its contents change but
+ #      not after a touch alone.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      write_input_files
+ #      create_watched_files
+ #      read_json_answer
+ #      send_request
+ #      wait_for_condition
+ #      test_queries_answered_from_memory
+ #      test_requests_over_connection
+ #      test_watcher_reloads_after_content_change_only
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import asyncio
+import functools
+import json
+import os
+import urllib.parse
+
+import bank_main
+import bank_range_index
+import poll_main
+import results_daemon
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  write_input_files
+ #
+ #  Subroutine Description:
+ #      This function writes a small ballot csv file and budget csv file in a folder
+ #      and returns their paths.  One candidate's name has letters outside ASCII, so
+ #      the candidate query must decode the path.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_input_files(tmp_path):
+
+    poll_file_path = tmp_path / 'election_data.csv'
+
+    bank_file_path = tmp_path / 'budget_data.csv'
+
+    candidates_list = ['Diana DeGette', 'Zoë Núñez', 'Diana DeGette', 'Raymon Anthony Doane']
+
+    poll_file_path.write_text \
+        ('Ballot ID,County,Candidate\n'
+         + ''.join(f'{ballot_index},Denver,{candidates_list[ballot_index % 4]}\n' for ballot_index in range(1, 41)),
+         encoding = 'utf-8')
+
+    bank_file_path.write_text \
+        ('Date,Profit/Losses\n' + ''.join(f'M-{row_index},{(row_index * 37) % 11 * 100}\n' for row_index in range(12)))
+
+    return poll_file_path, bank_file_path
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_watched_files
+ #
+ #  Subroutine Description:
+ #      This function returns the watched input files of 'poll' and 'bank' the way the
+ #      server creates them, loaded once.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                Description
+ #  -----   -------------       ----------------------------------------------
+ #  object  poll_file_path      the path of the ballot csv file
+ #  object  bank_file_path      the path of the budget csv file
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_watched_files(poll_file_path, bank_file_path):
+
+    watched_files_dictionary \
+        = {'poll': results_daemon.watched_input_file(str(poll_file_path), results_daemon.load_poll_results),
+           'bank': results_daemon.watched_input_file \
+                       (str(bank_file_path), results_daemon.load_bank_results, results_daemon.release_bank_results)}
+
+    for watched_file in watched_files_dictionary.values():
+
+        watched_file.load()
+
+    return watched_files_dictionary
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  read_json_answer
+ #
+ #  Subroutine Description:
+ #      This function answers a query and returns the status code and the decoded
+ #      JSON body.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                        Description
+ #  -----       -------------               ----------------------------------------------
+ #  dictionary  watched_files_dictionary    the watched input file of 'poll' and 'bank'
+ #  String      target_string               the request target
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def read_json_answer(watched_files_dictionary, target_string):
+
+    status_code_integer, body_bytes = results_daemon.answer_query(watched_files_dictionary, target_string)
+
+    return status_code_integer, json.loads(body_bytes)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  send_request
+ #
+ #  Subroutine Description:
+ #      This coroutine writes raw request bytes to a connection and returns the status
+ #      code, the Connection header, and the decoded JSON body of the answer.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  stream_reader   the asyncio stream reader of the connection
+ #  object  stream_writer   the asyncio stream writer of the connection
+ #  bytes   request_bytes   the request line and headers
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+async def send_request(stream_reader, stream_writer, request_bytes):
+
+    stream_writer.write(request_bytes)
+
+    await stream_writer.drain()
+
+    response_lines_list = (await stream_reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+
+    header_names_dictionary \
+        = {header_name_string.lower(): header_value_string.strip() \
+           for header_name_string, _, header_value_string \
+               in (response_line_string.partition(':') for response_line_string in response_lines_list[1:] \
+                   if response_line_string)}
+
+    body_bytes = await stream_reader.readexactly(int(header_names_dictionary['content-length']))
+
+    return int(response_lines_list[0].split()[1]), header_names_dictionary['connection'], json.loads(body_bytes)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  wait_for_condition
+ #
+ #  Subroutine Description:
+ #      This coroutine waits until a condition holds, or until a number of seconds
+ #      passes, and returns whether the condition held.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                Description
+ #  -----       -------------       ----------------------------------------------
+ #  function    condition_function  a function that returns whether to stop waiting
+ #  float       timeout_float       the number of seconds to wait (default: 10.0)
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+async def wait_for_condition(condition_function, timeout_float = 10.0):
+
+    for _ in range(int(timeout_float / 0.01)):
+
+        if condition_function():
+
+            return True
+
+        await asyncio.sleep(0.01)
+
+    return condition_function()
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_queries_answered_from_memory
+ #
+ #  Subroutine Description:
+ #      This test answers the status, summary, candidate, and range queries and
+ #      compares them with the programs' own results: the range answer must equal
+ #      the index's answer and hold no change statistics.  It then checks the 404
+ #      answers for an unknown path or candidate, the 400 answers for a range
+ #      without both dates or with a date the budget lacks, and the 503 answer for
+ #      a file that never loaded.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_queries_answered_from_memory(tmp_path):
+
+    poll_file_path, bank_file_path = write_input_files(tmp_path)
+
+    watched_files_dictionary = create_watched_files(poll_file_path, bank_file_path)
+
+    try:
+
+        status_code_integer, status_dictionary = read_json_answer(watched_files_dictionary, '/status')
+
+        assert status_code_integer == 200
+
+        assert status_dictionary['poll']['Loads'] == 1 and status_dictionary['bank']['Error'] is None
+
+
+        poll_summary_dictionary = json.loads(json.dumps(poll_main.read_file_and_calculate_values(str(poll_file_path))))
+
+        assert read_json_answer(watched_files_dictionary, '/poll/summary') == (200, poll_summary_dictionary)
+
+        assert read_json_answer(watched_files_dictionary, '/poll/candidates/' + urllib.parse.quote('Zoë Núñez')) \
+            == (200, {'Name': 'Zoë Núñez', 'Percent': 25.0, 'Vote Count': 10})
+
+        assert read_json_answer(watched_files_dictionary, '/poll/candidates/Nobody')[0] == 404
+
+
+        bank_summary_dictionary = json.loads(json.dumps(bank_main.read_file_and_calculate_values(str(bank_file_path))))
+
+        assert read_json_answer(watched_files_dictionary, '/bank/summary') == (200, bank_summary_dictionary)
+
+        status_code_integer, range_dictionary = read_json_answer(watched_files_dictionary, '/bank/range?start=M-2&end=M-9')
+
+        assert status_code_integer == 200
+
+        assert 'Change Statistics' not in range_dictionary
+
+        assert range_dictionary \
+            == json.loads(json.dumps(bank_range_index.query_date_range \
+                                         (watched_files_dictionary['bank'].results_dictionary['Range Index'],
+                                          'M-2',
+                                          'M-9')))
+
+        assert list(range_dictionary) \
+            == list(bank_summary_dictionary)[:bank_main.dictionary_indices_enumeration.CHANGE_STATISTICS.value]
+
+
+        for target_string in ('/bank/range?start=M-2', '/bank/range?start=M-2&end=M-99', '/bank/range?start=M-9&end=M-2'):
+
+            assert read_json_answer(watched_files_dictionary, target_string)[0] == 400
+
+        for target_string in ('/', '/poll', '/poll/unknown', '/bank/candidates/M-2', '/votes/summary'):
+
+            assert read_json_answer(watched_files_dictionary, target_string)[0] == 404
+
+
+        missing_file \
+            = results_daemon.watched_input_file(str(tmp_path / 'missing.csv'), results_daemon.load_poll_results)
+
+        missing_file.load()
+
+        status_code_integer, error_dictionary = read_json_answer({'poll': missing_file}, '/poll/summary')
+
+        assert status_code_integer == 503 and error_dictionary['Error'] == missing_file.error_string
+
+    finally:
+
+        results_daemon.release_bank_results(watched_files_dictionary['bank'].results_dictionary)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_requests_over_connection
+ #
+ #  Subroutine Description:
+ #      This test serves the results on a localhost port and sends several requests
+ #      over one connection: a GET, which keeps the connection open, a POST, which
+ #      must be answered with 405, and a request line that is not valid, which must
+ #      be answered with 400 and close the connection.  A GET with 'Connection:
+ #      close' on a new connection must close it too.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_requests_over_connection(tmp_path):
+
+    watched_files_dictionary = create_watched_files(*write_input_files(tmp_path))
+
+    async def exchange_requests():
+
+        server = await asyncio.start_server \
+                    (functools.partial(results_daemon.handle_connection, watched_files_dictionary),
+                     '127.0.0.1',
+                     0,
+                     limit = results_daemon.CONSTANT_REQUEST_HEAD_LIMIT)
+
+        port_integer = server.sockets[0].getsockname()[1]
+
+        async with server:
+
+            stream_reader, stream_writer = await asyncio.open_connection('127.0.0.1', port_integer)
+
+            status_code_integer, connection_string, summary_dictionary \
+                = await send_request(stream_reader, stream_writer, b'GET /bank/summary HTTP/1.1\r\nHost: a\r\n\r\n')
+
+            assert (status_code_integer, connection_string) == (200, 'keep-alive')
+
+            assert summary_dictionary == json.loads(watched_files_dictionary['bank'].results_dictionary['Summary JSON'])
+
+            assert (await send_request(stream_reader, stream_writer, b'POST /status HTTP/1.1\r\n\r\n'))[:2] \
+                == (405, 'keep-alive')
+
+            assert (await send_request(stream_reader, stream_writer, b'GET\r\n\r\n'))[:2] == (400, 'close')
+
+            assert await stream_reader.read() == b''
+
+            stream_writer.close()
+
+
+            stream_reader, stream_writer = await asyncio.open_connection('127.0.0.1', port_integer)
+
+            assert (await send_request \
+                        (stream_reader, stream_writer, b'GET /status HTTP/1.1\r\nConnection: close\r\n\r\n'))[:2] \
+                == (200, 'close')
+
+            assert await stream_reader.read() == b''
+
+            stream_writer.close()
+
+    try:
+
+        asyncio.run(exchange_requests())
+
+    finally:
+
+        results_daemon.release_bank_results(watched_files_dictionary['bank'].results_dictionary)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_watcher_reloads_after_content_change_only
+ #
+ #  Subroutine Description:
+ #      This test runs the watcher of the ballot file and the budget file at a short
+ #      interval.  A touch changes the modification time, which the watcher must
+ #      notice without analyzing the file again; an appended row changes the
+ #      contents, which it must analyze again, so the answers show the new row and
+ #      the old range index is closed.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name        Description
+ #  -----   --------    ----------------------------------------------
+ #  object  tmp_path    the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_watcher_reloads_after_content_change_only(tmp_path):
+
+    poll_file_path, bank_file_path = write_input_files(tmp_path)
+
+    watched_files_dictionary = create_watched_files(poll_file_path, bank_file_path)
+
+    async def watch_changes():
+
+        watcher_tasks_list \
+            = [asyncio.create_task(watched_file.watch(0.01)) for watched_file in watched_files_dictionary.values()]
+
+        try:
+
+            for file_path_object, watched_file in zip((poll_file_path, bank_file_path), watched_files_dictionary.values()):
+
+                file_status = os.stat(file_path_object)
+
+                os.utime(file_path_object, ns = (file_status.st_atime_ns, file_status.st_mtime_ns + 10 ** 9))
+
+                assert await wait_for_condition \
+                                 (lambda: watched_file.file_signature_tuple == watched_file.read_file_signature())
+
+                assert watched_file.load_count_integer == 1
+
+
+            old_results_dictionary = watched_files_dictionary['bank'].results_dictionary
+
+            with open(poll_file_path, 'a', encoding = 'utf-8') as poll_file:
+
+                poll_file.write('41,Denver,Zoë Núñez\n')
+
+            with open(bank_file_path, 'a') as bank_file:
+
+                bank_file.write('M-12,-90000\n')
+
+            for watched_file in watched_files_dictionary.values():
+
+                assert await wait_for_condition(lambda: watched_file.load_count_integer == 2)
+
+        finally:
+
+            for watcher_task in watcher_tasks_list:
+
+                watcher_task.cancel()
+
+        return old_results_dictionary
+
+    try:
+
+        old_results_dictionary = asyncio.run(watch_changes())
+
+        assert 'Memory Map' not in old_results_dictionary['Range Index']
+
+        assert read_json_answer(watched_files_dictionary, '/poll/candidates/' + urllib.parse.quote('Zoë Núñez'))[1] \
+            ['Vote Count'] == 11
+
+        assert read_json_answer(watched_files_dictionary, '/bank/summary')[1]['Total Records'] == 13
+
+        assert read_json_answer(watched_files_dictionary, '/bank/range?start=M-11&end=M-12')[1] \
+            ['Greatest Decrease in Profits']['Value'] < -80000
+
+    finally:
+
+        results_daemon.release_bank_results(watched_files_dictionary['bank'].results_dictionary)
@@ -0,0 +1,553 @@
+#*******************************************************************************************
+ #
+ #  File Name:  test_schema_parser.py
+ #
+ #  File Description:
+ #      These tests check the schema parser in common/schema_parser.py row for row
+ #      against the csv module.  They generate random csv text with quoted fields
+ #      that hold commas, quotation marks, and line breaks, quotation marks inside
+ #      unquoted fields, rows with an extra column,
+ #      carriage returns, and a missing final line break, cut it into blocks at random
+ #      offsets, and compare the parser's columns with the fields csv.reader returns.
+ #      Each test runs with NumPy, if it is installed, and without it.
+ #
+ #      Here is a List of subroutines and functions:
+ #
+ #      select_numpy
+ #      create_random_field
+ #      create_random_csv_text
+ #      cut_text_into_blocks
+ #      parse_schema_rows
+ #      test_text_columns_match_csv_reader
+ #      test_integer_columns_match_csv_reader
+ #      test_integer_column_error_matches_int
+ #      test_lazy_text_column_reads_as_list
+ #      test_stray_quote_parses_in_linear_time
+ #      test_quoted_line_breaks_match_csv_reader
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #  10/18/2026      Quotation marks inside unquoted fields  Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import csv
+import io
+import mmap
+import operator
+import random
+import time
+
+import pytest
+
+import schema_parser
+
+
+# These constants are the pieces of the random text fields and the fields with
+# quotation marks that force the csv module fallback: quoted fields, and fields the csv
+# module reads with a quotation mark as an ordinary character.
+CONSTANT_FIELD_PIECES = ('a', 'b', 'Zé', 'ü', 'x y', '1', '-7', 'ß', '')
+
+CONSTANT_QUOTED_FIELDS = ('"a,b"', '"c\nd"', '"e""f"', '"g\r\nh"', 'Cty"', 'i"j"k', '"l"m')
+
+
+# This constant holds the integer fields, besides random ones, that int accepts but
+# the vectorized conversion may not: signs, leading zeros, spaces, and values too long
+# for 64 bits.
+CONSTANT_INTEGER_FIELDS \
+    = ('0', '-0', '+5', '007', ' 5', '-12', '123456789012345678', '-1234567890123456789012', '9' * 19)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  select_numpy
+ #
+ #  Subroutine Description:
+ #      This fixture runs each test once with the schema parser's NumPy path, if NumPy
+ #      is installed, and once without it.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  request         the pytest request with the parameter
+ #  object  monkeypatch     the pytest fixture that restores the module afterward
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.fixture(params = ['numpy', 'python'])
+def select_numpy(request, monkeypatch):
+
+    if request.param == 'python':
+
+        monkeypatch.setattr(schema_parser, 'numpy', None)
+
+    return request.param
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_random_field
+ #
+ #  Subroutine Description:
+ #      This function returns a random csv field: a quoted field now and then if quoting
+ #      is on, and otherwise a few random pieces.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  random_object   the random number generator
+ #  bool    quoted_boolean  whether the field may be quoted
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_random_field(random_object, quoted_boolean):
+
+    if quoted_boolean and random_object.random() < 0.02:
+
+        return random_object.choice(CONSTANT_QUOTED_FIELDS)
+
+    return ''.join(random_object.choice(CONSTANT_FIELD_PIECES) for _ in range(random_object.randint(1, 3)))
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  create_random_csv_text
+ #
+ #  Subroutine Description:
+ #      This function returns random csv text with about the schema's number of
+ #      columns: now and then a row has an extra column, the line endings may be
+ #      carriage return and line feed, and the last line break may be missing.  The
+ #      integer columns hold random integers and, now and then, one of the edge-case
+ #      integer fields.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name                            Description
+ #  -----   -------------                   ----------------------------------------------
+ #  object  random_object                   the random number generator
+ #  int     column_count_integer            the number of columns in each row
+ #  tuple   integer_column_indices_tuple    the indices of the integer columns
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def create_random_csv_text(random_object, column_count_integer, integer_column_indices_tuple = ()):
+
+    quoted_boolean = random_object.random() < 0.5
+
+    lines_list = []
+
+    for _ in range(random_object.randint(0, 300)):
+
+        fields_list = []
+
+        for column_index in range(column_count_integer + (random_object.random() < 0.01)):
+
+            if column_index not in integer_column_indices_tuple:
+
+                fields_list.append(create_random_field(random_object, quoted_boolean))
+
+            elif random_object.random() < 0.01:
+
+                fields_list.append(random_object.choice(CONSTANT_INTEGER_FIELDS))
+
+            else:
+
+                fields_list.append(str(random_object.randint(-10 ** 9, 10 ** 9)))
+
+        lines_list.append(','.join(fields_list))
+
+
+    line_ending_string = random_object.choice(['\n', '\n', '\r\n'])
+
+    # A line break alone would be a blank row, which has no columns.
+    if len(lines_list) == 0:
+
+        return ''
+
+    return line_ending_string.join(lines_list) + random_object.choice([line_ending_string, ''])
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  cut_text_into_blocks
+ #
+ #  Subroutine Description:
+ #      This function cuts text into blocks at random offsets, which may fall inside a
+ #      field, a quoted field, or a carriage return and line feed.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  object  random_object   the random number generator
+ #  String  text_string     the text to cut
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def cut_text_into_blocks(random_object, text_string):
+
+    cut_offsets_list \
+        = sorted(random_object.sample(range(len(text_string) + 1),
+                                      min(len(text_string) + 1, random_object.randint(0, 20))))
+
+    return [text_string[start_integer:end_integer] \
+            for start_integer, end_integer \
+            in zip([0] + cut_offsets_list, cut_offsets_list + [len(text_string)])]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  parse_schema_rows
+ #
+ #  Subroutine Description:
+ #      This function parses blocks of csv text with the schema parser and returns the
+ #      rows of the needed columns as tuples.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type        Name                Description
+ #  -----       -------------       ----------------------------------------------
+ #  iterable    text_blocks         the blocks of csv text
+ #  object      csv_schema_object   the schema of the csv text
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def parse_schema_rows(text_blocks, csv_schema_object):
+
+    rows_list = []
+
+    for columns_list in schema_parser.parse_schema_columns(text_blocks, csv_schema_object):
+
+        rows_list.extend \
+            (zip(*[columns_list[column_index] for column_index in csv_schema_object.needed_column_indices_tuple]))
+
+    return rows_list
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_text_columns_match_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test compares the parser's text columns with csv.reader's fields for
+ #      random text, schemas, needed columns, and blocks.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  int     seed_integer    the seed of the random number generator
+ #  String  select_numpy    the fixture that selects the NumPy path
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(4))
+def test_text_columns_match_csv_reader(seed_integer, select_numpy):
+
+    random_object = random.Random(seed_integer)
+
+    for _ in range(150):
+
+        column_count_integer = random_object.choice([2, 3])
+
+        needed_column_indices_tuple \
+            = tuple(sorted(random_object.sample(range(column_count_integer),
+                                                random_object.randint(1, column_count_integer))))
+
+        csv_schema_object = schema_parser.csv_schema(column_count_integer, needed_column_indices_tuple)
+
+        text_string = create_random_csv_text(random_object, column_count_integer)
+
+        expected_rows_list \
+            = [tuple(csv_record[column_index] for column_index in needed_column_indices_tuple) \
+               for csv_record in csv.reader(io.StringIO(text_string, newline = ''))]
+
+        assert parse_schema_rows(cut_text_into_blocks(random_object, text_string), csv_schema_object) \
+                   == expected_rows_list, text_string
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_integer_columns_match_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test compares the parser's columns, with an integer column, with
+ #      csv.reader's fields converted by int, for random text and blocks in the bank
+ #      schema's layout and in a three-column layout.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  int     seed_integer    the seed of the random number generator
+ #  String  select_numpy    the fixture that selects the NumPy path
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(4))
+def test_integer_columns_match_csv_reader(seed_integer, select_numpy):
+
+    random_object = random.Random(seed_integer)
+
+    for column_count_integer, needed_column_indices_tuple, integer_column_indices_tuple \
+        in [(2, (0, 1), (1,)), (3, (0, 2), (1, 2)), (3, (1,), (1,))] * 40:
+
+        csv_schema_object \
+            = schema_parser.csv_schema \
+                (column_count_integer, needed_column_indices_tuple, integer_column_indices_tuple)
+
+        text_string = create_random_csv_text(random_object, column_count_integer, integer_column_indices_tuple)
+
+        expected_rows_list \
+            = [tuple(int(csv_record[column_index]) if column_index in integer_column_indices_tuple \
+                     else csv_record[column_index] \
+                     for column_index in needed_column_indices_tuple) \
+               for csv_record in csv.reader(io.StringIO(text_string, newline = ''))]
+
+        assert parse_schema_rows(cut_text_into_blocks(random_object, text_string), csv_schema_object) \
+                   == expected_rows_list, text_string
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_integer_column_error_matches_int
+ #
+ #  Subroutine Description:
+ #      This test checks that a field that is not an integer raises the ValueError
+ #      that int raises for it.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  String  select_numpy    the fixture that selects the NumPy path
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_integer_column_error_matches_int(select_numpy):
+
+    csv_schema_object = schema_parser.csv_schema(2, (0, 1), (1,))
+
+    with pytest.raises(ValueError, match = "invalid literal for int\\(\\) with base 10: '1.5'"):
+
+        parse_schema_rows(['Jan-10,5\nFeb-10,1.5\nMar-10,7\n'], csv_schema_object)
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_lazy_text_column_reads_as_list
+ #
+ #  Subroutine Description:
+ #      This test checks that a lazy text column reads like the list of its fields: its
+ #      length, indices, slices, and iteration.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_lazy_text_column_reads_as_list():
+
+    lazy_column = schema_parser.lazy_text_column('a,1\nb,2\nc,3\n', 0, 2, 3)
+
+    assert len(lazy_column) == 3
+
+    assert lazy_column[1] == 'b'
+
+    assert lazy_column[-1] == 'c'
+
+    assert lazy_column[1:] == ['b', 'c']
+
+    assert list(lazy_column) == ['a', 'b', 'c']
+
+    assert lazy_column.index('c') == 2
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_stray_quote_parses_in_linear_time
+ #
+ #  Subroutine Description:
+ #      This test parses ballot text of many blocks, once as it is and once with a
+ #      quotation mark inside an unquoted field near the start.  The rows must match
+ #      csv.reader's, the parser must yield a block's columns for every block it reads
+ #      instead of keeping the rest of the text, and the stray quotation mark must not
+ #      make the parse much slower.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  String  select_numpy    the fixture that selects the NumPy path
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def test_stray_quote_parses_in_linear_time(select_numpy):
+
+    csv_schema_object = schema_parser.csv_schema(3, (1, 2))
+
+    elapsed_seconds_list = []
+
+    for county_name_string in ('Denver', CONSTANT_QUOTED_FIELDS[4]):
+
+        text_string \
+            = ''.join(f'{row_index},{county_name_string if row_index == 10 else "Denver"},Diana DeGette\n' \
+                      for row_index in range(200000))
+
+        text_blocks_list \
+            = [text_string[start_integer:start_integer + schema_parser.CONSTANT_PARSE_BLOCK_SIZE] \
+               for start_integer in range(0, len(text_string), schema_parser.CONSTANT_PARSE_BLOCK_SIZE)]
+
+        text_blocks_iterator = iter(text_blocks_list)
+
+        rows_list = []
+
+        for yield_count_integer, columns_list \
+            in enumerate(schema_parser.parse_schema_columns(text_blocks_iterator, csv_schema_object), 1):
+
+            # Each yield leaves at most the block after it read ahead.
+            assert len(text_blocks_list) - operator.length_hint(text_blocks_iterator) <= yield_count_integer + 1
+
+            rows_list.extend(zip(columns_list[1], columns_list[2]))
+
+        assert rows_list \
+            == [(csv_record[1], csv_record[2]) for csv_record in csv.reader(io.StringIO(text_string, newline = ''))]
+
+
+        # The best of a few runs keeps a busy machine from failing the test.
+        elapsed_seconds_float = float('inf')
+
+        for _ in range(3):
+
+            start_time_float = time.perf_counter()
+
+            for _ in schema_parser.parse_schema_columns(text_blocks_list, csv_schema_object):
+
+                pass
+
+            elapsed_seconds_float = min(elapsed_seconds_float, time.perf_counter() - start_time_float)
+
+        elapsed_seconds_list.append(elapsed_seconds_float)
+
+    assert elapsed_seconds_list[1] < 4 * elapsed_seconds_list[0]
+
+
+#*******************************************************************************************
+ #
+ #  Subroutine Name:  test_quoted_line_breaks_match_csv_reader
+ #
+ #  Subroutine Description:
+ #      This test writes random csv text to a file and checks that the line breaks
+ #      find_quoted_line_breaks yields, with scan windows a few bytes long, are the
+ #      line breaks csv.reader reads inside a record rather than at its end.
+ #
+ #  Subroutine Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  int     seed_integer    the seed of the random number generator
+ #  object  select_numpy    the fixture that selects the NumPy path
+ #  object  monkeypatch     the pytest fixture that restores the window size
+ #  object  tmp_path        the pytest fixture with a temporary folder
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+@pytest.mark.parametrize('seed_integer', range(4))
+def test_quoted_line_breaks_match_csv_reader(seed_integer, select_numpy, monkeypatch, tmp_path):
+
+    random_object = random.Random(seed_integer)
+
+    input_file_path = tmp_path / 'input.csv'
+
+    for _ in range(40):
+
+        text_string = create_random_csv_text(random_object, 3)
+
+        if text_string == '':
+
+            continue
+
+        input_file_path.write_text(text_string, encoding = 'utf-8', newline = '')
+
+        # csv.reader counts a line at each line feed alone, as the file splits them.
+        lines_list = text_string.split('\n')
+
+        csv_reader_object \
+            = csv.reader([line_string + '\n' for line_string in lines_list[:-1]] + [lines_list[-1]] * (lines_list[-1] != ''))
+
+        record_end_lines_set = {csv_reader_object.line_num for _ in csv_reader_object}
+
+        text_bytes = text_string.encode('utf-8')
+
+        line_break_offsets_list = [offset_integer for offset_integer, byte_integer in enumerate(text_bytes) if byte_integer == 10]
+
+        monkeypatch.setattr(schema_parser, 'CONSTANT_QUOTE_SCAN_WINDOW_SIZE', random_object.randint(1, 30))
+
+        with open(input_file_path, 'rb') as binary_file, \
+             mmap.mmap(binary_file.fileno(), 0, access = mmap.ACCESS_READ) as memory_map:
+
+            assert list(schema_parser.find_quoted_line_breaks(memory_map, 0, len(text_bytes))) \
+                == [offset_integer for line_index, offset_integer in enumerate(line_break_offsets_list, 1) \
+                    if line_index not in record_end_lines_set]